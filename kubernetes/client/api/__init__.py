@@ -2,74 +2,103 @@ from __future__ import absolute_import
 
 # flake8: noqa
 
-# import apis into api package
-from kubernetes.client.api.admissionregistration_api import AdmissionregistrationApi
-from kubernetes.client.api.admissionregistration_v1_api import AdmissionregistrationV1Api
-from kubernetes.client.api.admissionregistration_v1beta1_api import AdmissionregistrationV1beta1Api
-from kubernetes.client.api.apiextensions_api import ApiextensionsApi
-from kubernetes.client.api.apiextensions_v1_api import ApiextensionsV1Api
-from kubernetes.client.api.apiextensions_v1beta1_api import ApiextensionsV1beta1Api
-from kubernetes.client.api.apiregistration_api import ApiregistrationApi
-from kubernetes.client.api.apiregistration_v1_api import ApiregistrationV1Api
-from kubernetes.client.api.apiregistration_v1beta1_api import ApiregistrationV1beta1Api
-from kubernetes.client.api.apis_api import ApisApi
-from kubernetes.client.api.apps_api import AppsApi
-from kubernetes.client.api.apps_v1_api import AppsV1Api
-from kubernetes.client.api.apps_v1beta1_api import AppsV1beta1Api
-from kubernetes.client.api.apps_v1beta2_api import AppsV1beta2Api
-from kubernetes.client.api.auditregistration_api import AuditregistrationApi
-from kubernetes.client.api.auditregistration_v1alpha1_api import AuditregistrationV1alpha1Api
-from kubernetes.client.api.authentication_api import AuthenticationApi
-from kubernetes.client.api.authentication_v1_api import AuthenticationV1Api
-from kubernetes.client.api.authentication_v1beta1_api import AuthenticationV1beta1Api
-from kubernetes.client.api.authorization_api import AuthorizationApi
-from kubernetes.client.api.authorization_v1_api import AuthorizationV1Api
-from kubernetes.client.api.authorization_v1beta1_api import AuthorizationV1beta1Api
-from kubernetes.client.api.autoscaling_api import AutoscalingApi
-from kubernetes.client.api.autoscaling_v1_api import AutoscalingV1Api
-from kubernetes.client.api.autoscaling_v2beta1_api import AutoscalingV2beta1Api
-from kubernetes.client.api.autoscaling_v2beta2_api import AutoscalingV2beta2Api
-from kubernetes.client.api.batch_api import BatchApi
-from kubernetes.client.api.batch_v1_api import BatchV1Api
-from kubernetes.client.api.batch_v1beta1_api import BatchV1beta1Api
-from kubernetes.client.api.batch_v2alpha1_api import BatchV2alpha1Api
-from kubernetes.client.api.certificates_api import CertificatesApi
-from kubernetes.client.api.certificates_v1beta1_api import CertificatesV1beta1Api
-from kubernetes.client.api.coordination_api import CoordinationApi
-from kubernetes.client.api.coordination_v1_api import CoordinationV1Api
-from kubernetes.client.api.coordination_v1beta1_api import CoordinationV1beta1Api
-from kubernetes.client.api.core_api import CoreApi
-from kubernetes.client.api.core_v1_api import CoreV1Api
-from kubernetes.client.api.custom_objects_api import CustomObjectsApi
-from kubernetes.client.api.discovery_api import DiscoveryApi
-from kubernetes.client.api.discovery_v1beta1_api import DiscoveryV1beta1Api
-from kubernetes.client.api.events_api import EventsApi
-from kubernetes.client.api.events_v1beta1_api import EventsV1beta1Api
-from kubernetes.client.api.extensions_api import ExtensionsApi
-from kubernetes.client.api.extensions_v1beta1_api import ExtensionsV1beta1Api
-from kubernetes.client.api.flowcontrol_apiserver_api import FlowcontrolApiserverApi
-from kubernetes.client.api.flowcontrol_apiserver_v1alpha1_api import FlowcontrolApiserverV1alpha1Api
-from kubernetes.client.api.logs_api import LogsApi
-from kubernetes.client.api.networking_api import NetworkingApi
-from kubernetes.client.api.networking_v1_api import NetworkingV1Api
-from kubernetes.client.api.networking_v1beta1_api import NetworkingV1beta1Api
-from kubernetes.client.api.node_api import NodeApi
-from kubernetes.client.api.node_v1alpha1_api import NodeV1alpha1Api
-from kubernetes.client.api.node_v1beta1_api import NodeV1beta1Api
-from kubernetes.client.api.policy_api import PolicyApi
-from kubernetes.client.api.policy_v1beta1_api import PolicyV1beta1Api
-from kubernetes.client.api.rbac_authorization_api import RbacAuthorizationApi
-from kubernetes.client.api.rbac_authorization_v1_api import RbacAuthorizationV1Api
-from kubernetes.client.api.rbac_authorization_v1alpha1_api import RbacAuthorizationV1alpha1Api
-from kubernetes.client.api.rbac_authorization_v1beta1_api import RbacAuthorizationV1beta1Api
-from kubernetes.client.api.scheduling_api import SchedulingApi
-from kubernetes.client.api.scheduling_v1_api import SchedulingV1Api
-from kubernetes.client.api.scheduling_v1alpha1_api import SchedulingV1alpha1Api
-from kubernetes.client.api.scheduling_v1beta1_api import SchedulingV1beta1Api
-from kubernetes.client.api.settings_api import SettingsApi
-from kubernetes.client.api.settings_v1alpha1_api import SettingsV1alpha1Api
-from kubernetes.client.api.storage_api import StorageApi
-from kubernetes.client.api.storage_v1_api import StorageV1Api
-from kubernetes.client.api.storage_v1alpha1_api import StorageV1alpha1Api
-from kubernetes.client.api.storage_v1beta1_api import StorageV1beta1Api
-from kubernetes.client.api.version_api import VersionApi
+import importlib
+import sys
+
+# APIs are imported on first access, some of the API modules are very
+# large and only a few of them are used by a given program.
+# API class name -> module of this package defining it
+_APIS = {
+    'AdmissionregistrationApi': 'admissionregistration_api',
+    'AdmissionregistrationV1Api': 'admissionregistration_v1_api',
+    'AdmissionregistrationV1beta1Api': 'admissionregistration_v1beta1_api',
+    'ApiextensionsApi': 'apiextensions_api',
+    'ApiextensionsV1Api': 'apiextensions_v1_api',
+    'ApiextensionsV1beta1Api': 'apiextensions_v1beta1_api',
+    'ApiregistrationApi': 'apiregistration_api',
+    'ApiregistrationV1Api': 'apiregistration_v1_api',
+    'ApiregistrationV1beta1Api': 'apiregistration_v1beta1_api',
+    'ApisApi': 'apis_api',
+    'AppsApi': 'apps_api',
+    'AppsV1Api': 'apps_v1_api',
+    'AppsV1beta1Api': 'apps_v1beta1_api',
+    'AppsV1beta2Api': 'apps_v1beta2_api',
+    'AuditregistrationApi': 'auditregistration_api',
+    'AuditregistrationV1alpha1Api': 'auditregistration_v1alpha1_api',
+    'AuthenticationApi': 'authentication_api',
+    'AuthenticationV1Api': 'authentication_v1_api',
+    'AuthenticationV1beta1Api': 'authentication_v1beta1_api',
+    'AuthorizationApi': 'authorization_api',
+    'AuthorizationV1Api': 'authorization_v1_api',
+    'AuthorizationV1beta1Api': 'authorization_v1beta1_api',
+    'AutoscalingApi': 'autoscaling_api',
+    'AutoscalingV1Api': 'autoscaling_v1_api',
+    'AutoscalingV2beta1Api': 'autoscaling_v2beta1_api',
+    'AutoscalingV2beta2Api': 'autoscaling_v2beta2_api',
+    'BatchApi': 'batch_api',
+    'BatchV1Api': 'batch_v1_api',
+    'BatchV1beta1Api': 'batch_v1beta1_api',
+    'BatchV2alpha1Api': 'batch_v2alpha1_api',
+    'CertificatesApi': 'certificates_api',
+    'CertificatesV1beta1Api': 'certificates_v1beta1_api',
+    'CoordinationApi': 'coordination_api',
+    'CoordinationV1Api': 'coordination_v1_api',
+    'CoordinationV1beta1Api': 'coordination_v1beta1_api',
+    'CoreApi': 'core_api',
+    'CoreV1Api': 'core_v1_api',
+    'CustomObjectsApi': 'custom_objects_api',
+    'DiscoveryApi': 'discovery_api',
+    'DiscoveryV1beta1Api': 'discovery_v1beta1_api',
+    'EventsApi': 'events_api',
+    'EventsV1beta1Api': 'events_v1beta1_api',
+    'ExtensionsApi': 'extensions_api',
+    'ExtensionsV1beta1Api': 'extensions_v1beta1_api',
+    'FlowcontrolApiserverApi': 'flowcontrol_apiserver_api',
+    'FlowcontrolApiserverV1alpha1Api': 'flowcontrol_apiserver_v1alpha1_api',
+    'LogsApi': 'logs_api',
+    'NetworkingApi': 'networking_api',
+    'NetworkingV1Api': 'networking_v1_api',
+    'NetworkingV1beta1Api': 'networking_v1beta1_api',
+    'NodeApi': 'node_api',
+    'NodeV1alpha1Api': 'node_v1alpha1_api',
+    'NodeV1beta1Api': 'node_v1beta1_api',
+    'PolicyApi': 'policy_api',
+    'PolicyV1beta1Api': 'policy_v1beta1_api',
+    'RbacAuthorizationApi': 'rbac_authorization_api',
+    'RbacAuthorizationV1Api': 'rbac_authorization_v1_api',
+    'RbacAuthorizationV1alpha1Api': 'rbac_authorization_v1alpha1_api',
+    'RbacAuthorizationV1beta1Api': 'rbac_authorization_v1beta1_api',
+    'SchedulingApi': 'scheduling_api',
+    'SchedulingV1Api': 'scheduling_v1_api',
+    'SchedulingV1alpha1Api': 'scheduling_v1alpha1_api',
+    'SchedulingV1beta1Api': 'scheduling_v1beta1_api',
+    'SettingsApi': 'settings_api',
+    'SettingsV1alpha1Api': 'settings_v1alpha1_api',
+    'StorageApi': 'storage_api',
+    'StorageV1Api': 'storage_v1_api',
+    'StorageV1alpha1Api': 'storage_v1alpha1_api',
+    'StorageV1beta1Api': 'storage_v1beta1_api',
+    'VersionApi': 'version_api',
+}
+
+__all__ = sorted(_APIS)
+
+
+def __getattr__(name):
+    module = _APIS.get(name)
+    if module is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(__name__ + '.' + module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_APIS))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) is not available, import eagerly
+    for _name in __all__:
+        __getattr__(_name)
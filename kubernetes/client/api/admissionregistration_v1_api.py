@@ -14,14 +14,12 @@ from __future__ import absolute_import
 
 import re  # noqa: F401
 
-# python 2 and python 3 compatibility library
-import six
-
 from kubernetes.client.api_client import ApiClient
 from kubernetes.client.exceptions import (  # noqa: F401
     ApiTypeError,
     ApiValueError
 )
+from kubernetes.client.operation import Operation
 
 
 class AdmissionregistrationV1Api(object):
@@ -91,79 +89,9 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_mutating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `create_mutating_webhook_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1MutatingWebhookConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['create_mutating_webhook_configuration'], kwargs)
 
     def create_validating_webhook_configuration(self, body, **kwargs):  # noqa: E501
         """create_validating_webhook_configuration  # noqa: E501
@@ -220,79 +148,9 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_validating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `create_validating_webhook_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1ValidatingWebhookConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['create_validating_webhook_configuration'], kwargs)
 
     def delete_collection_mutating_webhook_configuration(self, **kwargs):  # noqa: E501
         """delete_collection_mutating_webhook_configuration  # noqa: E501
@@ -365,99 +223,8 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'pretty',
-            '_continue',
-            'dry_run',
-            'field_selector',
-            'grace_period_seconds',
-            'label_selector',
-            'limit',
-            'orphan_dependents',
-            'propagation_policy',
-            'resource_version',
-            'timeout_seconds',
-            'body'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_collection_mutating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if '_continue' in local_var_params and local_var_params['_continue'] is not None:  # noqa: E501
-            query_params.append(('continue', local_var_params['_continue']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_selector' in local_var_params and local_var_params['field_selector'] is not None:  # noqa: E501
-            query_params.append(('fieldSelector', local_var_params['field_selector']))  # noqa: E501
-        if 'grace_period_seconds' in local_var_params and local_var_params['grace_period_seconds'] is not None:  # noqa: E501
-            query_params.append(('gracePeriodSeconds', local_var_params['grace_period_seconds']))  # noqa: E501
-        if 'label_selector' in local_var_params and local_var_params['label_selector'] is not None:  # noqa: E501
-            query_params.append(('labelSelector', local_var_params['label_selector']))  # noqa: E501
-        if 'limit' in local_var_params and local_var_params['limit'] is not None:  # noqa: E501
-            query_params.append(('limit', local_var_params['limit']))  # noqa: E501
-        if 'orphan_dependents' in local_var_params and local_var_params['orphan_dependents'] is not None:  # noqa: E501
-            query_params.append(('orphanDependents', local_var_params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in local_var_params and local_var_params['propagation_policy'] is not None:  # noqa: E501
-            query_params.append(('propagationPolicy', local_var_params['propagation_policy']))  # noqa: E501
-        if 'resource_version' in local_var_params and local_var_params['resource_version'] is not None:  # noqa: E501
-            query_params.append(('resourceVersion', local_var_params['resource_version']))  # noqa: E501
-        if 'timeout_seconds' in local_var_params and local_var_params['timeout_seconds'] is not None:  # noqa: E501
-            query_params.append(('timeoutSeconds', local_var_params['timeout_seconds']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1Status',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            _OPERATIONS['delete_collection_mutating_webhook_configuration'], kwargs)  # noqa: E501
 
     def delete_collection_validating_webhook_configuration(self, **kwargs):  # noqa: E501
         """delete_collection_validating_webhook_configuration  # noqa: E501
@@ -530,99 +297,8 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'pretty',
-            '_continue',
-            'dry_run',
-            'field_selector',
-            'grace_period_seconds',
-            'label_selector',
-            'limit',
-            'orphan_dependents',
-            'propagation_policy',
-            'resource_version',
-            'timeout_seconds',
-            'body'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_collection_validating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if '_continue' in local_var_params and local_var_params['_continue'] is not None:  # noqa: E501
-            query_params.append(('continue', local_var_params['_continue']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_selector' in local_var_params and local_var_params['field_selector'] is not None:  # noqa: E501
-            query_params.append(('fieldSelector', local_var_params['field_selector']))  # noqa: E501
-        if 'grace_period_seconds' in local_var_params and local_var_params['grace_period_seconds'] is not None:  # noqa: E501
-            query_params.append(('gracePeriodSeconds', local_var_params['grace_period_seconds']))  # noqa: E501
-        if 'label_selector' in local_var_params and local_var_params['label_selector'] is not None:  # noqa: E501
-            query_params.append(('labelSelector', local_var_params['label_selector']))  # noqa: E501
-        if 'limit' in local_var_params and local_var_params['limit'] is not None:  # noqa: E501
-            query_params.append(('limit', local_var_params['limit']))  # noqa: E501
-        if 'orphan_dependents' in local_var_params and local_var_params['orphan_dependents'] is not None:  # noqa: E501
-            query_params.append(('orphanDependents', local_var_params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in local_var_params and local_var_params['propagation_policy'] is not None:  # noqa: E501
-            query_params.append(('propagationPolicy', local_var_params['propagation_policy']))  # noqa: E501
-        if 'resource_version' in local_var_params and local_var_params['resource_version'] is not None:  # noqa: E501
-            query_params.append(('resourceVersion', local_var_params['resource_version']))  # noqa: E501
-        if 'timeout_seconds' in local_var_params and local_var_params['timeout_seconds'] is not None:  # noqa: E501
-            query_params.append(('timeoutSeconds', local_var_params['timeout_seconds']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1Status',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            _OPERATIONS['delete_collection_validating_webhook_configuration'], kwargs)  # noqa: E501
 
     def delete_mutating_webhook_configuration(self, name, **kwargs):  # noqa: E501
         """delete_mutating_webhook_configuration  # noqa: E501
@@ -685,88 +361,9 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'pretty',
-            'dry_run',
-            'grace_period_seconds',
-            'orphan_dependents',
-            'propagation_policy',
-            'body'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_mutating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `delete_mutating_webhook_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'grace_period_seconds' in local_var_params and local_var_params['grace_period_seconds'] is not None:  # noqa: E501
-            query_params.append(('gracePeriodSeconds', local_var_params['grace_period_seconds']))  # noqa: E501
-        if 'orphan_dependents' in local_var_params and local_var_params['orphan_dependents'] is not None:  # noqa: E501
-            query_params.append(('orphanDependents', local_var_params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in local_var_params and local_var_params['propagation_policy'] is not None:  # noqa: E501
-            query_params.append(('propagationPolicy', local_var_params['propagation_policy']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations/{name}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1Status',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['delete_mutating_webhook_configuration'], kwargs)
 
     def delete_validating_webhook_configuration(self, name, **kwargs):  # noqa: E501
         """delete_validating_webhook_configuration  # noqa: E501
@@ -829,88 +426,9 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'pretty',
-            'dry_run',
-            'grace_period_seconds',
-            'orphan_dependents',
-            'propagation_policy',
-            'body'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_validating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `delete_validating_webhook_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'grace_period_seconds' in local_var_params and local_var_params['grace_period_seconds'] is not None:  # noqa: E501
-            query_params.append(('gracePeriodSeconds', local_var_params['grace_period_seconds']))  # noqa: E501
-        if 'orphan_dependents' in local_var_params and local_var_params['orphan_dependents'] is not None:  # noqa: E501
-            query_params.append(('orphanDependents', local_var_params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in local_var_params and local_var_params['propagation_policy'] is not None:  # noqa: E501
-            query_params.append(('propagationPolicy', local_var_params['propagation_policy']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations/{name}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1Status',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['delete_validating_webhook_configuration'], kwargs)
 
     def get_api_resources(self, **kwargs):  # noqa: E501
         """get_api_resources  # noqa: E501
@@ -959,63 +477,8 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_api_resources" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1APIResourceList',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            _OPERATIONS['get_api_resources'], kwargs)
 
     def list_mutating_webhook_configuration(self, **kwargs):  # noqa: E501
         """list_mutating_webhook_configuration  # noqa: E501
@@ -1082,90 +545,8 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'pretty',
-            'allow_watch_bookmarks',
-            '_continue',
-            'field_selector',
-            'label_selector',
-            'limit',
-            'resource_version',
-            'timeout_seconds',
-            'watch'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_mutating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'allow_watch_bookmarks' in local_var_params and local_var_params['allow_watch_bookmarks'] is not None:  # noqa: E501
-            query_params.append(('allowWatchBookmarks', local_var_params['allow_watch_bookmarks']))  # noqa: E501
-        if '_continue' in local_var_params and local_var_params['_continue'] is not None:  # noqa: E501
-            query_params.append(('continue', local_var_params['_continue']))  # noqa: E501
-        if 'field_selector' in local_var_params and local_var_params['field_selector'] is not None:  # noqa: E501
-            query_params.append(('fieldSelector', local_var_params['field_selector']))  # noqa: E501
-        if 'label_selector' in local_var_params and local_var_params['label_selector'] is not None:  # noqa: E501
-            query_params.append(('labelSelector', local_var_params['label_selector']))  # noqa: E501
-        if 'limit' in local_var_params and local_var_params['limit'] is not None:  # noqa: E501
-            query_params.append(('limit', local_var_params['limit']))  # noqa: E501
-        if 'resource_version' in local_var_params and local_var_params['resource_version'] is not None:  # noqa: E501
-            query_params.append(('resourceVersion', local_var_params['resource_version']))  # noqa: E501
-        if 'timeout_seconds' in local_var_params and local_var_params['timeout_seconds'] is not None:  # noqa: E501
-            query_params.append(('timeoutSeconds', local_var_params['timeout_seconds']))  # noqa: E501
-        if 'watch' in local_var_params and local_var_params['watch'] is not None:  # noqa: E501
-            query_params.append(('watch', local_var_params['watch']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1MutatingWebhookConfigurationList',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            _OPERATIONS['list_mutating_webhook_configuration'], kwargs)
 
     def list_validating_webhook_configuration(self, **kwargs):  # noqa: E501
         """list_validating_webhook_configuration  # noqa: E501
@@ -1232,90 +613,8 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'pretty',
-            'allow_watch_bookmarks',
-            '_continue',
-            'field_selector',
-            'label_selector',
-            'limit',
-            'resource_version',
-            'timeout_seconds',
-            'watch'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_validating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'allow_watch_bookmarks' in local_var_params and local_var_params['allow_watch_bookmarks'] is not None:  # noqa: E501
-            query_params.append(('allowWatchBookmarks', local_var_params['allow_watch_bookmarks']))  # noqa: E501
-        if '_continue' in local_var_params and local_var_params['_continue'] is not None:  # noqa: E501
-            query_params.append(('continue', local_var_params['_continue']))  # noqa: E501
-        if 'field_selector' in local_var_params and local_var_params['field_selector'] is not None:  # noqa: E501
-            query_params.append(('fieldSelector', local_var_params['field_selector']))  # noqa: E501
-        if 'label_selector' in local_var_params and local_var_params['label_selector'] is not None:  # noqa: E501
-            query_params.append(('labelSelector', local_var_params['label_selector']))  # noqa: E501
-        if 'limit' in local_var_params and local_var_params['limit'] is not None:  # noqa: E501
-            query_params.append(('limit', local_var_params['limit']))  # noqa: E501
-        if 'resource_version' in local_var_params and local_var_params['resource_version'] is not None:  # noqa: E501
-            query_params.append(('resourceVersion', local_var_params['resource_version']))  # noqa: E501
-        if 'timeout_seconds' in local_var_params and local_var_params['timeout_seconds'] is not None:  # noqa: E501
-            query_params.append(('timeoutSeconds', local_var_params['timeout_seconds']))  # noqa: E501
-        if 'watch' in local_var_params and local_var_params['watch'] is not None:  # noqa: E501
-            query_params.append(('watch', local_var_params['watch']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1ValidatingWebhookConfigurationList',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            _OPERATIONS['list_validating_webhook_configuration'], kwargs)
 
     def patch_mutating_webhook_configuration(self, name, body, **kwargs):  # noqa: E501
         """patch_mutating_webhook_configuration  # noqa: E501
@@ -1376,93 +675,10 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager',
-            'force'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_mutating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `patch_mutating_webhook_configuration`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `patch_mutating_webhook_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-        if 'force' in local_var_params and local_var_params['force'] is not None:  # noqa: E501
-            query_params.append(('force', local_var_params['force']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json', 'application/apply-patch+yaml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations/{name}', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1MutatingWebhookConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['patch_mutating_webhook_configuration'], kwargs)
 
     def patch_validating_webhook_configuration(self, name, body, **kwargs):  # noqa: E501
         """patch_validating_webhook_configuration  # noqa: E501
@@ -1523,93 +739,10 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager',
-            'force'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_validating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `patch_validating_webhook_configuration`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `patch_validating_webhook_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-        if 'force' in local_var_params and local_var_params['force'] is not None:  # noqa: E501
-            query_params.append(('force', local_var_params['force']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json', 'application/apply-patch+yaml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations/{name}', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1ValidatingWebhookConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['patch_validating_webhook_configuration'], kwargs)
 
     def read_mutating_webhook_configuration(self, name, **kwargs):  # noqa: E501
         """read_mutating_webhook_configuration  # noqa: E501
@@ -1666,79 +799,9 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'pretty',
-            'exact',
-            'export'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_mutating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `read_mutating_webhook_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'exact' in local_var_params and local_var_params['exact'] is not None:  # noqa: E501
-            query_params.append(('exact', local_var_params['exact']))  # noqa: E501
-        if 'export' in local_var_params and local_var_params['export'] is not None:  # noqa: E501
-            query_params.append(('export', local_var_params['export']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations/{name}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1MutatingWebhookConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['read_mutating_webhook_configuration'], kwargs)
 
     def read_validating_webhook_configuration(self, name, **kwargs):  # noqa: E501
         """read_validating_webhook_configuration  # noqa: E501
@@ -1795,79 +858,9 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'pretty',
-            'exact',
-            'export'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_validating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `read_validating_webhook_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'exact' in local_var_params and local_var_params['exact'] is not None:  # noqa: E501
-            query_params.append(('exact', local_var_params['exact']))  # noqa: E501
-        if 'export' in local_var_params and local_var_params['export'] is not None:  # noqa: E501
-            query_params.append(('export', local_var_params['export']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations/{name}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1ValidatingWebhookConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['read_validating_webhook_configuration'], kwargs)
 
     def replace_mutating_webhook_configuration(self, name, body, **kwargs):  # noqa: E501
         """replace_mutating_webhook_configuration  # noqa: E501
@@ -1926,86 +919,10 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_mutating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `replace_mutating_webhook_configuration`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `replace_mutating_webhook_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations/{name}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1MutatingWebhookConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['replace_mutating_webhook_configuration'], kwargs)
 
     def replace_validating_webhook_configuration(self, name, body, **kwargs):  # noqa: E501
         """replace_validating_webhook_configuration  # noqa: E501
@@ -2064,83 +981,130 @@ class AdmissionregistrationV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_validating_webhook_configuration" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `replace_validating_webhook_configuration`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `replace_validating_webhook_configuration`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations/{name}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1ValidatingWebhookConfiguration',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['replace_validating_webhook_configuration'], kwargs)
+
+
+_OPERATIONS = dict((op.name, op) for op in [
+    Operation(
+        'create_mutating_webhook_configuration', 'POST', '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations',  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['body'],
+        response_type='V1MutatingWebhookConfiguration',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'create_validating_webhook_configuration', 'POST', '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations',  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['body'],
+        response_type='V1ValidatingWebhookConfiguration',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'delete_collection_mutating_webhook_configuration', 'DELETE', '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations',  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('_continue', 'continue'), ('dry_run', 'dryRun'), ('field_selector', 'fieldSelector'), ('grace_period_seconds', 'gracePeriodSeconds'), ('label_selector', 'labelSelector'), ('limit', 'limit'), ('orphan_dependents', 'orphanDependents'), ('propagation_policy', 'propagationPolicy'), ('resource_version', 'resourceVersion'), ('timeout_seconds', 'timeoutSeconds')],  # noqa: E501
+        body='body',
+        response_type='V1Status',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'delete_collection_validating_webhook_configuration', 'DELETE', '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations',  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('_continue', 'continue'), ('dry_run', 'dryRun'), ('field_selector', 'fieldSelector'), ('grace_period_seconds', 'gracePeriodSeconds'), ('label_selector', 'labelSelector'), ('limit', 'limit'), ('orphan_dependents', 'orphanDependents'), ('propagation_policy', 'propagationPolicy'), ('resource_version', 'resourceVersion'), ('timeout_seconds', 'timeoutSeconds')],  # noqa: E501
+        body='body',
+        response_type='V1Status',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'delete_mutating_webhook_configuration', 'DELETE', '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('grace_period_seconds', 'gracePeriodSeconds'), ('orphan_dependents', 'orphanDependents'), ('propagation_policy', 'propagationPolicy')],  # noqa: E501
+        body='body',
+        required=['name'],
+        response_type='V1Status',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'delete_validating_webhook_configuration', 'DELETE', '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('grace_period_seconds', 'gracePeriodSeconds'), ('orphan_dependents', 'orphanDependents'), ('propagation_policy', 'propagationPolicy')],  # noqa: E501
+        body='body',
+        required=['name'],
+        response_type='V1Status',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'get_api_resources', 'GET', '/apis/admissionregistration.k8s.io/v1/',
+        response_type='V1APIResourceList',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'list_mutating_webhook_configuration', 'GET', '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations',  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('allow_watch_bookmarks', 'allowWatchBookmarks'), ('_continue', 'continue'), ('field_selector', 'fieldSelector'), ('label_selector', 'labelSelector'), ('limit', 'limit'), ('resource_version', 'resourceVersion'), ('timeout_seconds', 'timeoutSeconds'), ('watch', 'watch')],  # noqa: E501
+        response_type='V1MutatingWebhookConfigurationList',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'],  # noqa: E501
+    ),
+    Operation(
+        'list_validating_webhook_configuration', 'GET', '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations',  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('allow_watch_bookmarks', 'allowWatchBookmarks'), ('_continue', 'continue'), ('field_selector', 'fieldSelector'), ('label_selector', 'labelSelector'), ('limit', 'limit'), ('resource_version', 'resourceVersion'), ('timeout_seconds', 'timeoutSeconds'), ('watch', 'watch')],  # noqa: E501
+        response_type='V1ValidatingWebhookConfigurationList',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'],  # noqa: E501
+    ),
+    Operation(
+        'patch_mutating_webhook_configuration', 'PATCH', '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager'), ('force', 'force')],  # noqa: E501
+        body='body',
+        required=['name', 'body'],
+        response_type='V1MutatingWebhookConfiguration',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+        content_types=['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json', 'application/apply-patch+yaml'],  # noqa: E501
+    ),
+    Operation(
+        'patch_validating_webhook_configuration', 'PATCH', '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager'), ('force', 'force')],  # noqa: E501
+        body='body',
+        required=['name', 'body'],
+        response_type='V1ValidatingWebhookConfiguration',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+        content_types=['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json', 'application/apply-patch+yaml'],  # noqa: E501
+    ),
+    Operation(
+        'read_mutating_webhook_configuration', 'GET', '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('exact', 'exact'), ('export', 'export')],  # noqa: E501
+        required=['name'],
+        response_type='V1MutatingWebhookConfiguration',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'read_validating_webhook_configuration', 'GET', '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('exact', 'exact'), ('export', 'export')],  # noqa: E501
+        required=['name'],
+        response_type='V1ValidatingWebhookConfiguration',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'replace_mutating_webhook_configuration', 'PUT', '/apis/admissionregistration.k8s.io/v1/mutatingwebhookconfigurations/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['name', 'body'],
+        response_type='V1MutatingWebhookConfiguration',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'replace_validating_webhook_configuration', 'PUT', '/apis/admissionregistration.k8s.io/v1/validatingwebhookconfigurations/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['name', 'body'],
+        response_type='V1ValidatingWebhookConfiguration',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+])
@@ -14,14 +14,12 @@ from __future__ import absolute_import
 
 import re  # noqa: F401
 
-# python 2 and python 3 compatibility library
-import six
-
 from kubernetes.client.api_client import ApiClient
 from kubernetes.client.exceptions import (  # noqa: F401
     ApiTypeError,
     ApiValueError
 )
+from kubernetes.client.operation import Operation
 
 
 class ApiextensionsApi(object):
@@ -83,60 +81,14 @@ class ApiextensionsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
+        return self.api_client.call_operation(
+            _OPERATIONS['get_api_group'], kwargs)
+
 
-        local_var_params = locals()
-
-        all_params = [
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_api_group" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1APIGroup',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+_OPERATIONS = dict((op.name, op) for op in [
+    Operation(
+        'get_api_group', 'GET', '/apis/apiextensions.k8s.io/',
+        response_type='V1APIGroup',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+])
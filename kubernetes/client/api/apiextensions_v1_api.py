@@ -14,14 +14,12 @@ from __future__ import absolute_import
 
 import re  # noqa: F401
 
-# python 2 and python 3 compatibility library
-import six
-
 from kubernetes.client.api_client import ApiClient
 from kubernetes.client.exceptions import (  # noqa: F401
     ApiTypeError,
     ApiValueError
 )
+from kubernetes.client.operation import Operation
 
 
 class ApiextensionsV1Api(object):
@@ -91,79 +89,9 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_custom_resource_definition" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `create_custom_resource_definition`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/customresourcedefinitions', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1CustomResourceDefinition',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['create_custom_resource_definition'], kwargs)
 
     def delete_collection_custom_resource_definition(self, **kwargs):  # noqa: E501
         """delete_collection_custom_resource_definition  # noqa: E501
@@ -236,99 +164,8 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'pretty',
-            '_continue',
-            'dry_run',
-            'field_selector',
-            'grace_period_seconds',
-            'label_selector',
-            'limit',
-            'orphan_dependents',
-            'propagation_policy',
-            'resource_version',
-            'timeout_seconds',
-            'body'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_collection_custom_resource_definition" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if '_continue' in local_var_params and local_var_params['_continue'] is not None:  # noqa: E501
-            query_params.append(('continue', local_var_params['_continue']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_selector' in local_var_params and local_var_params['field_selector'] is not None:  # noqa: E501
-            query_params.append(('fieldSelector', local_var_params['field_selector']))  # noqa: E501
-        if 'grace_period_seconds' in local_var_params and local_var_params['grace_period_seconds'] is not None:  # noqa: E501
-            query_params.append(('gracePeriodSeconds', local_var_params['grace_period_seconds']))  # noqa: E501
-        if 'label_selector' in local_var_params and local_var_params['label_selector'] is not None:  # noqa: E501
-            query_params.append(('labelSelector', local_var_params['label_selector']))  # noqa: E501
-        if 'limit' in local_var_params and local_var_params['limit'] is not None:  # noqa: E501
-            query_params.append(('limit', local_var_params['limit']))  # noqa: E501
-        if 'orphan_dependents' in local_var_params and local_var_params['orphan_dependents'] is not None:  # noqa: E501
-            query_params.append(('orphanDependents', local_var_params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in local_var_params and local_var_params['propagation_policy'] is not None:  # noqa: E501
-            query_params.append(('propagationPolicy', local_var_params['propagation_policy']))  # noqa: E501
-        if 'resource_version' in local_var_params and local_var_params['resource_version'] is not None:  # noqa: E501
-            query_params.append(('resourceVersion', local_var_params['resource_version']))  # noqa: E501
-        if 'timeout_seconds' in local_var_params and local_var_params['timeout_seconds'] is not None:  # noqa: E501
-            query_params.append(('timeoutSeconds', local_var_params['timeout_seconds']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/customresourcedefinitions', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1Status',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            _OPERATIONS['delete_collection_custom_resource_definition'], kwargs)  # noqa: E501
 
     def delete_custom_resource_definition(self, name, **kwargs):  # noqa: E501
         """delete_custom_resource_definition  # noqa: E501
@@ -391,88 +228,9 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'pretty',
-            'dry_run',
-            'grace_period_seconds',
-            'orphan_dependents',
-            'propagation_policy',
-            'body'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_custom_resource_definition" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `delete_custom_resource_definition`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'grace_period_seconds' in local_var_params and local_var_params['grace_period_seconds'] is not None:  # noqa: E501
-            query_params.append(('gracePeriodSeconds', local_var_params['grace_period_seconds']))  # noqa: E501
-        if 'orphan_dependents' in local_var_params and local_var_params['orphan_dependents'] is not None:  # noqa: E501
-            query_params.append(('orphanDependents', local_var_params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in local_var_params and local_var_params['propagation_policy'] is not None:  # noqa: E501
-            query_params.append(('propagationPolicy', local_var_params['propagation_policy']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1Status',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['delete_custom_resource_definition'], kwargs)
 
     def get_api_resources(self, **kwargs):  # noqa: E501
         """get_api_resources  # noqa: E501
@@ -521,63 +279,8 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_api_resources" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1APIResourceList',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            _OPERATIONS['get_api_resources'], kwargs)
 
     def list_custom_resource_definition(self, **kwargs):  # noqa: E501
         """list_custom_resource_definition  # noqa: E501
@@ -644,90 +347,8 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'pretty',
-            'allow_watch_bookmarks',
-            '_continue',
-            'field_selector',
-            'label_selector',
-            'limit',
-            'resource_version',
-            'timeout_seconds',
-            'watch'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_custom_resource_definition" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-
-        collection_formats = {}
-
-        path_params = {}
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'allow_watch_bookmarks' in local_var_params and local_var_params['allow_watch_bookmarks'] is not None:  # noqa: E501
-            query_params.append(('allowWatchBookmarks', local_var_params['allow_watch_bookmarks']))  # noqa: E501
-        if '_continue' in local_var_params and local_var_params['_continue'] is not None:  # noqa: E501
-            query_params.append(('continue', local_var_params['_continue']))  # noqa: E501
-        if 'field_selector' in local_var_params and local_var_params['field_selector'] is not None:  # noqa: E501
-            query_params.append(('fieldSelector', local_var_params['field_selector']))  # noqa: E501
-        if 'label_selector' in local_var_params and local_var_params['label_selector'] is not None:  # noqa: E501
-            query_params.append(('labelSelector', local_var_params['label_selector']))  # noqa: E501
-        if 'limit' in local_var_params and local_var_params['limit'] is not None:  # noqa: E501
-            query_params.append(('limit', local_var_params['limit']))  # noqa: E501
-        if 'resource_version' in local_var_params and local_var_params['resource_version'] is not None:  # noqa: E501
-            query_params.append(('resourceVersion', local_var_params['resource_version']))  # noqa: E501
-        if 'timeout_seconds' in local_var_params and local_var_params['timeout_seconds'] is not None:  # noqa: E501
-            query_params.append(('timeoutSeconds', local_var_params['timeout_seconds']))  # noqa: E501
-        if 'watch' in local_var_params and local_var_params['watch'] is not None:  # noqa: E501
-            query_params.append(('watch', local_var_params['watch']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/customresourcedefinitions', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1CustomResourceDefinitionList',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        return self.api_client.call_operation(
+            _OPERATIONS['list_custom_resource_definition'], kwargs)
 
     def patch_custom_resource_definition(self, name, body, **kwargs):  # noqa: E501
         """patch_custom_resource_definition  # noqa: E501
@@ -788,93 +409,10 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager',
-            'force'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_custom_resource_definition" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `patch_custom_resource_definition`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `patch_custom_resource_definition`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-        if 'force' in local_var_params and local_var_params['force'] is not None:  # noqa: E501
-            query_params.append(('force', local_var_params['force']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json', 'application/apply-patch+yaml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1CustomResourceDefinition',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['patch_custom_resource_definition'], kwargs)
 
     def patch_custom_resource_definition_status(self, name, body, **kwargs):  # noqa: E501
         """patch_custom_resource_definition_status  # noqa: E501
@@ -935,93 +473,10 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager',
-            'force'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_custom_resource_definition_status" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `patch_custom_resource_definition_status`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `patch_custom_resource_definition_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-        if 'force' in local_var_params and local_var_params['force'] is not None:  # noqa: E501
-            query_params.append(('force', local_var_params['force']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json', 'application/apply-patch+yaml'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}/status', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1CustomResourceDefinition',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['patch_custom_resource_definition_status'], kwargs)
 
     def read_custom_resource_definition(self, name, **kwargs):  # noqa: E501
         """read_custom_resource_definition  # noqa: E501
@@ -1078,79 +533,9 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'pretty',
-            'exact',
-            'export'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_custom_resource_definition" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `read_custom_resource_definition`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'exact' in local_var_params and local_var_params['exact'] is not None:  # noqa: E501
-            query_params.append(('exact', local_var_params['exact']))  # noqa: E501
-        if 'export' in local_var_params and local_var_params['export'] is not None:  # noqa: E501
-            query_params.append(('export', local_var_params['export']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1CustomResourceDefinition',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['read_custom_resource_definition'], kwargs)
 
     def read_custom_resource_definition_status(self, name, **kwargs):  # noqa: E501
         """read_custom_resource_definition_status  # noqa: E501
@@ -1203,73 +588,9 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'pretty'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method read_custom_resource_definition_status" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `read_custom_resource_definition_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}/status', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1CustomResourceDefinition',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['read_custom_resource_definition_status'], kwargs)
 
     def replace_custom_resource_definition(self, name, body, **kwargs):  # noqa: E501
         """replace_custom_resource_definition  # noqa: E501
@@ -1328,86 +649,10 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_custom_resource_definition" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `replace_custom_resource_definition`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `replace_custom_resource_definition`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1CustomResourceDefinition',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['replace_custom_resource_definition'], kwargs)
 
     def replace_custom_resource_definition_status(self, name, body, **kwargs):  # noqa: E501
         """replace_custom_resource_definition_status  # noqa: E501
@@ -1466,83 +711,100 @@ class ApiextensionsV1Api(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'name',
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_custom_resource_definition_status" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `replace_custom_resource_definition_status`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `replace_custom_resource_definition_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}/status', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='V1CustomResourceDefinition',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['replace_custom_resource_definition_status'], kwargs)
+
+
+_OPERATIONS = dict((op.name, op) for op in [
+    Operation(
+        'create_custom_resource_definition', 'POST', '/apis/apiextensions.k8s.io/v1/customresourcedefinitions',  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['body'],
+        response_type='V1CustomResourceDefinition',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'delete_collection_custom_resource_definition', 'DELETE', '/apis/apiextensions.k8s.io/v1/customresourcedefinitions',  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('_continue', 'continue'), ('dry_run', 'dryRun'), ('field_selector', 'fieldSelector'), ('grace_period_seconds', 'gracePeriodSeconds'), ('label_selector', 'labelSelector'), ('limit', 'limit'), ('orphan_dependents', 'orphanDependents'), ('propagation_policy', 'propagationPolicy'), ('resource_version', 'resourceVersion'), ('timeout_seconds', 'timeoutSeconds')],  # noqa: E501
+        body='body',
+        response_type='V1Status',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'delete_custom_resource_definition', 'DELETE', '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('grace_period_seconds', 'gracePeriodSeconds'), ('orphan_dependents', 'orphanDependents'), ('propagation_policy', 'propagationPolicy')],  # noqa: E501
+        body='body',
+        required=['name'],
+        response_type='V1Status',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'get_api_resources', 'GET', '/apis/apiextensions.k8s.io/v1/',
+        response_type='V1APIResourceList',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'list_custom_resource_definition', 'GET', '/apis/apiextensions.k8s.io/v1/customresourcedefinitions',  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('allow_watch_bookmarks', 'allowWatchBookmarks'), ('_continue', 'continue'), ('field_selector', 'fieldSelector'), ('label_selector', 'labelSelector'), ('limit', 'limit'), ('resource_version', 'resourceVersion'), ('timeout_seconds', 'timeoutSeconds'), ('watch', 'watch')],  # noqa: E501
+        response_type='V1CustomResourceDefinitionList',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf', 'application/json;stream=watch', 'application/vnd.kubernetes.protobuf;stream=watch'],  # noqa: E501
+    ),
+    Operation(
+        'patch_custom_resource_definition', 'PATCH', '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager'), ('force', 'force')],  # noqa: E501
+        body='body',
+        required=['name', 'body'],
+        response_type='V1CustomResourceDefinition',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+        content_types=['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json', 'application/apply-patch+yaml'],  # noqa: E501
+    ),
+    Operation(
+        'patch_custom_resource_definition_status', 'PATCH', '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}/status',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager'), ('force', 'force')],  # noqa: E501
+        body='body',
+        required=['name', 'body'],
+        response_type='V1CustomResourceDefinition',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+        content_types=['application/json-patch+json', 'application/merge-patch+json', 'application/strategic-merge-patch+json', 'application/apply-patch+yaml'],  # noqa: E501
+    ),
+    Operation(
+        'read_custom_resource_definition', 'GET', '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('exact', 'exact'), ('export', 'export')],  # noqa: E501
+        required=['name'],
+        response_type='V1CustomResourceDefinition',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'read_custom_resource_definition_status', 'GET', '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}/status',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty')],
+        required=['name'],
+        response_type='V1CustomResourceDefinition',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'replace_custom_resource_definition', 'PUT', '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['name', 'body'],
+        response_type='V1CustomResourceDefinition',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'replace_custom_resource_definition_status', 'PUT', '/apis/apiextensions.k8s.io/v1/customresourcedefinitions/{name}/status',  # noqa: E501
+        path_params=[('name', 'name')],
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['name', 'body'],
+        response_type='V1CustomResourceDefinition',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+])
@@ -14,14 +14,12 @@ from __future__ import absolute_import
 
 import re  # noqa: F401
 
-# python 2 and python 3 compatibility library
-import six
-
 from kubernetes.client.api_client import ApiClient
 from kubernetes.client.exceptions import (  # noqa: F401
     ApiTypeError,
     ApiValueError
 )
+from kubernetes.client.operation import Operation
 
 
 class CustomObjectsApi(object):
@@ -97,100 +95,12 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_cluster_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `create_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `create_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `create_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `create_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['create_cluster_custom_object'], kwargs)
 
     def create_namespaced_custom_object(self, group, version, namespace, plural, body, **kwargs):  # noqa: E501
         """create_namespaced_custom_object  # noqa: E501
@@ -255,107 +165,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'body',
-            'pretty',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method create_namespaced_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `create_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `create_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `create_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `create_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `create_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}', 'POST',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['create_namespaced_custom_object'], kwargs)
 
     def delete_cluster_custom_object(self, group, version, plural, name, **kwargs):  # noqa: E501
         """delete_cluster_custom_object  # noqa: E501
@@ -422,106 +238,12 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'name',
-            'grace_period_seconds',
-            'orphan_dependents',
-            'propagation_policy',
-            'dry_run',
-            'body'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_cluster_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `delete_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `delete_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `delete_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `delete_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'grace_period_seconds' in local_var_params and local_var_params['grace_period_seconds'] is not None:  # noqa: E501
-            query_params.append(('gracePeriodSeconds', local_var_params['grace_period_seconds']))  # noqa: E501
-        if 'orphan_dependents' in local_var_params and local_var_params['orphan_dependents'] is not None:  # noqa: E501
-            query_params.append(('orphanDependents', local_var_params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in local_var_params and local_var_params['propagation_policy'] is not None:  # noqa: E501
-            query_params.append(('propagationPolicy', local_var_params['propagation_policy']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['delete_cluster_custom_object'], kwargs)
 
     def delete_collection_cluster_custom_object(self, group, version, plural, **kwargs):  # noqa: E501
         """delete_collection_cluster_custom_object  # noqa: E501
@@ -588,102 +310,11 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'pretty',
-            'grace_period_seconds',
-            'orphan_dependents',
-            'propagation_policy',
-            'dry_run',
-            'body'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_collection_cluster_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `delete_collection_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `delete_collection_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `delete_collection_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'grace_period_seconds' in local_var_params and local_var_params['grace_period_seconds'] is not None:  # noqa: E501
-            query_params.append(('gracePeriodSeconds', local_var_params['grace_period_seconds']))  # noqa: E501
-        if 'orphan_dependents' in local_var_params and local_var_params['orphan_dependents'] is not None:  # noqa: E501
-            query_params.append(('orphanDependents', local_var_params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in local_var_params and local_var_params['propagation_policy'] is not None:  # noqa: E501
-            query_params.append(('propagationPolicy', local_var_params['propagation_policy']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        return self.api_client.call_operation(
+            _OPERATIONS['delete_collection_cluster_custom_object'], kwargs)
 
     def delete_collection_namespaced_custom_object(self, group, version, namespace, plural, **kwargs):  # noqa: E501
         """delete_collection_namespaced_custom_object  # noqa: E501
@@ -752,109 +383,12 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'pretty',
-            'grace_period_seconds',
-            'orphan_dependents',
-            'propagation_policy',
-            'dry_run',
-            'body'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_collection_namespaced_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `delete_collection_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `delete_collection_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `delete_collection_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `delete_collection_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if 'grace_period_seconds' in local_var_params and local_var_params['grace_period_seconds'] is not None:  # noqa: E501
-            query_params.append(('gracePeriodSeconds', local_var_params['grace_period_seconds']))  # noqa: E501
-        if 'orphan_dependents' in local_var_params and local_var_params['orphan_dependents'] is not None:  # noqa: E501
-            query_params.append(('orphanDependents', local_var_params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in local_var_params and local_var_params['propagation_policy'] is not None:  # noqa: E501
-            query_params.append(('propagationPolicy', local_var_params['propagation_policy']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        return self.api_client.call_operation(
+            _OPERATIONS['delete_collection_namespaced_custom_object'], kwargs)
 
     def delete_namespaced_custom_object(self, group, version, namespace, plural, name, **kwargs):  # noqa: E501
         """delete_namespaced_custom_object  # noqa: E501
@@ -923,113 +457,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'name',
-            'grace_period_seconds',
-            'orphan_dependents',
-            'propagation_policy',
-            'dry_run',
-            'body'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method delete_namespaced_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `delete_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `delete_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `delete_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `delete_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `delete_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'grace_period_seconds' in local_var_params and local_var_params['grace_period_seconds'] is not None:  # noqa: E501
-            query_params.append(('gracePeriodSeconds', local_var_params['grace_period_seconds']))  # noqa: E501
-        if 'orphan_dependents' in local_var_params and local_var_params['orphan_dependents'] is not None:  # noqa: E501
-            query_params.append(('orphanDependents', local_var_params['orphan_dependents']))  # noqa: E501
-        if 'propagation_policy' in local_var_params and local_var_params['propagation_policy'] is not None:  # noqa: E501
-            query_params.append(('propagationPolicy', local_var_params['propagation_policy']))  # noqa: E501
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'DELETE',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['delete_namespaced_custom_object'], kwargs)
 
     def get_cluster_custom_object(self, group, version, plural, name, **kwargs):  # noqa: E501
         """get_cluster_custom_object  # noqa: E501
@@ -1086,91 +520,12 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'name'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_cluster_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `get_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `get_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `get_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `get_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['get_cluster_custom_object'], kwargs)
 
     def get_cluster_custom_object_scale(self, group, version, plural, name, **kwargs):  # noqa: E501
         """get_cluster_custom_object_scale  # noqa: E501
@@ -1227,91 +582,12 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'name'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_cluster_custom_object_scale" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `get_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `get_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `get_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `get_cluster_custom_object_scale`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}/scale', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['get_cluster_custom_object_scale'], kwargs)
 
     def get_cluster_custom_object_status(self, group, version, plural, name, **kwargs):  # noqa: E501
         """get_cluster_custom_object_status  # noqa: E501
@@ -1368,91 +644,12 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'name'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_cluster_custom_object_status" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `get_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `get_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `get_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `get_cluster_custom_object_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}/status', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['get_cluster_custom_object_status'], kwargs)
 
     def get_namespaced_custom_object(self, group, version, namespace, plural, name, **kwargs):  # noqa: E501
         """get_namespaced_custom_object  # noqa: E501
@@ -1511,98 +708,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'name'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_namespaced_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `get_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `get_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `get_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `get_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `get_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['get_namespaced_custom_object'], kwargs)
 
     def get_namespaced_custom_object_scale(self, group, version, namespace, plural, name, **kwargs):  # noqa: E501
         """get_namespaced_custom_object_scale  # noqa: E501
@@ -1661,98 +773,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'name'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_namespaced_custom_object_scale" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `get_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `get_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `get_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `get_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `get_namespaced_custom_object_scale`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['get_namespaced_custom_object_scale'], kwargs)
 
     def get_namespaced_custom_object_status(self, group, version, namespace, plural, name, **kwargs):  # noqa: E501
         """get_namespaced_custom_object_status  # noqa: E501
@@ -1811,98 +838,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'name'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method get_namespaced_custom_object_status" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `get_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `get_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `get_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `get_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `get_namespaced_custom_object_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        return self.api_client.call_operation(
+            _OPERATIONS['get_namespaced_custom_object_status'], kwargs)
 
     def list_cluster_custom_object(self, group, version, plural, **kwargs):  # noqa: E501
         """list_cluster_custom_object  # noqa: E501
@@ -1973,108 +915,11 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'pretty',
-            '_continue',
-            'field_selector',
-            'label_selector',
-            'limit',
-            'resource_version',
-            'timeout_seconds',
-            'watch'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_cluster_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `list_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `list_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `list_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if '_continue' in local_var_params and local_var_params['_continue'] is not None:  # noqa: E501
-            query_params.append(('continue', local_var_params['_continue']))  # noqa: E501
-        if 'field_selector' in local_var_params and local_var_params['field_selector'] is not None:  # noqa: E501
-            query_params.append(('fieldSelector', local_var_params['field_selector']))  # noqa: E501
-        if 'label_selector' in local_var_params and local_var_params['label_selector'] is not None:  # noqa: E501
-            query_params.append(('labelSelector', local_var_params['label_selector']))  # noqa: E501
-        if 'limit' in local_var_params and local_var_params['limit'] is not None:  # noqa: E501
-            query_params.append(('limit', local_var_params['limit']))  # noqa: E501
-        if 'resource_version' in local_var_params and local_var_params['resource_version'] is not None:  # noqa: E501
-            query_params.append(('resourceVersion', local_var_params['resource_version']))  # noqa: E501
-        if 'timeout_seconds' in local_var_params and local_var_params['timeout_seconds'] is not None:  # noqa: E501
-            query_params.append(('timeoutSeconds', local_var_params['timeout_seconds']))  # noqa: E501
-        if 'watch' in local_var_params and local_var_params['watch'] is not None:  # noqa: E501
-            query_params.append(('watch', local_var_params['watch']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/json;stream=watch'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        return self.api_client.call_operation(
+            _OPERATIONS['list_cluster_custom_object'], kwargs)
 
     def list_namespaced_custom_object(self, group, version, namespace, plural, **kwargs):  # noqa: E501
         """list_namespaced_custom_object  # noqa: E501
@@ -2147,115 +992,12 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'pretty',
-            '_continue',
-            'field_selector',
-            'label_selector',
-            'limit',
-            'resource_version',
-            'timeout_seconds',
-            'watch'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method list_namespaced_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `list_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `list_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `list_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `list_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-
-        query_params = []
-        if 'pretty' in local_var_params and local_var_params['pretty'] is not None:  # noqa: E501
-            query_params.append(('pretty', local_var_params['pretty']))  # noqa: E501
-        if '_continue' in local_var_params and local_var_params['_continue'] is not None:  # noqa: E501
-            query_params.append(('continue', local_var_params['_continue']))  # noqa: E501
-        if 'field_selector' in local_var_params and local_var_params['field_selector'] is not None:  # noqa: E501
-            query_params.append(('fieldSelector', local_var_params['field_selector']))  # noqa: E501
-        if 'label_selector' in local_var_params and local_var_params['label_selector'] is not None:  # noqa: E501
-            query_params.append(('labelSelector', local_var_params['label_selector']))  # noqa: E501
-        if 'limit' in local_var_params and local_var_params['limit'] is not None:  # noqa: E501
-            query_params.append(('limit', local_var_params['limit']))  # noqa: E501
-        if 'resource_version' in local_var_params and local_var_params['resource_version'] is not None:  # noqa: E501
-            query_params.append(('resourceVersion', local_var_params['resource_version']))  # noqa: E501
-        if 'timeout_seconds' in local_var_params and local_var_params['timeout_seconds'] is not None:  # noqa: E501
-            query_params.append(('timeoutSeconds', local_var_params['timeout_seconds']))  # noqa: E501
-        if 'watch' in local_var_params and local_var_params['watch'] is not None:  # noqa: E501
-            query_params.append(('watch', local_var_params['watch']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/json;stream=watch'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}', 'GET',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        return self.api_client.call_operation(
+            _OPERATIONS['list_namespaced_custom_object'], kwargs)
 
     def patch_cluster_custom_object(self, group, version, plural, name, body, **kwargs):  # noqa: E501
         """patch_cluster_custom_object  # noqa: E501
@@ -2320,111 +1062,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager',
-            'force'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_cluster_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `patch_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `patch_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `patch_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `patch_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `patch_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-        if 'force' in local_var_params and local_var_params['force'] is not None:  # noqa: E501
-            query_params.append(('force', local_var_params['force']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/merge-patch+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['patch_cluster_custom_object'], kwargs)
 
     def patch_cluster_custom_object_scale(self, group, version, plural, name, body, **kwargs):  # noqa: E501
         """patch_cluster_custom_object_scale  # noqa: E501
@@ -2489,111 +1133,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager',
-            'force'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_cluster_custom_object_scale" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `patch_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `patch_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `patch_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `patch_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `patch_cluster_custom_object_scale`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-        if 'force' in local_var_params and local_var_params['force'] is not None:  # noqa: E501
-            query_params.append(('force', local_var_params['force']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/merge-patch+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}/scale', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['patch_cluster_custom_object_scale'], kwargs)
 
     def patch_cluster_custom_object_status(self, group, version, plural, name, body, **kwargs):  # noqa: E501
         """patch_cluster_custom_object_status  # noqa: E501
@@ -2658,111 +1204,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager',
-            'force'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_cluster_custom_object_status" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `patch_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `patch_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `patch_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `patch_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `patch_cluster_custom_object_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-        if 'force' in local_var_params and local_var_params['force'] is not None:  # noqa: E501
-            query_params.append(('force', local_var_params['force']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/merge-patch+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}/status', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['patch_cluster_custom_object_status'], kwargs)
 
     def patch_namespaced_custom_object(self, group, version, namespace, plural, name, body, **kwargs):  # noqa: E501
         """patch_namespaced_custom_object  # noqa: E501
@@ -2829,118 +1277,14 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager',
-            'force'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_namespaced_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `patch_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `patch_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `patch_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `patch_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `patch_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `patch_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-        if 'force' in local_var_params and local_var_params['force'] is not None:  # noqa: E501
-            query_params.append(('force', local_var_params['force']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/merge-patch+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['patch_namespaced_custom_object'], kwargs)
 
     def patch_namespaced_custom_object_scale(self, group, version, namespace, plural, name, body, **kwargs):  # noqa: E501
         """patch_namespaced_custom_object_scale  # noqa: E501
@@ -3007,118 +1351,14 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager',
-            'force'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_namespaced_custom_object_scale" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `patch_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `patch_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `patch_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `patch_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `patch_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `patch_namespaced_custom_object_scale`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-        if 'force' in local_var_params and local_var_params['force'] is not None:  # noqa: E501
-            query_params.append(('force', local_var_params['force']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/merge-patch+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['patch_namespaced_custom_object_scale'], kwargs)
 
     def patch_namespaced_custom_object_status(self, group, version, namespace, plural, name, body, **kwargs):  # noqa: E501
         """patch_namespaced_custom_object_status  # noqa: E501
@@ -3185,118 +1425,14 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager',
-            'force'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method patch_namespaced_custom_object_status" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `patch_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `patch_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `patch_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `patch_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `patch_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `patch_namespaced_custom_object_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-        if 'force' in local_var_params and local_var_params['force'] is not None:  # noqa: E501
-            query_params.append(('force', local_var_params['force']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # HTTP header `Content-Type`
-        header_params['Content-Type'] = self.api_client.select_header_content_type(  # noqa: E501
-            ['application/merge-patch+json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status', 'PATCH',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['patch_namespaced_custom_object_status'], kwargs)
 
     def replace_cluster_custom_object(self, group, version, plural, name, body, **kwargs):  # noqa: E501
         """replace_cluster_custom_object  # noqa: E501
@@ -3359,104 +1495,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_cluster_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `replace_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `replace_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `replace_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `replace_cluster_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `replace_cluster_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['replace_cluster_custom_object'], kwargs)
 
     def replace_cluster_custom_object_scale(self, group, version, plural, name, body, **kwargs):  # noqa: E501
         """replace_cluster_custom_object_scale  # noqa: E501
@@ -3519,104 +1564,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_cluster_custom_object_scale" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `replace_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `replace_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `replace_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `replace_cluster_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `replace_cluster_custom_object_scale`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}/scale', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['replace_cluster_custom_object_scale'], kwargs)
 
     def replace_cluster_custom_object_status(self, group, version, plural, name, body, **kwargs):  # noqa: E501
         """replace_cluster_custom_object_status  # noqa: E501
@@ -3679,104 +1633,13 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_cluster_custom_object_status" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `replace_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `replace_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `replace_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `replace_cluster_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `replace_cluster_custom_object_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/{plural}/{name}/status', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['replace_cluster_custom_object_status'], kwargs)
 
     def replace_namespaced_custom_object(self, group, version, namespace, plural, name, body, **kwargs):  # noqa: E501
         """replace_namespaced_custom_object  # noqa: E501
@@ -3841,111 +1704,14 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_namespaced_custom_object" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `replace_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `replace_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `replace_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `replace_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `replace_namespaced_custom_object`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `replace_namespaced_custom_object`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['replace_namespaced_custom_object'], kwargs)
 
     def replace_namespaced_custom_object_scale(self, group, version, namespace, plural, name, body, **kwargs):  # noqa: E501
         """replace_namespaced_custom_object_scale  # noqa: E501
@@ -4010,111 +1776,14 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_namespaced_custom_object_scale" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `replace_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `replace_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `replace_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `replace_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `replace_namespaced_custom_object_scale`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `replace_namespaced_custom_object_scale`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['replace_namespaced_custom_object_scale'], kwargs)
 
     def replace_namespaced_custom_object_status(self, group, version, namespace, plural, name, body, **kwargs):  # noqa: E501
         """replace_namespaced_custom_object_status  # noqa: E501
@@ -4179,108 +1848,241 @@ class CustomObjectsApi(object):
                  If the method is called asynchronously,
                  returns the request thread.
         """
-
-        local_var_params = locals()
-
-        all_params = [
-            'group',
-            'version',
-            'namespace',
-            'plural',
-            'name',
-            'body',
-            'dry_run',
-            'field_manager'
-        ]
-        all_params.extend(
-            [
-                'async_req',
-                '_return_http_data_only',
-                '_preload_content',
-                '_request_timeout'
-            ]
-        )
-
-        for key, val in six.iteritems(local_var_params['kwargs']):
-            if key not in all_params:
-                raise ApiTypeError(
-                    "Got an unexpected keyword argument '%s'"
-                    " to method replace_namespaced_custom_object_status" % key
-                )
-            local_var_params[key] = val
-        del local_var_params['kwargs']
-        # verify the required parameter 'group' is set
-        if self.api_client.client_side_validation and ('group' not in local_var_params or  # noqa: E501
-                                                        local_var_params['group'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `group` when calling `replace_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'version' is set
-        if self.api_client.client_side_validation and ('version' not in local_var_params or  # noqa: E501
-                                                        local_var_params['version'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `version` when calling `replace_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'namespace' is set
-        if self.api_client.client_side_validation and ('namespace' not in local_var_params or  # noqa: E501
-                                                        local_var_params['namespace'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `namespace` when calling `replace_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'plural' is set
-        if self.api_client.client_side_validation and ('plural' not in local_var_params or  # noqa: E501
-                                                        local_var_params['plural'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `plural` when calling `replace_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'name' is set
-        if self.api_client.client_side_validation and ('name' not in local_var_params or  # noqa: E501
-                                                        local_var_params['name'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `name` when calling `replace_namespaced_custom_object_status`")  # noqa: E501
-        # verify the required parameter 'body' is set
-        if self.api_client.client_side_validation and ('body' not in local_var_params or  # noqa: E501
-                                                        local_var_params['body'] is None):  # noqa: E501
-            raise ApiValueError("Missing the required parameter `body` when calling `replace_namespaced_custom_object_status`")  # noqa: E501
-
-        collection_formats = {}
-
-        path_params = {}
-        if 'group' in local_var_params:
-            path_params['group'] = local_var_params['group']  # noqa: E501
-        if 'version' in local_var_params:
-            path_params['version'] = local_var_params['version']  # noqa: E501
-        if 'namespace' in local_var_params:
-            path_params['namespace'] = local_var_params['namespace']  # noqa: E501
-        if 'plural' in local_var_params:
-            path_params['plural'] = local_var_params['plural']  # noqa: E501
-        if 'name' in local_var_params:
-            path_params['name'] = local_var_params['name']  # noqa: E501
-
-        query_params = []
-        if 'dry_run' in local_var_params and local_var_params['dry_run'] is not None:  # noqa: E501
-            query_params.append(('dryRun', local_var_params['dry_run']))  # noqa: E501
-        if 'field_manager' in local_var_params and local_var_params['field_manager'] is not None:  # noqa: E501
-            query_params.append(('fieldManager', local_var_params['field_manager']))  # noqa: E501
-
-        header_params = {}
-
-        form_params = []
-        local_var_files = {}
-
-        body_params = None
-        if 'body' in local_var_params:
-            body_params = local_var_params['body']
-        # HTTP header `Accept`
-        header_params['Accept'] = self.api_client.select_header_accept(
-            ['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'])  # noqa: E501
-
-        # Authentication setting
-        auth_settings = ['BearerToken']  # noqa: E501
-
-        return self.api_client.call_api(
-            '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status', 'PUT',
-            path_params,
-            query_params,
-            header_params,
-            body=body_params,
-            post_params=form_params,
-            files=local_var_files,
-            response_type='object',  # noqa: E501
-            auth_settings=auth_settings,
-            async_req=local_var_params.get('async_req'),
-            _return_http_data_only=local_var_params.get('_return_http_data_only'),  # noqa: E501
-            _preload_content=local_var_params.get('_preload_content', True),
-            _request_timeout=local_var_params.get('_request_timeout'),
-            collection_formats=collection_formats)
+        kwargs['group'] = group
+        kwargs['version'] = version
+        kwargs['namespace'] = namespace
+        kwargs['plural'] = plural
+        kwargs['name'] = name
+        kwargs['body'] = body
+        return self.api_client.call_operation(
+            _OPERATIONS['replace_namespaced_custom_object_status'], kwargs)
+
+
+_OPERATIONS = dict((op.name, op) for op in [
+    Operation(
+        'create_cluster_custom_object', 'POST', '/apis/{group}/{version}/{plural}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural')],  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'plural', 'body'],
+        response_type='object',
+        accepts=['application/json'],
+    ),
+    Operation(
+        'create_namespaced_custom_object', 'POST', '/apis/{group}/{version}/namespaces/{namespace}/{plural}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural')],  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'namespace', 'plural', 'body'],
+        response_type='object',
+        accepts=['application/json'],
+    ),
+    Operation(
+        'delete_cluster_custom_object', 'DELETE', '/apis/{group}/{version}/{plural}/{name}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('grace_period_seconds', 'gracePeriodSeconds'), ('orphan_dependents', 'orphanDependents'), ('propagation_policy', 'propagationPolicy'), ('dry_run', 'dryRun')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'plural', 'name'],
+        response_type='object',
+        accepts=['application/json'],
+    ),
+    Operation(
+        'delete_collection_cluster_custom_object', 'DELETE', '/apis/{group}/{version}/{plural}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural')],  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('grace_period_seconds', 'gracePeriodSeconds'), ('orphan_dependents', 'orphanDependents'), ('propagation_policy', 'propagationPolicy'), ('dry_run', 'dryRun')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'plural'],
+        response_type='object',
+        accepts=['application/json'],
+    ),
+    Operation(
+        'delete_collection_namespaced_custom_object', 'DELETE', '/apis/{group}/{version}/namespaces/{namespace}/{plural}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural')],  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('grace_period_seconds', 'gracePeriodSeconds'), ('orphan_dependents', 'orphanDependents'), ('propagation_policy', 'propagationPolicy'), ('dry_run', 'dryRun')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'namespace', 'plural'],
+        response_type='object',
+        accepts=['application/json'],
+    ),
+    Operation(
+        'delete_namespaced_custom_object', 'DELETE', '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('grace_period_seconds', 'gracePeriodSeconds'), ('orphan_dependents', 'orphanDependents'), ('propagation_policy', 'propagationPolicy'), ('dry_run', 'dryRun')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'namespace', 'plural', 'name'],
+        response_type='object',
+        accepts=['application/json'],
+    ),
+    Operation(
+        'get_cluster_custom_object', 'GET', '/apis/{group}/{version}/{plural}/{name}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        required=['group', 'version', 'plural', 'name'],
+        response_type='object',
+        accepts=['application/json'],
+    ),
+    Operation(
+        'get_cluster_custom_object_scale', 'GET', '/apis/{group}/{version}/{plural}/{name}/scale',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        required=['group', 'version', 'plural', 'name'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'get_cluster_custom_object_status', 'GET', '/apis/{group}/{version}/{plural}/{name}/status',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        required=['group', 'version', 'plural', 'name'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'get_namespaced_custom_object', 'GET', '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        required=['group', 'version', 'namespace', 'plural', 'name'],
+        response_type='object',
+        accepts=['application/json'],
+    ),
+    Operation(
+        'get_namespaced_custom_object_scale', 'GET', '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        required=['group', 'version', 'namespace', 'plural', 'name'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'get_namespaced_custom_object_status', 'GET', '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        required=['group', 'version', 'namespace', 'plural', 'name'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'list_cluster_custom_object', 'GET', '/apis/{group}/{version}/{plural}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural')],  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('_continue', 'continue'), ('field_selector', 'fieldSelector'), ('label_selector', 'labelSelector'), ('limit', 'limit'), ('resource_version', 'resourceVersion'), ('timeout_seconds', 'timeoutSeconds'), ('watch', 'watch')],  # noqa: E501
+        required=['group', 'version', 'plural'],
+        response_type='object',
+        accepts=['application/json', 'application/json;stream=watch'],
+    ),
+    Operation(
+        'list_namespaced_custom_object', 'GET', '/apis/{group}/{version}/namespaces/{namespace}/{plural}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural')],  # noqa: E501
+        query_params=[('pretty', 'pretty'), ('_continue', 'continue'), ('field_selector', 'fieldSelector'), ('label_selector', 'labelSelector'), ('limit', 'limit'), ('resource_version', 'resourceVersion'), ('timeout_seconds', 'timeoutSeconds'), ('watch', 'watch')],  # noqa: E501
+        required=['group', 'version', 'namespace', 'plural'],
+        response_type='object',
+        accepts=['application/json', 'application/json;stream=watch'],
+    ),
+    Operation(
+        'patch_cluster_custom_object', 'PATCH', '/apis/{group}/{version}/{plural}/{name}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager'), ('force', 'force')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json'],
+        content_types=['application/merge-patch+json'],
+    ),
+    Operation(
+        'patch_cluster_custom_object_scale', 'PATCH', '/apis/{group}/{version}/{plural}/{name}/scale',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager'), ('force', 'force')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+        content_types=['application/merge-patch+json'],
+    ),
+    Operation(
+        'patch_cluster_custom_object_status', 'PATCH', '/apis/{group}/{version}/{plural}/{name}/status',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager'), ('force', 'force')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+        content_types=['application/merge-patch+json'],
+    ),
+    Operation(
+        'patch_namespaced_custom_object', 'PATCH', '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager'), ('force', 'force')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json'],
+        content_types=['application/merge-patch+json'],
+    ),
+    Operation(
+        'patch_namespaced_custom_object_scale', 'PATCH', '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager'), ('force', 'force')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+        content_types=['application/merge-patch+json'],
+    ),
+    Operation(
+        'patch_namespaced_custom_object_status', 'PATCH', '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager'), ('force', 'force')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+        content_types=['application/merge-patch+json'],
+    ),
+    Operation(
+        'replace_cluster_custom_object', 'PUT', '/apis/{group}/{version}/{plural}/{name}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json'],
+    ),
+    Operation(
+        'replace_cluster_custom_object_scale', 'PUT', '/apis/{group}/{version}/{plural}/{name}/scale',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'replace_cluster_custom_object_status', 'PUT', '/apis/{group}/{version}/{plural}/{name}/status',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'replace_namespaced_custom_object', 'PUT', '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json'],
+    ),
+    Operation(
+        'replace_namespaced_custom_object_scale', 'PUT', '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/scale',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+    Operation(
+        'replace_namespaced_custom_object_status', 'PUT', '/apis/{group}/{version}/namespaces/{namespace}/{plural}/{name}/status',  # noqa: E501
+        path_params=[('group', 'group'), ('version', 'version'), ('namespace', 'namespace'), ('plural', 'plural'), ('name', 'name')],  # noqa: E501
+        query_params=[('dry_run', 'dryRun'), ('field_manager', 'fieldManager')],  # noqa: E501
+        body='body',
+        required=['group', 'version', 'namespace', 'plural', 'name', 'body'],
+        response_type='object',
+        accepts=['application/json', 'application/yaml', 'application/vnd.kubernetes.protobuf'],  # noqa: E501
+    ),
+])
@@ -11,8 +11,10 @@
 from __future__ import absolute_import
 
 import atexit
+import copy
 import datetime
 from dateutil.parser import parse
+import functools
 import json
 import mimetypes
 from multiprocessing.pool import ThreadPool
@@ -27,7 +29,39 @@ from six.moves.urllib.parse import quote
 from kubernetes.client.configuration import Configuration
 import kubernetes.client.models
 from kubernetes.client import rest
-from kubernetes.client.exceptions import ApiValueError
+from kubernetes.client import known_state
+from kubernetes.client import priority
+from kubernetes.client import serialization
+from kubernetes.client.exceptions import ApiException, ApiValueError
+
+_PATH_PARAM = re.compile(r'\{(\w+)\}')
+_ESCAPED_PATH_PARAM = re.compile(r'\{\{(\w+)\}\}')
+# resource path -> (str.format() template, names of its path parameters)
+_path_templates = {}
+_PATH_TEMPLATES_MAX = 4096
+# media type lists of the operations -> selected Accept and Content-Type
+_header_accept_cache = {}
+_header_content_type_cache = {}
+
+
+def _compile_path(resource_path):
+    compiled = _path_templates.get(resource_path)
+    if compiled is None:
+        template = resource_path.replace('{', '{{').replace('}', '}}')
+        template = _ESCAPED_PATH_PARAM.sub(r'{\1}', template)
+        compiled = (template, frozenset(_PATH_PARAM.findall(resource_path)))
+        if len(_path_templates) >= _PATH_TEMPLATES_MAX:
+            # paths formatted by the caller are not templates, do not let
+            # them grow the cache without bound
+            _path_templates.clear()
+        _path_templates[resource_path] = compiled
+    return compiled
+
+
+@functools.lru_cache(maxsize=1024)
+def _quote_path_param(value, safe):
+    # names and namespaces repeat a lot, quote() is comparatively slow
+    return quote(value, safe=safe)
 
 
 class ApiClient(object):
@@ -64,6 +98,10 @@ class ApiClient(object):
         'object': object,
     }
     _pool = None
+    _shared_rest_client = False
+    # Auth settings overriding those of the configuration, see
+    # with_credentials
+    _auth_settings = None
 
     def __init__(self, configuration=None, header_name=None, header_value=None,
                  cookie=None, pool_threads=1):
@@ -72,7 +110,11 @@ class ApiClient(object):
         self.configuration = configuration
         self.pool_threads = pool_threads
 
-        self.rest_client = rest.RESTClientObject(configuration)
+        if configuration.share_connection_pools:
+            self.rest_client = rest.acquire_shared_client(configuration)
+            self._shared_rest_client = True
+        else:
+            self.rest_client = rest.RESTClientObject(configuration)
         self.default_headers = {}
         if header_name is not None:
             self.default_headers[header_name] = header_value
@@ -80,6 +122,17 @@ class ApiClient(object):
         # Set default User-Agent.
         self.user_agent = 'OpenAPI-Generator/17.0.0-snapshot/python'
         self.client_side_validation = configuration.client_side_validation
+        # Optional concurrency.AdaptiveConcurrencyLimiter for API requests
+        self.concurrency_limiter = None
+        # Optional priority.PriorityScheduler admitting requests to the pool
+        self.priority_scheduler = None
+        self.priority = priority.NORMAL
+        # Optional known_state.KnownStates eliding writes that change nothing
+        self.known_states = None
+        # Optional single_flight.SingleFlight sharing identical GETs
+        self.single_flight = None
+        # Optional utils.read_cache.ReadCache answering reads locally
+        self.read_cache = None
 
     def __enter__(self):
         return self
@@ -94,6 +147,9 @@ class ApiClient(object):
             self._pool = None
             if hasattr(atexit, 'unregister'):
                 atexit.unregister(self.close)
+        if self._shared_rest_client:
+            self._shared_rest_client = False
+            rest.release_shared_client(self.rest_client)
 
     @property
     def pool(self):
@@ -114,9 +170,110 @@ class ApiClient(object):
     def user_agent(self, value):
         self.default_headers['User-Agent'] = value
 
+    def _view(self):
+        """Return a shallow copy of this client that shares its transport.
+
+        The copy has its own default headers and thread pool, and closing
+        it does not close the connection pool of this client.
+        """
+        view = copy.copy(self)
+        view._pool = None
+        view._shared_rest_client = False
+        view.default_headers = dict(self.default_headers)
+        return view
+
+    def with_priority(self, priority):
+        """Return a view of this client that sends requests with `priority`.
+
+        The view shares the configuration, connection pool and priority
+        scheduler of this client.
+
+        :param priority: priority.CRITICAL, priority.NORMAL or
+            priority.BACKGROUND.
+        :return: ApiClient.
+        """
+        view = self._view()
+        view.priority = priority
+        return view
+
+    def with_credentials(self, token=None, impersonate_user=None,
+                         impersonate_groups=None, impersonate_extra=None):
+        """Return a view of this client that authenticates differently.
+
+        The view shares the configuration and connection pool of this
+        client, so acting on behalf of many users or tenants does not cost
+        a client and a pool each.
+
+        :param token: bearer token used instead of the configured
+            credentials.
+        :param impersonate_user: user name sent as `Impersonate-User`.
+        :param impersonate_groups: list of group names, each sent as an
+            `Impersonate-Group` header. Repeated headers require urllib3 2.
+        :param impersonate_extra: dict of extra field name to list of
+            values, sent as `Impersonate-Extra-<name>` headers.
+        :return: ApiClient.
+        """
+        view = self._view()
+        if token is not None:
+            view._auth_settings = {
+                'BearerToken': {
+                    'type': 'api_key',
+                    'in': 'header',
+                    'key': 'authorization',
+                    'value': 'Bearer ' + token
+                }
+            }
+        if impersonate_user is not None:
+            view.default_headers['Impersonate-User'] = impersonate_user
+        if impersonate_groups:
+            view.default_headers['Impersonate-Group'] = list(
+                impersonate_groups)
+        for name, values in six.iteritems(impersonate_extra or {}):
+            view.default_headers['Impersonate-Extra-' + name] = list(values)
+        return view
+
     def set_default_header(self, header_name, header_value):
         self.default_headers[header_name] = header_value
 
+    def __perform(self, route, method, url, query_params, header_params,
+                  post_params, body, response_type, _preload_content,
+                  _request_timeout):
+        """Send a request and return its (deserialized data, response)."""
+        config = self.configuration
+        request = self.request
+        # the scheduler admits a request before it takes a limiter slot, so
+        # that slots are not held by requests waiting for their turn
+        if self.concurrency_limiter is not None:
+            request = functools.partial(
+                self.concurrency_limiter.call, route, request)
+        if self.priority_scheduler is not None:
+            request = functools.partial(
+                self.priority_scheduler.call, self.priority, request)
+        if config.retry_policy is None:
+            response_data = request(
+                method, url, query_params=query_params, headers=header_params,
+                post_params=post_params, body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+        else:
+            response_data = config.retry_policy.call(
+                method, request,
+                method, url, query_params=query_params, headers=header_params,
+                post_params=post_params, body=body,
+                _preload_content=_preload_content,
+                _request_timeout=_request_timeout)
+
+        self.last_response = response_data
+
+        return_data = response_data
+        if _preload_content:
+            # deserialize response data
+            if response_type:
+                return_data = self.deserialize(response_data, response_type)
+            else:
+                return_data = None
+        return return_data, response_data
+
     def __call_api(
             self, resource_path, method, path_params=None,
             query_params=None, header_params=None, body=None, post_params=None,
@@ -125,34 +282,49 @@ class ApiClient(object):
             _preload_content=True, _request_timeout=None, _host=None):
 
         config = self.configuration
+        route = (method, resource_path)
 
         # header parameters
         header_params = header_params or {}
         header_params.update(self.default_headers)
         if self.cookie:
             header_params['Cookie'] = self.cookie
-        if header_params:
+        if header_params and not self._plain_params(
+                six.itervalues(header_params), collection_formats):
             header_params = self.sanitize_for_serialization(header_params)
             header_params = dict(self.parameters_to_tuples(header_params,
                                                            collection_formats))
 
         # path parameters
         if path_params:
-            path_params = self.sanitize_for_serialization(path_params)
-            path_params = self.parameters_to_tuples(path_params,
-                                                    collection_formats)
-            for k, v in path_params:
-                # specified safe chars, encode everything
-                resource_path = resource_path.replace(
-                    '{%s}' % k,
-                    quote(str(v), safe=config.safe_chars_for_path_param)
-                )
+            template, names = _compile_path(resource_path)
+            safe = config.safe_chars_for_path_param
+            if (len(path_params) == len(names) and
+                    names.issuperset(path_params) and
+                    self._plain_params(six.itervalues(path_params),
+                                       collection_formats)):
+                resource_path = template.format(**dict(
+                    (k, _quote_path_param(str(v), safe))
+                    for k, v in six.iteritems(path_params)))
+            else:
+                path_params = self.sanitize_for_serialization(path_params)
+                path_params = self.parameters_to_tuples(path_params,
+                                                        collection_formats)
+                for k, v in path_params:
+                    # specified safe chars, encode everything
+                    resource_path = resource_path.replace(
+                        '{%s}' % k, _quote_path_param(str(v), safe))
 
         # query parameters
         if query_params:
-            query_params = self.sanitize_for_serialization(query_params)
-            query_params = self.parameters_to_tuples(query_params,
-                                                     collection_formats)
+            if (isinstance(query_params, list) and
+                    self._plain_params((v for _, v in query_params),
+                                       collection_formats)):
+                query_params = list(query_params)
+            else:
+                query_params = self.sanitize_for_serialization(query_params)
+                query_params = self.parameters_to_tuples(query_params,
+                                                         collection_formats)
 
         # post parameters
         if post_params or files:
@@ -177,21 +349,21 @@ class ApiClient(object):
             url = _host + resource_path
 
         # perform request and return response
-        response_data = self.request(
-            method, url, query_params=query_params, headers=header_params,
-            post_params=post_params, body=body,
-            _preload_content=_preload_content,
-            _request_timeout=_request_timeout)
-
-        self.last_response = response_data
-
-        return_data = response_data
-        if _preload_content:
-            # deserialize response data
-            if response_type:
-                return_data = self.deserialize(response_data, response_type)
-            else:
-                return_data = None
+        if (method == 'GET' and _preload_content and
+                self.single_flight is not None):
+            key = (url, tuple((k, str(v)) for k, v in query_params or ()),
+                   tuple(sorted((k, str(v))
+                                for k, v in six.iteritems(header_params))),
+                   response_type)
+            return_data, response_data = self.single_flight.do(
+                key, self.__perform, route, method, url, query_params,
+                header_params, post_params, body, response_type,
+                _preload_content, _request_timeout)
+            self.last_response = response_data
+        else:
+            return_data, response_data = self.__perform(
+                route, method, url, query_params, header_params, post_params,
+                body, response_type, _preload_content, _request_timeout)
 
         if _return_http_data_only:
             return (return_data)
@@ -213,33 +385,7 @@ class ApiClient(object):
         :param obj: The data to serialize.
         :return: The serialized form of data.
         """
-        if obj is None:
-            return None
-        elif isinstance(obj, self.PRIMITIVE_TYPES):
-            return obj
-        elif isinstance(obj, list):
-            return [self.sanitize_for_serialization(sub_obj)
-                    for sub_obj in obj]
-        elif isinstance(obj, tuple):
-            return tuple(self.sanitize_for_serialization(sub_obj)
-                         for sub_obj in obj)
-        elif isinstance(obj, (datetime.datetime, datetime.date)):
-            return obj.isoformat()
-
-        if isinstance(obj, dict):
-            obj_dict = obj
-        else:
-            # Convert model obj to dict except
-            # attributes `openapi_types`, `attribute_map`
-            # and attributes which value is not None.
-            # Convert attribute name to json key in
-            # model definition for request.
-            obj_dict = {obj.attribute_map[attr]: getattr(obj, attr)
-                        for attr, _ in six.iteritems(obj.openapi_types)
-                        if getattr(obj, attr) is not None}
-
-        return {key: self.sanitize_for_serialization(val)
-                for key, val in six.iteritems(obj_dict)}
+        return serialization.sanitize(obj)
 
     def deserialize(self, response, response_type):
         """Deserializes response into an object.
@@ -365,6 +511,129 @@ class ApiClient(object):
                                                        _request_timeout,
                                                        _host))
 
+    def call_operation(self, operation, params):
+        """Makes the HTTP request described by an operation.
+
+        :param operation: kubernetes.client.operation.Operation to call.
+        :param params: dict of the arguments of the API method, including
+            async_req, _return_http_data_only, _preload_content and
+            _request_timeout, and for replace and patch operations
+            _known_state, the current state of the object: if the write
+            would leave it as it is, it is returned without a request, and
+            _status_subresource, true when a custom resource has a status
+            subresource, so that its replace leaves the status alone.
+        :return: see call_api.
+        """
+        operation.check_params(params, self.client_side_validation)
+
+        if self.read_cache is not None and operation.method == 'GET':
+            data = self.read_cache.answer(operation, params,
+                                          self.configuration)
+            if data is not None:
+                return self._local_response(params, data)
+
+        header_params = {}
+        if operation.accepts:
+            header_params['Accept'] = self.select_header_accept(
+                operation.accepts)
+        if operation.content_types:
+            header_params['Content-Type'] = self.select_header_content_type(
+                operation.content_types)
+
+        body = None
+        if operation.body is not None:
+            body = params.get(operation.body)
+
+        path_params = operation.path_values(params)
+        known_states = self.known_states
+        track = (not params.get('async_req') and
+                 params.get('_preload_content', True))
+        if track and operation.method in ('PUT', 'PATCH') and \
+                params.get('dry_run') is None:
+            state = params.get('_known_state')
+            if state is None and known_states is not None:
+                state = known_states.get(operation, path_params)
+            if state is not None:
+                response = self._known_response(operation, params, body,
+                                                state)
+                if response is not None:
+                    if known_states is not None:
+                        known_states.elided += 1
+                    return response
+        if known_states is None or not track:
+            return self._call_operation(operation, params, header_params,
+                                        path_params, body)
+
+        try:
+            response = self._call_operation(operation, params, header_params,
+                                            path_params, body)
+        except ApiException:
+            if operation.method != 'GET':
+                known_states.forget(operation, path_params)
+            raise
+        # custom objects are read by get_* operations
+        returns_state = operation.response_type != 'str' and (
+            operation.name.startswith(('read_', 'replace_', 'patch_')) or
+            operation.name.startswith('get_') and 'name' in path_params)
+        if operation.name.startswith('delete_'):
+            known_states.forget(operation, path_params)
+        elif returns_state:
+            data = response
+            if not params.get('_return_http_data_only'):
+                data = response[0]
+            known_states.remember(operation, path_params, data)
+        return response
+
+    def _known_response(self, operation, params, body, state):
+        """Return the response to a write that leaves state as it is, or
+        None if the write changes it."""
+        if operation.method == 'PUT':
+            # the main endpoint of a typed kind leaves the status alone,
+            # that of a custom resource only with a status subresource
+            status = operation.path.endswith('/status') or (
+                operation.response_type == 'object' and
+                not params.get('_status_subresource'))
+            unchanged = known_state.unchanged_by_replace(body, state,
+                                                         status=status)
+        else:
+            unchanged = known_state.unchanged_by_patch(body, state)
+        if not unchanged:
+            return None
+        # the state is remembered or held by the caller, who must not see
+        # the changes made to the response, nor make any to the state
+        data = serialization.sanitize(state)
+        if operation.response_type != 'object':
+            klass = getattr(kubernetes.client.models,
+                            operation.response_type, None)
+            if klass is None:
+                return None
+            data = serialization.from_dict(klass, data, self.configuration)
+        return self._local_response(params, data)
+
+    def _local_response(self, params, data):
+        """Return data as call_api would return it from a response."""
+        if params.get('_return_http_data_only'):
+            return data
+        return data, 200, {}
+
+    def _call_operation(self, operation, params, header_params, path_params,
+                        body):
+        return self.call_api(
+            operation.path, operation.method,
+            path_params,
+            operation.query_values(params),
+            header_params,
+            body=body,
+            post_params=[],
+            files={},
+            response_type=operation.response_type,
+            auth_settings=operation.auth_settings,
+            async_req=params.get('async_req'),
+            _return_http_data_only=params.get('_return_http_data_only'),
+            _preload_content=params.get('_preload_content', True),
+            _request_timeout=params.get('_request_timeout'),
+            collection_formats={})
+
     def request(self, method, url, query_params=None, headers=None,
                 post_params=None, body=None, _preload_content=True,
                 _request_timeout=None):
@@ -424,6 +693,16 @@ class ApiClient(object):
                 " `POST`, `PATCH`, `PUT` or `DELETE`."
             )
 
+    def _plain_params(self, values, collection_formats):
+        """Whether parameters with these values come out of
+        sanitize_for_serialization and parameters_to_tuples unchanged."""
+        if collection_formats:
+            return False
+        for value in values:
+            if type(value) not in serialization.PLAIN_TYPES:
+                return False
+        return True
+
     def parameters_to_tuples(self, params, collection_formats):
         """Get parameters as list of tuples, formatting collections.
 
@@ -487,12 +766,17 @@ class ApiClient(object):
         if not accepts:
             return
 
-        accepts = [x.lower() for x in accepts]
+        key = tuple(accepts)
+        accept = _header_accept_cache.get(key)
+        if accept is None:
+            accepts = [x.lower() for x in accepts]
 
-        if 'application/json' in accepts:
-            return 'application/json'
-        else:
-            return ', '.join(accepts)
+            if 'application/json' in accepts:
+                accept = 'application/json'
+            else:
+                accept = ', '.join(accepts)
+            _header_accept_cache[key] = accept
+        return accept
 
     def select_header_content_type(self, content_types):
         """Returns `Content-Type` based on an array of content_types provided.
@@ -503,12 +787,18 @@ class ApiClient(object):
         if not content_types:
             return 'application/json'
 
-        content_types = [x.lower() for x in content_types]
+        key = tuple(content_types)
+        content_type = _header_content_type_cache.get(key)
+        if content_type is None:
+            content_types = [x.lower() for x in content_types]
 
-        if 'application/json' in content_types or '*/*' in content_types:
-            return 'application/json'
-        else:
-            return content_types[0]
+            if ('application/json' in content_types or
+                    '*/*' in content_types):
+                content_type = 'application/json'
+            else:
+                content_type = content_types[0]
+            _header_content_type_cache[key] = content_type
+        return content_type
 
     def update_params_for_auth(self, headers, querys, auth_settings):
         """Updates header and query params based on authentication setting.
@@ -520,8 +810,11 @@ class ApiClient(object):
         if not auth_settings:
             return
 
+        settings = self._auth_settings
+        if settings is None:
+            settings = self.configuration.auth_settings()
         for auth in auth_settings:
-            auth_setting = self.configuration.auth_settings().get(auth)
+            auth_setting = settings.get(auth)
             if auth_setting:
                 if auth_setting['in'] == 'cookie':
                     headers['Cookie'] = auth_setting['value']
@@ -0,0 +1,181 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+
+from kubernetes.client.exceptions import ApiException
+
+FLOW_SCHEMA_HEADER = 'X-Kubernetes-PF-FlowSchema-UID'
+PRIORITY_LEVEL_HEADER = 'X-Kubernetes-PF-PriorityLevel-UID'
+# requests whose priority level has not been observed yet
+UNKNOWN_PRIORITY_LEVEL = ''
+TOO_MANY_REQUESTS = 429
+
+
+class AIMDLimit(object):
+    """
+    An additive increase, multiplicative decrease concurrency limit.
+
+    The limit grows by roughly one per round of requests while it is being
+    used and latency stays within `latency_tolerance` times the lowest
+    latency observed for the same route. It is multiplied by
+    `backoff_ratio` on a 429 response or when latency rises above that
+    bound, at most once per round trip. Each route has its own baseline,
+    so a slow LIST is not mistaken for congestion after fast GETs.
+    """
+
+    def __init__(self, initial_limit=4, min_limit=1, max_limit=256,
+                 backoff_ratio=0.5, latency_tolerance=2.0):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.in_flight = 0
+        self.requests = 0
+        self.throttled = 0
+        # route -> lowest latency observed
+        self.min_latencies = {}
+        self._last_decrease = 0.0
+        self._cond = threading.Condition()
+
+    def acquire(self, timeout=None):
+        """Wait for a free slot. Returns False if the timeout expired."""
+        with self._cond:
+            if not self._cond.wait_for(
+                    lambda: self.in_flight < int(self.limit), timeout):
+                return False
+            self.in_flight += 1
+            return True
+
+    def release(self, latency, overloaded=False, route=None):
+        """Free a slot and adjust the limit from the request outcome."""
+        with self._cond:
+            utilized = self.in_flight >= int(self.limit) // 2
+            self.in_flight -= 1
+            self.requests += 1
+            now = time.time()
+            min_latency = self.min_latencies.get(route)
+            if overloaded:
+                self.throttled += 1
+                self._decrease(now, latency)
+            elif min_latency is None or latency < min_latency:
+                self.min_latencies[route] = latency
+                if utilized:
+                    self._increase()
+            elif latency > min_latency * self.latency_tolerance:
+                self._decrease(now, latency)
+            elif utilized:
+                self._increase()
+            self._cond.notify_all()
+
+    def _increase(self):
+        self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+
+    def _decrease(self, now, latency):
+        if now - self._last_decrease < latency:
+            return
+        self._last_decrease = now
+        self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+
+    def stats(self):
+        with self._cond:
+            return {'limit': int(self.limit), 'in_flight': self.in_flight,
+                    'requests': self.requests, 'throttled': self.throttled,
+                    'min_latencies': dict(self.min_latencies)}
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """
+    Limits in-flight requests per API Priority and Fairness priority level.
+
+    The priority level of a route is learned from the
+    X-Kubernetes-PF-PriorityLevel-UID header of its responses, so requests
+    that the API server queues separately are limited separately. Routes
+    are keyed by method and unformatted resource path, which keeps the
+    number of keys bounded. Until a route has been observed it shares the
+    limit of the unknown priority level.
+
+    Keyword arguments are passed to the AIMDLimit of each priority level.
+
+    Example:
+        api_client = kubernetes.client.ApiClient()
+        api_client.concurrency_limiter = AdaptiveConcurrencyLimiter()
+    """
+
+    def __init__(self, **limit_kwargs):
+        self._limit_kwargs = limit_kwargs
+        self._limits = {}
+        self._routes = {}
+        self._flow_schemas = {}
+        self._lock = threading.Lock()
+
+    def _limit(self, level):
+        limit = self._limits.get(level)
+        if limit is None:
+            with self._lock:
+                limit = self._limits.get(level)
+                if limit is None:
+                    limit = AIMDLimit(**self._limit_kwargs)
+                    self._limits[level] = limit
+        return limit
+
+    def call(self, route, func, *args, **kwargs):
+        """
+        Call func once a slot for the priority level of route is free and
+        feed the outcome back into that level's limit.
+        """
+        limit = self._limit(self._routes.get(route, UNKNOWN_PRIORITY_LEVEL))
+        limit.acquire()
+        start = time.time()
+        overloaded = False
+        try:
+            response = func(*args, **kwargs)
+        except ApiException as e:
+            overloaded = e.status == TOO_MANY_REQUESTS
+            if e.headers:
+                self._observe(route, e.headers.get(PRIORITY_LEVEL_HEADER),
+                              e.headers.get(FLOW_SCHEMA_HEADER))
+            raise
+        finally:
+            limit.release(time.time() - start, overloaded, route)
+        # websocket responses of stream() and those of other request()
+        # overrides may carry no headers
+        getheader = getattr(response, 'getheader', None)
+        if getheader is not None:
+            self._observe(route, getheader(PRIORITY_LEVEL_HEADER),
+                          getheader(FLOW_SCHEMA_HEADER))
+        return response
+
+    def _observe(self, route, level, flow_schema):
+        if level and self._routes.get(route) != level:
+            with self._lock:
+                self._routes[route] = level
+                if flow_schema:
+                    self._flow_schemas[level] = flow_schema
+
+    def stats(self):
+        """
+        Return the limit, in-flight, request and 429 counts per priority
+        level UID, plus the last flow schema UID seen for each level.
+        """
+        with self._lock:
+            limits = dict(self._limits)
+            flow_schemas = dict(self._flow_schemas)
+        result = {}
+        for level, limit in limits.items():
+            result[level] = limit.stats()
+            result[level]['flow_schema'] = flow_schemas.get(level)
+        return result
@@ -71,6 +71,8 @@ class Configuration(object):
     """
 
     _default = None
+    # Unmodified instance that default copies share while no default is set
+    _pristine = None
 
     def __init__(self, host="http://localhost",
                  api_key=None, api_key_prefix=None,
@@ -99,6 +101,11 @@ class Configuration(object):
         self.refresh_api_key_hook = None
         """function hook to refresh API key if expired
         """
+        self.token_provider = None
+        """token_provider.TokenProvider supplying a cached bearer token.
+           When set, it takes precedence over api_key and
+           refresh_api_key_hook. Copies of this configuration share it.
+        """
         self.username = username
         """Username for HTTP basic authentication
         """
@@ -153,6 +160,19 @@ class Configuration(object):
            cpu_count * 5 is used as default value to increase performance.
         """
 
+        self.stream_connection_pool_maxsize = None
+        """Maximum number of connections saved per pool for streaming
+           requests (watches, followed logs and other requests made with
+           _preload_content=False), which use a pool of their own. None uses
+           connection_pool_maxsize.
+        """
+
+        self.share_connection_pools = False
+        """Share connection pools with other clients of this process that
+           use the same host, TLS material, proxy and pool settings. Shared
+           pools are closed when the last ApiClient using them is closed.
+        """
+
         self.proxy = None
         """Proxy URL
         """
@@ -165,6 +185,25 @@ class Configuration(object):
         self.retries = None
         """Adding retries to override urllib3 default value 3
         """
+        self.retry_policy = None
+        """kubernetes.client.retry.RetryPolicy applied to API calls failing
+           with 429 or 5xx. None raises ApiException on the first failure.
+        """
+        self.qps = None
+        """Client side limit of read requests per second to this host.
+           None disables client side rate limiting. The budget is shared by
+           every client of the same host configured with the same limits.
+        """
+        self.burst = None
+        """Read requests allowed in a burst above qps, defaults to qps.
+        """
+        self.mutating_qps = None
+        """Limit of mutating (POST, PUT, PATCH, DELETE) requests per second,
+           defaults to qps.
+        """
+        self.mutating_burst = None
+        """Mutating requests allowed in a burst, defaults to burst.
+        """
         # Disable client side validation
         self.client_side_validation = True
 
@@ -172,16 +211,53 @@ class Configuration(object):
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            if k not in ('logger', 'logger_file_handler'):
+        for k, v in self._settings().items():
+            if k not in ('logger', 'logger_file_handler', 'token_provider'):
                 setattr(result, k, copy.deepcopy(v, memo))
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
+        # the token cache is shared
+        result.token_provider = self.token_provider
         # use setters to configure loggers
         result.logger_file = self.logger_file
         result.debug = self.debug
         return result
 
+    def _settings(self):
+        """Return all settings, including those read from a shared base."""
+        base = self.__dict__.get('_cow_base')
+        if base is None:
+            return self.__dict__
+        settings = dict(base._settings())
+        settings.update(self.__dict__)
+        del settings['_cow_base']
+        return settings
+
+    def __getattr__(self, name):
+        # Only called for settings a copy-on-write copy has not written yet.
+        base = self.__dict__.get('_cow_base')
+        if base is None:
+            raise AttributeError(name)
+        value = getattr(base, name)
+        if isinstance(value, (dict, list)):
+            # containers are copied on first read as callers mutate them
+            # in place, e.g. configuration.api_key['authorization'] = ...
+            value = copy.copy(value)
+            self.__dict__[name] = value
+        return value
+
+    def _copy_on_write(self):
+        """Return a copy that reads settings from this instance until they
+        are assigned.
+
+        Unlike deepcopy, this neither copies every setting nor sets up the
+        loggers again, which makes it cheap enough to do per ApiClient. It
+        must only be used on an instance that is not modified afterwards.
+        """
+        result = self.__class__.__new__(self.__class__)
+        result.__dict__['_cow_base'] = self
+        return result
+
     @classmethod
     def set_default(cls, default):
         """Set default instance of configuration.
@@ -199,13 +275,16 @@ class Configuration(object):
 
         This method returns newly created, based on default constructor,
         object of Configuration class or returns a copy of default
-        configuration passed by the set_default method.
+        configuration passed by the set_default method. The copy shares
+        the settings of the default until they are assigned on it.
 
         :return: The configuration object.
         """
         if cls._default is not None:
-            return copy.deepcopy(cls._default)
-        return Configuration()
+            return cls._default._copy_on_write()
+        if cls._pristine is None:
+            cls._pristine = Configuration()
+        return cls._pristine._copy_on_write()
 
     @property
     def logger_file(self):
@@ -328,6 +407,8 @@ class Configuration(object):
 
         :return: The Auth Settings information dict.
         """
+        if self.token_provider is not None:
+            return self.token_provider.auth_settings()
         auth = {}
         if 'authorization' in self.api_key:
             auth['BearerToken'] = {
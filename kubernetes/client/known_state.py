@@ -0,0 +1,232 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import threading
+
+import six
+
+from kubernetes.client import serialization
+
+# fields a replace cannot change: set by the server or given by the path
+SERVER_FIELDS = (
+    ('apiVersion',),
+    ('kind',),
+    ('metadata', 'creationTimestamp'),
+    ('metadata', 'generation'),
+    ('metadata', 'managedFields'),
+    ('metadata', 'namespace'),
+    ('metadata', 'resourceVersion'),
+    ('metadata', 'selfLink'),
+    ('metadata', 'uid'),
+)
+
+# a replace of the object itself leaves its status alone, and a replace
+# of the status subresource its spec, the spec is compared all the same
+_REPLACE_IGNORED = SERVER_FIELDS + (('status',),)
+_REPLACE_STATUS_IGNORED = SERVER_FIELDS
+
+_MISSING = object()
+
+
+def _same(a, b):
+    return type(a) is type(b) and a == b
+
+
+def unchanged_by_replace(body, state, status=False):
+    """
+    Return whether replacing state with body would leave it as it is.
+
+    Both are compared by serialization.content_hash without the fields in
+    SERVER_FIELDS, and without the status unless status is true. Fields
+    the server defaults must be present in body for it to compare equal.
+
+    :param body: model or dict sent to a replace_* method.
+    :param state: model or dict, the current state of the object.
+    :param status: whether body is sent to a replace_*_status method.
+    :return: bool
+    """
+    ignored = _REPLACE_STATUS_IGNORED if status else _REPLACE_IGNORED
+    return (serialization.content_hash(body, ignored) ==
+            serialization.content_hash(state, ignored))
+
+
+def unchanged_by_patch(body, state):
+    """
+    Return whether applying patch body to state would leave it as it is.
+
+    body is a merge or strategic merge patch (dict) or a JSON patch (list).
+    Only patches that set values the state already has are recognized:
+    removed keys must be absent, lists must be equal to the current ones,
+    and patches with $ directives or JSON patch operations other than add,
+    replace and test are always considered to change the object.
+
+    :param body: dict or list sent to a patch_* method.
+    :param state: model or dict, the current state of the object.
+    :return: bool
+    """
+    body = serialization.sanitize(body)
+    state = serialization.sanitize(state)
+    if type(body) is list:
+        return all(_operation_unchanged(op, state) for op in body)
+    return type(body) is dict and _merge_unchanged(body, state)
+
+
+def _merge_unchanged(patch, state):
+    for key, value in six.iteritems(patch):
+        if key.startswith('$'):
+            return False
+        current = state.get(key, _MISSING)
+        if value is None:
+            if current is not _MISSING:
+                return False
+        elif type(value) is dict:
+            if type(current) is not dict or \
+                    not _merge_unchanged(value, current):
+                return False
+        elif type(value) is list:
+            # a list is either replaced or merged element by element, when
+            # it is equal to the current one neither changes anything
+            for item in value:
+                if type(item) is dict and any(k.startswith('$') for k in item):
+                    return False
+            if current != value:
+                return False
+        elif not _same(value, current):
+            return False
+    return True
+
+
+def _resolve(document, pointer):
+    """Return the container and key that a JSON pointer designates."""
+    if not pointer.startswith('/'):
+        return None, None
+    tokens = [t.replace('~1', '/').replace('~0', '~')
+              for t in pointer[1:].split('/')]
+    for token in tokens[:-1]:
+        document = _child(document, token)
+        if document is _MISSING:
+            return None, None
+    return document, tokens[-1]
+
+
+def _child(document, token):
+    if type(document) is dict:
+        return document.get(token, _MISSING)
+    if type(document) is list and token.isdigit() and \
+            int(token) < len(document):
+        return document[int(token)]
+    return _MISSING
+
+
+def _operation_unchanged(operation, state):
+    if type(operation) is not dict or \
+            operation.get('op') not in ('add', 'replace', 'test'):
+        return False
+    parent, key = _resolve(state, operation.get('path', ''))
+    if operation['op'] == 'add' and type(parent) is not dict:
+        # adding to a list inserts an element
+        return False
+    current = _child(parent, key)
+    return current is not _MISSING and \
+        current == operation.get('value', _MISSING)
+
+
+class KnownStates(object):
+    """
+    Remembers the last state of objects the server returned, so writes
+    that would not change them are answered without a request.
+
+    Set as ApiClient.known_states, it records the objects returned by read,
+    replace and patch calls, and by get calls of custom objects, by their
+    path, and forgets the objects that are deleted or whose write failed.
+    A replace_* or patch_* call whose body would leave the known state as
+    it is returns a copy of that state instead of being sent (see
+    unchanged_by_replace and unchanged_by_patch), and is counted in
+    `elided`. Calls made with dry_run or _preload_content=False are always
+    sent. A replace of a custom object is compared with its status, unless
+    it is made with _status_subresource=True.
+
+    The state is only as fresh as the last response: an object changed by
+    another client since then may be left as it is by a write that would
+    have reverted it. lookup, when given, is asked first and lets the
+    state come from an up to date source such as a watch driven cache.
+
+    Input:
+    maxsize: int. Maximum number of objects remembered, the least recently
+        used is forgotten first.
+    lookup: callable(operation name, path parameters dict) returning the
+        current state of the object as a model or dict, or None.
+
+    Example:
+        api_client.known_states = KnownStates(maxsize=10000)
+        core_v1.replace_namespaced_config_map(name, namespace, desired)
+        # a write against a state known otherwise
+        core_v1.replace_namespaced_config_map(name, namespace, desired,
+                                              _known_state=current)
+    """
+
+    def __init__(self, maxsize=10000, lookup=None):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.lookup = lookup
+        self.elided = 0
+        self._states = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._states)
+
+    def get(self, operation, path_params):
+        """Return the known state of the object an operation targets."""
+        if self.lookup is not None:
+            state = self.lookup(operation.name, path_params)
+            if state is not None:
+                return state
+        key = _key(operation, path_params)
+        with self._lock:
+            state = self._states.get(key)
+            if state is not None:
+                self._states.move_to_end(key)
+            return state
+
+    def remember(self, operation, path_params, state):
+        """
+        Record state as the known state of the object.
+
+        A copy of state is kept as a dict, so changes made afterwards to
+        the model returned to the caller do not change the known state.
+        """
+        key = _key(operation, path_params)
+        state = serialization.sanitize(state)
+        with self._lock:
+            self._states[key] = state
+            self._states.move_to_end(key)
+            while len(self._states) > self.maxsize:
+                self._states.popitem(last=False)
+
+    def forget(self, operation, path_params):
+        """Drop the known state of the object."""
+        with self._lock:
+            self._states.pop(_key(operation, path_params), None)
+
+    def clear(self):
+        with self._lock:
+            self._states.clear()
+
+
+def _key(operation, path_params):
+    # reads, replaces and patches of an object share the path template
+    return operation.path, tuple(sorted(six.iteritems(path_params)))
@@ -13,676 +13,705 @@
 
 from __future__ import absolute_import
 
-# import models into model package
-from kubernetes.client.models.admissionregistration_v1_service_reference import AdmissionregistrationV1ServiceReference
-from kubernetes.client.models.admissionregistration_v1_webhook_client_config import AdmissionregistrationV1WebhookClientConfig
-from kubernetes.client.models.admissionregistration_v1beta1_service_reference import AdmissionregistrationV1beta1ServiceReference
-from kubernetes.client.models.admissionregistration_v1beta1_webhook_client_config import AdmissionregistrationV1beta1WebhookClientConfig
-from kubernetes.client.models.apiextensions_v1_service_reference import ApiextensionsV1ServiceReference
-from kubernetes.client.models.apiextensions_v1_webhook_client_config import ApiextensionsV1WebhookClientConfig
-from kubernetes.client.models.apiextensions_v1beta1_service_reference import ApiextensionsV1beta1ServiceReference
-from kubernetes.client.models.apiextensions_v1beta1_webhook_client_config import ApiextensionsV1beta1WebhookClientConfig
-from kubernetes.client.models.apiregistration_v1_service_reference import ApiregistrationV1ServiceReference
-from kubernetes.client.models.apiregistration_v1beta1_service_reference import ApiregistrationV1beta1ServiceReference
-from kubernetes.client.models.apps_v1beta1_deployment import AppsV1beta1Deployment
-from kubernetes.client.models.apps_v1beta1_deployment_condition import AppsV1beta1DeploymentCondition
-from kubernetes.client.models.apps_v1beta1_deployment_list import AppsV1beta1DeploymentList
-from kubernetes.client.models.apps_v1beta1_deployment_rollback import AppsV1beta1DeploymentRollback
-from kubernetes.client.models.apps_v1beta1_deployment_spec import AppsV1beta1DeploymentSpec
-from kubernetes.client.models.apps_v1beta1_deployment_status import AppsV1beta1DeploymentStatus
-from kubernetes.client.models.apps_v1beta1_deployment_strategy import AppsV1beta1DeploymentStrategy
-from kubernetes.client.models.apps_v1beta1_rollback_config import AppsV1beta1RollbackConfig
-from kubernetes.client.models.apps_v1beta1_rolling_update_deployment import AppsV1beta1RollingUpdateDeployment
-from kubernetes.client.models.apps_v1beta1_scale import AppsV1beta1Scale
-from kubernetes.client.models.apps_v1beta1_scale_spec import AppsV1beta1ScaleSpec
-from kubernetes.client.models.apps_v1beta1_scale_status import AppsV1beta1ScaleStatus
-from kubernetes.client.models.extensions_v1beta1_allowed_csi_driver import ExtensionsV1beta1AllowedCSIDriver
-from kubernetes.client.models.extensions_v1beta1_allowed_flex_volume import ExtensionsV1beta1AllowedFlexVolume
-from kubernetes.client.models.extensions_v1beta1_allowed_host_path import ExtensionsV1beta1AllowedHostPath
-from kubernetes.client.models.extensions_v1beta1_deployment import ExtensionsV1beta1Deployment
-from kubernetes.client.models.extensions_v1beta1_deployment_condition import ExtensionsV1beta1DeploymentCondition
-from kubernetes.client.models.extensions_v1beta1_deployment_list import ExtensionsV1beta1DeploymentList
-from kubernetes.client.models.extensions_v1beta1_deployment_rollback import ExtensionsV1beta1DeploymentRollback
-from kubernetes.client.models.extensions_v1beta1_deployment_spec import ExtensionsV1beta1DeploymentSpec
-from kubernetes.client.models.extensions_v1beta1_deployment_status import ExtensionsV1beta1DeploymentStatus
-from kubernetes.client.models.extensions_v1beta1_deployment_strategy import ExtensionsV1beta1DeploymentStrategy
-from kubernetes.client.models.extensions_v1beta1_fs_group_strategy_options import ExtensionsV1beta1FSGroupStrategyOptions
-from kubernetes.client.models.extensions_v1beta1_http_ingress_path import ExtensionsV1beta1HTTPIngressPath
-from kubernetes.client.models.extensions_v1beta1_http_ingress_rule_value import ExtensionsV1beta1HTTPIngressRuleValue
-from kubernetes.client.models.extensions_v1beta1_host_port_range import ExtensionsV1beta1HostPortRange
-from kubernetes.client.models.extensions_v1beta1_id_range import ExtensionsV1beta1IDRange
-from kubernetes.client.models.extensions_v1beta1_ingress import ExtensionsV1beta1Ingress
-from kubernetes.client.models.extensions_v1beta1_ingress_backend import ExtensionsV1beta1IngressBackend
-from kubernetes.client.models.extensions_v1beta1_ingress_list import ExtensionsV1beta1IngressList
-from kubernetes.client.models.extensions_v1beta1_ingress_rule import ExtensionsV1beta1IngressRule
-from kubernetes.client.models.extensions_v1beta1_ingress_spec import ExtensionsV1beta1IngressSpec
-from kubernetes.client.models.extensions_v1beta1_ingress_status import ExtensionsV1beta1IngressStatus
-from kubernetes.client.models.extensions_v1beta1_ingress_tls import ExtensionsV1beta1IngressTLS
-from kubernetes.client.models.extensions_v1beta1_pod_security_policy import ExtensionsV1beta1PodSecurityPolicy
-from kubernetes.client.models.extensions_v1beta1_pod_security_policy_list import ExtensionsV1beta1PodSecurityPolicyList
-from kubernetes.client.models.extensions_v1beta1_pod_security_policy_spec import ExtensionsV1beta1PodSecurityPolicySpec
-from kubernetes.client.models.extensions_v1beta1_rollback_config import ExtensionsV1beta1RollbackConfig
-from kubernetes.client.models.extensions_v1beta1_rolling_update_deployment import ExtensionsV1beta1RollingUpdateDeployment
-from kubernetes.client.models.extensions_v1beta1_run_as_group_strategy_options import ExtensionsV1beta1RunAsGroupStrategyOptions
-from kubernetes.client.models.extensions_v1beta1_run_as_user_strategy_options import ExtensionsV1beta1RunAsUserStrategyOptions
-from kubernetes.client.models.extensions_v1beta1_runtime_class_strategy_options import ExtensionsV1beta1RuntimeClassStrategyOptions
-from kubernetes.client.models.extensions_v1beta1_se_linux_strategy_options import ExtensionsV1beta1SELinuxStrategyOptions
-from kubernetes.client.models.extensions_v1beta1_scale import ExtensionsV1beta1Scale
-from kubernetes.client.models.extensions_v1beta1_scale_spec import ExtensionsV1beta1ScaleSpec
-from kubernetes.client.models.extensions_v1beta1_scale_status import ExtensionsV1beta1ScaleStatus
-from kubernetes.client.models.extensions_v1beta1_supplemental_groups_strategy_options import ExtensionsV1beta1SupplementalGroupsStrategyOptions
-from kubernetes.client.models.flowcontrol_v1alpha1_subject import FlowcontrolV1alpha1Subject
-from kubernetes.client.models.networking_v1beta1_http_ingress_path import NetworkingV1beta1HTTPIngressPath
-from kubernetes.client.models.networking_v1beta1_http_ingress_rule_value import NetworkingV1beta1HTTPIngressRuleValue
-from kubernetes.client.models.networking_v1beta1_ingress import NetworkingV1beta1Ingress
-from kubernetes.client.models.networking_v1beta1_ingress_backend import NetworkingV1beta1IngressBackend
-from kubernetes.client.models.networking_v1beta1_ingress_list import NetworkingV1beta1IngressList
-from kubernetes.client.models.networking_v1beta1_ingress_rule import NetworkingV1beta1IngressRule
-from kubernetes.client.models.networking_v1beta1_ingress_spec import NetworkingV1beta1IngressSpec
-from kubernetes.client.models.networking_v1beta1_ingress_status import NetworkingV1beta1IngressStatus
-from kubernetes.client.models.networking_v1beta1_ingress_tls import NetworkingV1beta1IngressTLS
-from kubernetes.client.models.policy_v1beta1_allowed_csi_driver import PolicyV1beta1AllowedCSIDriver
-from kubernetes.client.models.policy_v1beta1_allowed_flex_volume import PolicyV1beta1AllowedFlexVolume
-from kubernetes.client.models.policy_v1beta1_allowed_host_path import PolicyV1beta1AllowedHostPath
-from kubernetes.client.models.policy_v1beta1_fs_group_strategy_options import PolicyV1beta1FSGroupStrategyOptions
-from kubernetes.client.models.policy_v1beta1_host_port_range import PolicyV1beta1HostPortRange
-from kubernetes.client.models.policy_v1beta1_id_range import PolicyV1beta1IDRange
-from kubernetes.client.models.policy_v1beta1_pod_security_policy import PolicyV1beta1PodSecurityPolicy
-from kubernetes.client.models.policy_v1beta1_pod_security_policy_list import PolicyV1beta1PodSecurityPolicyList
-from kubernetes.client.models.policy_v1beta1_pod_security_policy_spec import PolicyV1beta1PodSecurityPolicySpec
-from kubernetes.client.models.policy_v1beta1_run_as_group_strategy_options import PolicyV1beta1RunAsGroupStrategyOptions
-from kubernetes.client.models.policy_v1beta1_run_as_user_strategy_options import PolicyV1beta1RunAsUserStrategyOptions
-from kubernetes.client.models.policy_v1beta1_runtime_class_strategy_options import PolicyV1beta1RuntimeClassStrategyOptions
-from kubernetes.client.models.policy_v1beta1_se_linux_strategy_options import PolicyV1beta1SELinuxStrategyOptions
-from kubernetes.client.models.policy_v1beta1_supplemental_groups_strategy_options import PolicyV1beta1SupplementalGroupsStrategyOptions
-from kubernetes.client.models.rbac_v1alpha1_subject import RbacV1alpha1Subject
-from kubernetes.client.models.v1_api_group import V1APIGroup
-from kubernetes.client.models.v1_api_group_list import V1APIGroupList
-from kubernetes.client.models.v1_api_resource import V1APIResource
-from kubernetes.client.models.v1_api_resource_list import V1APIResourceList
-from kubernetes.client.models.v1_api_service import V1APIService
-from kubernetes.client.models.v1_api_service_condition import V1APIServiceCondition
-from kubernetes.client.models.v1_api_service_list import V1APIServiceList
-from kubernetes.client.models.v1_api_service_spec import V1APIServiceSpec
-from kubernetes.client.models.v1_api_service_status import V1APIServiceStatus
-from kubernetes.client.models.v1_api_versions import V1APIVersions
-from kubernetes.client.models.v1_aws_elastic_block_store_volume_source import V1AWSElasticBlockStoreVolumeSource
-from kubernetes.client.models.v1_affinity import V1Affinity
-from kubernetes.client.models.v1_aggregation_rule import V1AggregationRule
-from kubernetes.client.models.v1_attached_volume import V1AttachedVolume
-from kubernetes.client.models.v1_azure_disk_volume_source import V1AzureDiskVolumeSource
-from kubernetes.client.models.v1_azure_file_persistent_volume_source import V1AzureFilePersistentVolumeSource
-from kubernetes.client.models.v1_azure_file_volume_source import V1AzureFileVolumeSource
-from kubernetes.client.models.v1_binding import V1Binding
-from kubernetes.client.models.v1_bound_object_reference import V1BoundObjectReference
-from kubernetes.client.models.v1_csi_node import V1CSINode
-from kubernetes.client.models.v1_csi_node_driver import V1CSINodeDriver
-from kubernetes.client.models.v1_csi_node_list import V1CSINodeList
-from kubernetes.client.models.v1_csi_node_spec import V1CSINodeSpec
-from kubernetes.client.models.v1_csi_persistent_volume_source import V1CSIPersistentVolumeSource
-from kubernetes.client.models.v1_csi_volume_source import V1CSIVolumeSource
-from kubernetes.client.models.v1_capabilities import V1Capabilities
-from kubernetes.client.models.v1_ceph_fs_persistent_volume_source import V1CephFSPersistentVolumeSource
-from kubernetes.client.models.v1_ceph_fs_volume_source import V1CephFSVolumeSource
-from kubernetes.client.models.v1_cinder_persistent_volume_source import V1CinderPersistentVolumeSource
-from kubernetes.client.models.v1_cinder_volume_source import V1CinderVolumeSource
-from kubernetes.client.models.v1_client_ip_config import V1ClientIPConfig
-from kubernetes.client.models.v1_cluster_role import V1ClusterRole
-from kubernetes.client.models.v1_cluster_role_binding import V1ClusterRoleBinding
-from kubernetes.client.models.v1_cluster_role_binding_list import V1ClusterRoleBindingList
-from kubernetes.client.models.v1_cluster_role_list import V1ClusterRoleList
-from kubernetes.client.models.v1_component_condition import V1ComponentCondition
-from kubernetes.client.models.v1_component_status import V1ComponentStatus
-from kubernetes.client.models.v1_component_status_list import V1ComponentStatusList
-from kubernetes.client.models.v1_config_map import V1ConfigMap
-from kubernetes.client.models.v1_config_map_env_source import V1ConfigMapEnvSource
-from kubernetes.client.models.v1_config_map_key_selector import V1ConfigMapKeySelector
-from kubernetes.client.models.v1_config_map_list import V1ConfigMapList
-from kubernetes.client.models.v1_config_map_node_config_source import V1ConfigMapNodeConfigSource
-from kubernetes.client.models.v1_config_map_projection import V1ConfigMapProjection
-from kubernetes.client.models.v1_config_map_volume_source import V1ConfigMapVolumeSource
-from kubernetes.client.models.v1_container import V1Container
-from kubernetes.client.models.v1_container_image import V1ContainerImage
-from kubernetes.client.models.v1_container_port import V1ContainerPort
-from kubernetes.client.models.v1_container_state import V1ContainerState
-from kubernetes.client.models.v1_container_state_running import V1ContainerStateRunning
-from kubernetes.client.models.v1_container_state_terminated import V1ContainerStateTerminated
-from kubernetes.client.models.v1_container_state_waiting import V1ContainerStateWaiting
-from kubernetes.client.models.v1_container_status import V1ContainerStatus
-from kubernetes.client.models.v1_controller_revision import V1ControllerRevision
-from kubernetes.client.models.v1_controller_revision_list import V1ControllerRevisionList
-from kubernetes.client.models.v1_cross_version_object_reference import V1CrossVersionObjectReference
-from kubernetes.client.models.v1_custom_resource_column_definition import V1CustomResourceColumnDefinition
-from kubernetes.client.models.v1_custom_resource_conversion import V1CustomResourceConversion
-from kubernetes.client.models.v1_custom_resource_definition import V1CustomResourceDefinition
-from kubernetes.client.models.v1_custom_resource_definition_condition import V1CustomResourceDefinitionCondition
-from kubernetes.client.models.v1_custom_resource_definition_list import V1CustomResourceDefinitionList
-from kubernetes.client.models.v1_custom_resource_definition_names import V1CustomResourceDefinitionNames
-from kubernetes.client.models.v1_custom_resource_definition_spec import V1CustomResourceDefinitionSpec
-from kubernetes.client.models.v1_custom_resource_definition_status import V1CustomResourceDefinitionStatus
-from kubernetes.client.models.v1_custom_resource_definition_version import V1CustomResourceDefinitionVersion
-from kubernetes.client.models.v1_custom_resource_subresource_scale import V1CustomResourceSubresourceScale
-from kubernetes.client.models.v1_custom_resource_subresources import V1CustomResourceSubresources
-from kubernetes.client.models.v1_custom_resource_validation import V1CustomResourceValidation
-from kubernetes.client.models.v1_daemon_endpoint import V1DaemonEndpoint
-from kubernetes.client.models.v1_daemon_set import V1DaemonSet
-from kubernetes.client.models.v1_daemon_set_condition import V1DaemonSetCondition
-from kubernetes.client.models.v1_daemon_set_list import V1DaemonSetList
-from kubernetes.client.models.v1_daemon_set_spec import V1DaemonSetSpec
-from kubernetes.client.models.v1_daemon_set_status import V1DaemonSetStatus
-from kubernetes.client.models.v1_daemon_set_update_strategy import V1DaemonSetUpdateStrategy
-from kubernetes.client.models.v1_delete_options import V1DeleteOptions
-from kubernetes.client.models.v1_deployment import V1Deployment
-from kubernetes.client.models.v1_deployment_condition import V1DeploymentCondition
-from kubernetes.client.models.v1_deployment_list import V1DeploymentList
-from kubernetes.client.models.v1_deployment_spec import V1DeploymentSpec
-from kubernetes.client.models.v1_deployment_status import V1DeploymentStatus
-from kubernetes.client.models.v1_deployment_strategy import V1DeploymentStrategy
-from kubernetes.client.models.v1_downward_api_projection import V1DownwardAPIProjection
-from kubernetes.client.models.v1_downward_api_volume_file import V1DownwardAPIVolumeFile
-from kubernetes.client.models.v1_downward_api_volume_source import V1DownwardAPIVolumeSource
-from kubernetes.client.models.v1_empty_dir_volume_source import V1EmptyDirVolumeSource
-from kubernetes.client.models.v1_endpoint_address import V1EndpointAddress
-from kubernetes.client.models.v1_endpoint_port import V1EndpointPort
-from kubernetes.client.models.v1_endpoint_subset import V1EndpointSubset
-from kubernetes.client.models.v1_endpoints import V1Endpoints
-from kubernetes.client.models.v1_endpoints_list import V1EndpointsList
-from kubernetes.client.models.v1_env_from_source import V1EnvFromSource
-from kubernetes.client.models.v1_env_var import V1EnvVar
-from kubernetes.client.models.v1_env_var_source import V1EnvVarSource
-from kubernetes.client.models.v1_ephemeral_container import V1EphemeralContainer
-from kubernetes.client.models.v1_event import V1Event
-from kubernetes.client.models.v1_event_list import V1EventList
-from kubernetes.client.models.v1_event_series import V1EventSeries
-from kubernetes.client.models.v1_event_source import V1EventSource
-from kubernetes.client.models.v1_exec_action import V1ExecAction
-from kubernetes.client.models.v1_external_documentation import V1ExternalDocumentation
-from kubernetes.client.models.v1_fc_volume_source import V1FCVolumeSource
-from kubernetes.client.models.v1_flex_persistent_volume_source import V1FlexPersistentVolumeSource
-from kubernetes.client.models.v1_flex_volume_source import V1FlexVolumeSource
-from kubernetes.client.models.v1_flocker_volume_source import V1FlockerVolumeSource
-from kubernetes.client.models.v1_gce_persistent_disk_volume_source import V1GCEPersistentDiskVolumeSource
-from kubernetes.client.models.v1_git_repo_volume_source import V1GitRepoVolumeSource
-from kubernetes.client.models.v1_glusterfs_persistent_volume_source import V1GlusterfsPersistentVolumeSource
-from kubernetes.client.models.v1_glusterfs_volume_source import V1GlusterfsVolumeSource
-from kubernetes.client.models.v1_group_version_for_discovery import V1GroupVersionForDiscovery
-from kubernetes.client.models.v1_http_get_action import V1HTTPGetAction
-from kubernetes.client.models.v1_http_header import V1HTTPHeader
-from kubernetes.client.models.v1_handler import V1Handler
-from kubernetes.client.models.v1_horizontal_pod_autoscaler import V1HorizontalPodAutoscaler
-from kubernetes.client.models.v1_horizontal_pod_autoscaler_list import V1HorizontalPodAutoscalerList
-from kubernetes.client.models.v1_horizontal_pod_autoscaler_spec import V1HorizontalPodAutoscalerSpec
-from kubernetes.client.models.v1_horizontal_pod_autoscaler_status import V1HorizontalPodAutoscalerStatus
-from kubernetes.client.models.v1_host_alias import V1HostAlias
-from kubernetes.client.models.v1_host_path_volume_source import V1HostPathVolumeSource
-from kubernetes.client.models.v1_ip_block import V1IPBlock
-from kubernetes.client.models.v1_iscsi_persistent_volume_source import V1ISCSIPersistentVolumeSource
-from kubernetes.client.models.v1_iscsi_volume_source import V1ISCSIVolumeSource
-from kubernetes.client.models.v1_json_schema_props import V1JSONSchemaProps
-from kubernetes.client.models.v1_job import V1Job
-from kubernetes.client.models.v1_job_condition import V1JobCondition
-from kubernetes.client.models.v1_job_list import V1JobList
-from kubernetes.client.models.v1_job_spec import V1JobSpec
-from kubernetes.client.models.v1_job_status import V1JobStatus
-from kubernetes.client.models.v1_key_to_path import V1KeyToPath
-from kubernetes.client.models.v1_label_selector import V1LabelSelector
-from kubernetes.client.models.v1_label_selector_requirement import V1LabelSelectorRequirement
-from kubernetes.client.models.v1_lease import V1Lease
-from kubernetes.client.models.v1_lease_list import V1LeaseList
-from kubernetes.client.models.v1_lease_spec import V1LeaseSpec
-from kubernetes.client.models.v1_lifecycle import V1Lifecycle
-from kubernetes.client.models.v1_limit_range import V1LimitRange
-from kubernetes.client.models.v1_limit_range_item import V1LimitRangeItem
-from kubernetes.client.models.v1_limit_range_list import V1LimitRangeList
-from kubernetes.client.models.v1_limit_range_spec import V1LimitRangeSpec
-from kubernetes.client.models.v1_list_meta import V1ListMeta
-from kubernetes.client.models.v1_load_balancer_ingress import V1LoadBalancerIngress
-from kubernetes.client.models.v1_load_balancer_status import V1LoadBalancerStatus
-from kubernetes.client.models.v1_local_object_reference import V1LocalObjectReference
-from kubernetes.client.models.v1_local_subject_access_review import V1LocalSubjectAccessReview
-from kubernetes.client.models.v1_local_volume_source import V1LocalVolumeSource
-from kubernetes.client.models.v1_managed_fields_entry import V1ManagedFieldsEntry
-from kubernetes.client.models.v1_mutating_webhook import V1MutatingWebhook
-from kubernetes.client.models.v1_mutating_webhook_configuration import V1MutatingWebhookConfiguration
-from kubernetes.client.models.v1_mutating_webhook_configuration_list import V1MutatingWebhookConfigurationList
-from kubernetes.client.models.v1_nfs_volume_source import V1NFSVolumeSource
-from kubernetes.client.models.v1_namespace import V1Namespace
-from kubernetes.client.models.v1_namespace_condition import V1NamespaceCondition
-from kubernetes.client.models.v1_namespace_list import V1NamespaceList
-from kubernetes.client.models.v1_namespace_spec import V1NamespaceSpec
-from kubernetes.client.models.v1_namespace_status import V1NamespaceStatus
-from kubernetes.client.models.v1_network_policy import V1NetworkPolicy
-from kubernetes.client.models.v1_network_policy_egress_rule import V1NetworkPolicyEgressRule
-from kubernetes.client.models.v1_network_policy_ingress_rule import V1NetworkPolicyIngressRule
-from kubernetes.client.models.v1_network_policy_list import V1NetworkPolicyList
-from kubernetes.client.models.v1_network_policy_peer import V1NetworkPolicyPeer
-from kubernetes.client.models.v1_network_policy_port import V1NetworkPolicyPort
-from kubernetes.client.models.v1_network_policy_spec import V1NetworkPolicySpec
-from kubernetes.client.models.v1_node import V1Node
-from kubernetes.client.models.v1_node_address import V1NodeAddress
-from kubernetes.client.models.v1_node_affinity import V1NodeAffinity
-from kubernetes.client.models.v1_node_condition import V1NodeCondition
-from kubernetes.client.models.v1_node_config_source import V1NodeConfigSource
-from kubernetes.client.models.v1_node_config_status import V1NodeConfigStatus
-from kubernetes.client.models.v1_node_daemon_endpoints import V1NodeDaemonEndpoints
-from kubernetes.client.models.v1_node_list import V1NodeList
-from kubernetes.client.models.v1_node_selector import V1NodeSelector
-from kubernetes.client.models.v1_node_selector_requirement import V1NodeSelectorRequirement
-from kubernetes.client.models.v1_node_selector_term import V1NodeSelectorTerm
-from kubernetes.client.models.v1_node_spec import V1NodeSpec
-from kubernetes.client.models.v1_node_status import V1NodeStatus
-from kubernetes.client.models.v1_node_system_info import V1NodeSystemInfo
-from kubernetes.client.models.v1_non_resource_attributes import V1NonResourceAttributes
-from kubernetes.client.models.v1_non_resource_rule import V1NonResourceRule
-from kubernetes.client.models.v1_object_field_selector import V1ObjectFieldSelector
-from kubernetes.client.models.v1_object_meta import V1ObjectMeta
-from kubernetes.client.models.v1_object_reference import V1ObjectReference
-from kubernetes.client.models.v1_owner_reference import V1OwnerReference
-from kubernetes.client.models.v1_persistent_volume import V1PersistentVolume
-from kubernetes.client.models.v1_persistent_volume_claim import V1PersistentVolumeClaim
-from kubernetes.client.models.v1_persistent_volume_claim_condition import V1PersistentVolumeClaimCondition
-from kubernetes.client.models.v1_persistent_volume_claim_list import V1PersistentVolumeClaimList
-from kubernetes.client.models.v1_persistent_volume_claim_spec import V1PersistentVolumeClaimSpec
-from kubernetes.client.models.v1_persistent_volume_claim_status import V1PersistentVolumeClaimStatus
-from kubernetes.client.models.v1_persistent_volume_claim_volume_source import V1PersistentVolumeClaimVolumeSource
-from kubernetes.client.models.v1_persistent_volume_list import V1PersistentVolumeList
-from kubernetes.client.models.v1_persistent_volume_spec import V1PersistentVolumeSpec
-from kubernetes.client.models.v1_persistent_volume_status import V1PersistentVolumeStatus
-from kubernetes.client.models.v1_photon_persistent_disk_volume_source import V1PhotonPersistentDiskVolumeSource
-from kubernetes.client.models.v1_pod import V1Pod
-from kubernetes.client.models.v1_pod_affinity import V1PodAffinity
-from kubernetes.client.models.v1_pod_affinity_term import V1PodAffinityTerm
-from kubernetes.client.models.v1_pod_anti_affinity import V1PodAntiAffinity
-from kubernetes.client.models.v1_pod_condition import V1PodCondition
-from kubernetes.client.models.v1_pod_dns_config import V1PodDNSConfig
-from kubernetes.client.models.v1_pod_dns_config_option import V1PodDNSConfigOption
-from kubernetes.client.models.v1_pod_ip import V1PodIP
-from kubernetes.client.models.v1_pod_list import V1PodList
-from kubernetes.client.models.v1_pod_readiness_gate import V1PodReadinessGate
-from kubernetes.client.models.v1_pod_security_context import V1PodSecurityContext
-from kubernetes.client.models.v1_pod_spec import V1PodSpec
-from kubernetes.client.models.v1_pod_status import V1PodStatus
-from kubernetes.client.models.v1_pod_template import V1PodTemplate
-from kubernetes.client.models.v1_pod_template_list import V1PodTemplateList
-from kubernetes.client.models.v1_pod_template_spec import V1PodTemplateSpec
-from kubernetes.client.models.v1_policy_rule import V1PolicyRule
-from kubernetes.client.models.v1_portworx_volume_source import V1PortworxVolumeSource
-from kubernetes.client.models.v1_preconditions import V1Preconditions
-from kubernetes.client.models.v1_preferred_scheduling_term import V1PreferredSchedulingTerm
-from kubernetes.client.models.v1_priority_class import V1PriorityClass
-from kubernetes.client.models.v1_priority_class_list import V1PriorityClassList
-from kubernetes.client.models.v1_probe import V1Probe
-from kubernetes.client.models.v1_projected_volume_source import V1ProjectedVolumeSource
-from kubernetes.client.models.v1_quobyte_volume_source import V1QuobyteVolumeSource
-from kubernetes.client.models.v1_rbd_persistent_volume_source import V1RBDPersistentVolumeSource
-from kubernetes.client.models.v1_rbd_volume_source import V1RBDVolumeSource
-from kubernetes.client.models.v1_replica_set import V1ReplicaSet
-from kubernetes.client.models.v1_replica_set_condition import V1ReplicaSetCondition
-from kubernetes.client.models.v1_replica_set_list import V1ReplicaSetList
-from kubernetes.client.models.v1_replica_set_spec import V1ReplicaSetSpec
-from kubernetes.client.models.v1_replica_set_status import V1ReplicaSetStatus
-from kubernetes.client.models.v1_replication_controller import V1ReplicationController
-from kubernetes.client.models.v1_replication_controller_condition import V1ReplicationControllerCondition
-from kubernetes.client.models.v1_replication_controller_list import V1ReplicationControllerList
-from kubernetes.client.models.v1_replication_controller_spec import V1ReplicationControllerSpec
-from kubernetes.client.models.v1_replication_controller_status import V1ReplicationControllerStatus
-from kubernetes.client.models.v1_resource_attributes import V1ResourceAttributes
-from kubernetes.client.models.v1_resource_field_selector import V1ResourceFieldSelector
-from kubernetes.client.models.v1_resource_quota import V1ResourceQuota
-from kubernetes.client.models.v1_resource_quota_list import V1ResourceQuotaList
-from kubernetes.client.models.v1_resource_quota_spec import V1ResourceQuotaSpec
-from kubernetes.client.models.v1_resource_quota_status import V1ResourceQuotaStatus
-from kubernetes.client.models.v1_resource_requirements import V1ResourceRequirements
-from kubernetes.client.models.v1_resource_rule import V1ResourceRule
-from kubernetes.client.models.v1_role import V1Role
-from kubernetes.client.models.v1_role_binding import V1RoleBinding
-from kubernetes.client.models.v1_role_binding_list import V1RoleBindingList
-from kubernetes.client.models.v1_role_list import V1RoleList
-from kubernetes.client.models.v1_role_ref import V1RoleRef
-from kubernetes.client.models.v1_rolling_update_daemon_set import V1RollingUpdateDaemonSet
-from kubernetes.client.models.v1_rolling_update_deployment import V1RollingUpdateDeployment
-from kubernetes.client.models.v1_rolling_update_stateful_set_strategy import V1RollingUpdateStatefulSetStrategy
-from kubernetes.client.models.v1_rule_with_operations import V1RuleWithOperations
-from kubernetes.client.models.v1_se_linux_options import V1SELinuxOptions
-from kubernetes.client.models.v1_scale import V1Scale
-from kubernetes.client.models.v1_scale_io_persistent_volume_source import V1ScaleIOPersistentVolumeSource
-from kubernetes.client.models.v1_scale_io_volume_source import V1ScaleIOVolumeSource
-from kubernetes.client.models.v1_scale_spec import V1ScaleSpec
-from kubernetes.client.models.v1_scale_status import V1ScaleStatus
-from kubernetes.client.models.v1_scope_selector import V1ScopeSelector
-from kubernetes.client.models.v1_scoped_resource_selector_requirement import V1ScopedResourceSelectorRequirement
-from kubernetes.client.models.v1_secret import V1Secret
-from kubernetes.client.models.v1_secret_env_source import V1SecretEnvSource
-from kubernetes.client.models.v1_secret_key_selector import V1SecretKeySelector
-from kubernetes.client.models.v1_secret_list import V1SecretList
-from kubernetes.client.models.v1_secret_projection import V1SecretProjection
-from kubernetes.client.models.v1_secret_reference import V1SecretReference
-from kubernetes.client.models.v1_secret_volume_source import V1SecretVolumeSource
-from kubernetes.client.models.v1_security_context import V1SecurityContext
-from kubernetes.client.models.v1_self_subject_access_review import V1SelfSubjectAccessReview
-from kubernetes.client.models.v1_self_subject_access_review_spec import V1SelfSubjectAccessReviewSpec
-from kubernetes.client.models.v1_self_subject_rules_review import V1SelfSubjectRulesReview
-from kubernetes.client.models.v1_self_subject_rules_review_spec import V1SelfSubjectRulesReviewSpec
-from kubernetes.client.models.v1_server_address_by_client_cidr import V1ServerAddressByClientCIDR
-from kubernetes.client.models.v1_service import V1Service
-from kubernetes.client.models.v1_service_account import V1ServiceAccount
-from kubernetes.client.models.v1_service_account_list import V1ServiceAccountList
-from kubernetes.client.models.v1_service_account_token_projection import V1ServiceAccountTokenProjection
-from kubernetes.client.models.v1_service_list import V1ServiceList
-from kubernetes.client.models.v1_service_port import V1ServicePort
-from kubernetes.client.models.v1_service_spec import V1ServiceSpec
-from kubernetes.client.models.v1_service_status import V1ServiceStatus
-from kubernetes.client.models.v1_session_affinity_config import V1SessionAffinityConfig
-from kubernetes.client.models.v1_stateful_set import V1StatefulSet
-from kubernetes.client.models.v1_stateful_set_condition import V1StatefulSetCondition
-from kubernetes.client.models.v1_stateful_set_list import V1StatefulSetList
-from kubernetes.client.models.v1_stateful_set_spec import V1StatefulSetSpec
-from kubernetes.client.models.v1_stateful_set_status import V1StatefulSetStatus
-from kubernetes.client.models.v1_stateful_set_update_strategy import V1StatefulSetUpdateStrategy
-from kubernetes.client.models.v1_status import V1Status
-from kubernetes.client.models.v1_status_cause import V1StatusCause
-from kubernetes.client.models.v1_status_details import V1StatusDetails
-from kubernetes.client.models.v1_storage_class import V1StorageClass
-from kubernetes.client.models.v1_storage_class_list import V1StorageClassList
-from kubernetes.client.models.v1_storage_os_persistent_volume_source import V1StorageOSPersistentVolumeSource
-from kubernetes.client.models.v1_storage_os_volume_source import V1StorageOSVolumeSource
-from kubernetes.client.models.v1_subject import V1Subject
-from kubernetes.client.models.v1_subject_access_review import V1SubjectAccessReview
-from kubernetes.client.models.v1_subject_access_review_spec import V1SubjectAccessReviewSpec
-from kubernetes.client.models.v1_subject_access_review_status import V1SubjectAccessReviewStatus
-from kubernetes.client.models.v1_subject_rules_review_status import V1SubjectRulesReviewStatus
-from kubernetes.client.models.v1_sysctl import V1Sysctl
-from kubernetes.client.models.v1_tcp_socket_action import V1TCPSocketAction
-from kubernetes.client.models.v1_taint import V1Taint
-from kubernetes.client.models.v1_token_request import V1TokenRequest
-from kubernetes.client.models.v1_token_request_spec import V1TokenRequestSpec
-from kubernetes.client.models.v1_token_request_status import V1TokenRequestStatus
-from kubernetes.client.models.v1_token_review import V1TokenReview
-from kubernetes.client.models.v1_token_review_spec import V1TokenReviewSpec
-from kubernetes.client.models.v1_token_review_status import V1TokenReviewStatus
-from kubernetes.client.models.v1_toleration import V1Toleration
-from kubernetes.client.models.v1_topology_selector_label_requirement import V1TopologySelectorLabelRequirement
-from kubernetes.client.models.v1_topology_selector_term import V1TopologySelectorTerm
-from kubernetes.client.models.v1_topology_spread_constraint import V1TopologySpreadConstraint
-from kubernetes.client.models.v1_typed_local_object_reference import V1TypedLocalObjectReference
-from kubernetes.client.models.v1_user_info import V1UserInfo
-from kubernetes.client.models.v1_validating_webhook import V1ValidatingWebhook
-from kubernetes.client.models.v1_validating_webhook_configuration import V1ValidatingWebhookConfiguration
-from kubernetes.client.models.v1_validating_webhook_configuration_list import V1ValidatingWebhookConfigurationList
-from kubernetes.client.models.v1_volume import V1Volume
-from kubernetes.client.models.v1_volume_attachment import V1VolumeAttachment
-from kubernetes.client.models.v1_volume_attachment_list import V1VolumeAttachmentList
-from kubernetes.client.models.v1_volume_attachment_source import V1VolumeAttachmentSource
-from kubernetes.client.models.v1_volume_attachment_spec import V1VolumeAttachmentSpec
-from kubernetes.client.models.v1_volume_attachment_status import V1VolumeAttachmentStatus
-from kubernetes.client.models.v1_volume_device import V1VolumeDevice
-from kubernetes.client.models.v1_volume_error import V1VolumeError
-from kubernetes.client.models.v1_volume_mount import V1VolumeMount
-from kubernetes.client.models.v1_volume_node_affinity import V1VolumeNodeAffinity
-from kubernetes.client.models.v1_volume_node_resources import V1VolumeNodeResources
-from kubernetes.client.models.v1_volume_projection import V1VolumeProjection
-from kubernetes.client.models.v1_vsphere_virtual_disk_volume_source import V1VsphereVirtualDiskVolumeSource
-from kubernetes.client.models.v1_watch_event import V1WatchEvent
-from kubernetes.client.models.v1_webhook_conversion import V1WebhookConversion
-from kubernetes.client.models.v1_weighted_pod_affinity_term import V1WeightedPodAffinityTerm
-from kubernetes.client.models.v1_windows_security_context_options import V1WindowsSecurityContextOptions
-from kubernetes.client.models.v1alpha1_aggregation_rule import V1alpha1AggregationRule
-from kubernetes.client.models.v1alpha1_audit_sink import V1alpha1AuditSink
-from kubernetes.client.models.v1alpha1_audit_sink_list import V1alpha1AuditSinkList
-from kubernetes.client.models.v1alpha1_audit_sink_spec import V1alpha1AuditSinkSpec
-from kubernetes.client.models.v1alpha1_cluster_role import V1alpha1ClusterRole
-from kubernetes.client.models.v1alpha1_cluster_role_binding import V1alpha1ClusterRoleBinding
-from kubernetes.client.models.v1alpha1_cluster_role_binding_list import V1alpha1ClusterRoleBindingList
-from kubernetes.client.models.v1alpha1_cluster_role_list import V1alpha1ClusterRoleList
-from kubernetes.client.models.v1alpha1_flow_distinguisher_method import V1alpha1FlowDistinguisherMethod
-from kubernetes.client.models.v1alpha1_flow_schema import V1alpha1FlowSchema
-from kubernetes.client.models.v1alpha1_flow_schema_condition import V1alpha1FlowSchemaCondition
-from kubernetes.client.models.v1alpha1_flow_schema_list import V1alpha1FlowSchemaList
-from kubernetes.client.models.v1alpha1_flow_schema_spec import V1alpha1FlowSchemaSpec
-from kubernetes.client.models.v1alpha1_flow_schema_status import V1alpha1FlowSchemaStatus
-from kubernetes.client.models.v1alpha1_group_subject import V1alpha1GroupSubject
-from kubernetes.client.models.v1alpha1_limit_response import V1alpha1LimitResponse
-from kubernetes.client.models.v1alpha1_limited_priority_level_configuration import V1alpha1LimitedPriorityLevelConfiguration
-from kubernetes.client.models.v1alpha1_non_resource_policy_rule import V1alpha1NonResourcePolicyRule
-from kubernetes.client.models.v1alpha1_overhead import V1alpha1Overhead
-from kubernetes.client.models.v1alpha1_pod_preset import V1alpha1PodPreset
-from kubernetes.client.models.v1alpha1_pod_preset_list import V1alpha1PodPresetList
-from kubernetes.client.models.v1alpha1_pod_preset_spec import V1alpha1PodPresetSpec
-from kubernetes.client.models.v1alpha1_policy import V1alpha1Policy
-from kubernetes.client.models.v1alpha1_policy_rule import V1alpha1PolicyRule
-from kubernetes.client.models.v1alpha1_policy_rules_with_subjects import V1alpha1PolicyRulesWithSubjects
-from kubernetes.client.models.v1alpha1_priority_class import V1alpha1PriorityClass
-from kubernetes.client.models.v1alpha1_priority_class_list import V1alpha1PriorityClassList
-from kubernetes.client.models.v1alpha1_priority_level_configuration import V1alpha1PriorityLevelConfiguration
-from kubernetes.client.models.v1alpha1_priority_level_configuration_condition import V1alpha1PriorityLevelConfigurationCondition
-from kubernetes.client.models.v1alpha1_priority_level_configuration_list import V1alpha1PriorityLevelConfigurationList
-from kubernetes.client.models.v1alpha1_priority_level_configuration_reference import V1alpha1PriorityLevelConfigurationReference
-from kubernetes.client.models.v1alpha1_priority_level_configuration_spec import V1alpha1PriorityLevelConfigurationSpec
-from kubernetes.client.models.v1alpha1_priority_level_configuration_status import V1alpha1PriorityLevelConfigurationStatus
-from kubernetes.client.models.v1alpha1_queuing_configuration import V1alpha1QueuingConfiguration
-from kubernetes.client.models.v1alpha1_resource_policy_rule import V1alpha1ResourcePolicyRule
-from kubernetes.client.models.v1alpha1_role import V1alpha1Role
-from kubernetes.client.models.v1alpha1_role_binding import V1alpha1RoleBinding
-from kubernetes.client.models.v1alpha1_role_binding_list import V1alpha1RoleBindingList
-from kubernetes.client.models.v1alpha1_role_list import V1alpha1RoleList
-from kubernetes.client.models.v1alpha1_role_ref import V1alpha1RoleRef
-from kubernetes.client.models.v1alpha1_runtime_class import V1alpha1RuntimeClass
-from kubernetes.client.models.v1alpha1_runtime_class_list import V1alpha1RuntimeClassList
-from kubernetes.client.models.v1alpha1_runtime_class_spec import V1alpha1RuntimeClassSpec
-from kubernetes.client.models.v1alpha1_scheduling import V1alpha1Scheduling
-from kubernetes.client.models.v1alpha1_service_account_subject import V1alpha1ServiceAccountSubject
-from kubernetes.client.models.v1alpha1_service_reference import V1alpha1ServiceReference
-from kubernetes.client.models.v1alpha1_user_subject import V1alpha1UserSubject
-from kubernetes.client.models.v1alpha1_volume_attachment import V1alpha1VolumeAttachment
-from kubernetes.client.models.v1alpha1_volume_attachment_list import V1alpha1VolumeAttachmentList
-from kubernetes.client.models.v1alpha1_volume_attachment_source import V1alpha1VolumeAttachmentSource
-from kubernetes.client.models.v1alpha1_volume_attachment_spec import V1alpha1VolumeAttachmentSpec
-from kubernetes.client.models.v1alpha1_volume_attachment_status import V1alpha1VolumeAttachmentStatus
-from kubernetes.client.models.v1alpha1_volume_error import V1alpha1VolumeError
-from kubernetes.client.models.v1alpha1_webhook import V1alpha1Webhook
-from kubernetes.client.models.v1alpha1_webhook_client_config import V1alpha1WebhookClientConfig
-from kubernetes.client.models.v1alpha1_webhook_throttle_config import V1alpha1WebhookThrottleConfig
-from kubernetes.client.models.v1beta1_api_service import V1beta1APIService
-from kubernetes.client.models.v1beta1_api_service_condition import V1beta1APIServiceCondition
-from kubernetes.client.models.v1beta1_api_service_list import V1beta1APIServiceList
-from kubernetes.client.models.v1beta1_api_service_spec import V1beta1APIServiceSpec
-from kubernetes.client.models.v1beta1_api_service_status import V1beta1APIServiceStatus
-from kubernetes.client.models.v1beta1_aggregation_rule import V1beta1AggregationRule
-from kubernetes.client.models.v1beta1_csi_driver import V1beta1CSIDriver
-from kubernetes.client.models.v1beta1_csi_driver_list import V1beta1CSIDriverList
-from kubernetes.client.models.v1beta1_csi_driver_spec import V1beta1CSIDriverSpec
-from kubernetes.client.models.v1beta1_csi_node import V1beta1CSINode
-from kubernetes.client.models.v1beta1_csi_node_driver import V1beta1CSINodeDriver
-from kubernetes.client.models.v1beta1_csi_node_list import V1beta1CSINodeList
-from kubernetes.client.models.v1beta1_csi_node_spec import V1beta1CSINodeSpec
-from kubernetes.client.models.v1beta1_certificate_signing_request import V1beta1CertificateSigningRequest
-from kubernetes.client.models.v1beta1_certificate_signing_request_condition import V1beta1CertificateSigningRequestCondition
-from kubernetes.client.models.v1beta1_certificate_signing_request_list import V1beta1CertificateSigningRequestList
-from kubernetes.client.models.v1beta1_certificate_signing_request_spec import V1beta1CertificateSigningRequestSpec
-from kubernetes.client.models.v1beta1_certificate_signing_request_status import V1beta1CertificateSigningRequestStatus
-from kubernetes.client.models.v1beta1_cluster_role import V1beta1ClusterRole
-from kubernetes.client.models.v1beta1_cluster_role_binding import V1beta1ClusterRoleBinding
-from kubernetes.client.models.v1beta1_cluster_role_binding_list import V1beta1ClusterRoleBindingList
-from kubernetes.client.models.v1beta1_cluster_role_list import V1beta1ClusterRoleList
-from kubernetes.client.models.v1beta1_controller_revision import V1beta1ControllerRevision
-from kubernetes.client.models.v1beta1_controller_revision_list import V1beta1ControllerRevisionList
-from kubernetes.client.models.v1beta1_cron_job import V1beta1CronJob
-from kubernetes.client.models.v1beta1_cron_job_list import V1beta1CronJobList
-from kubernetes.client.models.v1beta1_cron_job_spec import V1beta1CronJobSpec
-from kubernetes.client.models.v1beta1_cron_job_status import V1beta1CronJobStatus
-from kubernetes.client.models.v1beta1_custom_resource_column_definition import V1beta1CustomResourceColumnDefinition
-from kubernetes.client.models.v1beta1_custom_resource_conversion import V1beta1CustomResourceConversion
-from kubernetes.client.models.v1beta1_custom_resource_definition import V1beta1CustomResourceDefinition
-from kubernetes.client.models.v1beta1_custom_resource_definition_condition import V1beta1CustomResourceDefinitionCondition
-from kubernetes.client.models.v1beta1_custom_resource_definition_list import V1beta1CustomResourceDefinitionList
-from kubernetes.client.models.v1beta1_custom_resource_definition_names import V1beta1CustomResourceDefinitionNames
-from kubernetes.client.models.v1beta1_custom_resource_definition_spec import V1beta1CustomResourceDefinitionSpec
-from kubernetes.client.models.v1beta1_custom_resource_definition_status import V1beta1CustomResourceDefinitionStatus
-from kubernetes.client.models.v1beta1_custom_resource_definition_version import V1beta1CustomResourceDefinitionVersion
-from kubernetes.client.models.v1beta1_custom_resource_subresource_scale import V1beta1CustomResourceSubresourceScale
-from kubernetes.client.models.v1beta1_custom_resource_subresources import V1beta1CustomResourceSubresources
-from kubernetes.client.models.v1beta1_custom_resource_validation import V1beta1CustomResourceValidation
-from kubernetes.client.models.v1beta1_daemon_set import V1beta1DaemonSet
-from kubernetes.client.models.v1beta1_daemon_set_condition import V1beta1DaemonSetCondition
-from kubernetes.client.models.v1beta1_daemon_set_list import V1beta1DaemonSetList
-from kubernetes.client.models.v1beta1_daemon_set_spec import V1beta1DaemonSetSpec
-from kubernetes.client.models.v1beta1_daemon_set_status import V1beta1DaemonSetStatus
-from kubernetes.client.models.v1beta1_daemon_set_update_strategy import V1beta1DaemonSetUpdateStrategy
-from kubernetes.client.models.v1beta1_endpoint import V1beta1Endpoint
-from kubernetes.client.models.v1beta1_endpoint_conditions import V1beta1EndpointConditions
-from kubernetes.client.models.v1beta1_endpoint_port import V1beta1EndpointPort
-from kubernetes.client.models.v1beta1_endpoint_slice import V1beta1EndpointSlice
-from kubernetes.client.models.v1beta1_endpoint_slice_list import V1beta1EndpointSliceList
-from kubernetes.client.models.v1beta1_event import V1beta1Event
-from kubernetes.client.models.v1beta1_event_list import V1beta1EventList
-from kubernetes.client.models.v1beta1_event_series import V1beta1EventSeries
-from kubernetes.client.models.v1beta1_eviction import V1beta1Eviction
-from kubernetes.client.models.v1beta1_external_documentation import V1beta1ExternalDocumentation
-from kubernetes.client.models.v1beta1_ip_block import V1beta1IPBlock
-from kubernetes.client.models.v1beta1_json_schema_props import V1beta1JSONSchemaProps
-from kubernetes.client.models.v1beta1_job_template_spec import V1beta1JobTemplateSpec
-from kubernetes.client.models.v1beta1_lease import V1beta1Lease
-from kubernetes.client.models.v1beta1_lease_list import V1beta1LeaseList
-from kubernetes.client.models.v1beta1_lease_spec import V1beta1LeaseSpec
-from kubernetes.client.models.v1beta1_local_subject_access_review import V1beta1LocalSubjectAccessReview
-from kubernetes.client.models.v1beta1_mutating_webhook import V1beta1MutatingWebhook
-from kubernetes.client.models.v1beta1_mutating_webhook_configuration import V1beta1MutatingWebhookConfiguration
-from kubernetes.client.models.v1beta1_mutating_webhook_configuration_list import V1beta1MutatingWebhookConfigurationList
-from kubernetes.client.models.v1beta1_network_policy import V1beta1NetworkPolicy
-from kubernetes.client.models.v1beta1_network_policy_egress_rule import V1beta1NetworkPolicyEgressRule
-from kubernetes.client.models.v1beta1_network_policy_ingress_rule import V1beta1NetworkPolicyIngressRule
-from kubernetes.client.models.v1beta1_network_policy_list import V1beta1NetworkPolicyList
-from kubernetes.client.models.v1beta1_network_policy_peer import V1beta1NetworkPolicyPeer
-from kubernetes.client.models.v1beta1_network_policy_port import V1beta1NetworkPolicyPort
-from kubernetes.client.models.v1beta1_network_policy_spec import V1beta1NetworkPolicySpec
-from kubernetes.client.models.v1beta1_non_resource_attributes import V1beta1NonResourceAttributes
-from kubernetes.client.models.v1beta1_non_resource_rule import V1beta1NonResourceRule
-from kubernetes.client.models.v1beta1_overhead import V1beta1Overhead
-from kubernetes.client.models.v1beta1_pod_disruption_budget import V1beta1PodDisruptionBudget
-from kubernetes.client.models.v1beta1_pod_disruption_budget_list import V1beta1PodDisruptionBudgetList
-from kubernetes.client.models.v1beta1_pod_disruption_budget_spec import V1beta1PodDisruptionBudgetSpec
-from kubernetes.client.models.v1beta1_pod_disruption_budget_status import V1beta1PodDisruptionBudgetStatus
-from kubernetes.client.models.v1beta1_policy_rule import V1beta1PolicyRule
-from kubernetes.client.models.v1beta1_priority_class import V1beta1PriorityClass
-from kubernetes.client.models.v1beta1_priority_class_list import V1beta1PriorityClassList
-from kubernetes.client.models.v1beta1_replica_set import V1beta1ReplicaSet
-from kubernetes.client.models.v1beta1_replica_set_condition import V1beta1ReplicaSetCondition
-from kubernetes.client.models.v1beta1_replica_set_list import V1beta1ReplicaSetList
-from kubernetes.client.models.v1beta1_replica_set_spec import V1beta1ReplicaSetSpec
-from kubernetes.client.models.v1beta1_replica_set_status import V1beta1ReplicaSetStatus
-from kubernetes.client.models.v1beta1_resource_attributes import V1beta1ResourceAttributes
-from kubernetes.client.models.v1beta1_resource_rule import V1beta1ResourceRule
-from kubernetes.client.models.v1beta1_role import V1beta1Role
-from kubernetes.client.models.v1beta1_role_binding import V1beta1RoleBinding
-from kubernetes.client.models.v1beta1_role_binding_list import V1beta1RoleBindingList
-from kubernetes.client.models.v1beta1_role_list import V1beta1RoleList
-from kubernetes.client.models.v1beta1_role_ref import V1beta1RoleRef
-from kubernetes.client.models.v1beta1_rolling_update_daemon_set import V1beta1RollingUpdateDaemonSet
-from kubernetes.client.models.v1beta1_rolling_update_stateful_set_strategy import V1beta1RollingUpdateStatefulSetStrategy
-from kubernetes.client.models.v1beta1_rule_with_operations import V1beta1RuleWithOperations
-from kubernetes.client.models.v1beta1_runtime_class import V1beta1RuntimeClass
-from kubernetes.client.models.v1beta1_runtime_class_list import V1beta1RuntimeClassList
-from kubernetes.client.models.v1beta1_scheduling import V1beta1Scheduling
-from kubernetes.client.models.v1beta1_self_subject_access_review import V1beta1SelfSubjectAccessReview
-from kubernetes.client.models.v1beta1_self_subject_access_review_spec import V1beta1SelfSubjectAccessReviewSpec
-from kubernetes.client.models.v1beta1_self_subject_rules_review import V1beta1SelfSubjectRulesReview
-from kubernetes.client.models.v1beta1_self_subject_rules_review_spec import V1beta1SelfSubjectRulesReviewSpec
-from kubernetes.client.models.v1beta1_stateful_set import V1beta1StatefulSet
-from kubernetes.client.models.v1beta1_stateful_set_condition import V1beta1StatefulSetCondition
-from kubernetes.client.models.v1beta1_stateful_set_list import V1beta1StatefulSetList
-from kubernetes.client.models.v1beta1_stateful_set_spec import V1beta1StatefulSetSpec
-from kubernetes.client.models.v1beta1_stateful_set_status import V1beta1StatefulSetStatus
-from kubernetes.client.models.v1beta1_stateful_set_update_strategy import V1beta1StatefulSetUpdateStrategy
-from kubernetes.client.models.v1beta1_storage_class import V1beta1StorageClass
-from kubernetes.client.models.v1beta1_storage_class_list import V1beta1StorageClassList
-from kubernetes.client.models.v1beta1_subject import V1beta1Subject
-from kubernetes.client.models.v1beta1_subject_access_review import V1beta1SubjectAccessReview
-from kubernetes.client.models.v1beta1_subject_access_review_spec import V1beta1SubjectAccessReviewSpec
-from kubernetes.client.models.v1beta1_subject_access_review_status import V1beta1SubjectAccessReviewStatus
-from kubernetes.client.models.v1beta1_subject_rules_review_status import V1beta1SubjectRulesReviewStatus
-from kubernetes.client.models.v1beta1_token_review import V1beta1TokenReview
-from kubernetes.client.models.v1beta1_token_review_spec import V1beta1TokenReviewSpec
-from kubernetes.client.models.v1beta1_token_review_status import V1beta1TokenReviewStatus
-from kubernetes.client.models.v1beta1_user_info import V1beta1UserInfo
-from kubernetes.client.models.v1beta1_validating_webhook import V1beta1ValidatingWebhook
-from kubernetes.client.models.v1beta1_validating_webhook_configuration import V1beta1ValidatingWebhookConfiguration
-from kubernetes.client.models.v1beta1_validating_webhook_configuration_list import V1beta1ValidatingWebhookConfigurationList
-from kubernetes.client.models.v1beta1_volume_attachment import V1beta1VolumeAttachment
-from kubernetes.client.models.v1beta1_volume_attachment_list import V1beta1VolumeAttachmentList
-from kubernetes.client.models.v1beta1_volume_attachment_source import V1beta1VolumeAttachmentSource
-from kubernetes.client.models.v1beta1_volume_attachment_spec import V1beta1VolumeAttachmentSpec
-from kubernetes.client.models.v1beta1_volume_attachment_status import V1beta1VolumeAttachmentStatus
-from kubernetes.client.models.v1beta1_volume_error import V1beta1VolumeError
-from kubernetes.client.models.v1beta1_volume_node_resources import V1beta1VolumeNodeResources
-from kubernetes.client.models.v1beta2_controller_revision import V1beta2ControllerRevision
-from kubernetes.client.models.v1beta2_controller_revision_list import V1beta2ControllerRevisionList
-from kubernetes.client.models.v1beta2_daemon_set import V1beta2DaemonSet
-from kubernetes.client.models.v1beta2_daemon_set_condition import V1beta2DaemonSetCondition
-from kubernetes.client.models.v1beta2_daemon_set_list import V1beta2DaemonSetList
-from kubernetes.client.models.v1beta2_daemon_set_spec import V1beta2DaemonSetSpec
-from kubernetes.client.models.v1beta2_daemon_set_status import V1beta2DaemonSetStatus
-from kubernetes.client.models.v1beta2_daemon_set_update_strategy import V1beta2DaemonSetUpdateStrategy
-from kubernetes.client.models.v1beta2_deployment import V1beta2Deployment
-from kubernetes.client.models.v1beta2_deployment_condition import V1beta2DeploymentCondition
-from kubernetes.client.models.v1beta2_deployment_list import V1beta2DeploymentList
-from kubernetes.client.models.v1beta2_deployment_spec import V1beta2DeploymentSpec
-from kubernetes.client.models.v1beta2_deployment_status import V1beta2DeploymentStatus
-from kubernetes.client.models.v1beta2_deployment_strategy import V1beta2DeploymentStrategy
-from kubernetes.client.models.v1beta2_replica_set import V1beta2ReplicaSet
-from kubernetes.client.models.v1beta2_replica_set_condition import V1beta2ReplicaSetCondition
-from kubernetes.client.models.v1beta2_replica_set_list import V1beta2ReplicaSetList
-from kubernetes.client.models.v1beta2_replica_set_spec import V1beta2ReplicaSetSpec
-from kubernetes.client.models.v1beta2_replica_set_status import V1beta2ReplicaSetStatus
-from kubernetes.client.models.v1beta2_rolling_update_daemon_set import V1beta2RollingUpdateDaemonSet
-from kubernetes.client.models.v1beta2_rolling_update_deployment import V1beta2RollingUpdateDeployment
-from kubernetes.client.models.v1beta2_rolling_update_stateful_set_strategy import V1beta2RollingUpdateStatefulSetStrategy
-from kubernetes.client.models.v1beta2_scale import V1beta2Scale
-from kubernetes.client.models.v1beta2_scale_spec import V1beta2ScaleSpec
-from kubernetes.client.models.v1beta2_scale_status import V1beta2ScaleStatus
-from kubernetes.client.models.v1beta2_stateful_set import V1beta2StatefulSet
-from kubernetes.client.models.v1beta2_stateful_set_condition import V1beta2StatefulSetCondition
-from kubernetes.client.models.v1beta2_stateful_set_list import V1beta2StatefulSetList
-from kubernetes.client.models.v1beta2_stateful_set_spec import V1beta2StatefulSetSpec
-from kubernetes.client.models.v1beta2_stateful_set_status import V1beta2StatefulSetStatus
-from kubernetes.client.models.v1beta2_stateful_set_update_strategy import V1beta2StatefulSetUpdateStrategy
-from kubernetes.client.models.v2alpha1_cron_job import V2alpha1CronJob
-from kubernetes.client.models.v2alpha1_cron_job_list import V2alpha1CronJobList
-from kubernetes.client.models.v2alpha1_cron_job_spec import V2alpha1CronJobSpec
-from kubernetes.client.models.v2alpha1_cron_job_status import V2alpha1CronJobStatus
-from kubernetes.client.models.v2alpha1_job_template_spec import V2alpha1JobTemplateSpec
-from kubernetes.client.models.v2beta1_cross_version_object_reference import V2beta1CrossVersionObjectReference
-from kubernetes.client.models.v2beta1_external_metric_source import V2beta1ExternalMetricSource
-from kubernetes.client.models.v2beta1_external_metric_status import V2beta1ExternalMetricStatus
-from kubernetes.client.models.v2beta1_horizontal_pod_autoscaler import V2beta1HorizontalPodAutoscaler
-from kubernetes.client.models.v2beta1_horizontal_pod_autoscaler_condition import V2beta1HorizontalPodAutoscalerCondition
-from kubernetes.client.models.v2beta1_horizontal_pod_autoscaler_list import V2beta1HorizontalPodAutoscalerList
-from kubernetes.client.models.v2beta1_horizontal_pod_autoscaler_spec import V2beta1HorizontalPodAutoscalerSpec
-from kubernetes.client.models.v2beta1_horizontal_pod_autoscaler_status import V2beta1HorizontalPodAutoscalerStatus
-from kubernetes.client.models.v2beta1_metric_spec import V2beta1MetricSpec
-from kubernetes.client.models.v2beta1_metric_status import V2beta1MetricStatus
-from kubernetes.client.models.v2beta1_object_metric_source import V2beta1ObjectMetricSource
-from kubernetes.client.models.v2beta1_object_metric_status import V2beta1ObjectMetricStatus
-from kubernetes.client.models.v2beta1_pods_metric_source import V2beta1PodsMetricSource
-from kubernetes.client.models.v2beta1_pods_metric_status import V2beta1PodsMetricStatus
-from kubernetes.client.models.v2beta1_resource_metric_source import V2beta1ResourceMetricSource
-from kubernetes.client.models.v2beta1_resource_metric_status import V2beta1ResourceMetricStatus
-from kubernetes.client.models.v2beta2_cross_version_object_reference import V2beta2CrossVersionObjectReference
-from kubernetes.client.models.v2beta2_external_metric_source import V2beta2ExternalMetricSource
-from kubernetes.client.models.v2beta2_external_metric_status import V2beta2ExternalMetricStatus
-from kubernetes.client.models.v2beta2_horizontal_pod_autoscaler import V2beta2HorizontalPodAutoscaler
-from kubernetes.client.models.v2beta2_horizontal_pod_autoscaler_condition import V2beta2HorizontalPodAutoscalerCondition
-from kubernetes.client.models.v2beta2_horizontal_pod_autoscaler_list import V2beta2HorizontalPodAutoscalerList
-from kubernetes.client.models.v2beta2_horizontal_pod_autoscaler_spec import V2beta2HorizontalPodAutoscalerSpec
-from kubernetes.client.models.v2beta2_horizontal_pod_autoscaler_status import V2beta2HorizontalPodAutoscalerStatus
-from kubernetes.client.models.v2beta2_metric_identifier import V2beta2MetricIdentifier
-from kubernetes.client.models.v2beta2_metric_spec import V2beta2MetricSpec
-from kubernetes.client.models.v2beta2_metric_status import V2beta2MetricStatus
-from kubernetes.client.models.v2beta2_metric_target import V2beta2MetricTarget
-from kubernetes.client.models.v2beta2_metric_value_status import V2beta2MetricValueStatus
-from kubernetes.client.models.v2beta2_object_metric_source import V2beta2ObjectMetricSource
-from kubernetes.client.models.v2beta2_object_metric_status import V2beta2ObjectMetricStatus
-from kubernetes.client.models.v2beta2_pods_metric_source import V2beta2PodsMetricSource
-from kubernetes.client.models.v2beta2_pods_metric_status import V2beta2PodsMetricStatus
-from kubernetes.client.models.v2beta2_resource_metric_source import V2beta2ResourceMetricSource
-from kubernetes.client.models.v2beta2_resource_metric_status import V2beta2ResourceMetricStatus
-from kubernetes.client.models.version_info import VersionInfo
+import importlib
+import sys
+
+# Models are imported on first access, importing all of them up front
+# dominates the import time of the package.
+# model class name -> module of this package defining it
+_MODELS = {
+    'AdmissionregistrationV1ServiceReference': 'admissionregistration_v1_service_reference',  # noqa: E501
+    'AdmissionregistrationV1WebhookClientConfig': 'admissionregistration_v1_webhook_client_config',  # noqa: E501
+    'AdmissionregistrationV1beta1ServiceReference': 'admissionregistration_v1beta1_service_reference',  # noqa: E501
+    'AdmissionregistrationV1beta1WebhookClientConfig': 'admissionregistration_v1beta1_webhook_client_config',  # noqa: E501
+    'ApiextensionsV1ServiceReference': 'apiextensions_v1_service_reference',
+    'ApiextensionsV1WebhookClientConfig': 'apiextensions_v1_webhook_client_config',  # noqa: E501
+    'ApiextensionsV1beta1ServiceReference': 'apiextensions_v1beta1_service_reference',  # noqa: E501
+    'ApiextensionsV1beta1WebhookClientConfig': 'apiextensions_v1beta1_webhook_client_config',  # noqa: E501
+    'ApiregistrationV1ServiceReference': 'apiregistration_v1_service_reference',  # noqa: E501
+    'ApiregistrationV1beta1ServiceReference': 'apiregistration_v1beta1_service_reference',  # noqa: E501
+    'AppsV1beta1Deployment': 'apps_v1beta1_deployment',
+    'AppsV1beta1DeploymentCondition': 'apps_v1beta1_deployment_condition',
+    'AppsV1beta1DeploymentList': 'apps_v1beta1_deployment_list',
+    'AppsV1beta1DeploymentRollback': 'apps_v1beta1_deployment_rollback',
+    'AppsV1beta1DeploymentSpec': 'apps_v1beta1_deployment_spec',
+    'AppsV1beta1DeploymentStatus': 'apps_v1beta1_deployment_status',
+    'AppsV1beta1DeploymentStrategy': 'apps_v1beta1_deployment_strategy',
+    'AppsV1beta1RollbackConfig': 'apps_v1beta1_rollback_config',
+    'AppsV1beta1RollingUpdateDeployment': 'apps_v1beta1_rolling_update_deployment',  # noqa: E501
+    'AppsV1beta1Scale': 'apps_v1beta1_scale',
+    'AppsV1beta1ScaleSpec': 'apps_v1beta1_scale_spec',
+    'AppsV1beta1ScaleStatus': 'apps_v1beta1_scale_status',
+    'ExtensionsV1beta1AllowedCSIDriver': 'extensions_v1beta1_allowed_csi_driver',  # noqa: E501
+    'ExtensionsV1beta1AllowedFlexVolume': 'extensions_v1beta1_allowed_flex_volume',  # noqa: E501
+    'ExtensionsV1beta1AllowedHostPath': 'extensions_v1beta1_allowed_host_path',
+    'ExtensionsV1beta1Deployment': 'extensions_v1beta1_deployment',
+    'ExtensionsV1beta1DeploymentCondition': 'extensions_v1beta1_deployment_condition',  # noqa: E501
+    'ExtensionsV1beta1DeploymentList': 'extensions_v1beta1_deployment_list',
+    'ExtensionsV1beta1DeploymentRollback': 'extensions_v1beta1_deployment_rollback',  # noqa: E501
+    'ExtensionsV1beta1DeploymentSpec': 'extensions_v1beta1_deployment_spec',
+    'ExtensionsV1beta1DeploymentStatus': 'extensions_v1beta1_deployment_status',  # noqa: E501
+    'ExtensionsV1beta1DeploymentStrategy': 'extensions_v1beta1_deployment_strategy',  # noqa: E501
+    'ExtensionsV1beta1FSGroupStrategyOptions': 'extensions_v1beta1_fs_group_strategy_options',  # noqa: E501
+    'ExtensionsV1beta1HTTPIngressPath': 'extensions_v1beta1_http_ingress_path',
+    'ExtensionsV1beta1HTTPIngressRuleValue': 'extensions_v1beta1_http_ingress_rule_value',  # noqa: E501
+    'ExtensionsV1beta1HostPortRange': 'extensions_v1beta1_host_port_range',
+    'ExtensionsV1beta1IDRange': 'extensions_v1beta1_id_range',
+    'ExtensionsV1beta1Ingress': 'extensions_v1beta1_ingress',
+    'ExtensionsV1beta1IngressBackend': 'extensions_v1beta1_ingress_backend',
+    'ExtensionsV1beta1IngressList': 'extensions_v1beta1_ingress_list',
+    'ExtensionsV1beta1IngressRule': 'extensions_v1beta1_ingress_rule',
+    'ExtensionsV1beta1IngressSpec': 'extensions_v1beta1_ingress_spec',
+    'ExtensionsV1beta1IngressStatus': 'extensions_v1beta1_ingress_status',
+    'ExtensionsV1beta1IngressTLS': 'extensions_v1beta1_ingress_tls',
+    'ExtensionsV1beta1PodSecurityPolicy': 'extensions_v1beta1_pod_security_policy',  # noqa: E501
+    'ExtensionsV1beta1PodSecurityPolicyList': 'extensions_v1beta1_pod_security_policy_list',  # noqa: E501
+    'ExtensionsV1beta1PodSecurityPolicySpec': 'extensions_v1beta1_pod_security_policy_spec',  # noqa: E501
+    'ExtensionsV1beta1RollbackConfig': 'extensions_v1beta1_rollback_config',
+    'ExtensionsV1beta1RollingUpdateDeployment': 'extensions_v1beta1_rolling_update_deployment',  # noqa: E501
+    'ExtensionsV1beta1RunAsGroupStrategyOptions': 'extensions_v1beta1_run_as_group_strategy_options',  # noqa: E501
+    'ExtensionsV1beta1RunAsUserStrategyOptions': 'extensions_v1beta1_run_as_user_strategy_options',  # noqa: E501
+    'ExtensionsV1beta1RuntimeClassStrategyOptions': 'extensions_v1beta1_runtime_class_strategy_options',  # noqa: E501
+    'ExtensionsV1beta1SELinuxStrategyOptions': 'extensions_v1beta1_se_linux_strategy_options',  # noqa: E501
+    'ExtensionsV1beta1Scale': 'extensions_v1beta1_scale',
+    'ExtensionsV1beta1ScaleSpec': 'extensions_v1beta1_scale_spec',
+    'ExtensionsV1beta1ScaleStatus': 'extensions_v1beta1_scale_status',
+    'ExtensionsV1beta1SupplementalGroupsStrategyOptions': 'extensions_v1beta1_supplemental_groups_strategy_options',  # noqa: E501
+    'FlowcontrolV1alpha1Subject': 'flowcontrol_v1alpha1_subject',
+    'NetworkingV1beta1HTTPIngressPath': 'networking_v1beta1_http_ingress_path',
+    'NetworkingV1beta1HTTPIngressRuleValue': 'networking_v1beta1_http_ingress_rule_value',  # noqa: E501
+    'NetworkingV1beta1Ingress': 'networking_v1beta1_ingress',
+    'NetworkingV1beta1IngressBackend': 'networking_v1beta1_ingress_backend',
+    'NetworkingV1beta1IngressList': 'networking_v1beta1_ingress_list',
+    'NetworkingV1beta1IngressRule': 'networking_v1beta1_ingress_rule',
+    'NetworkingV1beta1IngressSpec': 'networking_v1beta1_ingress_spec',
+    'NetworkingV1beta1IngressStatus': 'networking_v1beta1_ingress_status',
+    'NetworkingV1beta1IngressTLS': 'networking_v1beta1_ingress_tls',
+    'PolicyV1beta1AllowedCSIDriver': 'policy_v1beta1_allowed_csi_driver',
+    'PolicyV1beta1AllowedFlexVolume': 'policy_v1beta1_allowed_flex_volume',
+    'PolicyV1beta1AllowedHostPath': 'policy_v1beta1_allowed_host_path',
+    'PolicyV1beta1FSGroupStrategyOptions': 'policy_v1beta1_fs_group_strategy_options',  # noqa: E501
+    'PolicyV1beta1HostPortRange': 'policy_v1beta1_host_port_range',
+    'PolicyV1beta1IDRange': 'policy_v1beta1_id_range',
+    'PolicyV1beta1PodSecurityPolicy': 'policy_v1beta1_pod_security_policy',
+    'PolicyV1beta1PodSecurityPolicyList': 'policy_v1beta1_pod_security_policy_list',  # noqa: E501
+    'PolicyV1beta1PodSecurityPolicySpec': 'policy_v1beta1_pod_security_policy_spec',  # noqa: E501
+    'PolicyV1beta1RunAsGroupStrategyOptions': 'policy_v1beta1_run_as_group_strategy_options',  # noqa: E501
+    'PolicyV1beta1RunAsUserStrategyOptions': 'policy_v1beta1_run_as_user_strategy_options',  # noqa: E501
+    'PolicyV1beta1RuntimeClassStrategyOptions': 'policy_v1beta1_runtime_class_strategy_options',  # noqa: E501
+    'PolicyV1beta1SELinuxStrategyOptions': 'policy_v1beta1_se_linux_strategy_options',  # noqa: E501
+    'PolicyV1beta1SupplementalGroupsStrategyOptions': 'policy_v1beta1_supplemental_groups_strategy_options',  # noqa: E501
+    'RbacV1alpha1Subject': 'rbac_v1alpha1_subject',
+    'V1APIGroup': 'v1_api_group',
+    'V1APIGroupList': 'v1_api_group_list',
+    'V1APIResource': 'v1_api_resource',
+    'V1APIResourceList': 'v1_api_resource_list',
+    'V1APIService': 'v1_api_service',
+    'V1APIServiceCondition': 'v1_api_service_condition',
+    'V1APIServiceList': 'v1_api_service_list',
+    'V1APIServiceSpec': 'v1_api_service_spec',
+    'V1APIServiceStatus': 'v1_api_service_status',
+    'V1APIVersions': 'v1_api_versions',
+    'V1AWSElasticBlockStoreVolumeSource': 'v1_aws_elastic_block_store_volume_source',  # noqa: E501
+    'V1Affinity': 'v1_affinity',
+    'V1AggregationRule': 'v1_aggregation_rule',
+    'V1AttachedVolume': 'v1_attached_volume',
+    'V1AzureDiskVolumeSource': 'v1_azure_disk_volume_source',
+    'V1AzureFilePersistentVolumeSource': 'v1_azure_file_persistent_volume_source',  # noqa: E501
+    'V1AzureFileVolumeSource': 'v1_azure_file_volume_source',
+    'V1Binding': 'v1_binding',
+    'V1BoundObjectReference': 'v1_bound_object_reference',
+    'V1CSINode': 'v1_csi_node',
+    'V1CSINodeDriver': 'v1_csi_node_driver',
+    'V1CSINodeList': 'v1_csi_node_list',
+    'V1CSINodeSpec': 'v1_csi_node_spec',
+    'V1CSIPersistentVolumeSource': 'v1_csi_persistent_volume_source',
+    'V1CSIVolumeSource': 'v1_csi_volume_source',
+    'V1Capabilities': 'v1_capabilities',
+    'V1CephFSPersistentVolumeSource': 'v1_ceph_fs_persistent_volume_source',
+    'V1CephFSVolumeSource': 'v1_ceph_fs_volume_source',
+    'V1CinderPersistentVolumeSource': 'v1_cinder_persistent_volume_source',
+    'V1CinderVolumeSource': 'v1_cinder_volume_source',
+    'V1ClientIPConfig': 'v1_client_ip_config',
+    'V1ClusterRole': 'v1_cluster_role',
+    'V1ClusterRoleBinding': 'v1_cluster_role_binding',
+    'V1ClusterRoleBindingList': 'v1_cluster_role_binding_list',
+    'V1ClusterRoleList': 'v1_cluster_role_list',
+    'V1ComponentCondition': 'v1_component_condition',
+    'V1ComponentStatus': 'v1_component_status',
+    'V1ComponentStatusList': 'v1_component_status_list',
+    'V1ConfigMap': 'v1_config_map',
+    'V1ConfigMapEnvSource': 'v1_config_map_env_source',
+    'V1ConfigMapKeySelector': 'v1_config_map_key_selector',
+    'V1ConfigMapList': 'v1_config_map_list',
+    'V1ConfigMapNodeConfigSource': 'v1_config_map_node_config_source',
+    'V1ConfigMapProjection': 'v1_config_map_projection',
+    'V1ConfigMapVolumeSource': 'v1_config_map_volume_source',
+    'V1Container': 'v1_container',
+    'V1ContainerImage': 'v1_container_image',
+    'V1ContainerPort': 'v1_container_port',
+    'V1ContainerState': 'v1_container_state',
+    'V1ContainerStateRunning': 'v1_container_state_running',
+    'V1ContainerStateTerminated': 'v1_container_state_terminated',
+    'V1ContainerStateWaiting': 'v1_container_state_waiting',
+    'V1ContainerStatus': 'v1_container_status',
+    'V1ControllerRevision': 'v1_controller_revision',
+    'V1ControllerRevisionList': 'v1_controller_revision_list',
+    'V1CrossVersionObjectReference': 'v1_cross_version_object_reference',
+    'V1CustomResourceColumnDefinition': 'v1_custom_resource_column_definition',
+    'V1CustomResourceConversion': 'v1_custom_resource_conversion',
+    'V1CustomResourceDefinition': 'v1_custom_resource_definition',
+    'V1CustomResourceDefinitionCondition': 'v1_custom_resource_definition_condition',  # noqa: E501
+    'V1CustomResourceDefinitionList': 'v1_custom_resource_definition_list',
+    'V1CustomResourceDefinitionNames': 'v1_custom_resource_definition_names',
+    'V1CustomResourceDefinitionSpec': 'v1_custom_resource_definition_spec',
+    'V1CustomResourceDefinitionStatus': 'v1_custom_resource_definition_status',
+    'V1CustomResourceDefinitionVersion': 'v1_custom_resource_definition_version',  # noqa: E501
+    'V1CustomResourceSubresourceScale': 'v1_custom_resource_subresource_scale',
+    'V1CustomResourceSubresources': 'v1_custom_resource_subresources',
+    'V1CustomResourceValidation': 'v1_custom_resource_validation',
+    'V1DaemonEndpoint': 'v1_daemon_endpoint',
+    'V1DaemonSet': 'v1_daemon_set',
+    'V1DaemonSetCondition': 'v1_daemon_set_condition',
+    'V1DaemonSetList': 'v1_daemon_set_list',
+    'V1DaemonSetSpec': 'v1_daemon_set_spec',
+    'V1DaemonSetStatus': 'v1_daemon_set_status',
+    'V1DaemonSetUpdateStrategy': 'v1_daemon_set_update_strategy',
+    'V1DeleteOptions': 'v1_delete_options',
+    'V1Deployment': 'v1_deployment',
+    'V1DeploymentCondition': 'v1_deployment_condition',
+    'V1DeploymentList': 'v1_deployment_list',
+    'V1DeploymentSpec': 'v1_deployment_spec',
+    'V1DeploymentStatus': 'v1_deployment_status',
+    'V1DeploymentStrategy': 'v1_deployment_strategy',
+    'V1DownwardAPIProjection': 'v1_downward_api_projection',
+    'V1DownwardAPIVolumeFile': 'v1_downward_api_volume_file',
+    'V1DownwardAPIVolumeSource': 'v1_downward_api_volume_source',
+    'V1EmptyDirVolumeSource': 'v1_empty_dir_volume_source',
+    'V1EndpointAddress': 'v1_endpoint_address',
+    'V1EndpointPort': 'v1_endpoint_port',
+    'V1EndpointSubset': 'v1_endpoint_subset',
+    'V1Endpoints': 'v1_endpoints',
+    'V1EndpointsList': 'v1_endpoints_list',
+    'V1EnvFromSource': 'v1_env_from_source',
+    'V1EnvVar': 'v1_env_var',
+    'V1EnvVarSource': 'v1_env_var_source',
+    'V1EphemeralContainer': 'v1_ephemeral_container',
+    'V1Event': 'v1_event',
+    'V1EventList': 'v1_event_list',
+    'V1EventSeries': 'v1_event_series',
+    'V1EventSource': 'v1_event_source',
+    'V1ExecAction': 'v1_exec_action',
+    'V1ExternalDocumentation': 'v1_external_documentation',
+    'V1FCVolumeSource': 'v1_fc_volume_source',
+    'V1FlexPersistentVolumeSource': 'v1_flex_persistent_volume_source',
+    'V1FlexVolumeSource': 'v1_flex_volume_source',
+    'V1FlockerVolumeSource': 'v1_flocker_volume_source',
+    'V1GCEPersistentDiskVolumeSource': 'v1_gce_persistent_disk_volume_source',
+    'V1GitRepoVolumeSource': 'v1_git_repo_volume_source',
+    'V1GlusterfsPersistentVolumeSource': 'v1_glusterfs_persistent_volume_source',  # noqa: E501
+    'V1GlusterfsVolumeSource': 'v1_glusterfs_volume_source',
+    'V1GroupVersionForDiscovery': 'v1_group_version_for_discovery',
+    'V1HTTPGetAction': 'v1_http_get_action',
+    'V1HTTPHeader': 'v1_http_header',
+    'V1Handler': 'v1_handler',
+    'V1HorizontalPodAutoscaler': 'v1_horizontal_pod_autoscaler',
+    'V1HorizontalPodAutoscalerList': 'v1_horizontal_pod_autoscaler_list',
+    'V1HorizontalPodAutoscalerSpec': 'v1_horizontal_pod_autoscaler_spec',
+    'V1HorizontalPodAutoscalerStatus': 'v1_horizontal_pod_autoscaler_status',
+    'V1HostAlias': 'v1_host_alias',
+    'V1HostPathVolumeSource': 'v1_host_path_volume_source',
+    'V1IPBlock': 'v1_ip_block',
+    'V1ISCSIPersistentVolumeSource': 'v1_iscsi_persistent_volume_source',
+    'V1ISCSIVolumeSource': 'v1_iscsi_volume_source',
+    'V1JSONSchemaProps': 'v1_json_schema_props',
+    'V1Job': 'v1_job',
+    'V1JobCondition': 'v1_job_condition',
+    'V1JobList': 'v1_job_list',
+    'V1JobSpec': 'v1_job_spec',
+    'V1JobStatus': 'v1_job_status',
+    'V1KeyToPath': 'v1_key_to_path',
+    'V1LabelSelector': 'v1_label_selector',
+    'V1LabelSelectorRequirement': 'v1_label_selector_requirement',
+    'V1Lease': 'v1_lease',
+    'V1LeaseList': 'v1_lease_list',
+    'V1LeaseSpec': 'v1_lease_spec',
+    'V1Lifecycle': 'v1_lifecycle',
+    'V1LimitRange': 'v1_limit_range',
+    'V1LimitRangeItem': 'v1_limit_range_item',
+    'V1LimitRangeList': 'v1_limit_range_list',
+    'V1LimitRangeSpec': 'v1_limit_range_spec',
+    'V1ListMeta': 'v1_list_meta',
+    'V1LoadBalancerIngress': 'v1_load_balancer_ingress',
+    'V1LoadBalancerStatus': 'v1_load_balancer_status',
+    'V1LocalObjectReference': 'v1_local_object_reference',
+    'V1LocalSubjectAccessReview': 'v1_local_subject_access_review',
+    'V1LocalVolumeSource': 'v1_local_volume_source',
+    'V1ManagedFieldsEntry': 'v1_managed_fields_entry',
+    'V1MutatingWebhook': 'v1_mutating_webhook',
+    'V1MutatingWebhookConfiguration': 'v1_mutating_webhook_configuration',
+    'V1MutatingWebhookConfigurationList': 'v1_mutating_webhook_configuration_list',  # noqa: E501
+    'V1NFSVolumeSource': 'v1_nfs_volume_source',
+    'V1Namespace': 'v1_namespace',
+    'V1NamespaceCondition': 'v1_namespace_condition',
+    'V1NamespaceList': 'v1_namespace_list',
+    'V1NamespaceSpec': 'v1_namespace_spec',
+    'V1NamespaceStatus': 'v1_namespace_status',
+    'V1NetworkPolicy': 'v1_network_policy',
+    'V1NetworkPolicyEgressRule': 'v1_network_policy_egress_rule',
+    'V1NetworkPolicyIngressRule': 'v1_network_policy_ingress_rule',
+    'V1NetworkPolicyList': 'v1_network_policy_list',
+    'V1NetworkPolicyPeer': 'v1_network_policy_peer',
+    'V1NetworkPolicyPort': 'v1_network_policy_port',
+    'V1NetworkPolicySpec': 'v1_network_policy_spec',
+    'V1Node': 'v1_node',
+    'V1NodeAddress': 'v1_node_address',
+    'V1NodeAffinity': 'v1_node_affinity',
+    'V1NodeCondition': 'v1_node_condition',
+    'V1NodeConfigSource': 'v1_node_config_source',
+    'V1NodeConfigStatus': 'v1_node_config_status',
+    'V1NodeDaemonEndpoints': 'v1_node_daemon_endpoints',
+    'V1NodeList': 'v1_node_list',
+    'V1NodeSelector': 'v1_node_selector',
+    'V1NodeSelectorRequirement': 'v1_node_selector_requirement',
+    'V1NodeSelectorTerm': 'v1_node_selector_term',
+    'V1NodeSpec': 'v1_node_spec',
+    'V1NodeStatus': 'v1_node_status',
+    'V1NodeSystemInfo': 'v1_node_system_info',
+    'V1NonResourceAttributes': 'v1_non_resource_attributes',
+    'V1NonResourceRule': 'v1_non_resource_rule',
+    'V1ObjectFieldSelector': 'v1_object_field_selector',
+    'V1ObjectMeta': 'v1_object_meta',
+    'V1ObjectReference': 'v1_object_reference',
+    'V1OwnerReference': 'v1_owner_reference',
+    'V1PersistentVolume': 'v1_persistent_volume',
+    'V1PersistentVolumeClaim': 'v1_persistent_volume_claim',
+    'V1PersistentVolumeClaimCondition': 'v1_persistent_volume_claim_condition',
+    'V1PersistentVolumeClaimList': 'v1_persistent_volume_claim_list',
+    'V1PersistentVolumeClaimSpec': 'v1_persistent_volume_claim_spec',
+    'V1PersistentVolumeClaimStatus': 'v1_persistent_volume_claim_status',
+    'V1PersistentVolumeClaimVolumeSource': 'v1_persistent_volume_claim_volume_source',  # noqa: E501
+    'V1PersistentVolumeList': 'v1_persistent_volume_list',
+    'V1PersistentVolumeSpec': 'v1_persistent_volume_spec',
+    'V1PersistentVolumeStatus': 'v1_persistent_volume_status',
+    'V1PhotonPersistentDiskVolumeSource': 'v1_photon_persistent_disk_volume_source',  # noqa: E501
+    'V1Pod': 'v1_pod',
+    'V1PodAffinity': 'v1_pod_affinity',
+    'V1PodAffinityTerm': 'v1_pod_affinity_term',
+    'V1PodAntiAffinity': 'v1_pod_anti_affinity',
+    'V1PodCondition': 'v1_pod_condition',
+    'V1PodDNSConfig': 'v1_pod_dns_config',
+    'V1PodDNSConfigOption': 'v1_pod_dns_config_option',
+    'V1PodIP': 'v1_pod_ip',
+    'V1PodList': 'v1_pod_list',
+    'V1PodReadinessGate': 'v1_pod_readiness_gate',
+    'V1PodSecurityContext': 'v1_pod_security_context',
+    'V1PodSpec': 'v1_pod_spec',
+    'V1PodStatus': 'v1_pod_status',
+    'V1PodTemplate': 'v1_pod_template',
+    'V1PodTemplateList': 'v1_pod_template_list',
+    'V1PodTemplateSpec': 'v1_pod_template_spec',
+    'V1PolicyRule': 'v1_policy_rule',
+    'V1PortworxVolumeSource': 'v1_portworx_volume_source',
+    'V1Preconditions': 'v1_preconditions',
+    'V1PreferredSchedulingTerm': 'v1_preferred_scheduling_term',
+    'V1PriorityClass': 'v1_priority_class',
+    'V1PriorityClassList': 'v1_priority_class_list',
+    'V1Probe': 'v1_probe',
+    'V1ProjectedVolumeSource': 'v1_projected_volume_source',
+    'V1QuobyteVolumeSource': 'v1_quobyte_volume_source',
+    'V1RBDPersistentVolumeSource': 'v1_rbd_persistent_volume_source',
+    'V1RBDVolumeSource': 'v1_rbd_volume_source',
+    'V1ReplicaSet': 'v1_replica_set',
+    'V1ReplicaSetCondition': 'v1_replica_set_condition',
+    'V1ReplicaSetList': 'v1_replica_set_list',
+    'V1ReplicaSetSpec': 'v1_replica_set_spec',
+    'V1ReplicaSetStatus': 'v1_replica_set_status',
+    'V1ReplicationController': 'v1_replication_controller',
+    'V1ReplicationControllerCondition': 'v1_replication_controller_condition',
+    'V1ReplicationControllerList': 'v1_replication_controller_list',
+    'V1ReplicationControllerSpec': 'v1_replication_controller_spec',
+    'V1ReplicationControllerStatus': 'v1_replication_controller_status',
+    'V1ResourceAttributes': 'v1_resource_attributes',
+    'V1ResourceFieldSelector': 'v1_resource_field_selector',
+    'V1ResourceQuota': 'v1_resource_quota',
+    'V1ResourceQuotaList': 'v1_resource_quota_list',
+    'V1ResourceQuotaSpec': 'v1_resource_quota_spec',
+    'V1ResourceQuotaStatus': 'v1_resource_quota_status',
+    'V1ResourceRequirements': 'v1_resource_requirements',
+    'V1ResourceRule': 'v1_resource_rule',
+    'V1Role': 'v1_role',
+    'V1RoleBinding': 'v1_role_binding',
+    'V1RoleBindingList': 'v1_role_binding_list',
+    'V1RoleList': 'v1_role_list',
+    'V1RoleRef': 'v1_role_ref',
+    'V1RollingUpdateDaemonSet': 'v1_rolling_update_daemon_set',
+    'V1RollingUpdateDeployment': 'v1_rolling_update_deployment',
+    'V1RollingUpdateStatefulSetStrategy': 'v1_rolling_update_stateful_set_strategy',  # noqa: E501
+    'V1RuleWithOperations': 'v1_rule_with_operations',
+    'V1SELinuxOptions': 'v1_se_linux_options',
+    'V1Scale': 'v1_scale',
+    'V1ScaleIOPersistentVolumeSource': 'v1_scale_io_persistent_volume_source',
+    'V1ScaleIOVolumeSource': 'v1_scale_io_volume_source',
+    'V1ScaleSpec': 'v1_scale_spec',
+    'V1ScaleStatus': 'v1_scale_status',
+    'V1ScopeSelector': 'v1_scope_selector',
+    'V1ScopedResourceSelectorRequirement': 'v1_scoped_resource_selector_requirement',  # noqa: E501
+    'V1Secret': 'v1_secret',
+    'V1SecretEnvSource': 'v1_secret_env_source',
+    'V1SecretKeySelector': 'v1_secret_key_selector',
+    'V1SecretList': 'v1_secret_list',
+    'V1SecretProjection': 'v1_secret_projection',
+    'V1SecretReference': 'v1_secret_reference',
+    'V1SecretVolumeSource': 'v1_secret_volume_source',
+    'V1SecurityContext': 'v1_security_context',
+    'V1SelfSubjectAccessReview': 'v1_self_subject_access_review',
+    'V1SelfSubjectAccessReviewSpec': 'v1_self_subject_access_review_spec',
+    'V1SelfSubjectRulesReview': 'v1_self_subject_rules_review',
+    'V1SelfSubjectRulesReviewSpec': 'v1_self_subject_rules_review_spec',
+    'V1ServerAddressByClientCIDR': 'v1_server_address_by_client_cidr',
+    'V1Service': 'v1_service',
+    'V1ServiceAccount': 'v1_service_account',
+    'V1ServiceAccountList': 'v1_service_account_list',
+    'V1ServiceAccountTokenProjection': 'v1_service_account_token_projection',
+    'V1ServiceList': 'v1_service_list',
+    'V1ServicePort': 'v1_service_port',
+    'V1ServiceSpec': 'v1_service_spec',
+    'V1ServiceStatus': 'v1_service_status',
+    'V1SessionAffinityConfig': 'v1_session_affinity_config',
+    'V1StatefulSet': 'v1_stateful_set',
+    'V1StatefulSetCondition': 'v1_stateful_set_condition',
+    'V1StatefulSetList': 'v1_stateful_set_list',
+    'V1StatefulSetSpec': 'v1_stateful_set_spec',
+    'V1StatefulSetStatus': 'v1_stateful_set_status',
+    'V1StatefulSetUpdateStrategy': 'v1_stateful_set_update_strategy',
+    'V1Status': 'v1_status',
+    'V1StatusCause': 'v1_status_cause',
+    'V1StatusDetails': 'v1_status_details',
+    'V1StorageClass': 'v1_storage_class',
+    'V1StorageClassList': 'v1_storage_class_list',
+    'V1StorageOSPersistentVolumeSource': 'v1_storage_os_persistent_volume_source',  # noqa: E501
+    'V1StorageOSVolumeSource': 'v1_storage_os_volume_source',
+    'V1Subject': 'v1_subject',
+    'V1SubjectAccessReview': 'v1_subject_access_review',
+    'V1SubjectAccessReviewSpec': 'v1_subject_access_review_spec',
+    'V1SubjectAccessReviewStatus': 'v1_subject_access_review_status',
+    'V1SubjectRulesReviewStatus': 'v1_subject_rules_review_status',
+    'V1Sysctl': 'v1_sysctl',
+    'V1TCPSocketAction': 'v1_tcp_socket_action',
+    'V1Taint': 'v1_taint',
+    'V1TokenRequest': 'v1_token_request',
+    'V1TokenRequestSpec': 'v1_token_request_spec',
+    'V1TokenRequestStatus': 'v1_token_request_status',
+    'V1TokenReview': 'v1_token_review',
+    'V1TokenReviewSpec': 'v1_token_review_spec',
+    'V1TokenReviewStatus': 'v1_token_review_status',
+    'V1Toleration': 'v1_toleration',
+    'V1TopologySelectorLabelRequirement': 'v1_topology_selector_label_requirement',  # noqa: E501
+    'V1TopologySelectorTerm': 'v1_topology_selector_term',
+    'V1TopologySpreadConstraint': 'v1_topology_spread_constraint',
+    'V1TypedLocalObjectReference': 'v1_typed_local_object_reference',
+    'V1UserInfo': 'v1_user_info',
+    'V1ValidatingWebhook': 'v1_validating_webhook',
+    'V1ValidatingWebhookConfiguration': 'v1_validating_webhook_configuration',
+    'V1ValidatingWebhookConfigurationList': 'v1_validating_webhook_configuration_list',  # noqa: E501
+    'V1Volume': 'v1_volume',
+    'V1VolumeAttachment': 'v1_volume_attachment',
+    'V1VolumeAttachmentList': 'v1_volume_attachment_list',
+    'V1VolumeAttachmentSource': 'v1_volume_attachment_source',
+    'V1VolumeAttachmentSpec': 'v1_volume_attachment_spec',
+    'V1VolumeAttachmentStatus': 'v1_volume_attachment_status',
+    'V1VolumeDevice': 'v1_volume_device',
+    'V1VolumeError': 'v1_volume_error',
+    'V1VolumeMount': 'v1_volume_mount',
+    'V1VolumeNodeAffinity': 'v1_volume_node_affinity',
+    'V1VolumeNodeResources': 'v1_volume_node_resources',
+    'V1VolumeProjection': 'v1_volume_projection',
+    'V1VsphereVirtualDiskVolumeSource': 'v1_vsphere_virtual_disk_volume_source',  # noqa: E501
+    'V1WatchEvent': 'v1_watch_event',
+    'V1WebhookConversion': 'v1_webhook_conversion',
+    'V1WeightedPodAffinityTerm': 'v1_weighted_pod_affinity_term',
+    'V1WindowsSecurityContextOptions': 'v1_windows_security_context_options',
+    'V1alpha1AggregationRule': 'v1alpha1_aggregation_rule',
+    'V1alpha1AuditSink': 'v1alpha1_audit_sink',
+    'V1alpha1AuditSinkList': 'v1alpha1_audit_sink_list',
+    'V1alpha1AuditSinkSpec': 'v1alpha1_audit_sink_spec',
+    'V1alpha1ClusterRole': 'v1alpha1_cluster_role',
+    'V1alpha1ClusterRoleBinding': 'v1alpha1_cluster_role_binding',
+    'V1alpha1ClusterRoleBindingList': 'v1alpha1_cluster_role_binding_list',
+    'V1alpha1ClusterRoleList': 'v1alpha1_cluster_role_list',
+    'V1alpha1FlowDistinguisherMethod': 'v1alpha1_flow_distinguisher_method',
+    'V1alpha1FlowSchema': 'v1alpha1_flow_schema',
+    'V1alpha1FlowSchemaCondition': 'v1alpha1_flow_schema_condition',
+    'V1alpha1FlowSchemaList': 'v1alpha1_flow_schema_list',
+    'V1alpha1FlowSchemaSpec': 'v1alpha1_flow_schema_spec',
+    'V1alpha1FlowSchemaStatus': 'v1alpha1_flow_schema_status',
+    'V1alpha1GroupSubject': 'v1alpha1_group_subject',
+    'V1alpha1LimitResponse': 'v1alpha1_limit_response',
+    'V1alpha1LimitedPriorityLevelConfiguration': 'v1alpha1_limited_priority_level_configuration',  # noqa: E501
+    'V1alpha1NonResourcePolicyRule': 'v1alpha1_non_resource_policy_rule',
+    'V1alpha1Overhead': 'v1alpha1_overhead',
+    'V1alpha1PodPreset': 'v1alpha1_pod_preset',
+    'V1alpha1PodPresetList': 'v1alpha1_pod_preset_list',
+    'V1alpha1PodPresetSpec': 'v1alpha1_pod_preset_spec',
+    'V1alpha1Policy': 'v1alpha1_policy',
+    'V1alpha1PolicyRule': 'v1alpha1_policy_rule',
+    'V1alpha1PolicyRulesWithSubjects': 'v1alpha1_policy_rules_with_subjects',
+    'V1alpha1PriorityClass': 'v1alpha1_priority_class',
+    'V1alpha1PriorityClassList': 'v1alpha1_priority_class_list',
+    'V1alpha1PriorityLevelConfiguration': 'v1alpha1_priority_level_configuration',  # noqa: E501
+    'V1alpha1PriorityLevelConfigurationCondition': 'v1alpha1_priority_level_configuration_condition',  # noqa: E501
+    'V1alpha1PriorityLevelConfigurationList': 'v1alpha1_priority_level_configuration_list',  # noqa: E501
+    'V1alpha1PriorityLevelConfigurationReference': 'v1alpha1_priority_level_configuration_reference',  # noqa: E501
+    'V1alpha1PriorityLevelConfigurationSpec': 'v1alpha1_priority_level_configuration_spec',  # noqa: E501
+    'V1alpha1PriorityLevelConfigurationStatus': 'v1alpha1_priority_level_configuration_status',  # noqa: E501
+    'V1alpha1QueuingConfiguration': 'v1alpha1_queuing_configuration',
+    'V1alpha1ResourcePolicyRule': 'v1alpha1_resource_policy_rule',
+    'V1alpha1Role': 'v1alpha1_role',
+    'V1alpha1RoleBinding': 'v1alpha1_role_binding',
+    'V1alpha1RoleBindingList': 'v1alpha1_role_binding_list',
+    'V1alpha1RoleList': 'v1alpha1_role_list',
+    'V1alpha1RoleRef': 'v1alpha1_role_ref',
+    'V1alpha1RuntimeClass': 'v1alpha1_runtime_class',
+    'V1alpha1RuntimeClassList': 'v1alpha1_runtime_class_list',
+    'V1alpha1RuntimeClassSpec': 'v1alpha1_runtime_class_spec',
+    'V1alpha1Scheduling': 'v1alpha1_scheduling',
+    'V1alpha1ServiceAccountSubject': 'v1alpha1_service_account_subject',
+    'V1alpha1ServiceReference': 'v1alpha1_service_reference',
+    'V1alpha1UserSubject': 'v1alpha1_user_subject',
+    'V1alpha1VolumeAttachment': 'v1alpha1_volume_attachment',
+    'V1alpha1VolumeAttachmentList': 'v1alpha1_volume_attachment_list',
+    'V1alpha1VolumeAttachmentSource': 'v1alpha1_volume_attachment_source',
+    'V1alpha1VolumeAttachmentSpec': 'v1alpha1_volume_attachment_spec',
+    'V1alpha1VolumeAttachmentStatus': 'v1alpha1_volume_attachment_status',
+    'V1alpha1VolumeError': 'v1alpha1_volume_error',
+    'V1alpha1Webhook': 'v1alpha1_webhook',
+    'V1alpha1WebhookClientConfig': 'v1alpha1_webhook_client_config',
+    'V1alpha1WebhookThrottleConfig': 'v1alpha1_webhook_throttle_config',
+    'V1beta1APIService': 'v1beta1_api_service',
+    'V1beta1APIServiceCondition': 'v1beta1_api_service_condition',
+    'V1beta1APIServiceList': 'v1beta1_api_service_list',
+    'V1beta1APIServiceSpec': 'v1beta1_api_service_spec',
+    'V1beta1APIServiceStatus': 'v1beta1_api_service_status',
+    'V1beta1AggregationRule': 'v1beta1_aggregation_rule',
+    'V1beta1CSIDriver': 'v1beta1_csi_driver',
+    'V1beta1CSIDriverList': 'v1beta1_csi_driver_list',
+    'V1beta1CSIDriverSpec': 'v1beta1_csi_driver_spec',
+    'V1beta1CSINode': 'v1beta1_csi_node',
+    'V1beta1CSINodeDriver': 'v1beta1_csi_node_driver',
+    'V1beta1CSINodeList': 'v1beta1_csi_node_list',
+    'V1beta1CSINodeSpec': 'v1beta1_csi_node_spec',
+    'V1beta1CertificateSigningRequest': 'v1beta1_certificate_signing_request',
+    'V1beta1CertificateSigningRequestCondition': 'v1beta1_certificate_signing_request_condition',  # noqa: E501
+    'V1beta1CertificateSigningRequestList': 'v1beta1_certificate_signing_request_list',  # noqa: E501
+    'V1beta1CertificateSigningRequestSpec': 'v1beta1_certificate_signing_request_spec',  # noqa: E501
+    'V1beta1CertificateSigningRequestStatus': 'v1beta1_certificate_signing_request_status',  # noqa: E501
+    'V1beta1ClusterRole': 'v1beta1_cluster_role',
+    'V1beta1ClusterRoleBinding': 'v1beta1_cluster_role_binding',
+    'V1beta1ClusterRoleBindingList': 'v1beta1_cluster_role_binding_list',
+    'V1beta1ClusterRoleList': 'v1beta1_cluster_role_list',
+    'V1beta1ControllerRevision': 'v1beta1_controller_revision',
+    'V1beta1ControllerRevisionList': 'v1beta1_controller_revision_list',
+    'V1beta1CronJob': 'v1beta1_cron_job',
+    'V1beta1CronJobList': 'v1beta1_cron_job_list',
+    'V1beta1CronJobSpec': 'v1beta1_cron_job_spec',
+    'V1beta1CronJobStatus': 'v1beta1_cron_job_status',
+    'V1beta1CustomResourceColumnDefinition': 'v1beta1_custom_resource_column_definition',  # noqa: E501
+    'V1beta1CustomResourceConversion': 'v1beta1_custom_resource_conversion',
+    'V1beta1CustomResourceDefinition': 'v1beta1_custom_resource_definition',
+    'V1beta1CustomResourceDefinitionCondition': 'v1beta1_custom_resource_definition_condition',  # noqa: E501
+    'V1beta1CustomResourceDefinitionList': 'v1beta1_custom_resource_definition_list',  # noqa: E501
+    'V1beta1CustomResourceDefinitionNames': 'v1beta1_custom_resource_definition_names',  # noqa: E501
+    'V1beta1CustomResourceDefinitionSpec': 'v1beta1_custom_resource_definition_spec',  # noqa: E501
+    'V1beta1CustomResourceDefinitionStatus': 'v1beta1_custom_resource_definition_status',  # noqa: E501
+    'V1beta1CustomResourceDefinitionVersion': 'v1beta1_custom_resource_definition_version',  # noqa: E501
+    'V1beta1CustomResourceSubresourceScale': 'v1beta1_custom_resource_subresource_scale',  # noqa: E501
+    'V1beta1CustomResourceSubresources': 'v1beta1_custom_resource_subresources',  # noqa: E501
+    'V1beta1CustomResourceValidation': 'v1beta1_custom_resource_validation',
+    'V1beta1DaemonSet': 'v1beta1_daemon_set',
+    'V1beta1DaemonSetCondition': 'v1beta1_daemon_set_condition',
+    'V1beta1DaemonSetList': 'v1beta1_daemon_set_list',
+    'V1beta1DaemonSetSpec': 'v1beta1_daemon_set_spec',
+    'V1beta1DaemonSetStatus': 'v1beta1_daemon_set_status',
+    'V1beta1DaemonSetUpdateStrategy': 'v1beta1_daemon_set_update_strategy',
+    'V1beta1Endpoint': 'v1beta1_endpoint',
+    'V1beta1EndpointConditions': 'v1beta1_endpoint_conditions',
+    'V1beta1EndpointPort': 'v1beta1_endpoint_port',
+    'V1beta1EndpointSlice': 'v1beta1_endpoint_slice',
+    'V1beta1EndpointSliceList': 'v1beta1_endpoint_slice_list',
+    'V1beta1Event': 'v1beta1_event',
+    'V1beta1EventList': 'v1beta1_event_list',
+    'V1beta1EventSeries': 'v1beta1_event_series',
+    'V1beta1Eviction': 'v1beta1_eviction',
+    'V1beta1ExternalDocumentation': 'v1beta1_external_documentation',
+    'V1beta1IPBlock': 'v1beta1_ip_block',
+    'V1beta1JSONSchemaProps': 'v1beta1_json_schema_props',
+    'V1beta1JobTemplateSpec': 'v1beta1_job_template_spec',
+    'V1beta1Lease': 'v1beta1_lease',
+    'V1beta1LeaseList': 'v1beta1_lease_list',
+    'V1beta1LeaseSpec': 'v1beta1_lease_spec',
+    'V1beta1LocalSubjectAccessReview': 'v1beta1_local_subject_access_review',
+    'V1beta1MutatingWebhook': 'v1beta1_mutating_webhook',
+    'V1beta1MutatingWebhookConfiguration': 'v1beta1_mutating_webhook_configuration',  # noqa: E501
+    'V1beta1MutatingWebhookConfigurationList': 'v1beta1_mutating_webhook_configuration_list',  # noqa: E501
+    'V1beta1NetworkPolicy': 'v1beta1_network_policy',
+    'V1beta1NetworkPolicyEgressRule': 'v1beta1_network_policy_egress_rule',
+    'V1beta1NetworkPolicyIngressRule': 'v1beta1_network_policy_ingress_rule',
+    'V1beta1NetworkPolicyList': 'v1beta1_network_policy_list',
+    'V1beta1NetworkPolicyPeer': 'v1beta1_network_policy_peer',
+    'V1beta1NetworkPolicyPort': 'v1beta1_network_policy_port',
+    'V1beta1NetworkPolicySpec': 'v1beta1_network_policy_spec',
+    'V1beta1NonResourceAttributes': 'v1beta1_non_resource_attributes',
+    'V1beta1NonResourceRule': 'v1beta1_non_resource_rule',
+    'V1beta1Overhead': 'v1beta1_overhead',
+    'V1beta1PodDisruptionBudget': 'v1beta1_pod_disruption_budget',
+    'V1beta1PodDisruptionBudgetList': 'v1beta1_pod_disruption_budget_list',
+    'V1beta1PodDisruptionBudgetSpec': 'v1beta1_pod_disruption_budget_spec',
+    'V1beta1PodDisruptionBudgetStatus': 'v1beta1_pod_disruption_budget_status',
+    'V1beta1PolicyRule': 'v1beta1_policy_rule',
+    'V1beta1PriorityClass': 'v1beta1_priority_class',
+    'V1beta1PriorityClassList': 'v1beta1_priority_class_list',
+    'V1beta1ReplicaSet': 'v1beta1_replica_set',
+    'V1beta1ReplicaSetCondition': 'v1beta1_replica_set_condition',
+    'V1beta1ReplicaSetList': 'v1beta1_replica_set_list',
+    'V1beta1ReplicaSetSpec': 'v1beta1_replica_set_spec',
+    'V1beta1ReplicaSetStatus': 'v1beta1_replica_set_status',
+    'V1beta1ResourceAttributes': 'v1beta1_resource_attributes',
+    'V1beta1ResourceRule': 'v1beta1_resource_rule',
+    'V1beta1Role': 'v1beta1_role',
+    'V1beta1RoleBinding': 'v1beta1_role_binding',
+    'V1beta1RoleBindingList': 'v1beta1_role_binding_list',
+    'V1beta1RoleList': 'v1beta1_role_list',
+    'V1beta1RoleRef': 'v1beta1_role_ref',
+    'V1beta1RollingUpdateDaemonSet': 'v1beta1_rolling_update_daemon_set',
+    'V1beta1RollingUpdateStatefulSetStrategy': 'v1beta1_rolling_update_stateful_set_strategy',  # noqa: E501
+    'V1beta1RuleWithOperations': 'v1beta1_rule_with_operations',
+    'V1beta1RuntimeClass': 'v1beta1_runtime_class',
+    'V1beta1RuntimeClassList': 'v1beta1_runtime_class_list',
+    'V1beta1Scheduling': 'v1beta1_scheduling',
+    'V1beta1SelfSubjectAccessReview': 'v1beta1_self_subject_access_review',
+    'V1beta1SelfSubjectAccessReviewSpec': 'v1beta1_self_subject_access_review_spec',  # noqa: E501
+    'V1beta1SelfSubjectRulesReview': 'v1beta1_self_subject_rules_review',
+    'V1beta1SelfSubjectRulesReviewSpec': 'v1beta1_self_subject_rules_review_spec',  # noqa: E501
+    'V1beta1StatefulSet': 'v1beta1_stateful_set',
+    'V1beta1StatefulSetCondition': 'v1beta1_stateful_set_condition',
+    'V1beta1StatefulSetList': 'v1beta1_stateful_set_list',
+    'V1beta1StatefulSetSpec': 'v1beta1_stateful_set_spec',
+    'V1beta1StatefulSetStatus': 'v1beta1_stateful_set_status',
+    'V1beta1StatefulSetUpdateStrategy': 'v1beta1_stateful_set_update_strategy',
+    'V1beta1StorageClass': 'v1beta1_storage_class',
+    'V1beta1StorageClassList': 'v1beta1_storage_class_list',
+    'V1beta1Subject': 'v1beta1_subject',
+    'V1beta1SubjectAccessReview': 'v1beta1_subject_access_review',
+    'V1beta1SubjectAccessReviewSpec': 'v1beta1_subject_access_review_spec',
+    'V1beta1SubjectAccessReviewStatus': 'v1beta1_subject_access_review_status',
+    'V1beta1SubjectRulesReviewStatus': 'v1beta1_subject_rules_review_status',
+    'V1beta1TokenReview': 'v1beta1_token_review',
+    'V1beta1TokenReviewSpec': 'v1beta1_token_review_spec',
+    'V1beta1TokenReviewStatus': 'v1beta1_token_review_status',
+    'V1beta1UserInfo': 'v1beta1_user_info',
+    'V1beta1ValidatingWebhook': 'v1beta1_validating_webhook',
+    'V1beta1ValidatingWebhookConfiguration': 'v1beta1_validating_webhook_configuration',  # noqa: E501
+    'V1beta1ValidatingWebhookConfigurationList': 'v1beta1_validating_webhook_configuration_list',  # noqa: E501
+    'V1beta1VolumeAttachment': 'v1beta1_volume_attachment',
+    'V1beta1VolumeAttachmentList': 'v1beta1_volume_attachment_list',
+    'V1beta1VolumeAttachmentSource': 'v1beta1_volume_attachment_source',
+    'V1beta1VolumeAttachmentSpec': 'v1beta1_volume_attachment_spec',
+    'V1beta1VolumeAttachmentStatus': 'v1beta1_volume_attachment_status',
+    'V1beta1VolumeError': 'v1beta1_volume_error',
+    'V1beta1VolumeNodeResources': 'v1beta1_volume_node_resources',
+    'V1beta2ControllerRevision': 'v1beta2_controller_revision',
+    'V1beta2ControllerRevisionList': 'v1beta2_controller_revision_list',
+    'V1beta2DaemonSet': 'v1beta2_daemon_set',
+    'V1beta2DaemonSetCondition': 'v1beta2_daemon_set_condition',
+    'V1beta2DaemonSetList': 'v1beta2_daemon_set_list',
+    'V1beta2DaemonSetSpec': 'v1beta2_daemon_set_spec',
+    'V1beta2DaemonSetStatus': 'v1beta2_daemon_set_status',
+    'V1beta2DaemonSetUpdateStrategy': 'v1beta2_daemon_set_update_strategy',
+    'V1beta2Deployment': 'v1beta2_deployment',
+    'V1beta2DeploymentCondition': 'v1beta2_deployment_condition',
+    'V1beta2DeploymentList': 'v1beta2_deployment_list',
+    'V1beta2DeploymentSpec': 'v1beta2_deployment_spec',
+    'V1beta2DeploymentStatus': 'v1beta2_deployment_status',
+    'V1beta2DeploymentStrategy': 'v1beta2_deployment_strategy',
+    'V1beta2ReplicaSet': 'v1beta2_replica_set',
+    'V1beta2ReplicaSetCondition': 'v1beta2_replica_set_condition',
+    'V1beta2ReplicaSetList': 'v1beta2_replica_set_list',
+    'V1beta2ReplicaSetSpec': 'v1beta2_replica_set_spec',
+    'V1beta2ReplicaSetStatus': 'v1beta2_replica_set_status',
+    'V1beta2RollingUpdateDaemonSet': 'v1beta2_rolling_update_daemon_set',
+    'V1beta2RollingUpdateDeployment': 'v1beta2_rolling_update_deployment',
+    'V1beta2RollingUpdateStatefulSetStrategy': 'v1beta2_rolling_update_stateful_set_strategy',  # noqa: E501
+    'V1beta2Scale': 'v1beta2_scale',
+    'V1beta2ScaleSpec': 'v1beta2_scale_spec',
+    'V1beta2ScaleStatus': 'v1beta2_scale_status',
+    'V1beta2StatefulSet': 'v1beta2_stateful_set',
+    'V1beta2StatefulSetCondition': 'v1beta2_stateful_set_condition',
+    'V1beta2StatefulSetList': 'v1beta2_stateful_set_list',
+    'V1beta2StatefulSetSpec': 'v1beta2_stateful_set_spec',
+    'V1beta2StatefulSetStatus': 'v1beta2_stateful_set_status',
+    'V1beta2StatefulSetUpdateStrategy': 'v1beta2_stateful_set_update_strategy',
+    'V2alpha1CronJob': 'v2alpha1_cron_job',
+    'V2alpha1CronJobList': 'v2alpha1_cron_job_list',
+    'V2alpha1CronJobSpec': 'v2alpha1_cron_job_spec',
+    'V2alpha1CronJobStatus': 'v2alpha1_cron_job_status',
+    'V2alpha1JobTemplateSpec': 'v2alpha1_job_template_spec',
+    'V2beta1CrossVersionObjectReference': 'v2beta1_cross_version_object_reference',  # noqa: E501
+    'V2beta1ExternalMetricSource': 'v2beta1_external_metric_source',
+    'V2beta1ExternalMetricStatus': 'v2beta1_external_metric_status',
+    'V2beta1HorizontalPodAutoscaler': 'v2beta1_horizontal_pod_autoscaler',
+    'V2beta1HorizontalPodAutoscalerCondition': 'v2beta1_horizontal_pod_autoscaler_condition',  # noqa: E501
+    'V2beta1HorizontalPodAutoscalerList': 'v2beta1_horizontal_pod_autoscaler_list',  # noqa: E501
+    'V2beta1HorizontalPodAutoscalerSpec': 'v2beta1_horizontal_pod_autoscaler_spec',  # noqa: E501
+    'V2beta1HorizontalPodAutoscalerStatus': 'v2beta1_horizontal_pod_autoscaler_status',  # noqa: E501
+    'V2beta1MetricSpec': 'v2beta1_metric_spec',
+    'V2beta1MetricStatus': 'v2beta1_metric_status',
+    'V2beta1ObjectMetricSource': 'v2beta1_object_metric_source',
+    'V2beta1ObjectMetricStatus': 'v2beta1_object_metric_status',
+    'V2beta1PodsMetricSource': 'v2beta1_pods_metric_source',
+    'V2beta1PodsMetricStatus': 'v2beta1_pods_metric_status',
+    'V2beta1ResourceMetricSource': 'v2beta1_resource_metric_source',
+    'V2beta1ResourceMetricStatus': 'v2beta1_resource_metric_status',
+    'V2beta2CrossVersionObjectReference': 'v2beta2_cross_version_object_reference',  # noqa: E501
+    'V2beta2ExternalMetricSource': 'v2beta2_external_metric_source',
+    'V2beta2ExternalMetricStatus': 'v2beta2_external_metric_status',
+    'V2beta2HorizontalPodAutoscaler': 'v2beta2_horizontal_pod_autoscaler',
+    'V2beta2HorizontalPodAutoscalerCondition': 'v2beta2_horizontal_pod_autoscaler_condition',  # noqa: E501
+    'V2beta2HorizontalPodAutoscalerList': 'v2beta2_horizontal_pod_autoscaler_list',  # noqa: E501
+    'V2beta2HorizontalPodAutoscalerSpec': 'v2beta2_horizontal_pod_autoscaler_spec',  # noqa: E501
+    'V2beta2HorizontalPodAutoscalerStatus': 'v2beta2_horizontal_pod_autoscaler_status',  # noqa: E501
+    'V2beta2MetricIdentifier': 'v2beta2_metric_identifier',
+    'V2beta2MetricSpec': 'v2beta2_metric_spec',
+    'V2beta2MetricStatus': 'v2beta2_metric_status',
+    'V2beta2MetricTarget': 'v2beta2_metric_target',
+    'V2beta2MetricValueStatus': 'v2beta2_metric_value_status',
+    'V2beta2ObjectMetricSource': 'v2beta2_object_metric_source',
+    'V2beta2ObjectMetricStatus': 'v2beta2_object_metric_status',
+    'V2beta2PodsMetricSource': 'v2beta2_pods_metric_source',
+    'V2beta2PodsMetricStatus': 'v2beta2_pods_metric_status',
+    'V2beta2ResourceMetricSource': 'v2beta2_resource_metric_source',
+    'V2beta2ResourceMetricStatus': 'v2beta2_resource_metric_status',
+    'VersionInfo': 'version_info',
+}
+
+__all__ = sorted(_MODELS)
+
+
+def __getattr__(name):
+    module = _MODELS.get(name)
+    if module is None:
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name))
+    value = getattr(importlib.import_module(__name__ + '.' + module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODELS))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) is not available, import eagerly
+    for _name in __all__:
+        __getattr__(_name)
@@ -15,6 +15,7 @@ import re  # noqa: F401
 
 import six
 
+from kubernetes.client import serialization
 from kubernetes.client.configuration import Configuration
 
 
@@ -161,6 +162,20 @@ class ApiextensionsV1beta1ServiceReference(object):
 
         self._port = port
 
+    @classmethod
+    def from_dict(cls, data, local_vars_configuration=None):
+        """Builds a ApiextensionsV1beta1ServiceReference from its JSON representation.
+
+        Attributes are assigned without going through the setters, so the
+        data is not validated. See serialization.from_dict.
+
+        :param data: dict keyed by the json keys of ApiextensionsV1beta1ServiceReference.
+        :param local_vars_configuration: Configuration shared by the
+                                         created models.
+        :return: ApiextensionsV1beta1ServiceReference
+        """
+        return serialization.from_dict(cls, data, local_vars_configuration)
+
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -198,11 +213,15 @@ class ApiextensionsV1beta1ServiceReference(object):
         if not isinstance(other, ApiextensionsV1beta1ServiceReference):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return serialization.equal(self, other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, ApiextensionsV1beta1ServiceReference):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return not serialization.equal(self, other)
+
+    def __hash__(self):
+        """Returns the hash of the content, see serialization.content_hash"""
+        return int(serialization.content_hash(self)[:16], 16)
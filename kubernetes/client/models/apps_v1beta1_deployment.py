@@ -15,6 +15,7 @@ import re  # noqa: F401
 
 import six
 
+from kubernetes.client import serialization
 from kubernetes.client.configuration import Configuration
 
 
@@ -181,6 +182,20 @@ class AppsV1beta1Deployment(object):
 
         self._status = status
 
+    @classmethod
+    def from_dict(cls, data, local_vars_configuration=None):
+        """Builds a AppsV1beta1Deployment from its JSON representation.
+
+        Attributes are assigned without going through the setters, so the
+        data is not validated. See serialization.from_dict.
+
+        :param data: dict keyed by the json keys of AppsV1beta1Deployment.
+        :param local_vars_configuration: Configuration shared by the
+                                         created models.
+        :return: AppsV1beta1Deployment
+        """
+        return serialization.from_dict(cls, data, local_vars_configuration)
+
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -218,11 +233,15 @@ class AppsV1beta1Deployment(object):
         if not isinstance(other, AppsV1beta1Deployment):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return serialization.equal(self, other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, AppsV1beta1Deployment):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return not serialization.equal(self, other)
+
+    def __hash__(self):
+        """Returns the hash of the content, see serialization.content_hash"""
+        return int(serialization.content_hash(self)[:16], 16)
@@ -15,6 +15,7 @@ import re  # noqa: F401
 
 import six
 
+from kubernetes.client import serialization
 from kubernetes.client.configuration import Configuration
 
 
@@ -76,6 +77,20 @@ class ExtensionsV1beta1AllowedCSIDriver(object):
 
         self._name = name
 
+    @classmethod
+    def from_dict(cls, data, local_vars_configuration=None):
+        """Builds a ExtensionsV1beta1AllowedCSIDriver from its JSON representation.
+
+        Attributes are assigned without going through the setters, so the
+        data is not validated. See serialization.from_dict.
+
+        :param data: dict keyed by the json keys of ExtensionsV1beta1AllowedCSIDriver.
+        :param local_vars_configuration: Configuration shared by the
+                                         created models.
+        :return: ExtensionsV1beta1AllowedCSIDriver
+        """
+        return serialization.from_dict(cls, data, local_vars_configuration)
+
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -113,11 +128,15 @@ class ExtensionsV1beta1AllowedCSIDriver(object):
         if not isinstance(other, ExtensionsV1beta1AllowedCSIDriver):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return serialization.equal(self, other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, ExtensionsV1beta1AllowedCSIDriver):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return not serialization.equal(self, other)
+
+    def __hash__(self):
+        """Returns the hash of the content, see serialization.content_hash"""
+        return int(serialization.content_hash(self)[:16], 16)
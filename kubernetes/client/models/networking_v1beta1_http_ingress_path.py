@@ -15,6 +15,7 @@ import re  # noqa: F401
 
 import six
 
+from kubernetes.client import serialization
 from kubernetes.client.configuration import Configuration
 
 
@@ -102,6 +103,20 @@ class NetworkingV1beta1HTTPIngressPath(object):
 
         self._path = path
 
+    @classmethod
+    def from_dict(cls, data, local_vars_configuration=None):
+        """Builds a NetworkingV1beta1HTTPIngressPath from its JSON representation.
+
+        Attributes are assigned without going through the setters, so the
+        data is not validated. See serialization.from_dict.
+
+        :param data: dict keyed by the json keys of NetworkingV1beta1HTTPIngressPath.
+        :param local_vars_configuration: Configuration shared by the
+                                         created models.
+        :return: NetworkingV1beta1HTTPIngressPath
+        """
+        return serialization.from_dict(cls, data, local_vars_configuration)
+
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -139,11 +154,15 @@ class NetworkingV1beta1HTTPIngressPath(object):
         if not isinstance(other, NetworkingV1beta1HTTPIngressPath):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return serialization.equal(self, other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, NetworkingV1beta1HTTPIngressPath):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return not serialization.equal(self, other)
+
+    def __hash__(self):
+        """Returns the hash of the content, see serialization.content_hash"""
+        return int(serialization.content_hash(self)[:16], 16)
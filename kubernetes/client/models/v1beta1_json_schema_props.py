@@ -15,6 +15,7 @@ import re  # noqa: F401
 
 import six
 
+from kubernetes.client import serialization
 from kubernetes.client.configuration import Configuration
 
 
@@ -1189,6 +1190,20 @@ class V1beta1JSONSchemaProps(object):
 
         self._x_kubernetes_preserve_unknown_fields = x_kubernetes_preserve_unknown_fields
 
+    @classmethod
+    def from_dict(cls, data, local_vars_configuration=None):
+        """Builds a V1beta1JSONSchemaProps from its JSON representation.
+
+        Attributes are assigned without going through the setters, so the
+        data is not validated. See serialization.from_dict.
+
+        :param data: dict keyed by the json keys of V1beta1JSONSchemaProps.
+        :param local_vars_configuration: Configuration shared by the
+                                         created models.
+        :return: V1beta1JSONSchemaProps
+        """
+        return serialization.from_dict(cls, data, local_vars_configuration)
+
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -1226,11 +1241,15 @@ class V1beta1JSONSchemaProps(object):
         if not isinstance(other, V1beta1JSONSchemaProps):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return serialization.equal(self, other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, V1beta1JSONSchemaProps):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return not serialization.equal(self, other)
+
+    def __hash__(self):
+        """Returns the hash of the content, see serialization.content_hash"""
+        return int(serialization.content_hash(self)[:16], 16)
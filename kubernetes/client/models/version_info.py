@@ -15,6 +15,7 @@ import re  # noqa: F401
 
 import six
 
+from kubernetes.client import serialization
 from kubernetes.client.configuration import Configuration
 
 
@@ -290,6 +291,20 @@ class VersionInfo(object):
 
         self._platform = platform
 
+    @classmethod
+    def from_dict(cls, data, local_vars_configuration=None):
+        """Builds a VersionInfo from its JSON representation.
+
+        Attributes are assigned without going through the setters, so the
+        data is not validated. See serialization.from_dict.
+
+        :param data: dict keyed by the json keys of VersionInfo.
+        :param local_vars_configuration: Configuration shared by the
+                                         created models.
+        :return: VersionInfo
+        """
+        return serialization.from_dict(cls, data, local_vars_configuration)
+
     def to_dict(self):
         """Returns the model properties as a dict"""
         result = {}
@@ -327,11 +342,15 @@ class VersionInfo(object):
         if not isinstance(other, VersionInfo):
             return False
 
-        return self.to_dict() == other.to_dict()
+        return serialization.equal(self, other)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
         if not isinstance(other, VersionInfo):
             return True
 
-        return self.to_dict() != other.to_dict()
+        return not serialization.equal(self, other)
+
+    def __hash__(self):
+        """Returns the hash of the content, see serialization.content_hash"""
+        return int(serialization.content_hash(self)[:16], 16)
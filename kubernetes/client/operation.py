@@ -0,0 +1,115 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+
+from kubernetes.client.exceptions import ApiTypeError, ApiValueError
+
+# keyword arguments every operation accepts besides its own parameters
+COMMON_PARAMS = frozenset([
+    'async_req',
+    '_return_http_data_only',
+    '_preload_content',
+    '_request_timeout',
+])
+# keyword arguments replace and patch operations accept in addition, see
+# known_state.KnownStates
+WRITE_PARAMS = frozenset([
+    '_known_state',
+    '_status_subresource',
+])
+
+
+class Operation(object):
+    """
+    Describes an API operation: its path template, parameters with their
+    wire names, response type and media types.
+
+    The generated API methods are thin wrappers that hand their arguments
+    to ApiClient.call_operation(), which builds the request from this
+    description instead of per-method code.
+
+    :param name: operation name, used in error messages.
+    :param method: HTTP method.
+    :param path: path template, e.g. /api/v1/namespaces/{namespace}/pods.
+    :param path_params: (argument, wire name) pairs of path parameters.
+    :param query_params: (argument, wire name) pairs of query parameters, in
+        the order they are sent.
+    :param body: name of the body argument, None if there is none.
+    :param required: arguments that must not be None.
+    :param response_type: type the response is deserialized to.
+    :param accepts: media types for the Accept header.
+    :param content_types: media types for the Content-Type header.
+    :param auth_settings: names of the auth settings to apply.
+    """
+
+    __slots__ = ('name', 'method', 'path', 'path_params', 'query_params',
+                 'body', 'required', 'response_type', 'accepts',
+                 'content_types', 'auth_settings', 'params')
+
+    def __init__(self, name, method, path, path_params=(), query_params=(),
+                 body=None, required=(), response_type=None, accepts=(),
+                 content_types=(), auth_settings=('BearerToken',)):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.path_params = tuple(path_params)
+        self.query_params = tuple(query_params)
+        self.body = body
+        self.required = tuple(required)
+        self.response_type = response_type
+        self.accepts = list(accepts)
+        self.content_types = list(content_types)
+        self.auth_settings = list(auth_settings)
+        params = [p for p, _ in self.path_params + self.query_params]
+        if body is not None:
+            params.append(body)
+        if method in ('PUT', 'PATCH'):
+            params.extend(WRITE_PARAMS)
+        self.params = COMMON_PARAMS.union(params)
+
+    def __repr__(self):
+        return 'Operation(%r, %r, %r)' % (self.name, self.method, self.path)
+
+    def check_params(self, params, client_side_validation=True):
+        """
+        Raise ApiTypeError for unknown arguments and, with client side
+        validation, ApiValueError for missing required ones.
+        """
+        if not self.params.issuperset(params):
+            for key in params:
+                if key not in self.params:
+                    raise ApiTypeError(
+                        "Got an unexpected keyword argument '%s'"
+                        " to method %s" % (key, self.name))
+        if client_side_validation:
+            for key in self.required:
+                if params.get(key) is None:
+                    raise ApiValueError(
+                        "Missing the required parameter `%s` when calling "
+                        "`%s`" % (key, self.name))
+
+    def path_values(self, params):
+        return dict((wire, params[name]) for name, wire in self.path_params
+                    if name in params)
+
+    def query_values(self, params):
+        return [(wire, params[name]) for name, wire in self.query_params
+                if params.get(name) is not None]
+
+
+def operation_of(method):
+    """Return the Operation behind a generated API method, bound or not."""
+    func = getattr(method, '__func__', method)
+    return sys.modules[func.__module__]._OPERATIONS[func.__name__]
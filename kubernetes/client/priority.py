@@ -0,0 +1,83 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import itertools
+import threading
+
+# Lower values are admitted first.
+CRITICAL = 0
+NORMAL = 1
+BACKGROUND = 2
+
+
+class PriorityScheduler(object):
+    """
+    Admits requests to a shared connection pool by priority.
+
+    At most `max_in_flight` requests run at once. When every slot is taken,
+    waiting requests are admitted in priority order, first come first
+    served within a priority. The last `reserved` slots are only handed to
+    CRITICAL requests, so that leader election renewals and status writes
+    still get a connection while slow background lists hold the others.
+
+    Example:
+        api_client = kubernetes.client.ApiClient()
+        api_client.priority_scheduler = PriorityScheduler(max_in_flight=8)
+        leases = CoordinationV1Api(api_client.with_priority(CRITICAL))
+        audit = CoreV1Api(api_client.with_priority(BACKGROUND))
+    """
+
+    def __init__(self, max_in_flight, reserved=1):
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        if not 0 <= reserved < max_in_flight:
+            raise ValueError("reserved must be smaller than max_in_flight")
+        self.max_in_flight = max_in_flight
+        self.reserved = reserved
+        self.in_flight = 0
+        self._waiters = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    def _capacity(self, priority):
+        if priority <= CRITICAL:
+            return self.max_in_flight
+        return self.max_in_flight - self.reserved
+
+    def acquire(self, priority=NORMAL):
+        """Block until a request of the given priority may run."""
+        with self._cond:
+            entry = (priority, next(self._seq))
+            heapq.heappush(self._waiters, entry)
+            self._cond.wait_for(
+                lambda: (self._waiters[0] == entry and
+                         self.in_flight < self._capacity(priority)))
+            heapq.heappop(self._waiters)
+            self.in_flight += 1
+            # the next waiter may be admissible as well
+            self._cond.notify_all()
+
+    def release(self):
+        with self._cond:
+            self.in_flight -= 1
+            self._cond.notify_all()
+
+    def call(self, priority, func, *args, **kwargs):
+        """Run func once admitted with the given priority."""
+        self.acquire(priority)
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.release()
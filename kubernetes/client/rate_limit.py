@@ -0,0 +1,139 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+READ = 'read'
+MUTATING = 'mutating'
+MUTATING_METHODS = frozenset(['POST', 'PUT', 'PATCH', 'DELETE'])
+
+
+def verb_class(method):
+    """Return MUTATING for write verbs and READ for everything else."""
+    return MUTATING if method.upper() in MUTATING_METHODS else READ
+
+
+class TokenBucket(object):
+    """
+    A token bucket refilled at `qps` tokens per second up to `burst` tokens.
+    """
+
+    def __init__(self, qps, burst):
+        if qps <= 0 or burst < 1:
+            raise ValueError("qps must be positive and burst at least 1")
+        self.qps = float(qps)
+        self.burst = burst
+        self._tokens = float(burst)
+        self._last = time.time()
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """
+        Take a token and return how many seconds the caller has to wait
+        before it may use it.
+        """
+        with self._lock:
+            now = time.time()
+            self._tokens = min(self.burst,
+                               self._tokens + (now - self._last) * self.qps)
+            self._last = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.qps
+
+    def wait(self):
+        """Block until a token is available and return the seconds waited."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+
+class RateLimiter(object):
+    """
+    Client side QPS/burst limiter with separate budgets for read and
+    mutating requests.
+
+    :param qps: sustained read requests per second.
+    :param burst: read requests allowed in a burst.
+    :param mutating_qps: sustained mutating requests per second, defaults
+        to qps.
+    :param mutating_burst: mutating requests allowed in a burst, defaults
+        to burst.
+    """
+
+    def __init__(self, qps, burst=None, mutating_qps=None,
+                 mutating_burst=None):
+        if burst is None:
+            burst = max(1, int(qps))
+        if mutating_qps is None:
+            mutating_qps = qps
+        if mutating_burst is None:
+            mutating_burst = burst
+        self._buckets = {
+            READ: TokenBucket(qps, burst),
+            MUTATING: TokenBucket(mutating_qps, mutating_burst),
+        }
+        self._lock = threading.Lock()
+        self._stats = dict((k, {'requests': 0, 'throttled': 0,
+                                'wait_seconds': 0.0})
+                           for k in self._buckets)
+
+    def wait(self, method):
+        """
+        Block until a request with the given method may be sent.
+
+        :return: the number of seconds the request was delayed.
+        """
+        kind = verb_class(method)
+        waited = self._buckets[kind].wait()
+        with self._lock:
+            stats = self._stats[kind]
+            stats['requests'] += 1
+            if waited > 0:
+                stats['throttled'] += 1
+                stats['wait_seconds'] += waited
+        if waited > 0:
+            logger.debug("client side throttling delayed %s request by %.3fs",
+                         method, waited)
+        return waited
+
+    def stats(self):
+        """Return a copy of the request and wait counters per verb class."""
+        with self._lock:
+            return dict((k, dict(v)) for k, v in self._stats.items())
+
+
+_shared_limiters = {}
+_shared_limiters_lock = threading.Lock()
+
+
+def shared_rate_limiter(host, qps, burst=None, mutating_qps=None,
+                        mutating_burst=None):
+    """
+    Return the RateLimiter shared by every client of `host` configured with
+    the same limits, creating it on first use.
+    """
+    key = (host, qps, burst, mutating_qps, mutating_burst)
+    with _shared_limiters_lock:
+        limiter = _shared_limiters.get(key)
+        if limiter is None:
+            limiter = RateLimiter(qps, burst, mutating_qps, mutating_burst)
+            _shared_limiters[key] = limiter
+        return limiter
@@ -12,19 +12,23 @@
 
 from __future__ import absolute_import
 
+import atexit
 import io
 import json
 import logging
 import re
 import ssl
+import threading
 
 import certifi
 # python 2 and python 3 compatibility library
 import six
 from six.moves.urllib.parse import urlencode
 import urllib3
+from urllib3._collections import HTTPHeaderDict
 
 from kubernetes.client.exceptions import ApiException, ApiValueError
+from kubernetes.client import rate_limit
 
 
 logger = logging.getLogger(__name__)
@@ -47,6 +51,21 @@ class RESTResponse(io.IOBase):
         return self.urllib3_response.getheader(name, default)
 
 
+def _pool_manager_stats(pool_manager):
+    stats = {'connections': 0, 'requests': 0, 'idle': 0}
+    if pool_manager is None:
+        return stats
+    for key in pool_manager.pools.keys():
+        pool = pool_manager.pools.get(key)
+        if pool is None:
+            continue
+        stats['connections'] += pool.num_connections
+        stats['requests'] += pool.num_requests
+        if pool.pool is not None:
+            stats['idle'] += pool.pool.qsize()
+    return stats
+
+
 class RESTClientObject(object):
 
     def __init__(self, configuration, pools_size=4, maxsize=None):
@@ -81,30 +100,90 @@ class RESTClientObject(object):
                 maxsize = configuration.connection_pool_maxsize
             else:
                 maxsize = 4
+        self.maxsize = maxsize
+
+        self.rate_limiter = None
+        if configuration.qps:
+            self.rate_limiter = rate_limit.shared_rate_limiter(
+                configuration.host, configuration.qps, configuration.burst,
+                configuration.mutating_qps, configuration.mutating_burst)
+
+        self.proxy = configuration.proxy
+        self.proxy_headers = configuration.proxy_headers
+        self.pool_kwargs = dict(
+            num_pools=pools_size,
+            cert_reqs=cert_reqs,
+            ca_certs=ca_certs,
+            cert_file=configuration.cert_file,
+            key_file=configuration.key_file,
+            **addition_pool_args
+        )
 
         # https pool manager
-        if configuration.proxy:
-            self.pool_manager = urllib3.ProxyManager(
-                num_pools=pools_size,
-                maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                proxy_url=configuration.proxy,
-                proxy_headers=configuration.proxy_headers,
-                **addition_pool_args
-            )
-        else:
-            self.pool_manager = urllib3.PoolManager(
-                num_pools=pools_size,
+        self.pool_manager = self._new_pool_manager(maxsize)
+
+        # Watches, followed logs and other unbuffered responses keep their
+        # connection for as long as the caller reads from them, so they get
+        # a pool of their own and cannot starve short requests.
+        self.stream_pool_maxsize = configuration.stream_connection_pool_maxsize
+        if self.stream_pool_maxsize is None:
+            self.stream_pool_maxsize = maxsize
+        self._stream_pool_manager = None
+        self._stream_pool_lock = threading.Lock()
+
+    def _new_pool_manager(self, maxsize):
+        if self.proxy:
+            return urllib3.ProxyManager(
                 maxsize=maxsize,
-                cert_reqs=cert_reqs,
-                ca_certs=ca_certs,
-                cert_file=configuration.cert_file,
-                key_file=configuration.key_file,
-                **addition_pool_args
+                proxy_url=self.proxy,
+                proxy_headers=self.proxy_headers,
+                **self.pool_kwargs
             )
+        return urllib3.PoolManager(maxsize=maxsize, **self.pool_kwargs)
+
+    @property
+    def stream_pool_manager(self):
+        """Pool manager for streaming requests, created on first use."""
+        if self._stream_pool_manager is None:
+            with self._stream_pool_lock:
+                if self._stream_pool_manager is None:
+                    self._stream_pool_manager = self._new_pool_manager(
+                        self.stream_pool_maxsize)
+        return self._stream_pool_manager
+
+    def select_pool_manager(self, query_params=None, _preload_content=True):
+        """Returns the pool manager a request should be sent through.
+
+        Requests that are not preloaded or that watch or follow a resource
+        go through the streaming pool.
+        """
+        if not _preload_content:
+            return self.stream_pool_manager
+        if query_params:
+            items = (query_params.items() if isinstance(query_params, dict)
+                     else query_params)
+            for k, v in items:
+                if k in ('watch', 'follow') and v in (True, 'true', 'True'):
+                    return self.stream_pool_manager
+        return self.pool_manager
+
+    def pool_stats(self):
+        """Returns connection counters of the regular and streaming pools.
+
+        :return: dict with `default` and `stream` entries, each holding the
+            pool maxsize and the number of connections opened, requests
+            sent and idle connections over all hosts of that pool.
+        """
+        stats = {'default': _pool_manager_stats(self.pool_manager),
+                 'stream': _pool_manager_stats(self._stream_pool_manager)}
+        stats['stream']['maxsize'] = self.stream_pool_maxsize
+        return stats
+
+    def close(self):
+        """Closes all pooled connections."""
+        self.pool_manager.clear()
+        if self._stream_pool_manager is not None:
+            self._stream_pool_manager.clear()
 
     def request(self, method, url, query_params=None, headers=None,
                 body=None, post_params=None, _preload_content=True,
@@ -138,10 +217,17 @@ class RESTClientObject(object):
 
         post_params = post_params or {}
         headers = headers or {}
+        if any(isinstance(v, list) for v in six.itervalues(headers)):
+            # send list values as repeated headers
+            multi_headers = HTTPHeaderDict()
+            for k, v in six.iteritems(headers):
+                for value in (v if isinstance(v, list) else [v]):
+                    multi_headers.add(k, value)
+            headers = multi_headers
 
         timeout = None
         if _request_timeout:
-            if isinstance(_request_timeout, (int, ) if six.PY3 else (int, long)):  # noqa: E501,F821
+            if isinstance(_request_timeout, (int, float) if six.PY3 else (int, long, float)):  # noqa: E501,F821
                 timeout = urllib3.Timeout(total=_request_timeout)
             elif (isinstance(_request_timeout, tuple) and
                   len(_request_timeout) == 2):
@@ -151,6 +237,11 @@ class RESTClientObject(object):
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
 
+        if self.rate_limiter is not None:
+            self.rate_limiter.wait(method)
+
+        pool_manager = self.select_pool_manager(query_params, _preload_content)
+
         try:
             # For `POST`, `PUT`, `PATCH`, `OPTIONS`, `DELETE`
             if method in ['POST', 'PUT', 'PATCH', 'OPTIONS', 'DELETE']:
@@ -158,20 +249,28 @@ class RESTClientObject(object):
                     url += '?' + urlencode(query_params)
                 if re.search('json', headers['Content-Type'], re.IGNORECASE):
                     if headers['Content-Type'] == 'application/json-patch+json':
-                        if not isinstance(body, list):
+                        if isinstance(body, bytes):
+                            # already serialized, a JSON patch is an array
+                            rewrite = body.lstrip()[:1] != b'['
+                        else:
+                            rewrite = not isinstance(body, list)
+                        if rewrite:
                             headers['Content-Type'] = \
                                 'application/strategic-merge-patch+json'
                     request_body = None
-                    if body is not None:
+                    if isinstance(body, bytes):
+                        # already serialized, e.g. by serialization.dumps
+                        request_body = body
+                    elif body is not None:
                         request_body = json.dumps(body)
-                    r = self.pool_manager.request(
+                    r = pool_manager.request(
                         method, url,
                         body=request_body,
                         preload_content=_preload_content,
                         timeout=timeout,
                         headers=headers)
                 elif headers['Content-Type'] == 'application/x-www-form-urlencoded':  # noqa: E501
-                    r = self.pool_manager.request(
+                    r = pool_manager.request(
                         method, url,
                         fields=post_params,
                         encode_multipart=False,
@@ -183,7 +282,7 @@ class RESTClientObject(object):
                     # Content-Type which generated by urllib3 will be
                     # overwritten.
                     del headers['Content-Type']
-                    r = self.pool_manager.request(
+                    r = pool_manager.request(
                         method, url,
                         fields=post_params,
                         encode_multipart=True,
@@ -195,7 +294,7 @@ class RESTClientObject(object):
                 # provided in serialized form
                 elif isinstance(body, str) or isinstance(body, bytes):
                     request_body = body
-                    r = self.pool_manager.request(
+                    r = pool_manager.request(
                         method, url,
                         body=request_body,
                         preload_content=_preload_content,
@@ -209,11 +308,11 @@ class RESTClientObject(object):
                     raise ApiException(status=0, reason=msg)
             # For `GET`, `HEAD`
             else:
-                r = self.pool_manager.request(method, url,
-                                              fields=query_params,
-                                              preload_content=_preload_content,
-                                              timeout=timeout,
-                                              headers=headers)
+                r = pool_manager.request(method, url,
+                                         fields=query_params,
+                                         preload_content=_preload_content,
+                                         timeout=timeout,
+                                         headers=headers)
         except urllib3.exceptions.SSLError as e:
             msg = "{0}\n{1}".format(type(e).__name__, str(e))
             raise ApiException(status=0, reason=msg)
@@ -298,3 +397,79 @@ class RESTClientObject(object):
                             _preload_content=_preload_content,
                             _request_timeout=_request_timeout,
                             body=body)
+
+
+# Transport settings that RESTClientObject reads from a Configuration.
+# Clients whose configurations agree on all of them can share pools.
+_TRANSPORT_SETTINGS = (
+    'host', 'verify_ssl', 'ssl_ca_cert', 'cert_file', 'key_file',
+    'assert_hostname', 'retries', 'connection_pool_maxsize',
+    'stream_connection_pool_maxsize', 'proxy', 'qps', 'burst',
+    'mutating_qps', 'mutating_burst',
+)
+
+_shared_clients = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _transport_key(configuration):
+    key = []
+    for name in _TRANSPORT_SETTINGS:
+        value = getattr(configuration, name)
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        key.append(value)
+    proxy_headers = configuration.proxy_headers
+    key.append(tuple(sorted(proxy_headers.items())) if proxy_headers
+               else None)
+    return tuple(key)
+
+
+def acquire_shared_client(configuration):
+    """Returns the process wide RESTClientObject for a configuration.
+
+    Configurations with the same host, TLS material, proxy and pool
+    settings get the same client, so its connections and TLS sessions are
+    reused. Every call must be paired with release_shared_client.
+
+    :param configuration: Configuration of the client.
+    :return: RESTClientObject.
+    """
+    key = _transport_key(configuration)
+    with _shared_clients_lock:
+        entry = _shared_clients.get(key)
+        if entry is None:
+            entry = [RESTClientObject(configuration), 0]
+            _shared_clients[key] = entry
+        entry[1] += 1
+        return entry[0]
+
+
+def release_shared_client(client):
+    """Drops a reference taken by acquire_shared_client.
+
+    The client's connections are closed once the last reference is gone.
+    """
+    with _shared_clients_lock:
+        for key, entry in list(_shared_clients.items()):
+            if entry[0] is client:
+                entry[1] -= 1
+                if entry[1] > 0:
+                    return
+                del _shared_clients[key]
+                break
+        else:
+            return
+    client.close()
+
+
+@atexit.register
+def close_shared_clients():
+    """Closes every shared client regardless of outstanding references."""
+    with _shared_clients_lock:
+        clients = [entry[0] for entry in _shared_clients.values()]
+        _shared_clients.clear()
+    for client in clients:
+        client.close()
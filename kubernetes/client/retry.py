@@ -0,0 +1,135 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import email.utils
+import logging
+import random
+import time
+
+from kubernetes.client.exceptions import ApiException
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_METHODS = frozenset(['GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE'])
+RETRY_STATUSES = frozenset([429, 500, 502, 503, 504])
+
+
+def parse_retry_after(headers):
+    """
+    Return the delay in seconds requested by a Retry-After header, or None.
+
+    Both the delta-seconds and the HTTP-date forms are understood.
+    """
+    if not headers:
+        return None
+    value = None
+    for name in ('Retry-After', 'retry-after'):
+        value = headers.get(name)
+        if value is not None:
+            break
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = email.utils.parsedate_tz(value)
+        if when is None:
+            return None
+        return max(0.0, email.utils.mktime_tz(when) - time.time())
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _attempt_timeout(timeout, remaining):
+    """Return the _request_timeout of an attempt given the time left."""
+    remaining = max(remaining, 0.001)
+    if isinstance(timeout, tuple) and len(timeout) == 2:
+        return tuple(min(t, remaining) if t else remaining for t in timeout)
+    if timeout:
+        return min(timeout, remaining)
+    return remaining
+
+
+class RetryPolicy(object):
+    """
+    Retry policy for API calls that fail with a retryable status.
+
+    Retries use full-jitter exponential backoff, a Retry-After header sent
+    by the API server takes precedence over the computed backoff, both
+    bounded by `backoff_max`, and all attempts together must finish within
+    `deadline` seconds: the _request_timeout of each attempt is cut down
+    to the time left.
+
+    :param max_attempts: total number of attempts, including the first one.
+    :param backoff_base: backoff of the first retry in seconds.
+    :param backoff_max: upper bound of a single backoff in seconds.
+    :param deadline: overall time budget in seconds across all attempts and
+        backoffs, None for no limit.
+    :param statuses: HTTP statuses that are retried.
+    :param methods: HTTP methods that are retried. Only idempotent methods
+        are retried by default.
+    """
+
+    def __init__(self, max_attempts=5, backoff_base=0.5, backoff_max=30.0,
+                 deadline=None, statuses=RETRY_STATUSES,
+                 methods=IDEMPOTENT_METHODS):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.deadline = deadline
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(m.upper() for m in methods)
+
+    def is_retryable(self, method, exc):
+        return (method.upper() in self.methods and
+                getattr(exc, 'status', None) in self.statuses)
+
+    def backoff(self, attempt, retry_after=None):
+        """Return the delay before retry number `attempt` (starting at 1)."""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+        cap = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, cap)
+
+    def call(self, method, func, *args, **kwargs):
+        """
+        Call func, retrying the ApiException failures this policy allows.
+
+        The last exception is re-raised once the attempts or the deadline
+        are exhausted.
+        """
+        start = time.time()
+        attempt = 1
+        timeout = kwargs.get('_request_timeout')
+        while True:
+            if self.deadline is not None and '_request_timeout' in kwargs:
+                kwargs['_request_timeout'] = _attempt_timeout(
+                    timeout, self.deadline - (time.time() - start))
+            try:
+                return func(*args, **kwargs)
+            except ApiException as e:
+                if (attempt >= self.max_attempts or
+                        not self.is_retryable(method, e)):
+                    raise
+                delay = self.backoff(attempt, parse_retry_after(e.headers))
+                if (self.deadline is not None and
+                        time.time() - start + delay > self.deadline):
+                    raise
+                logger.debug("%s request failed with %s, retrying in %.3fs "
+                             "(attempt %d of %d)", method, e.status, delay,
+                             attempt + 1, self.max_attempts)
+                time.sleep(delay)
+                attempt += 1
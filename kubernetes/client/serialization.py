@@ -0,0 +1,376 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Serialization of models to and from their JSON representation.
+
+The attributes of each model class are compiled once into
+(attribute, json key, kind) tuples, so serializing an instance does not
+walk openapi_types and attribute_map or go through the properties.
+Attributes declared as primitives, or as lists and dicts of primitives,
+are copied without recursing into them when their values match.
+from_dict() builds models the same way in the other direction, and
+equal() and content_hash() compare them without serializing on every
+comparison.
+"""
+
+import datetime
+import hashlib
+import json
+import threading
+
+from dateutil.parser import parse
+import six
+
+from kubernetes.client.configuration import Configuration
+
+# values that serialize to themselves
+PLAIN_TYPES = frozenset((float, bool, bytes, six.text_type) +
+                        six.integer_types)
+_PLAIN_BASES = tuple(PLAIN_TYPES)
+_PLAIN_DECLARED = frozenset(['str', 'int', 'long', 'float', 'bool'])
+
+# attribute kinds
+PLAIN = 0
+PLAIN_LIST = 1
+PLAIN_DICT = 2
+OTHER = 3
+
+_MISSING = object()
+_fields = {}
+_fields_lock = threading.Lock()
+
+
+def _kind(openapi_type):
+    if openapi_type in _PLAIN_DECLARED:
+        return PLAIN
+    if openapi_type.startswith('list[') and \
+            openapi_type[5:-1] in _PLAIN_DECLARED:
+        return PLAIN_LIST
+    if openapi_type.startswith('dict(') and \
+            openapi_type[5:-1].split(', ', 1)[-1] in _PLAIN_DECLARED:
+        return PLAIN_DICT
+    return OTHER
+
+
+def fields(klass):
+    """
+    Return the (private attribute, attribute, json key, kind) tuples of a
+    model class.
+    """
+    result = _fields.get(klass)
+    if result is None:
+        result = tuple(
+            ('_' + attr, attr, klass.attribute_map[attr], _kind(type_))
+            for attr, type_ in six.iteritems(klass.openapi_types))
+        with _fields_lock:
+            _fields[klass] = result
+    return result
+
+
+def _all_plain(values):
+    for value in values:
+        if type(value) not in PLAIN_TYPES:
+            return False
+    return True
+
+
+def sanitize(obj):
+    """
+    Return obj as built from lists, dicts and primitives, ready for json.
+
+    Models become dicts keyed by their json keys without the attributes
+    that are None, dates become ISO 8601 strings.
+    """
+    if obj is None:
+        return None
+    cls = type(obj)
+    if cls in PLAIN_TYPES:
+        return obj
+    if cls is dict:
+        return dict((key, sanitize(value))
+                    for key, value in six.iteritems(obj))
+    if cls is list:
+        return [sanitize(item) for item in obj]
+    if hasattr(cls, 'openapi_types'):
+        return serialize_model(obj)
+    if isinstance(obj, _PLAIN_BASES):
+        return obj
+    if isinstance(obj, list):
+        return [sanitize(item) for item in obj]
+    if isinstance(obj, tuple):
+        return tuple(sanitize(item) for item in obj)
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    if isinstance(obj, dict):
+        return dict((key, sanitize(value))
+                    for key, value in six.iteritems(obj))
+    return serialize_model(obj)
+
+
+def serialize_model(obj):
+    """Return the dict that represents model obj in JSON."""
+    result = {}
+    values = getattr(obj, '__dict__', {})
+    for private, attr, key, kind in fields(type(obj)):
+        # the generated properties return the private attribute as it is
+        value = values.get(private, _MISSING)
+        if value is _MISSING:
+            value = getattr(obj, attr)
+        if value is None:
+            continue
+        cls = type(value)
+        if kind == PLAIN and cls in PLAIN_TYPES:
+            result[key] = value
+        elif kind == PLAIN_LIST and cls is list and _all_plain(value):
+            result[key] = list(value)
+        elif kind == PLAIN_DICT and cls is dict and \
+                _all_plain(six.itervalues(value)):
+            result[key] = dict(value)
+        else:
+            result[key] = sanitize(value)
+    return result
+
+
+def _default(obj):
+    if hasattr(type(obj), 'openapi_types'):
+        # nested values are handled by the encoder as it reaches them
+        result = {}
+        values = getattr(obj, '__dict__', {})
+        for private, attr, key, _ in fields(type(obj)):
+            value = values.get(private, _MISSING)
+            if value is _MISSING:
+                value = getattr(obj, attr)
+            if value is not None:
+                result[key] = value
+        return result
+    if isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    raise TypeError("Object of type %s is not JSON serializable"
+                    % type(obj).__name__)
+
+
+_encoder = json.JSONEncoder(default=_default, check_circular=False)
+
+
+def dumps(obj):
+    """
+    Serialize obj, which may contain models, to JSON bytes.
+
+    This is a single pass of the C json encoder, which calls back for each
+    model and date, instead of building a sanitized copy first. The bytes
+    can be passed as the body of an API call and are sent as they are.
+    """
+    return _encoder.encode(obj).encode('utf-8')
+
+
+def equal(a, b):
+    """
+    Return whether models a and b have equal attributes.
+
+    The attributes of a's class are compared one by one, nested models
+    through their own __eq__, and the comparison stops at the first
+    difference.
+    """
+    if a is b:
+        return True
+    values_a = getattr(a, '__dict__', {})
+    values_b = getattr(b, '__dict__', {})
+    for private, attr, _, _ in fields(type(a)):
+        value_a = values_a.get(private, _MISSING)
+        if value_a is _MISSING:
+            value_a = getattr(a, attr)
+        value_b = values_b.get(private, _MISSING)
+        if value_b is _MISSING:
+            value_b = getattr(b, attr)
+        if value_a is not value_b and value_a != value_b:
+            return False
+    return True
+
+
+# fields set by the server that change without the object changing
+IGNORED_FIELDS = (('metadata', 'resourceVersion'),
+                  ('metadata', 'managedFields'))
+
+_canonical_encoder = json.JSONEncoder(
+    ensure_ascii=False, check_circular=False, sort_keys=True,
+    separators=(',', ':'))
+
+
+def _drop(data, path):
+    for key in path[:-1]:
+        data = data.get(key) if isinstance(data, dict) else None
+    if isinstance(data, dict):
+        data.pop(path[-1], None)
+
+
+def content_hash(obj, ignored_fields=IGNORED_FIELDS):
+    """
+    Return the SHA-256 hex digest of the canonical JSON form of obj.
+
+    The JSON has sorted keys and no whitespace, so the hash only depends
+    on the content, and leaves out the fields in ignored_fields. For a
+    model the digest is cached on the instance with a copy of the model,
+    and is reused for as long as the model is equal to that copy, so any
+    change to the model or to the values under it is seen.
+
+    :param obj: model, or value built from lists, dicts and primitives.
+    :param ignored_fields: sequence of paths of json keys to leave out.
+    :return: str
+    """
+    ignored_fields = tuple(tuple(path) for path in ignored_fields)
+    values = getattr(obj, '__dict__', None)
+    model = values is not None and hasattr(type(obj), 'openapi_types')
+    if model:
+        cached = values.get('_content_hash')
+        if cached is not None and cached[0] == ignored_fields and \
+                cached[1] == obj:
+            return cached[2]
+    data = sanitize(obj)
+    if model:
+        snapshot = from_dict(type(obj), data,
+                             values.get('local_vars_configuration'))
+    for path in ignored_fields:
+        _drop(data, path)
+    digest = hashlib.sha256(
+        _canonical_encoder.encode(data).encode('utf-8')).hexdigest()
+    if model:
+        values['_content_hash'] = (ignored_fields, snapshot, digest)
+    return digest
+
+
+def _parse_datetime(value, configuration):
+    if isinstance(value, datetime.datetime):
+        return value
+    return parse(value)
+
+
+def _parse_date(value, configuration):
+    if isinstance(value, datetime.date):
+        return value
+    return parse(value).date()
+
+
+def _copy_list(value, configuration):
+    return list(value)
+
+
+def _copy_dict(value, configuration):
+    return dict(value)
+
+
+def _model_decoder(name):
+    klass = []
+
+    def decode(value, configuration):
+        if not klass:
+            import kubernetes.client.models
+            klass.append(getattr(kubernetes.client.models, name))
+        return from_dict(klass[0], value, configuration)
+    return decode
+
+
+_decoders = {}
+
+
+def _decoder(openapi_type):
+    """
+    Return a function turning a JSON value of openapi_type into the value
+    of a model attribute, or None if the JSON value is used as it is.
+    """
+    if openapi_type in _decoders:
+        return _decoders[openapi_type]
+    if openapi_type in _PLAIN_DECLARED or openapi_type == 'object':
+        decoder = None
+    elif openapi_type == 'datetime':
+        decoder = _parse_datetime
+    elif openapi_type == 'date':
+        decoder = _parse_date
+    elif openapi_type.startswith('list['):
+        item = _decoder(openapi_type[5:-1])
+        if item is None:
+            decoder = _copy_list
+        else:
+            def decoder(value, configuration):
+                return [None if v is None else item(v, configuration)
+                        for v in value]
+    elif openapi_type.startswith('dict('):
+        item = _decoder(openapi_type[5:-1].split(', ', 1)[1])
+        if item is None:
+            decoder = _copy_dict
+        else:
+            def decoder(value, configuration):
+                return dict((k, None if v is None else item(v, configuration))
+                            for k, v in six.iteritems(value))
+    else:
+        decoder = _model_decoder(openapi_type)
+    _decoders[openapi_type] = decoder
+    return decoder
+
+
+_readers = {}
+
+
+def _reader(klass):
+    reader = _readers.get(klass)
+    if reader is None:
+        defaults = dict(('_' + attr, None) for attr in klass.openapi_types)
+        defaults['discriminator'] = None
+        keys = dict(
+            (klass.attribute_map[attr], ('_' + attr, _decoder(type_)))
+            for attr, type_ in six.iteritems(klass.openapi_types))
+        reader = (defaults, keys, hasattr(klass, 'get_real_child_model'))
+        with _fields_lock:
+            _readers[klass] = reader
+    return reader
+
+
+def from_dict(klass, data, configuration=None):
+    """
+    Build an instance of model klass from its JSON representation.
+
+    The attributes are assigned directly instead of going through
+    __init__ and the property setters, so the data is not validated,
+    unknown keys are ignored and primitive values are taken as they are.
+    Nested models are built the same way. Lists and dicts are copied,
+    values of type object are shared with data.
+
+    :param klass: model class.
+    :param data: dict keyed by the json keys of klass, or None.
+    :param configuration: Configuration of the created models, shared by
+        all of them. Defaults to a copy of the default configuration.
+    :return: instance of klass, or None if data is None.
+    """
+    if data is None:
+        return None
+    if configuration is None:
+        configuration = Configuration.get_default_copy()
+    defaults, keys, discriminated = _reader(klass)
+    values = dict(defaults)
+    values['local_vars_configuration'] = configuration
+    for key, value in six.iteritems(data):
+        field = keys.get(key)
+        if field is not None and value is not None:
+            private, decode = field
+            values[private] = (value if decode is None
+                               else decode(value, configuration))
+    instance = klass.__new__(klass)
+    instance.__dict__.update(values)
+    if discriminated:
+        name = instance.get_real_child_model(data)
+        if name:
+            import kubernetes.client.models
+            return from_dict(getattr(kubernetes.client.models, name), data,
+                             configuration)
+    return instance
@@ -0,0 +1,80 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+
+
+class _Call(object):
+
+    __slots__ = ('done', 'result', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight(object):
+    """
+    Shares one in flight call between the callers asking for the same key.
+
+    The first caller of `do` for a key runs the function, callers arriving
+    while it runs wait for it and get the same result, or the same
+    exception. Nothing is kept once the call returns, a later caller runs
+    the function again.
+
+    Set as ApiClient.single_flight, it is used for GET requests that are
+    decoded (_preload_content left to True), keyed by their URL, query and
+    headers, which include the credentials. The callers then share the
+    deserialized response and must not modify it. A waiting caller is
+    bound by the timeout of the request it joined, not its own.
+
+    Example:
+        api_client.single_flight = SingleFlight()
+    """
+
+    def __init__(self):
+        self.shared = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._calls)
+
+    def do(self, key, func, *args, **kwargs):
+        """Return func(*args, **kwargs), shared with concurrent callers of
+        the same key."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
@@ -0,0 +1,151 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import calendar
+import datetime
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+def _to_timestamp(expiry):
+    if expiry is None or isinstance(expiry, (int, float)):
+        return expiry
+    if isinstance(expiry, datetime.datetime):
+        if expiry.tzinfo is not None:
+            expiry = expiry.astimezone(datetime.timezone.utc)
+        return (calendar.timegm(expiry.timetuple()) +
+                expiry.microsecond / 1e6)
+    raise TypeError("expiry must be a datetime, a timestamp or None")
+
+
+class TokenProvider(object):
+    """
+    Caches a bearer token and the auth settings built from it.
+
+    `fetch` is called to obtain a token and returns a `(token, expiry)`
+    pair, where expiry is a datetime (UTC if naive), a UNIX timestamp, or
+    None for a token that does not expire. The token is refreshed
+    `refresh_margin` seconds before it expires, by a background thread
+    unless `background` is False, so API calls only read the precomputed
+    header. If a refresh has not completed by the time the token expires,
+    the next API call refreshes it synchronously. Background refreshes are
+    at least `retry_interval` seconds apart. A token that is already
+    expired when fetched, e.g. because of clock skew, counts as a failed
+    refresh: it is used as it is and fetched again `retry_interval` seconds
+    later, in the background or by the first API call after that.
+
+    Example:
+        def fetch():
+            token = run_exec_plugin()
+            return token['status']['token'], parse(
+                token['status']['expirationTimestamp'])
+
+        configuration.token_provider = TokenProvider(fetch)
+    """
+
+    def __init__(self, fetch, refresh_margin=60.0, retry_interval=5.0,
+                 background=True):
+        self._fetch = fetch
+        self.refresh_margin = refresh_margin
+        self.retry_interval = retry_interval
+        self.background = background
+        self.expiry = None
+        self._auth_settings = None
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._timer = None
+        self._closed = False
+        # time before which an expired token is not fetched again
+        self._retry_at = 0.0
+
+    def _refresh(self):
+        with self._refresh_lock:
+            self._do_refresh()
+
+    def _do_refresh(self):
+        token, expiry = self._fetch()
+        expiry = _to_timestamp(expiry)
+        settings = {
+            'BearerToken': {
+                'type': 'api_key',
+                'in': 'header',
+                'key': 'authorization',
+                'value': 'Bearer ' + token
+            }
+        }
+        with self._lock:
+            self._auth_settings = settings
+            self.expiry = expiry
+        if expiry is not None:
+            remaining = expiry - time.time()
+            if remaining <= 0:
+                logger.warning("fetched token is already expired, retrying "
+                               "in %ss", self.retry_interval)
+                self._retry_at = time.time() + self.retry_interval
+                self._schedule(self.retry_interval)
+            elif remaining > self.refresh_margin:
+                self._schedule(remaining - self.refresh_margin)
+            else:
+                # tokens living shorter than the margin are refreshed halfway
+                self._schedule(max(remaining / 2, self.retry_interval))
+
+    def _schedule(self, delay):
+        if not self.background or self._closed:
+            return
+        timer = threading.Timer(max(0.0, delay), self._background_refresh)
+        timer.daemon = True
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = timer
+        timer.start()
+
+    def _background_refresh(self):
+        try:
+            self._refresh()
+        except Exception:
+            logger.exception("background token refresh failed, retrying "
+                             "in %ss", self.retry_interval)
+            self._schedule(self.retry_interval)
+
+    def _valid(self):
+        if self._auth_settings is None:
+            return False
+        # an expired token keeps being used until it may be fetched again
+        now = time.time()
+        return (self.expiry is None or now < self.expiry or
+                now < self._retry_at)
+
+    def auth_settings(self):
+        """Returns the cached auth settings, refreshing an expired token."""
+        if not self._valid():
+            with self._refresh_lock:
+                if not self._valid():
+                    self._do_refresh()
+        return self._auth_settings
+
+    def token(self):
+        """Returns the current `Bearer <token>` header value."""
+        return self.auth_settings()['BearerToken']['value']
+
+    def close(self):
+        """Stops background refreshes."""
+        with self._lock:
+            self._closed = True
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
@@ -5,6 +5,8 @@ import atexit
 import weakref
 import unittest
 
+from mock import Mock
+
 import kubernetes
 
 
@@ -23,3 +25,71 @@ class TestApiClient(unittest.TestCase):
         self.assertIsNotNone(client._pool)
         atexit._run_exitfuncs()
         self.assertIsNone(client._pool)
+
+    def test_with_credentials(self):
+        config = kubernetes.client.Configuration()
+        config.api_key['authorization'] = 'parent'
+        config.api_key_prefix['authorization'] = 'Bearer'
+        client = kubernetes.client.ApiClient(config)
+        view = client.with_credentials(
+            token='tenant', impersonate_user='alice',
+            impersonate_groups=['dev', 'ops'],
+            impersonate_extra={'scopes': ['view']})
+        self.assertIs(view.rest_client, client.rest_client)
+        self.assertIs(view.configuration, client.configuration)
+
+        view.request = Mock(return_value=Mock(data='{}'))
+        view.call_api('/api', 'GET', auth_settings=['BearerToken'])
+        headers = view.request.call_args[1]['headers']
+        self.assertEqual(headers['authorization'], 'Bearer tenant')
+        self.assertEqual(headers['Impersonate-User'], 'alice')
+        self.assertEqual(headers['Impersonate-Group'], ['dev', 'ops'])
+        self.assertEqual(headers['Impersonate-Extra-scopes'], ['view'])
+
+        client.request = Mock(return_value=Mock(data='{}'))
+        client.call_api('/api', 'GET', auth_settings=['BearerToken'])
+        headers = client.request.call_args[1]['headers']
+        self.assertEqual(headers['authorization'], 'Bearer parent')
+        self.assertNotIn('Impersonate-User', headers)
+
+    def test_path_params(self):
+        client = kubernetes.client.ApiClient()
+        client.request = Mock(return_value=Mock(data='{}'))
+        client.call_api('/api/v1/namespaces/{namespace}/pods/{name}', 'GET',
+                        path_params={'namespace': 'ns', 'name': 'a b/c'})
+        url = client.request.call_args[0][1]
+        self.assertTrue(url.endswith('/api/v1/namespaces/ns/pods/a%20b%2Fc'))
+
+        # parameters missing from the path are left as they are
+        client.call_api('/api/v1/namespaces/{namespace}/pods/{name}', 'GET',
+                        path_params={'namespace': 'ns'})
+        url = client.request.call_args[0][1]
+        self.assertTrue(url.endswith('/api/v1/namespaces/ns/pods/{name}'))
+
+    def test_params_are_sanitized(self):
+        client = kubernetes.client.ApiClient()
+        client.request = Mock(return_value=Mock(data='{}'))
+        client.call_api('/api/v1/pods', 'GET',
+                        query_params=[('fieldSelector', None),
+                                      ('limit', 10)],
+                        header_params={'X-Test': ['a', 'b']},
+                        collection_formats={})
+        kwargs = client.request.call_args[1]
+        self.assertEqual(kwargs['query_params'],
+                         [('fieldSelector', None), ('limit', 10)])
+        self.assertEqual(kwargs['headers']['X-Test'], ['a', 'b'])
+
+    def test_select_headers(self):
+        client = kubernetes.client.ApiClient()
+        for _ in range(2):
+            self.assertEqual(client.select_header_accept(
+                ['application/json', 'application/yaml']),
+                'application/json')
+            self.assertEqual(client.select_header_accept(
+                ['text/plain', 'Application/YAML']),
+                'text/plain, application/yaml')
+            self.assertEqual(client.select_header_content_type(
+                ['application/merge-patch+json']),
+                'application/merge-patch+json')
+            self.assertEqual(client.select_header_content_type(['*/*']),
+                             'application/json')
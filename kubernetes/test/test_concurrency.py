@@ -0,0 +1,142 @@
+# coding: utf-8
+
+import threading
+import unittest
+
+from mock import Mock
+
+from kubernetes.client import ApiClient, CoreV1Api, concurrency
+from kubernetes.client.rest import ApiException
+from kubernetes.stream import ws_client
+from kubernetes.stream.stream import _websocket_request
+
+
+def _response(level=None):
+    headers = {}
+    if level:
+        headers[concurrency.PRIORITY_LEVEL_HEADER] = level
+        headers[concurrency.FLOW_SCHEMA_HEADER] = 'fs-' + level
+    resp = Mock(status=200, data='{}')
+    resp.getheader.side_effect = lambda name, default=None: headers.get(
+        name, default)
+    resp.getheaders.return_value = headers
+    return resp
+
+
+class TestAIMDLimit(unittest.TestCase):
+
+    def test_increase_when_utilized(self):
+        limit = concurrency.AIMDLimit(initial_limit=2)
+        for _ in range(10):
+            limit.acquire()
+            limit.release(0.01)
+        self.assertGreater(limit.limit, 2)
+
+    def test_decrease_on_overload_and_latency(self):
+        limit = concurrency.AIMDLimit(initial_limit=8)
+        limit.acquire()
+        limit.release(0.0, overloaded=True)
+        self.assertEqual(limit.limit, 4)
+        self.assertEqual(limit.throttled, 1)
+        limit.acquire()
+        limit.release(0.01)
+        limit._last_decrease = 0
+        limit.acquire()
+        limit.release(0.1)
+        self.assertEqual(int(limit.limit), 2)
+
+    def test_latency_baseline_per_route(self):
+        limit = concurrency.AIMDLimit(initial_limit=8)
+        get, lst = ('GET', '/pods/{name}'), ('GET', '/pods')
+        for route, latency in ((get, 0.01), (lst, 0.5), (get, 0.015)):
+            limit.acquire()
+            limit.release(latency, route=route)
+        self.assertEqual(limit.limit, 8)
+        self.assertEqual(limit.min_latencies, {get: 0.01, lst: 0.5})
+        limit.acquire()
+        limit.release(1.5, route=lst)
+        self.assertEqual(limit.limit, 4)
+
+    def test_never_below_min(self):
+        limit = concurrency.AIMDLimit(initial_limit=1, min_limit=1)
+        limit.acquire()
+        limit.release(0.0, overloaded=True)
+        self.assertEqual(limit.limit, 1)
+
+    def test_acquire_blocks_at_limit(self):
+        limit = concurrency.AIMDLimit(initial_limit=1)
+        self.assertTrue(limit.acquire())
+        self.assertFalse(limit.acquire(timeout=0.01))
+        threading.Timer(0.01, limit.release, args=(0.0,)).start()
+        self.assertTrue(limit.acquire(timeout=1))
+
+
+class TestAdaptiveConcurrencyLimiter(unittest.TestCase):
+
+    def test_learns_priority_level(self):
+        limiter = concurrency.AdaptiveConcurrencyLimiter()
+        route = ('GET', '/api/v1/pods')
+        limiter.call(route, Mock(return_value=_response('workload-low')))
+        limiter.call(route, Mock(return_value=_response('workload-low')))
+        stats = limiter.stats()
+        self.assertEqual(stats['']['requests'], 1)
+        self.assertEqual(stats['workload-low']['requests'], 1)
+        self.assertEqual(stats['workload-low']['flow_schema'],
+                         'fs-workload-low')
+
+    def test_throttled(self):
+        limiter = concurrency.AdaptiveConcurrencyLimiter(initial_limit=8)
+        error = ApiException(status=429)
+        error.headers = {}
+        with self.assertRaises(ApiException):
+            limiter.call(('GET', '/'), Mock(side_effect=error))
+        stats = limiter.stats()['']
+        self.assertEqual(stats['throttled'], 1)
+        self.assertEqual(stats['limit'], 4)
+        self.assertEqual(stats['in_flight'], 0)
+
+    def test_api_client_integration(self):
+        client = ApiClient()
+        client.concurrency_limiter = concurrency.AdaptiveConcurrencyLimiter()
+        client.request = Mock(return_value=_response('global-default'))
+        client.call_api('/api/v1/namespaces/{namespace}/pods', 'GET',
+                        path_params={'namespace': 'default'})
+        self.assertEqual(
+            client.concurrency_limiter._routes,
+            {('GET', '/api/v1/namespaces/{namespace}/pods'):
+             'global-default'})
+
+    def test_stream_responses_without_headers(self):
+        client = ApiClient()
+        client.concurrency_limiter = concurrency.AdaptiveConcurrencyLimiter()
+        api = CoreV1Api(client)
+
+        def websocket_call(configuration, method, url, **kwargs):
+            return ws_client.WSResponse('output')
+
+        result = _websocket_request(
+            websocket_call, None, api.connect_get_namespaced_pod_exec,
+            'pod', 'default', command=['true'])
+        self.assertEqual(result, 'output')
+        self.assertEqual(client.concurrency_limiter._routes, {})
+        self.assertEqual(client.concurrency_limiter.stats()['']['requests'],
+                         1)
+
+    def test_scheduler_admits_before_limiter(self):
+        client = ApiClient()
+        order = []
+        client.priority_scheduler = Mock()
+        client.priority_scheduler.call.side_effect = \
+            lambda priority, func, *a, **kw: (order.append('scheduler'),
+                                              func(*a, **kw))[1]
+        client.concurrency_limiter = Mock()
+        client.concurrency_limiter.call.side_effect = \
+            lambda route, func, *a, **kw: (order.append('limiter'),
+                                           func(*a, **kw))[1]
+        client.request = Mock(return_value=_response('global-default'))
+        client.call_api('/api/v1/pods', 'GET')
+        self.assertEqual(order, ['scheduler', 'limiter'])
+
+
+if __name__ == '__main__':
+    unittest.main()
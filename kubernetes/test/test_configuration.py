@@ -1,5 +1,6 @@
 # coding: utf-8
 
+import copy
 import unittest
 
 from kubernetes.client import Configuration
@@ -34,6 +35,41 @@ class TestConfiguration(unittest.TestCase):
         self.assertNotEqual(id(c1.api_key), id(c2.api_key))
         self.assertNotEqual(id(c1.api_key_prefix), id(c2.api_key_prefix))
 
+    def testDefaultCopyIsIndependent(self):
+        c1 = Configuration(host="example.com")
+        c1.api_key['authorization'] = 'token'
+        c1.proxy_headers = {'X-Proxy': '1'}
+        Configuration.set_default(c1)
+
+        c2 = Configuration.get_default_copy()
+        c3 = Configuration.get_default_copy()
+        c2.host = "other.com"
+        c2.api_key['authorization'] = 'changed'
+        c2.proxy_headers['X-Proxy'] = '2'
+        c2.debug = True
+
+        self.assertEqual(c3.host, "example.com")
+        self.assertEqual(c3.api_key['authorization'], 'token')
+        self.assertEqual(c3.proxy_headers, {'X-Proxy': '1'})
+        self.assertFalse(c3.debug)
+        self.assertEqual(
+            Configuration.get_default_copy().auth_settings(),
+            c3.auth_settings())
+
+        # deep copies of copies carry every setting
+        c4 = copy.deepcopy(c2)
+        self.assertEqual(c4.host, "other.com")
+        self.assertEqual(c4.api_key['authorization'], 'changed')
+        self.assertEqual(c4.verify_ssl, c1.verify_ssl)
+        self.assertNotIn('_cow_base', c4.__dict__)
+
+    def testDefaultCopyWithoutDefault(self):
+        c1 = Configuration.get_default_copy()
+        c2 = Configuration.get_default_copy()
+        c1.api_key['authorization'] = 'token'
+        self.assertEqual(c2.api_key, {})
+        self.assertEqual(c2.host, Configuration().host)
+
 
 if __name__ == '__main__':
     unittest.main()
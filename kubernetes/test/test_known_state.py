@@ -0,0 +1,172 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from mock import Mock
+
+from kubernetes import client
+from kubernetes.client import known_state
+from kubernetes.client.exceptions import ApiException
+
+
+def config_map(data, resource_version=None):
+    return client.V1ConfigMap(
+        api_version='v1', kind='ConfigMap', data=data,
+        metadata=client.V1ObjectMeta(name='cm', namespace='ns',
+                                     resource_version=resource_version,
+                                     uid='1234'))
+
+
+class TestUnchanged(unittest.TestCase):
+
+    def test_replace(self):
+        state = config_map({'a': '1'}, resource_version='7')
+        desired = {'metadata': {'name': 'cm'}, 'data': {'a': '1'}}
+        self.assertTrue(known_state.unchanged_by_replace(desired, state))
+        desired['data']['a'] = '2'
+        self.assertFalse(known_state.unchanged_by_replace(desired, state))
+
+    def test_replace_status(self):
+        state = client.V1Namespace(
+            metadata=client.V1ObjectMeta(name='ns'),
+            status=client.V1NamespaceStatus(phase='Active'))
+        desired = client.V1Namespace(
+            metadata=client.V1ObjectMeta(name='ns'),
+            status=client.V1NamespaceStatus(phase='Terminating'))
+        self.assertTrue(known_state.unchanged_by_replace(desired, state))
+        self.assertFalse(known_state.unchanged_by_replace(desired, state,
+                                                          status=True))
+
+    def test_merge_patch(self):
+        state = config_map({'a': '1'})
+        self.assertTrue(known_state.unchanged_by_patch(
+            {'data': {'a': '1'}, 'metadata': {'labels': None}}, state))
+        self.assertFalse(known_state.unchanged_by_patch(
+            {'data': {'a': None}}, state))
+        self.assertFalse(known_state.unchanged_by_patch(
+            {'data': {'b': '2'}}, state))
+        self.assertFalse(known_state.unchanged_by_patch(
+            {'$setElementOrder/data': []}, state))
+
+    def test_json_patch(self):
+        state = {'data': {'a': '1'}, 'items': ['x']}
+        self.assertTrue(known_state.unchanged_by_patch(
+            [{'op': 'replace', 'path': '/data/a', 'value': '1'},
+             {'op': 'test', 'path': '/items/0', 'value': 'x'}], state))
+        self.assertFalse(known_state.unchanged_by_patch(
+            [{'op': 'add', 'path': '/items/0', 'value': 'x'}], state))
+        self.assertFalse(known_state.unchanged_by_patch(
+            [{'op': 'remove', 'path': '/data/a'}], state))
+
+
+class TestKnownStates(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = client.ApiClient()
+        self.api_client.call_api = Mock()
+        self.api_client.known_states = known_state.KnownStates(maxsize=10)
+        self.api = client.CoreV1Api(self.api_client)
+
+    def test_elides_unchanged_writes(self):
+        current = config_map({'a': '1'}, resource_version='7')
+        self.api_client.call_api.return_value = current
+        self.assertIs(self.api.read_namespaced_config_map('cm', 'ns'),
+                      current)
+        desired = config_map({'a': '1'})
+        result = self.api.replace_namespaced_config_map('cm', 'ns', desired)
+        self.assertEqual(result, current)
+        self.assertIsNot(result, current)
+        self.assertEqual(self.api.patch_namespaced_config_map(
+            'cm', 'ns', {'data': {'a': '1'}}), current)
+        self.assertEqual(self.api_client.call_api.call_count, 1)
+        self.assertEqual(self.api_client.known_states.elided, 2)
+
+        self.api.replace_namespaced_config_map('cm', 'ns', desired,
+                                               dry_run='All')
+        self.api.patch_namespaced_config_map('cm', 'ns',
+                                             {'data': {'a': '2'}})
+        self.assertEqual(self.api_client.call_api.call_count, 3)
+
+    def test_sends_writes_of_mutated_reads(self):
+        self.api_client.call_api.side_effect = \
+            lambda *args, **kwargs: config_map({'a': '1'}, '7')
+        current = self.api.read_namespaced_config_map('cm', 'ns')
+        current.data['a'] = '2'
+        self.api.replace_namespaced_config_map('cm', 'ns', current)
+        self.assertEqual(self.api_client.call_api.call_count, 2)
+        self.assertEqual(self.api_client.call_api.call_args[0][1], 'PUT')
+        self.assertEqual(self.api_client.known_states.elided, 0)
+
+        elided = self.api.patch_namespaced_config_map(
+            'cm', 'ns', {'data': {'a': '1'}})
+        elided.data['a'] = '3'
+        self.api.patch_namespaced_config_map('cm', 'ns',
+                                             {'data': {'a': '1'}})
+        self.assertEqual(self.api_client.call_api.call_count, 2)
+        self.assertEqual(self.api_client.known_states.elided, 2)
+
+    def test_forgets_failed_and_deleted(self):
+        states = self.api_client.known_states
+        self.api_client.call_api.return_value = config_map({'a': '1'})
+        self.api.read_namespaced_config_map('cm', 'ns')
+        self.assertEqual(len(states), 1)
+        self.api_client.call_api.side_effect = ApiException(status=409)
+        with self.assertRaises(ApiException):
+            self.api.replace_namespaced_config_map(
+                'cm', 'ns', config_map({'a': '2'}))
+        self.assertEqual(len(states), 0)
+
+        self.api_client.call_api.side_effect = None
+        self.api.read_namespaced_config_map('cm', 'ns')
+        self.api.delete_namespaced_config_map('cm', 'ns')
+        self.assertEqual(len(states), 0)
+
+    def test_known_state_argument(self):
+        self.api_client.known_states = None
+        current = {'metadata': {'name': 'cm', 'resourceVersion': '7'},
+                   'data': {'a': '1'}}
+        result = self.api.replace_namespaced_config_map(
+            'cm', 'ns', config_map({'a': '1'}), _known_state=current)
+        self.assertIsInstance(result, client.V1ConfigMap)
+        self.assertEqual(result.metadata.resource_version, '7')
+        self.api_client.call_api.assert_not_called()
+        self.assertRaises(TypeError, self.api.read_namespaced_config_map,
+                          'cm', 'ns', _known_state=current)
+
+    def test_custom_objects(self):
+        api = client.CustomObjectsApi(self.api_client)
+        args = ('example.com', 'v1', 'ns', 'jobs', 'job')
+        state = {'apiVersion': 'example.com/v1', 'kind': 'Job',
+                 'metadata': {'name': 'job', 'resourceVersion': '7'},
+                 'spec': {'size': 1}, 'status': {'phase': 'Running'}}
+        self.api_client.call_api.side_effect = \
+            lambda *args, **kwargs: json.loads(json.dumps(state))
+        api.get_namespaced_custom_object(*args)
+        self.assertEqual(len(self.api_client.known_states), 1)
+
+        body = dict(state, status={'phase': 'Succeeded'})
+        api.replace_namespaced_custom_object(*args, body)
+        self.assertEqual(self.api_client.call_api.call_count, 2)
+        result = api.replace_namespaced_custom_object(
+            *args, body, _status_subresource=True)
+        self.assertEqual(result['status'], {'phase': 'Running'})
+        self.assertEqual(self.api_client.call_api.call_count, 2)
+        api.replace_namespaced_custom_object(*args, state)
+        self.assertEqual(self.api_client.call_api.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+import unittest
+
+import kubernetes.client
+from kubernetes.client import api, models
+
+
+class TestLazyImport(unittest.TestCase):
+
+    def test_import_does_not_load_apis_or_models(self):
+        code = (
+            "import sys, kubernetes.client\n"
+            "loaded = [m for m in sys.modules if\n"
+            "          m.startswith('kubernetes.client.api.') or\n"
+            "          m.startswith('kubernetes.client.models.')]\n"
+            "print(len(loaded))\n")
+        output = subprocess.check_output([sys.executable, '-c', code])
+        self.assertEqual(int(output.decode().strip()), 0)
+
+    def test_resolve_on_access(self):
+        from kubernetes.client.models.v1_pod import V1Pod
+        from kubernetes.client.api.core_v1_api import CoreV1Api
+        self.assertIs(kubernetes.client.V1Pod, V1Pod)
+        self.assertIs(models.V1Pod, V1Pod)
+        self.assertIs(kubernetes.client.CoreV1Api, CoreV1Api)
+        self.assertIs(api.CoreV1Api, CoreV1Api)
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            kubernetes.client.V1DoesNotExist
+        with self.assertRaises(ImportError):
+            from kubernetes.client import V1DoesNotExist  # noqa: F401
+
+    def test_all_and_dir(self):
+        self.assertIn('V1Pod', kubernetes.client.__all__)
+        self.assertIn('CoreV1Api', kubernetes.client.__all__)
+        self.assertIn('ApiClient', kubernetes.client.__all__)
+        self.assertIn('V1Pod', dir(kubernetes.client))
+        self.assertIn('V1Pod', dir(models))
+        self.assertIn('CoreV1Api', dir(api))
+
+    def test_deserialize_resolves_models(self):
+        client = kubernetes.client.ApiClient()
+        pod = client._ApiClient__deserialize(
+            {'metadata': {'name': 'foo'}}, 'V1Pod')
+        self.assertIsInstance(pod, kubernetes.client.V1Pod)
+        self.assertIsInstance(pod.metadata, kubernetes.client.V1ObjectMeta)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from mock import Mock
+
+from kubernetes import client
+from kubernetes.client.exceptions import ApiException
+from kubernetes.utils import multi_get
+
+
+def page(names, token=None, remaining=None):
+    metadata = {}
+    if token:
+        metadata['continue'] = token
+    if remaining is not None:
+        metadata['remainingItemCount'] = remaining
+    return Mock(data=json.dumps({
+        'metadata': metadata,
+        'items': [{'metadata': {'name': n, 'namespace': 'ns'}}
+                  for n in names]}))
+
+
+class TestMultiGet(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = client.ApiClient()
+        self.api_client.call_api = Mock()
+        self.api = client.CoreV1Api(self.api_client)
+
+    def test_choose_strategy(self):
+        self.assertEqual(multi_get.choose_strategy(1, 10), multi_get.READ)
+        self.assertEqual(multi_get.choose_strategy(100, 1000),
+                         multi_get.LIST)
+        self.assertEqual(multi_get.choose_strategy(10, 100000),
+                         multi_get.READ)
+        self.assertEqual(multi_get.choose_strategy(10, None),
+                         multi_get.READ)
+
+    def test_list(self):
+        self.api_client.call_api.side_effect = [
+            page(['a'], token='t', remaining=3),
+            page(['a', 'b'], token='t'), page(['c', 'd'])]
+        found, missing = multi_get.get_many(
+            self.api.read_namespaced_pod, self.api.list_namespaced_pod,
+            ['a', 'c', 'x'], namespace='ns')
+        self.assertEqual(sorted(found), ['a', 'c'])
+        self.assertIsInstance(found['c'], client.V1Pod)
+        self.assertEqual(missing, ['x'])
+        self.assertEqual(self.api_client.call_api.call_count, 3)
+
+    def test_read(self):
+        def read(path, method, path_params, *args, **kwargs):
+            if path_params['name'] == 'x':
+                raise ApiException(status=404)
+            return client.V1Pod(metadata=client.V1ObjectMeta(
+                name=path_params['name']))
+        self.api_client.call_api.side_effect = read
+        found, missing = multi_get.get_many(
+            self.api.read_namespaced_pod, self.api.list_namespaced_pod,
+            ['a', 'b', 'x'], namespace='ns', strategy=multi_get.READ)
+        self.assertEqual(sorted(found), ['a', 'b'])
+        self.assertEqual(found['b'].metadata.name, 'b')
+        self.assertEqual(missing, ['x'])
+
+    def test_read_errors(self):
+        self.api_client.call_api.side_effect = ApiException(status=403)
+        self.assertRaises(ApiException, multi_get.get_many,
+                          self.api.read_node, self.api.list_node, ['a'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+from mock import Mock
+
+import kubernetes
+from kubernetes.client.exceptions import ApiTypeError, ApiValueError
+from kubernetes.client.operation import Operation
+
+LIST_PODS = Operation(
+    'list_namespaced_pod', 'GET', '/api/v1/namespaces/{namespace}/pods',
+    path_params=[('namespace', 'namespace')],
+    query_params=[('_continue', 'continue'),
+                  ('label_selector', 'labelSelector')],
+    required=['namespace'],
+    response_type='V1PodList',
+    accepts=['application/json', 'application/yaml'])
+
+
+class TestOperation(unittest.TestCase):
+
+    def test_check_params(self):
+        LIST_PODS.check_params({'namespace': 'ns', 'async_req': True})
+        with self.assertRaises(ApiTypeError) as e:
+            LIST_PODS.check_params({'namespace': 'ns', 'name': 'foo'})
+        self.assertEqual(str(e.exception),
+                         "Got an unexpected keyword argument 'name' to "
+                         "method list_namespaced_pod")
+        with self.assertRaises(ApiValueError):
+            LIST_PODS.check_params({'namespace': None})
+        LIST_PODS.check_params({'namespace': None},
+                               client_side_validation=False)
+
+    def test_values(self):
+        params = {'namespace': 'ns', '_continue': 'token',
+                  'label_selector': None}
+        self.assertEqual(LIST_PODS.path_values(params), {'namespace': 'ns'})
+        self.assertEqual(LIST_PODS.query_values(params),
+                         [('continue', 'token')])
+
+    def test_call_operation(self):
+        client = kubernetes.client.ApiClient()
+        client.call_api = Mock(return_value='result')
+        result = client.call_operation(
+            LIST_PODS, {'namespace': 'ns', 'label_selector': 'app=foo',
+                        '_return_http_data_only': True})
+        self.assertEqual(result, 'result')
+        client.call_api.assert_called_once_with(
+            '/api/v1/namespaces/{namespace}/pods', 'GET',
+            {'namespace': 'ns'}, [('labelSelector', 'app=foo')],
+            {'Accept': 'application/json'},
+            body=None, post_params=[], files={},
+            response_type='V1PodList', auth_settings=['BearerToken'],
+            async_req=None, _return_http_data_only=True,
+            _preload_content=True, _request_timeout=None,
+            collection_formats={})
+
+    def test_generated_method(self):
+        client = kubernetes.client.ApiClient()
+        client.call_api = Mock()
+        api = kubernetes.client.CoreV1Api(client)
+        api.create_namespaced_config_map('ns', {'data': {}}, dry_run='All')
+        args, kwargs = client.call_api.call_args
+        self.assertEqual(args, ('/api/v1/namespaces/{namespace}/configmaps',
+                                'POST', {'namespace': 'ns'},
+                                [('dryRun', 'All')],
+                                {'Accept': 'application/json'}))
+        self.assertEqual(kwargs['body'], {'data': {}})
+        self.assertEqual(kwargs['response_type'], 'V1ConfigMap')
+        self.assertTrue(kwargs['_return_http_data_only'])
+
+
+if __name__ == '__main__':
+    unittest.main()
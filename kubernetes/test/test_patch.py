@@ -0,0 +1,100 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import copy
+import unittest
+
+from kubernetes import client
+from kubernetes.utils import patch
+
+
+def pod():
+    return client.V1Pod(
+        metadata=client.V1ObjectMeta(name='web', labels={'app': 'web'},
+                                     finalizers=['a', 'b']),
+        spec=client.V1PodSpec(containers=[
+            client.V1Container(name='app', image='app:1'),
+            client.V1Container(name='proxy', image='proxy:1', env=[
+                client.V1EnvVar(name='PORT', value='80')]),
+        ]))
+
+
+class TestPatch(unittest.TestCase):
+
+    def test_unchanged(self):
+        self.assertEqual(patch.merge_patch(pod(), pod()), {})
+        self.assertEqual(patch.json_patch(pod(), pod()), [])
+        self.assertEqual(patch.strategic_merge_patch(pod(), pod()), {})
+
+    def test_merge_patch(self):
+        original, modified = pod(), pod()
+        modified.metadata.labels = {'app': 'web', 'tier': 'front'}
+        modified.metadata.finalizers = None
+        modified.spec.containers[0].image = 'app:2'
+        self.assertEqual(patch.merge_patch(original, modified), {
+            'metadata': {'labels': {'tier': 'front'}, 'finalizers': None},
+            'spec': {'containers': [
+                {'name': 'app', 'image': 'app:2'},
+                {'name': 'proxy', 'image': 'proxy:1',
+                 'env': [{'name': 'PORT', 'value': '80'}]}]}})
+
+    def test_json_patch(self):
+        original = {'a': {'b/c': 1, 'd': 2}, 'l': [1, 2, 3]}
+        modified = {'a': {'b/c': True}, 'l': [1, 5], 'e': 'f'}
+        self.assertEqual(patch.json_patch(original, modified), [
+            {'op': 'remove', 'path': '/a/d'},
+            {'op': 'replace', 'path': '/a/b~1c', 'value': True},
+            {'op': 'replace', 'path': '/l/1', 'value': 5},
+            {'op': 'remove', 'path': '/l/2'},
+            {'op': 'add', 'path': '/e', 'value': 'f'}])
+
+    def test_strategic_merge_patch(self):
+        original, modified = pod(), copy.deepcopy(pod())
+        modified.metadata.finalizers = ['b', 'c']
+        containers = modified.spec.containers
+        containers[1].env[0].value = '8080'
+        containers.reverse()
+        containers.pop()
+        containers.append(client.V1Container(name='log', image='log:1'))
+        self.assertEqual(patch.strategic_merge_patch(original, modified), {
+            'metadata': {
+                'finalizers': ['c'],
+                '$deleteFromPrimitiveList/finalizers': ['a'],
+                '$setElementOrder/finalizers': ['b', 'c']},
+            'spec': {
+                'containers': [
+                    {'name': 'proxy', 'env': [{'name': 'PORT',
+                                               'value': '8080'}]},
+                    {'name': 'log', 'image': 'log:1'},
+                    {'name': 'app', '$patch': 'delete'}],
+                '$setElementOrder/containers': [{'name': 'proxy'},
+                                                {'name': 'log'}]}})
+
+    def test_strategic_merge_patch_of_dicts(self):
+        original = client.ApiClient().sanitize_for_serialization(pod())
+        modified = copy.deepcopy(original)
+        modified['spec']['containers'][0]['image'] = 'app:2'
+        self.assertEqual(
+            patch.strategic_merge_patch(original, modified, 'V1Pod'),
+            {'spec': {'containers': [{'name': 'app', 'image': 'app:2'}]}})
+        self.assertRaises(ValueError, patch.strategic_merge_patch,
+                          original, modified)
+
+    def test_different_classes(self):
+        self.assertRaises(ValueError, patch.merge_patch,
+                          pod(), client.V1ConfigMap())
+
+
+if __name__ == '__main__':
+    unittest.main()
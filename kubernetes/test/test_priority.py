@@ -0,0 +1,78 @@
+# coding: utf-8
+
+import threading
+import time
+import unittest
+
+from mock import Mock
+
+from kubernetes.client import ApiClient, priority
+
+
+class TestPriorityScheduler(unittest.TestCase):
+
+    def _start(self, scheduler, prio, order):
+        def run():
+            scheduler.acquire(prio)
+            order.append(prio)
+        t = threading.Thread(target=run)
+        t.start()
+        return t
+
+    def test_admits_higher_priority_first(self):
+        scheduler = priority.PriorityScheduler(max_in_flight=2, reserved=0)
+        scheduler.acquire(priority.NORMAL)
+        scheduler.acquire(priority.NORMAL)
+        order = []
+        threads = []
+        for prio in (priority.BACKGROUND, priority.NORMAL, priority.CRITICAL):
+            threads.append(self._start(scheduler, prio, order))
+            time.sleep(0.02)
+        self.assertEqual(order, [])
+        for _ in threads:
+            scheduler.release()
+            time.sleep(0.02)
+        for t in threads:
+            t.join(1)
+        self.assertEqual(order, [priority.CRITICAL, priority.NORMAL,
+                                 priority.BACKGROUND])
+
+    def test_reserved_slots(self):
+        scheduler = priority.PriorityScheduler(max_in_flight=2, reserved=1)
+        scheduler.acquire(priority.BACKGROUND)
+        order = []
+        t = self._start(scheduler, priority.BACKGROUND, order)
+        time.sleep(0.02)
+        self.assertEqual(order, [])
+        scheduler.acquire(priority.CRITICAL)
+        self.assertEqual(scheduler.in_flight, 2)
+        scheduler.release()
+        scheduler.release()
+        t.join(1)
+        self.assertEqual(order, [priority.BACKGROUND])
+
+    def test_invalid_arguments(self):
+        self.assertRaises(ValueError, priority.PriorityScheduler, 0)
+        self.assertRaises(ValueError, priority.PriorityScheduler, 2, 2)
+
+
+class TestApiClientPriority(unittest.TestCase):
+
+    def test_view_shares_transport(self):
+        client = ApiClient()
+        client.priority_scheduler = priority.PriorityScheduler(4)
+        view = client.with_priority(priority.CRITICAL)
+        self.assertIs(view.rest_client, client.rest_client)
+        self.assertIs(view.priority_scheduler, client.priority_scheduler)
+        self.assertEqual(client.priority, priority.NORMAL)
+        view.set_default_header('X-Test', '1')
+        self.assertNotIn('X-Test', client.default_headers)
+
+        client.priority_scheduler.call = Mock(return_value=Mock(data='{}'))
+        view.call_api('/api', 'GET')
+        self.assertEqual(client.priority_scheduler.call.call_args[0][0],
+                         priority.CRITICAL)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# coding: utf-8
+
+import unittest
+
+from mock import Mock, patch
+
+from kubernetes.client import Configuration, rate_limit, rest
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_separate_verb_budgets(self):
+        limiter = rate_limit.RateLimiter(qps=100, burst=1, mutating_qps=50)
+        with patch('time.sleep') as sleep:
+            self.assertEqual(limiter.wait('GET'), 0)
+            self.assertEqual(limiter.wait('POST'), 0)
+            self.assertGreater(limiter.wait('LIST'), 0)
+            self.assertGreater(limiter.wait('delete'), 0)
+        self.assertEqual(sleep.call_count, 2)
+        stats = limiter.stats()
+        self.assertEqual(stats['read']['requests'], 2)
+        self.assertEqual(stats['read']['throttled'], 1)
+        self.assertAlmostEqual(stats['mutating']['wait_seconds'], 0.02,
+                               delta=0.005)
+
+    def test_shared_per_host_and_limits(self):
+        a = rate_limit.shared_rate_limiter('https://a', 5, 10)
+        self.assertIs(a, rate_limit.shared_rate_limiter('https://a', 5, 10))
+        self.assertIsNot(a, rate_limit.shared_rate_limiter('https://b', 5, 10))
+        self.assertIsNot(a, rate_limit.shared_rate_limiter('https://a', 6, 10))
+
+
+class TestRESTClientRateLimit(unittest.TestCase):
+
+    def test_disabled_by_default(self):
+        client = rest.RESTClientObject(Configuration())
+        self.assertIsNone(client.rate_limiter)
+
+    def test_request_waits_for_token(self):
+        config = Configuration(host='https://limited.example.com')
+        config.qps = 1000
+        c1 = rest.RESTClientObject(config)
+        c2 = rest.RESTClientObject(config)
+        self.assertIs(c1.rate_limiter, c2.rate_limiter)
+        c1.pool_manager = Mock()
+        c1.pool_manager.request.return_value = Mock(status=200, data=b'{}')
+        before = c1.rate_limiter.stats()['read']['requests']
+        c1.GET(config.host + '/api')
+        self.assertEqual(c1.rate_limiter.stats()['read']['requests'],
+                         before + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import unittest
+
+from mock import Mock
+
+from kubernetes import client
+from kubernetes.utils import read_cache
+
+
+def pod(namespace, name, labels=None, phase='Running'):
+    return {'metadata': {'namespace': namespace, 'name': name,
+                         'labels': labels or {}, 'resourceVersion': '1'},
+            'status': {'phase': phase}}
+
+
+class TestSelectors(unittest.TestCase):
+
+    def test_label_selector(self):
+        matches = read_cache.parse_label_selector(
+            'app=web,tier in (front, back),!canary,env!=prod,team')
+        self.assertTrue(matches({'app': 'web', 'tier': 'back', 'team': 'a'}))
+        self.assertFalse(matches({'app': 'web', 'tier': 'db', 'team': 'a'}))
+        self.assertFalse(matches({'app': 'web', 'tier': 'front',
+                                  'team': 'a', 'canary': 'true'}))
+        self.assertFalse(matches({'app': 'web', 'tier': 'front',
+                                  'team': 'a', 'env': 'prod'}))
+        self.assertFalse(matches({'app': 'web', 'tier': 'front'}))
+        self.assertTrue(read_cache.parse_label_selector(
+            'tier notin (db)')({}))
+        self.assertTrue(read_cache.parse_label_selector(None)(None))
+        self.assertRaises(ValueError, read_cache.parse_label_selector,
+                          'tier in front')
+
+    def test_field_selector(self):
+        matches = read_cache.parse_field_selector(
+            'metadata.name=a,status.phase!=Failed,spec.nodeName=')
+        self.assertTrue(matches(pod('ns', 'a')))
+        self.assertFalse(matches(pod('ns', 'b')))
+        self.assertFalse(matches(pod('ns', 'a', phase='Failed')))
+        self.assertRaises(ValueError, read_cache.parse_field_selector, 'a')
+
+
+class TestReadCache(unittest.TestCase):
+
+    def setUp(self):
+        self.api_client = client.ApiClient()
+        self.api_client.call_api = Mock(return_value='from server')
+        self.api = client.CoreV1Api(self.api_client)
+        self.cache = read_cache.ReadCache()
+        self.pods = self.cache.register(self.api.list_pod_for_all_namespaces)
+        self.api_client.read_cache = self.cache
+
+    def test_not_synced(self):
+        self.assertEqual(self.api.read_namespaced_pod('a', 'ns'),
+                         'from server')
+
+    def test_answers_from_cache(self):
+        self.pods.replace([pod('ns', 'a', {'app': 'web'}), pod('ns', 'b'),
+                           pod('other', 'a', {'app': 'web'})], '10')
+        self.pods.apply('DELETED', pod('ns', 'b'))
+        self.pods.apply('ADDED', dict(pod('ns', 'c', {'app': 'web'}),
+                                      metadata={'namespace': 'ns',
+                                                'name': 'c',
+                                                'resourceVersion': '12',
+                                                'labels': {'app': 'web'}}))
+
+        result = self.api.read_namespaced_pod('a', 'ns')
+        self.assertIsInstance(result, client.V1Pod)
+        self.assertEqual(result.status.phase, 'Running')
+
+        pods = self.api.list_namespaced_pod('ns', label_selector='app=web')
+        self.assertEqual([p.metadata.name for p in pods.items], ['a', 'c'])
+        self.assertEqual(pods.metadata.resource_version, '12')
+        pods = self.api.list_pod_for_all_namespaces(
+            field_selector='metadata.name=a')
+        self.assertEqual([p.metadata.namespace for p in pods.items],
+                         ['ns', 'other'])
+        self.assertEqual(self.cache.hits, 3)
+        self.api_client.call_api.assert_not_called()
+
+    def test_passes_through(self):
+        self.pods.replace([pod('ns', 'a')], '10')
+        for call in [
+                lambda: self.api.read_namespaced_pod('missing', 'ns'),
+                lambda: self.api.list_namespaced_pod('ns', limit=10),
+                lambda: self.api.list_namespaced_pod('ns', watch=True),
+                lambda: self.api.list_namespaced_pod(
+                    'ns', _preload_content=False),
+                lambda: self.api.list_namespaced_pod(
+                    'ns', label_selector='a in b'),
+                lambda: self.api.list_namespaced_service('ns'),
+                lambda: self.api.delete_namespaced_pod('a', 'ns')]:
+            self.assertEqual(call(), 'from server')
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_informer_lists_pages(self):
+        pages = [{'metadata': {'continue': 'token'},
+                  'items': [pod('ns', 'a')]},
+                 {'metadata': {'resourceVersion': '20'},
+                  'items': [pod('ns', 'b')]}]
+        self.api_client.call_api.side_effect = [
+            Mock(data=json.dumps(page)) for page in pages]
+        self.pods._list()
+        self.assertTrue(self.pods.synced)
+        self.assertEqual(self.pods.resource_version, '20')
+        self.assertEqual(len(self.pods.items('ns')), 2)
+        query = self.api_client.call_api.call_args[0][3]
+        self.assertIn(('continue', 'token'), query)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+# coding: utf-8
+
+import unittest
+
+from mock import Mock
+
+from kubernetes.client import ApiClient, Configuration, rest
+
+
+class TestStreamPool(unittest.TestCase):
+
+    def setUp(self):
+        config = Configuration(host='http://localhost')
+        config.connection_pool_maxsize = 4
+        config.stream_connection_pool_maxsize = 20
+        self.client = rest.RESTClientObject(config)
+
+    def test_stream_pool_is_separate_and_lazy(self):
+        self.assertIsNone(self.client._stream_pool_manager)
+        self.assertIs(self.client.select_pool_manager(),
+                      self.client.pool_manager)
+        stream = self.client.select_pool_manager(_preload_content=False)
+        self.assertIsNot(stream, self.client.pool_manager)
+        self.assertEqual(stream.connection_pool_kw['maxsize'], 20)
+        self.assertEqual(
+            self.client.pool_manager.connection_pool_kw['maxsize'], 4)
+
+    def test_watch_and_follow_select_stream_pool(self):
+        stream = self.client.stream_pool_manager
+        for query in ([('watch', True)], [('follow', 'true')],
+                      {'watch': True}):
+            self.assertIs(self.client.select_pool_manager(query), stream)
+        for query in ([('watch', False)], [('limit', 10)]):
+            self.assertIs(self.client.select_pool_manager(query),
+                          self.client.pool_manager)
+
+    def test_request_routing(self):
+        self.client.pool_manager = Mock()
+        self.client._stream_pool_manager = Mock()
+        self.client._stream_pool_manager.request.return_value = Mock(
+            status=200)
+        self.client.GET('http://localhost/api/v1/pods',
+                        query_params=[('watch', True)],
+                        _preload_content=False)
+        self.client._stream_pool_manager.request.assert_called_once()
+        self.client.pool_manager.request.assert_not_called()
+
+    def test_list_headers_are_repeated(self):
+        self.client.pool_manager = Mock()
+        self.client.pool_manager.request.return_value = Mock(
+            status=200, data=b'{}')
+        self.client.GET('http://localhost/api',
+                        headers={'Impersonate-Group': ['a', 'b']})
+        headers = self.client.pool_manager.request.call_args[1]['headers']
+        self.assertEqual(headers.getlist('Impersonate-Group'), ['a', 'b'])
+
+    def test_bytes_body_is_sent_as_is(self):
+        self.client.pool_manager = Mock()
+        self.client.pool_manager.request.return_value = Mock(
+            status=200, data=b'{}')
+        self.client.POST('http://localhost/api/v1/namespaces',
+                         body=b'{"metadata": {"name": "ns"}}')
+        self.assertEqual(
+            self.client.pool_manager.request.call_args[1]['body'],
+            b'{"metadata": {"name": "ns"}}')
+
+    def test_bytes_json_patch_keeps_its_content_type(self):
+        self.client.pool_manager = Mock()
+        self.client.pool_manager.request.return_value = Mock(
+            status=200, data=b'{}')
+        content_type = 'application/json-patch+json'
+        for body, expected in (
+                (b' [{"op": "remove", "path": "/a"}]', content_type),
+                (b'{"a": null}', 'application/strategic-merge-patch+json')):
+            self.client.PATCH('http://localhost/api/v1/namespaces/ns',
+                              headers={'Content-Type': content_type},
+                              body=body)
+            call = self.client.pool_manager.request.call_args[1]
+            self.assertEqual(call['body'], body)
+            self.assertEqual(call['headers']['Content-Type'], expected)
+
+    def test_pool_stats(self):
+        stats = self.client.pool_stats()
+        self.assertEqual(stats['stream'], {'connections': 0, 'requests': 0,
+                                           'idle': 0, 'maxsize': 20})
+        self.client.pool_manager.connection_from_url('http://localhost')
+        self.assertEqual(self.client.pool_stats()['default']['connections'],
+                         0)
+
+
+class TestSharedClients(unittest.TestCase):
+
+    def tearDown(self):
+        rest.close_shared_clients()
+
+    def _config(self, host='https://shared.example.com'):
+        config = Configuration(host=host)
+        config.share_connection_pools = True
+        return config
+
+    def test_same_transport_shares_client(self):
+        a = rest.acquire_shared_client(self._config())
+        b = rest.acquire_shared_client(self._config())
+        self.assertIs(a, b)
+        other = self._config()
+        other.ssl_ca_cert = '/tmp/ca.crt'
+        self.assertIsNot(a, rest.acquire_shared_client(other))
+        self.assertIsNot(
+            a, rest.acquire_shared_client(self._config('https://other')))
+
+    def test_reference_counting(self):
+        a = rest.acquire_shared_client(self._config())
+        rest.acquire_shared_client(self._config())
+        a.close = Mock()
+        rest.release_shared_client(a)
+        a.close.assert_not_called()
+        rest.release_shared_client(a)
+        a.close.assert_called_once_with()
+        self.assertIsNot(a, rest.acquire_shared_client(self._config()))
+
+    def test_api_clients_share_pools(self):
+        with ApiClient(self._config()) as c1, ApiClient(self._config()) as c2:
+            self.assertIs(c1.rest_client, c2.rest_client)
+            view = c1.with_priority(0)
+            view.close()
+            self.assertEqual(len(rest._shared_clients), 1)
+        self.assertEqual(rest._shared_clients, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
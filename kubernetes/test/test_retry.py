@@ -0,0 +1,107 @@
+# coding: utf-8
+
+import unittest
+
+from mock import Mock, patch
+
+from kubernetes.client import ApiClient, Configuration, retry
+from kubernetes.client.rest import ApiException
+
+
+def _error(status, headers=None):
+    e = ApiException(status=status, reason='error')
+    e.headers = headers
+    return e
+
+
+class TestParseRetryAfter(unittest.TestCase):
+
+    def test_forms(self):
+        self.assertIsNone(retry.parse_retry_after(None))
+        self.assertIsNone(retry.parse_retry_after({'Other': '1'}))
+        self.assertEqual(retry.parse_retry_after({'Retry-After': '3'}), 3)
+        self.assertEqual(
+            retry.parse_retry_after({'Retry-After': 'Thu, 01 Jan 1970 '
+                                                    '00:00:00 GMT'}), 0)
+        self.assertIsNone(retry.parse_retry_after({'Retry-After': 'soon'}))
+
+
+@patch('time.sleep')
+class TestRetryPolicy(unittest.TestCase):
+
+    def test_retries_then_succeeds(self, sleep):
+        func = Mock(side_effect=[_error(503),
+                                 _error(429, {'Retry-After': '2'}), 'ok'])
+        policy = retry.RetryPolicy(backoff_base=0.1)
+        self.assertEqual(policy.call('GET', func, 'a', b=1), 'ok')
+        self.assertEqual(func.call_count, 3)
+        func.assert_called_with('a', b=1)
+        self.assertLessEqual(sleep.call_args_list[0][0][0], 0.1)
+        self.assertEqual(sleep.call_args_list[1][0][0], 2)
+
+    def test_non_idempotent_not_retried(self, sleep):
+        func = Mock(side_effect=_error(503))
+        with self.assertRaises(ApiException):
+            retry.RetryPolicy().call('POST', func)
+        self.assertEqual(func.call_count, 1)
+
+    def test_non_retryable_status(self, sleep):
+        func = Mock(side_effect=_error(404))
+        self.assertRaises(ApiException, retry.RetryPolicy().call, 'GET', func)
+        self.assertEqual(func.call_count, 1)
+
+    def test_max_attempts(self, sleep):
+        func = Mock(side_effect=_error(500))
+        policy = retry.RetryPolicy(max_attempts=3)
+        self.assertRaises(ApiException, policy.call, 'GET', func)
+        self.assertEqual(func.call_count, 3)
+
+    def test_deadline(self, sleep):
+        func = Mock(side_effect=_error(429, {'Retry-After': '10'}))
+        policy = retry.RetryPolicy(deadline=5)
+        self.assertRaises(ApiException, policy.call, 'GET', func)
+        self.assertEqual(func.call_count, 1)
+        sleep.assert_not_called()
+
+    def test_retry_after_is_bounded(self, sleep):
+        func = Mock(side_effect=[_error(429, {'Retry-After': '3600'}), 'ok'])
+        policy = retry.RetryPolicy(backoff_max=30)
+        self.assertEqual(policy.call('GET', func), 'ok')
+        sleep.assert_called_once_with(30)
+
+    @patch('kubernetes.client.retry.time')
+    def test_deadline_bounds_each_attempt(self, clock, sleep):
+        now = clock.time
+        now.side_effect = iter([100, 100, 101, 104])
+        func = Mock(side_effect=[_error(503), 'ok'])
+        policy = retry.RetryPolicy(deadline=10, backoff_base=0.001)
+        self.assertEqual(policy.call('GET', func, _request_timeout=8), 'ok')
+        self.assertEqual(func.call_args_list[0][1], {'_request_timeout': 8})
+        self.assertEqual(func.call_args_list[1][1], {'_request_timeout': 6})
+
+        now.side_effect = iter([100, 100])
+        func = Mock(return_value='ok')
+        policy.call('GET', func, _request_timeout=(3, 30))
+        func.assert_called_once_with(_request_timeout=(3, 10))
+        now.side_effect = iter([100, 100])
+        policy.call('GET', func, _request_timeout=None)
+        func.assert_called_with(_request_timeout=10)
+
+
+class TestApiClientRetry(unittest.TestCase):
+
+    @patch('time.sleep')
+    def test_call_api_uses_policy(self, sleep):
+        config = Configuration()
+        config.retry_policy = retry.RetryPolicy()
+        client = ApiClient(config)
+        resp = Mock(status=200, data='{}')
+        resp.getheaders.return_value = {}
+        client.request = Mock(side_effect=[_error(503), resp])
+        client.call_api('/api', 'GET', response_type='object',
+                        _return_http_data_only=True)
+        self.assertEqual(client.request.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
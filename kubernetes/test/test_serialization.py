@@ -0,0 +1,155 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import json
+import unittest
+
+from dateutil.tz import tzutc
+
+from kubernetes import client
+from kubernetes.client import serialization
+
+
+def deployment():
+    created = datetime.datetime(2021, 1, 2, 3, 4, 5, tzinfo=tzutc())
+    container = client.V1Container(
+        name='nginx', image='nginx', args=['-g', 'daemon off;'],
+        ports=[client.V1ContainerPort(container_port=80)],
+        resources=client.V1ResourceRequirements(limits={'cpu': '1'}))
+    return client.V1Deployment(
+        api_version='apps/v1', kind='Deployment',
+        metadata=client.V1ObjectMeta(name='web', labels={'app': 'web'},
+                                     creation_timestamp=created),
+        spec=client.V1DeploymentSpec(
+            replicas=2,
+            selector=client.V1LabelSelector(match_labels={'app': 'web'}),
+            # dicts are accepted in place of models
+            template={'metadata': {'labels': {'app': 'web'}},
+                      'spec': client.V1PodSpec(containers=[container])}))
+
+
+EXPECTED = {
+    'apiVersion': 'apps/v1',
+    'kind': 'Deployment',
+    'metadata': {'name': 'web', 'labels': {'app': 'web'},
+                 'creationTimestamp': '2021-01-02T03:04:05+00:00'},
+    'spec': {
+        'replicas': 2,
+        'selector': {'matchLabels': {'app': 'web'}},
+        'template': {
+            'metadata': {'labels': {'app': 'web'}},
+            'spec': {'containers': [{
+                'name': 'nginx', 'image': 'nginx',
+                'args': ['-g', 'daemon off;'],
+                'ports': [{'containerPort': 80}],
+                'resources': {'limits': {'cpu': '1'}}}]}}},
+}
+
+
+class TestSerialization(unittest.TestCase):
+
+    def test_sanitize(self):
+        body = deployment()
+        self.assertEqual(serialization.sanitize(body), EXPECTED)
+        self.assertEqual(
+            client.ApiClient().sanitize_for_serialization(body), EXPECTED)
+
+    def test_sanitize_copies_containers(self):
+        labels = {'app': 'web'}
+        meta = client.V1ObjectMeta(labels=labels)
+        result = serialization.sanitize(meta)
+        self.assertEqual(result, {'labels': labels})
+        self.assertIsNot(result['labels'], labels)
+
+    def test_sanitize_primitives(self):
+        self.assertIsNone(serialization.sanitize(None))
+        self.assertEqual(serialization.sanitize((1, 'a')), (1, 'a'))
+        self.assertEqual(serialization.sanitize(datetime.date(2021, 1, 2)),
+                         '2021-01-02')
+
+    def test_dumps(self):
+        data = serialization.dumps([deployment()])
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(json.loads(data.decode('utf-8')), [EXPECTED])
+
+    def test_dumps_rejects_unknown_types(self):
+        with self.assertRaises(TypeError):
+            serialization.dumps({'a': object()})
+
+    def test_from_dict(self):
+        data = json.loads(serialization.dumps(deployment()).decode('utf-8'))
+        data['unknownField'] = 1
+        result = client.V1Deployment.from_dict(data)
+        self.assertIsInstance(result, client.V1Deployment)
+        self.assertIsInstance(result.spec.template, client.V1PodTemplateSpec)
+        self.assertIsInstance(result.spec.template.spec.containers[0].ports[0],
+                              client.V1ContainerPort)
+        self.assertEqual(result.metadata.creation_timestamp,
+                         deployment().metadata.creation_timestamp)
+        self.assertEqual(serialization.sanitize(result), EXPECTED)
+        # containers are copied, not shared with the data
+        self.assertIsNot(result.metadata.labels, data['metadata']['labels'])
+
+    def test_from_dict_matches_deserialize(self):
+        data = {'metadata': {'name': 'cm', 'resourceVersion': '1'},
+                'data': {'a': 'b'}, 'binaryData': None}
+        response = type('Response', (), {'data': json.dumps(data)})
+        expected = client.ApiClient().deserialize(response, 'V1ConfigMap')
+        self.assertEqual(client.V1ConfigMap.from_dict(data), expected)
+        self.assertIsNone(client.V1ConfigMap.from_dict(None))
+
+    def test_from_dict_does_not_validate(self):
+        # the name of a container is required, the setter would raise
+        container = client.V1Container.from_dict({'image': 'nginx'})
+        self.assertIsNone(container.name)
+        self.assertEqual(container.image, 'nginx')
+
+    def test_equal(self):
+        a, b = deployment(), deployment()
+        self.assertEqual(a, b)
+        self.assertFalse(a != b)
+        b.spec.selector.match_labels['app'] = 'api'
+        self.assertNotEqual(a, b)
+        self.assertNotEqual(a, a.to_dict())
+
+    def test_content_hash(self):
+        a, b = deployment(), deployment()
+        self.assertEqual(serialization.content_hash(a),
+                         serialization.content_hash(b))
+        self.assertEqual(hash(a), hash(b))
+        self.assertEqual(len(set([a, b])), 1)
+        b.metadata.resource_version = '42'
+        b.metadata.managed_fields = [
+            client.V1ManagedFieldsEntry(manager='kubectl')]
+        self.assertNotEqual(a, b)
+        self.assertEqual(serialization.content_hash(a),
+                         serialization.content_hash(b))
+        self.assertNotEqual(serialization.content_hash(a, ()),
+                            serialization.content_hash(b, ()))
+        self.assertEqual(serialization.content_hash(a),
+                         serialization.content_hash(serialization.sanitize(a)))
+
+    def test_content_hash_sees_changes(self):
+        obj = deployment()
+        before = serialization.content_hash(obj)
+        self.assertEqual(serialization.content_hash(obj), before)
+        obj.spec.template['spec'].containers[0].args.append('-q')
+        self.assertNotEqual(serialization.content_hash(obj), before)
+        obj.spec.template['spec'].containers[0].args.pop()
+        self.assertEqual(serialization.content_hash(obj), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import unittest
+
+from mock import Mock
+
+from kubernetes import client
+from kubernetes.client.single_flight import SingleFlight
+
+
+class BlockingRequest(object):
+    """Stands in for ApiClient.request, holding requests until released."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+
+    def __call__(self, method, url, **kwargs):
+        self.calls.append((method, url, kwargs['headers'].get(
+            'authorization')))
+        self.release.wait(5)
+        return Mock(status=200, data=b'{"metadata": {"name": "cm"}}',
+                    getheaders=Mock(return_value={}))
+
+
+def run_concurrently(funcs):
+    results = [None] * len(funcs)
+
+    def run(i):
+        results[i] = funcs[i]()
+    threads = [threading.Thread(target=run, args=(i,))
+               for i in range(len(funcs))]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def test_do(self):
+        group = SingleFlight()
+        started, release = threading.Event(), threading.Event()
+
+        def slow():
+            started.set()
+            release.wait(5)
+            return object()
+        threads, results = run_concurrently(
+            [lambda: group.do('a', slow)] +
+            [lambda: group.do('a', len, 'x')] * 3)
+        started.wait(5)
+        while group.shared < 3:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertTrue(all(r is results[0] for r in results))
+        self.assertEqual(len(group), 0)
+        self.assertEqual(group.do('a', len, 'x'), 1)
+
+    def test_errors_are_shared(self):
+        group = SingleFlight()
+
+        def fail():
+            raise ValueError('boom')
+        self.assertRaises(ValueError, group.do, 'a', fail)
+        self.assertEqual(len(group), 0)
+
+    def test_api_client(self):
+        configuration = client.Configuration()
+        configuration.api_key['authorization'] = 'Bearer a'
+        api_client = client.ApiClient(configuration)
+        api_client.single_flight = SingleFlight()
+        api_client.request = request = BlockingRequest()
+        other = api_client.with_credentials(token='b')
+        api = client.CoreV1Api(api_client)
+        threads, results = run_concurrently(
+            [lambda: api.read_namespaced_config_map('cm', 'ns')] * 4 +
+            [lambda: client.CoreV1Api(other).read_namespaced_config_map(
+                'cm', 'ns'),
+             lambda: api.read_namespaced_config_map('other', 'ns')])
+        while api_client.single_flight.shared < 3 or len(request.calls) < 3:
+            threading.Event().wait(0.001)
+        request.release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sorted(request.calls), [
+            ('GET', 'http://localhost/api/v1/namespaces/ns/configmaps/cm',
+             'Bearer a'),
+            ('GET', 'http://localhost/api/v1/namespaces/ns/configmaps/cm',
+             'Bearer b'),
+            ('GET', 'http://localhost/api/v1/namespaces/ns/configmaps/other',
+             'Bearer a')])
+        self.assertIsInstance(results[0], client.V1ConfigMap)
+        self.assertTrue(all(r is results[0] for r in results[:4]))
+        self.assertIsNot(results[4], results[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+import unittest
+
+from mock import Mock
+
+from kubernetes import client
+from kubernetes.client.exceptions import ApiException
+from kubernetes.utils.snapshot import Snapshot
+
+OBJECTS = {
+    '/api/v1/pods': ['p%d' % i for i in range(5)],
+    '/api/v1/nodes': ['n0', 'n1'],
+}
+
+
+class FakeServer(object):
+    """Answers paginated lists of OBJECTS, two objects per page."""
+
+    def __init__(self, fail=None):
+        self.fail = fail
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def __call__(self, path, method, path_params, query, *args, **kwargs):
+        query = dict(query)
+        with self.lock:
+            self.queries.append((path, query))
+        if path == self.fail:
+            raise ApiException(status=410)
+        names = OBJECTS[path]
+        start = int(query.get('continue', 0))
+        end = start + int(query['limit'])
+        metadata = {'resourceVersion': query.get('resourceVersion', '42')}
+        if end < len(names):
+            metadata['continue'] = str(end)
+        return Mock(data=json.dumps({
+            'metadata': metadata,
+            'items': [{'metadata': {'name': n}} for n in names[start:end]]}))
+
+
+class TestSnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeServer()
+        api_client = client.ApiClient()
+        api_client.call_api = Mock(side_effect=self.server)
+        api = client.CoreV1Api(api_client)
+        self.lists = {'pods': api.list_pod_for_all_namespaces,
+                      'nodes': api.list_node}
+
+    def test_consistent_snapshot(self):
+        snapshot = Snapshot(self.lists, page_size=2)
+        result = snapshot.collect()
+        self.assertEqual([p.metadata.name for p in result['pods']],
+                         OBJECTS['/api/v1/pods'])
+        self.assertIsInstance(result['nodes'][0], client.V1Node)
+        self.assertEqual(snapshot.resource_versions,
+                         {'pods': '42', 'nodes': '42'})
+        probe = self.server.queries[0]
+        self.assertEqual(probe, ('/api/v1/nodes', {'limit': 1}))
+        for path, query in self.server.queries[1:]:
+            if 'continue' in query:
+                self.assertNotIn('resourceVersion', query)
+            else:
+                self.assertEqual(query['resourceVersion'], '42')
+        self.assertRaises(RuntimeError, snapshot.collect)
+
+    def test_independent_lists(self):
+        snapshot = Snapshot(self.lists, page_size=10, consistent=False,
+                            decode=False)
+        pairs = list(snapshot)
+        self.assertEqual(len(pairs), 7)
+        self.assertTrue(all(isinstance(obj, dict) for _, obj in pairs))
+        for _, query in self.server.queries:
+            self.assertNotIn('resourceVersion', query)
+
+    def test_errors(self):
+        self.server.fail = '/api/v1/pods'
+        with self.assertRaises(ApiException) as e:
+            Snapshot(self.lists, page_size=2).collect()
+        self.assertEqual(e.exception.status, 410)
+
+    def test_watch(self):
+        snapshot = Snapshot(self.lists)
+        self.assertRaises(ValueError, snapshot.watch, 'pods')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+import unittest
+
+from kubernetes import client
+from kubernetes.client.exceptions import ApiException
+from kubernetes.utils import status_writer
+
+
+class FakePatch(object):
+
+    def __init__(self, fail=None):
+        self.calls = []
+        self.fail = list(fail or [])
+        self.release = threading.Event()
+        self.release.set()
+        self.started = threading.Event()
+
+    def __call__(self, name, namespace, body):
+        self.started.set()
+        self.release.wait()
+        self.calls.append(((name, namespace), body))
+        if self.fail:
+            raise self.fail.pop(0)
+
+
+class TestStatusWriter(unittest.TestCase):
+
+    def test_merge_status(self):
+        pending = {'progress': 1, 'counts': {'done': 1, 'failed': 0}}
+        status_writer.merge_status(
+            pending, {'progress': 2, 'counts': {'done': 2}, 'error': None})
+        self.assertEqual(pending, {'progress': 2, 'error': None,
+                                   'counts': {'done': 2, 'failed': 0}})
+
+    def test_merge_status_by_merge_key(self):
+        pending = {'conditions': [{'type': 'Ready', 'status': 'False'}]}
+        status_writer.merge_status(
+            pending, {'conditions': [{'type': 'Initialized',
+                                      'status': 'True'}]}, 'V1PodStatus')
+        status_writer.merge_status(
+            pending, {'conditions': [{'type': 'Ready', 'status': 'True'}]},
+            'V1PodStatus')
+        self.assertEqual(pending, {'conditions': [
+            {'type': 'Ready', 'status': 'True'},
+            {'type': 'Initialized', 'status': 'True'}]})
+        # lists without a merge key are replaced
+        status_writer.merge_status(
+            pending, {'conditions': [{'type': 'Ready'}]})
+        self.assertEqual(pending, {'conditions': [{'type': 'Ready'}]})
+
+    def test_status_type_of_generated_methods(self):
+        api = client.CoreV1Api(client.ApiClient())
+        writer = status_writer.StatusWriter(api.patch_namespaced_pod_status)
+        self.assertEqual(writer.klass, 'V1PodStatus')
+        writer.close()
+        writer = status_writer.StatusWriter(FakePatch(),
+                                            klass=client.V1NodeStatus)
+        self.assertEqual(writer.klass, 'V1NodeStatus')
+        writer.close()
+
+    def test_changes_are_coalesced(self):
+        patch = FakePatch()
+        writer = status_writer.StatusWriter(patch, interval=60)
+        for progress in range(10):
+            writer.submit(('a', 'ns'), {'progress': progress})
+        writer.submit(('b', 'ns'), client.V1JobStatus(active=1))
+        self.assertEqual(patch.calls, [])
+        self.assertTrue(writer.close(timeout=5))
+        self.assertEqual(sorted(patch.calls), [
+            (('a', 'ns'), {'status': {'progress': 9}}),
+            (('b', 'ns'), {'status': {'active': 1}})])
+        self.assertEqual(writer.coalesced, 9)
+
+    def test_one_write_in_flight_per_object(self):
+        patch = FakePatch()
+        patch.release.clear()
+        writer = status_writer.StatusWriter(patch, interval=60, workers=4)
+        writer.submit(('a', 'ns'), {'phase': 'Running'}, flush=True)
+        self.assertTrue(patch.started.wait(5))
+        writer.submit(('a', 'ns'), {'progress': 1}, flush=True)
+        writer.submit(('a', 'ns'), {'progress': 2}, flush=True)
+        patch.release.set()
+        self.assertTrue(writer.close(timeout=5))
+        self.assertEqual(patch.calls, [
+            (('a', 'ns'), {'status': {'phase': 'Running'}}),
+            (('a', 'ns'), {'status': {'progress': 2}})])
+
+    def test_failed_writes(self):
+        patch = FakePatch(fail=[ApiException(status=500),
+                                ApiException(status=404)])
+        writer = status_writer.StatusWriter(patch, interval=0.01, workers=1)
+        writer.submit(('a', 'ns'), {'phase': 'Running', 'progress': 1})
+        self.assertTrue(writer.flush(timeout=5))
+        self.assertEqual(len(patch.calls), 2)
+        self.assertEqual(patch.calls[1][1],
+                         {'status': {'phase': 'Running', 'progress': 1}})
+        writer.close()
+        self.assertRaises(RuntimeError, writer.submit, ('a', 'ns'), {})
+
+    def test_retry_with_change_submitted_during_write(self):
+        patch = FakePatch(fail=[ApiException(status=500)])
+        patch.release.clear()
+        writer = status_writer.StatusWriter(patch, interval=0.01, workers=1)
+        writer.submit(('a', 'ns'), {'phase': 'Running'}, flush=True)
+        self.assertTrue(patch.started.wait(5))
+        writer.submit(('a', 'ns'), {'progress': 1})
+        patch.release.set()
+        end = time.time() + 5
+        while len(patch.calls) < 2 and time.time() < end:
+            time.sleep(0.01)
+        self.assertEqual(patch.calls[1][1],
+                         {'status': {'phase': 'Running', 'progress': 1}})
+        writer.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
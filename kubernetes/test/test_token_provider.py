@@ -0,0 +1,81 @@
+# coding: utf-8
+
+import copy
+import datetime
+import threading
+import time
+import unittest
+
+from mock import Mock
+
+from kubernetes.client import Configuration, token_provider
+
+
+class TestTokenProvider(unittest.TestCase):
+
+    def test_caches_until_expiry(self):
+        fetch = Mock(return_value=('abc', time.time() + 3600))
+        provider = token_provider.TokenProvider(fetch, background=False)
+        self.assertEqual(provider.token(), 'Bearer abc')
+        self.assertIs(provider.auth_settings(), provider.auth_settings())
+        self.assertEqual(fetch.call_count, 1)
+
+    def test_expired_token_refreshed_synchronously(self):
+        fetch = Mock(side_effect=[('old', time.time() + 0.05),
+                                  ('new', None)])
+        provider = token_provider.TokenProvider(fetch, background=False)
+        provider.auth_settings()
+        time.sleep(0.1)
+        self.assertEqual(provider.token(), 'Bearer new')
+        self.assertEqual(provider.token(), 'Bearer new')
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_background_refresh_before_expiry(self):
+        refreshed = threading.Event()
+        tokens = iter(['first', 'second'])
+
+        def fetch():
+            token = next(tokens, 'later')
+            if token == 'second':
+                refreshed.set()
+            return token, datetime.datetime.utcnow() + datetime.timedelta(
+                seconds=60.2)
+
+        provider = token_provider.TokenProvider(fetch, refresh_margin=60)
+        self.assertEqual(provider.token(), 'Bearer first')
+        self.assertTrue(refreshed.wait(5))
+        provider.close()
+
+    def test_expired_fetch_backs_off(self):
+        fetch = Mock(return_value=('abc', time.time() - 1))
+        provider = token_provider.TokenProvider(fetch, retry_interval=0.2)
+        provider.auth_settings()
+        time.sleep(0.3)
+        provider.close()
+        self.assertLessEqual(fetch.call_count, 3)
+
+    def test_expired_fetch_is_not_retried_by_every_call(self):
+        fetch = Mock(side_effect=[('old', time.time() - 1),
+                                  ('new', None)])
+        provider = token_provider.TokenProvider(
+            fetch, retry_interval=0.1, background=False)
+        for _ in range(5):
+            self.assertEqual(provider.token(), 'Bearer old')
+        self.assertEqual(fetch.call_count, 1)
+        time.sleep(0.15)
+        self.assertEqual(provider.token(), 'Bearer new')
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_configuration(self):
+        config = Configuration()
+        config.api_key['authorization'] = 'static'
+        config.token_provider = token_provider.TokenProvider(
+            Mock(return_value=('dynamic', None)), background=False)
+        self.assertEqual(config.auth_settings()['BearerToken']['value'],
+                         'Bearer dynamic')
+        self.assertIs(copy.deepcopy(config).token_provider,
+                      config.token_provider)
+
+
+if __name__ == '__main__':
+    unittest.main()
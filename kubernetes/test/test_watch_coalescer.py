@@ -0,0 +1,139 @@
+# coding: utf-8
+
+import json
+import threading
+import time
+import unittest
+
+from kubernetes.client.rest import ApiException
+from kubernetes.utils import watch_coalescer, watch_decoder
+
+
+def _event(type, name, rv, namespace='default'):
+    raw = {'metadata': {'name': name, 'namespace': namespace,
+                        'resourceVersion': rv}}
+    return {'type': type, 'object': raw, 'raw_object': raw}
+
+
+def _drain(coalescer):
+    coalescer.close()
+    return [(e['type'], e['raw_object']['metadata']['name'],
+             e['raw_object']['metadata']['resourceVersion'])
+            for e in coalescer]
+
+
+class TestEventCoalescer(unittest.TestCase):
+
+    def test_modified_events_collapse(self):
+        c = watch_coalescer.EventCoalescer()
+        c.put(_event('ADDED', 'a', '1'))
+        c.put(_event('MODIFIED', 'b', '2'))
+        c.put(_event('MODIFIED', 'a', '3'))
+        c.put(_event('MODIFIED', 'b', '4'))
+        c.put(_event('MODIFIED', 'a', '5', namespace='other'))
+        self.assertEqual(c.coalesced, 2)
+        self.assertEqual(_drain(c), [('ADDED', 'a', '3'),
+                                     ('MODIFIED', 'b', '4'),
+                                     ('MODIFIED', 'a', '5')])
+
+    def test_deleted_wins(self):
+        c = watch_coalescer.EventCoalescer()
+        c.put(_event('ADDED', 'a', '1'))
+        c.put(_event('DELETED', 'a', '2'))
+        self.assertEqual(_drain(c), [('DELETED', 'a', '2')])
+
+    def test_deleted_is_kept_when_recreated(self):
+        c = watch_coalescer.EventCoalescer()
+        c.put(_event('MODIFIED', 'a', '1'))
+        c.put(_event('DELETED', 'a', '2'))
+        c.put(_event('ADDED', 'a', '3'))
+        c.put(_event('MODIFIED', 'a', '4'))
+        self.assertEqual(_drain(c), [('DELETED', 'a', '2'),
+                                     ('ADDED', 'a', '4')])
+
+        c = watch_coalescer.EventCoalescer()
+        c.put(_event('DELETED', 'a', '1'))
+        c.put(_event('ADDED', 'a', '2'))
+        c.put(_event('DELETED', 'a', '3'))
+        self.assertEqual(_drain(c), [('DELETED', 'a', '1')])
+
+    def test_lazy_events_are_not_decoded(self):
+        c = watch_coalescer.EventCoalescer()
+        for type, rv in (('ADDED', '1'), ('MODIFIED', '2')):
+            line = json.dumps({'type': type, 'object': {
+                'metadata': {'name': 'a', 'resourceVersion': rv}}})
+            c.put(watch_decoder.LazyWatchEvent(line.encode('utf8'), 'V1Pod'))
+        c.close()
+        event = c.get()
+        self.assertEqual(event.type, 'ADDED')
+        self.assertEqual(event.resource_version, '2')
+        self.assertIsNone(event._object)
+
+    def test_drop_policies(self):
+        c = watch_coalescer.EventCoalescer(maxsize=2, policy='drop_newest')
+        for i, name in enumerate('abc'):
+            c.put(_event('MODIFIED', name, str(i)))
+        self.assertTrue(c.put(_event('MODIFIED', 'a', '9')))
+        self.assertEqual(c.dropped, 1)
+        self.assertEqual(_drain(c), [('MODIFIED', 'a', '9'),
+                                     ('MODIFIED', 'b', '1')])
+
+        c = watch_coalescer.EventCoalescer(maxsize=2, policy='drop_oldest')
+        for i, name in enumerate('abc'):
+            c.put(_event('MODIFIED', name, str(i)))
+        self.assertEqual(c.dropped, 1)
+        self.assertEqual(_drain(c), [('MODIFIED', 'b', '1'),
+                                     ('MODIFIED', 'c', '2')])
+
+    def test_block_policy(self):
+        c = watch_coalescer.EventCoalescer(maxsize=1)
+        c.put(_event('MODIFIED', 'a', '1'))
+        self.assertFalse(c.put(_event('MODIFIED', 'b', '2'), timeout=0.01))
+        t = threading.Thread(target=c.put, args=(_event('ADDED', 'c', '3'),))
+        t.start()
+        self.assertEqual(c.get()['raw_object']['metadata']['name'], 'a')
+        t.join()
+        self.assertEqual(_drain(c), [('ADDED', 'c', '3')])
+
+    def test_window(self):
+        c = watch_coalescer.EventCoalescer(window=0.05)
+        c.put(_event('MODIFIED', 'a', '1'))
+        self.assertIsNone(c.get(timeout=0))
+        start = time.time()
+        self.assertIsNotNone(c.get(timeout=1))
+        self.assertGreater(time.time() - start, 0.01)
+
+    def test_feed(self):
+        # the window outlasts the stream, which is flushed on close
+        c = watch_coalescer.EventCoalescer(window=60)
+        c.feed(iter([_event('ADDED', 'a', '1'), _event('MODIFIED', 'a', '2')]))
+        events = list(c)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['type'], 'ADDED')
+
+    def test_feed_error(self):
+        def stream():
+            yield _event('ADDED', 'a', '1')
+            raise ApiException(status=410, reason='Gone')
+
+        c = watch_coalescer.EventCoalescer()
+        c.feed(stream()).join(5)
+        events = []
+        with self.assertRaises(ApiException) as raised:
+            for event in c:
+                events.append(event['type'])
+        self.assertEqual(events, ['ADDED'])
+        self.assertEqual(raised.exception.status, 410)
+
+        c = watch_coalescer.EventCoalescer()
+        c.close()
+        c.feed(iter([_event('ADDED', 'a', '1')])).join(5)
+        self.assertEqual(list(c), [])
+
+    def test_invalid_policy(self):
+        self.assertRaises(ValueError, watch_coalescer.EventCoalescer,
+                          policy='nope')
+
+
+if __name__ == '__main__':
+    unittest.main()
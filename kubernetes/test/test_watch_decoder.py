@@ -0,0 +1,110 @@
+# coding: utf-8
+
+import json
+import unittest
+
+from mock import Mock, patch
+
+from kubernetes import client
+from kubernetes.client.rest import ApiException
+from kubernetes.utils import watch_decoder
+
+
+def _event(type, name, rv='1'):
+    return json.dumps({
+        'type': type,
+        'object': {
+            'apiVersion': 'v1',
+            'kind': 'ConfigMap',
+            'metadata': {'name': name, 'namespace': 'default',
+                         'resourceVersion': rv},
+            'data': {'key': name},
+        },
+    }, separators=(',', ':')).encode('utf8') + b'\n'
+
+
+class TestWatchLineSplitter(unittest.TestCase):
+
+    def test_split_across_chunks(self):
+        splitter = watch_decoder.WatchLineSplitter()
+        self.assertEqual(splitter.feed(b'ab'), [])
+        self.assertEqual(splitter.feed(b'c\nde\n\nf'), [b'abc', b'de'])
+        self.assertEqual(splitter.feed(u'g\n'), [b'fg'])
+        self.assertEqual(splitter.feed(b'tail'), [])
+        self.assertEqual(splitter.flush(), [b'tail'])
+        self.assertEqual(splitter.flush(), [])
+
+
+class TestLazyWatchEvent(unittest.TestCase):
+
+    def test_type_is_read_without_parsing(self):
+        event = watch_decoder.LazyWatchEvent(
+            _event('MODIFIED', 'a').rstrip(), 'V1ConfigMap')
+        self.assertEqual(event.type, 'MODIFIED')
+        self.assertIsNone(event._raw)
+        self.assertEqual(event.name, 'a')
+        self.assertEqual(event['raw_object']['data'], {'key': 'a'})
+        self.assertEqual(event.object.metadata.name, 'a')
+        self.assertEqual(event['object'].data, {'key': 'a'})
+
+    def test_object_is_built_from_the_dict(self):
+        api_client = Mock(configuration=client.Configuration())
+        event = watch_decoder.LazyWatchEvent(
+            _event('ADDED', 'a').rstrip(), 'V1ConfigMap', api_client)
+        self.assertIsInstance(event.object, client.V1ConfigMap)
+        self.assertEqual(event.object.data, {'key': 'a'})
+        self.assertIs(event.object.local_vars_configuration,
+                      api_client.configuration)
+        api_client.deserialize.assert_not_called()
+
+    def test_type_fallback_for_reordered_fields(self):
+        line = b'{"object": {"metadata": {}}, "type": "ADDED"}'
+        event = watch_decoder.LazyWatchEvent(line)
+        self.assertEqual(event.type, 'ADDED')
+        self.assertEqual(event.object, {'metadata': {}})
+
+
+class TestStreamLazyEvents(unittest.TestCase):
+
+    def _func(self, chunks):
+        resp = Mock()
+        resp.stream = Mock(return_value=chunks)
+        func = Mock(return_value=resp)
+        func.__doc__ = ':param bool watch:\n:return: V1ConfigMapList\n'
+        return func, resp
+
+    def test_stream(self):
+        body = _event('ADDED', 'a') + _event('DELETED', 'b', '2')
+        func, resp = self._func([body[:10], body[10:70], body[70:]])
+        events = list(watch_decoder.stream_lazy_events(
+            func, namespace='default'))
+        func.assert_called_once_with(
+            namespace='default', watch=True, _preload_content=False)
+        self.assertEqual([e.type for e in events], ['ADDED', 'DELETED'])
+        self.assertEqual(events[1].object.metadata.resource_version, '2')
+        resp.close.assert_called_once_with()
+        resp.release_conn.assert_called_once_with()
+
+    @patch('kubernetes.client.ApiClient')
+    def test_no_client_is_created(self, api_client):
+        body = _event('ADDED', 'a')
+        func, resp = self._func([body])
+        func.__doc__ = ':param bool follow:\n:return: str\n'
+        event, = watch_decoder.stream_lazy_events(func)
+        func.assert_called_once_with(follow=True, _preload_content=False)
+        self.assertEqual(event.type, 'ADDED')
+        self.assertEqual(event.name, 'a')
+        api_client.assert_not_called()
+
+    def test_error_event(self):
+        body = json.dumps({'type': 'ERROR', 'object': {
+            'code': 410, 'reason': 'Gone', 'message': 'too old'}})
+        func, resp = self._func([body.encode('utf8') + b'\n'])
+        with self.assertRaises(ApiException) as e:
+            list(watch_decoder.stream_lazy_events(func))
+        self.assertEqual(e.exception.status, 410)
+        resp.close.assert_called_once_with()
+
+
+if __name__ == '__main__':
+    unittest.main()
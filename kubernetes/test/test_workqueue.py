@@ -0,0 +1,103 @@
+# coding: utf-8
+
+import threading
+import time
+import unittest
+
+from kubernetes.utils import workqueue
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_then_wait(self):
+        bucket = workqueue.TokenBucket(qps=10, burst=2)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertEqual(bucket.reserve(), 0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.01)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, delta=0.01)
+
+
+class TestWorkQueue(unittest.TestCase):
+
+    def test_dedup(self):
+        q = workqueue.WorkQueue()
+        q.add('a')
+        q.add('b')
+        q.add('a')
+        self.assertEqual(len(q), 2)
+        self.assertEqual(q.get(), 'a')
+        self.assertEqual(q.get(), 'b')
+        self.assertIsNone(q.get(timeout=0))
+
+    def test_no_concurrent_processing(self):
+        q = workqueue.WorkQueue()
+        q.add('a')
+        self.assertEqual(q.get(), 'a')
+        q.add('a')
+        q.add('a')
+        self.assertIsNone(q.get(timeout=0))
+        q.done('a')
+        self.assertEqual(q.get(timeout=0), 'a')
+        q.done('a')
+        self.assertIsNone(q.get(timeout=0))
+
+    def test_rate_limited_backoff(self):
+        q = workqueue.WorkQueue(base_delay=0.01)
+        q.add_rate_limited('a')
+        q.add_rate_limited('b')
+        self.assertEqual(q.num_requeues('a'), 1)
+        self.assertIsNone(q.get(timeout=0))
+        self.assertEqual(q.get(timeout=1), 'a')
+        self.assertEqual(q.get(timeout=1), 'b')
+        q.forget('a')
+        self.assertEqual(q.num_requeues('a'), 0)
+
+    def test_shutdown_releases_get(self):
+        q = workqueue.WorkQueue()
+        t = threading.Timer(0.01, q.shutdown)
+        t.start()
+        self.assertIsNone(q.get())
+        q.add('a')
+        self.assertEqual(len(q), 0)
+
+
+class TestStartWorkers(unittest.TestCase):
+
+    def test_reconcile_and_retry(self):
+        q = workqueue.WorkQueue(base_delay=0.001)
+        seen = []
+        lock = threading.Lock()
+        finished = threading.Event()
+
+        def reconcile(key):
+            with lock:
+                seen.append(key)
+                if seen.count('bad') < 3 and key == 'bad':
+                    raise RuntimeError('boom')
+                if len(seen) == 5:
+                    finished.set()
+
+        for key in ('a', 'b', 'bad'):
+            q.add(key)
+        threads = workqueue.start_workers(q, reconcile, workers=3)
+        self.assertTrue(finished.wait(5))
+        q.shutdown()
+        for t in threads:
+            t.join(1)
+        self.assertEqual(sorted(seen), ['a', 'b', 'bad', 'bad', 'bad'])
+        self.assertEqual(q.num_requeues('bad'), 0)
+
+    def test_resync(self):
+        q = workqueue.WorkQueue()
+        workqueue.start_workers(q, lambda key: None, workers=0,
+                                list_keys=lambda: ['x', 'y'],
+                                resync_period=0.01)
+        deadline = time.time() + 5
+        while len(q) < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        q.shutdown()
+        self.assertEqual(len(q), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
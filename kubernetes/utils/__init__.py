@@ -16,4 +16,13 @@ from __future__ import absolute_import
 
 from .create_from_yaml import (FailToCreateError, create_from_dict,
                                create_from_yaml)
+from .multi_get import get_many
+from .patch import json_patch, merge_patch, strategic_merge_patch
 from .quantity import parse_quantity
+from .read_cache import Informer, ReadCache
+from .snapshot import Snapshot
+from .status_writer import StatusWriter
+from .watch_coalescer import EventCoalescer
+from .watch_decoder import (LazyWatchEvent, WatchLineSplitter,
+                            iter_lazy_events, stream_lazy_events)
+from .workqueue import WorkQueue, start_workers
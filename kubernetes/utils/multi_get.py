@@ -0,0 +1,140 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import kubernetes.client.models
+from kubernetes.client import serialization
+from kubernetes.client.exceptions import ApiException
+from kubernetes.client.operation import operation_of
+
+LIST = 'list'
+READ = 'read'
+
+
+def _call(func, namespace, *args, **kwargs):
+    if namespace is None:
+        return func(*args, **kwargs)
+    return func(*(args + (namespace,)), **kwargs)
+
+
+def _count(list_func, namespace, label_selector):
+    """Return the number of objects a list would return, None if the
+    server does not tell."""
+    resp = _call(list_func, namespace, limit=1, _preload_content=False,
+                 label_selector=label_selector)
+    page = json.loads(resp.data)
+    remaining = (page.get('metadata') or {}).get('remainingItemCount')
+    if remaining is None:
+        return None if (page.get('metadata') or {}).get('continue') \
+            else len(page.get('items') or ())
+    return remaining + len(page.get('items') or ())
+
+
+def choose_strategy(count, total, read_cost=20):
+    """
+    Return LIST or READ for fetching count objects out of total.
+
+    A read costs about read_cost times what an object in a list costs, so
+    listing wins when the list holds fewer than count * read_cost objects.
+    """
+    if count <= 1:
+        return READ
+    if total is None:
+        return LIST if count > read_cost else READ
+    return LIST if total <= count * read_cost else READ
+
+
+def get_many(read_func, list_func, names, namespace=None, label_selector=None,
+             workers=8, read_cost=20, page_size=500, strategy=None):
+    """
+    Fetch many objects of one type by name.
+
+    Field selectors match a single name, so there is no list of several
+    names by name: either each object is read, with `workers` reads in
+    flight, or the namespace is listed page by page and the objects are
+    picked from it. The number of objects the list would return is asked
+    for first (a list with limit=1) and the cheaper way is chosen, see
+    choose_strategy. Only the objects picked from a list are decoded into
+    models.
+
+    Input:
+    read_func: the generated read method, e.g.
+        CoreV1Api().read_namespaced_pod.
+    list_func: the generated list method, e.g. list_namespaced_pod.
+    names: iterable of the names to fetch.
+    namespace: namespace of the objects, None for cluster scoped ones.
+    label_selector: narrows the list, when all the objects match it.
+    workers: int. Reads in flight at once.
+    read_cost: float. Cost of a read relative to an object in a list.
+    page_size: int. Objects per page when listing.
+    strategy: LIST or READ to skip the choice.
+
+    Returns:
+        (dict of name to model, sorted list of the names not found).
+
+    Example:
+        pods, missing = get_many(core_v1.read_namespaced_pod,
+                                 core_v1.list_namespaced_pod,
+                                 names, namespace='default')
+    """
+    names = set(names)
+    if strategy is None:
+        total = None
+        if len(names) > 1:
+            total = _count(list_func, namespace, label_selector)
+        strategy = choose_strategy(len(names), total, read_cost)
+    if strategy == LIST:
+        found = _list_names(list_func, names, namespace, label_selector,
+                            page_size)
+    else:
+        found = _read_names(read_func, names, namespace, workers)
+    return found, sorted(names.difference(found))
+
+
+def _read_names(read_func, names, namespace, workers):
+    def read(name):
+        try:
+            return name, _call(read_func, namespace, name)
+        except ApiException as e:
+            if e.status == 404:
+                return name, None
+            raise
+
+    with ThreadPoolExecutor(max(1, min(workers, len(names)))) as pool:
+        return dict((name, obj) for name, obj in pool.map(read, names)
+                    if obj is not None)
+
+
+def _list_names(list_func, names, namespace, label_selector, page_size):
+    operation = operation_of(list_func)
+    klass = getattr(kubernetes.client.models,
+                    operation.response_type[:-len('List')])
+    configuration = list_func.__self__.api_client.configuration
+    found, token = {}, None
+    while True:
+        kwargs = {'limit': page_size, '_preload_content': False,
+                  'label_selector': label_selector}
+        if token:
+            kwargs['_continue'] = token
+        page = json.loads(_call(list_func, namespace, **kwargs).data)
+        for item in page.get('items') or ():
+            name = (item.get('metadata') or {}).get('name')
+            if name in names:
+                found[name] = serialization.from_dict(klass, item,
+                                                      configuration)
+        token = (page.get('metadata') or {}).get('continue')
+        if not token or len(found) == len(names):
+            return found
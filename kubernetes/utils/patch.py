@@ -0,0 +1,313 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Computes the patch that turns one version of an object into another.
+
+Each function takes two models of the same class, or their JSON dicts,
+and returns a patch that the generated patch_* methods accept as body:
+a list from json_patch() is sent as application/json-patch+json and a
+dict from strategic_merge_patch() as application/strategic-merge-patch+json.
+merge_patch() is what the patch_*_custom_object methods send.
+
+Example:
+    desired = copy.deepcopy(current)
+    desired.spec.replicas = 3
+    patch = strategic_merge_patch(current, desired)
+    if patch:
+        apps_v1.patch_namespaced_deployment(name, namespace, patch)
+"""
+
+import six
+
+import kubernetes.client.models
+from kubernetes.client import serialization
+
+# (model, json key) of the lists that the API server merges element by
+# element, with the key identifying the elements
+MERGE_KEYS = {
+    ('V1ObjectMeta', 'ownerReferences'): 'uid',
+    ('V1PodSpec', 'containers'): 'name',
+    ('V1PodSpec', 'ephemeralContainers'): 'name',
+    ('V1PodSpec', 'hostAliases'): 'ip',
+    ('V1PodSpec', 'imagePullSecrets'): 'name',
+    ('V1PodSpec', 'initContainers'): 'name',
+    ('V1PodSpec', 'topologySpreadConstraints'): 'topologyKey',
+    ('V1PodSpec', 'volumes'): 'name',
+    ('V1Container', 'env'): 'name',
+    ('V1Container', 'ports'): 'containerPort',
+    ('V1Container', 'volumeDevices'): 'devicePath',
+    ('V1Container', 'volumeMounts'): 'mountPath',
+    ('V1EphemeralContainer', 'env'): 'name',
+    ('V1EphemeralContainer', 'ports'): 'containerPort',
+    ('V1EphemeralContainer', 'volumeDevices'): 'devicePath',
+    ('V1EphemeralContainer', 'volumeMounts'): 'mountPath',
+    ('V1PodStatus', 'conditions'): 'type',
+    ('V1PodStatus', 'podIPs'): 'ip',
+    ('V1ServiceSpec', 'ports'): 'port',
+    ('V1ServiceAccount', 'secrets'): 'name',
+    ('V1NodeStatus', 'addresses'): 'type',
+    ('V1NodeStatus', 'conditions'): 'type',
+    ('V1ComponentStatus', 'conditions'): 'type',
+    ('V1NamespaceStatus', 'conditions'): 'type',
+    ('V1PersistentVolumeClaimStatus', 'conditions'): 'type',
+    ('V1ReplicationControllerStatus', 'conditions'): 'type',
+    ('V1DaemonSetStatus', 'conditions'): 'type',
+    ('V1DeploymentStatus', 'conditions'): 'type',
+    ('V1ReplicaSetStatus', 'conditions'): 'type',
+    ('V1StatefulSetStatus', 'conditions'): 'type',
+    ('V1JobStatus', 'conditions'): 'type',
+}
+
+# (model, json key) of the lists of primitives that the API server merges
+# as sets
+MERGED_PRIMITIVE_LISTS = frozenset([
+    ('V1ObjectMeta', 'finalizers'),
+    ('V1NodeSpec', 'podCIDRs'),
+])
+
+_MISSING = object()
+
+
+def _same(a, b):
+    # 1 == True and 1 == 1.0, but they are different JSON
+    return type(a) is type(b) and a == b
+
+
+def _as_json(obj, other):
+    if hasattr(type(obj), 'openapi_types'):
+        if hasattr(type(other), 'openapi_types') and \
+                type(other) is not type(obj):
+            raise ValueError("cannot diff a %s against a %s" % (
+                type(obj).__name__, type(other).__name__))
+        return serialization.sanitize(obj)
+    if obj is None:
+        return {}
+    return obj
+
+
+def merge_patch(original, modified):
+    """
+    Return the JSON merge patch (RFC 7386) from original to modified.
+
+    Dicts are compared key by key, removed keys are set to None and lists
+    that differ are replaced as a whole.
+
+    :param original: model or dict.
+    :param modified: model or dict, of the same class as original.
+    :return: dict, empty if there is nothing to change.
+    """
+    return _merge_patch(_as_json(original, modified),
+                        _as_json(modified, original))
+
+
+def _merge_patch(original, modified):
+    patch = {}
+    for key in original:
+        if key not in modified:
+            patch[key] = None
+    for key, value in six.iteritems(modified):
+        old = original.get(key, _MISSING)
+        if type(old) is dict and type(value) is dict:
+            nested = _merge_patch(old, value)
+            if nested:
+                patch[key] = nested
+        elif not _same(old, value):
+            patch[key] = value
+    return patch
+
+
+def json_patch(original, modified):
+    """
+    Return the JSON patch (RFC 6902) from original to modified.
+
+    Lists are compared index by index: elements are replaced in place,
+    added at the end or removed from the end, so inserting at the front of
+    a list replaces every element after it.
+
+    :param original: model or dict.
+    :param modified: model or dict, of the same class as original.
+    :return: list of operations, empty if there is nothing to change.
+    """
+    operations = []
+    _json_patch(_as_json(original, modified), _as_json(modified, original),
+                '', operations)
+    return operations
+
+
+def _pointer(path, key):
+    return '%s/%s' % (path,
+                      six.text_type(key).replace('~', '~0').replace('/', '~1'))
+
+
+def _json_patch(original, modified, path, operations):
+    if type(original) is dict and type(modified) is dict:
+        for key in original:
+            if key not in modified:
+                operations.append({'op': 'remove',
+                                   'path': _pointer(path, key)})
+        for key, value in six.iteritems(modified):
+            old = original.get(key, _MISSING)
+            if old is _MISSING:
+                operations.append({'op': 'add', 'path': _pointer(path, key),
+                                   'value': value})
+            else:
+                _json_patch(old, value, _pointer(path, key), operations)
+    elif type(original) is list and type(modified) is list:
+        common = min(len(original), len(modified))
+        for index in range(common):
+            _json_patch(original[index], modified[index],
+                        _pointer(path, index), operations)
+        for index in range(len(original) - 1, common - 1, -1):
+            operations.append({'op': 'remove',
+                               'path': _pointer(path, index)})
+        for index in range(common, len(modified)):
+            operations.append({'op': 'add', 'path': _pointer(path, index),
+                               'value': modified[index]})
+    elif not _same(original, modified):
+        operations.append({'op': 'replace', 'path': path, 'value': modified})
+
+
+def strategic_merge_patch(original, modified, klass=None):
+    """
+    Return the strategic merge patch from original to modified.
+
+    Like a merge patch, except for the lists in MERGE_KEYS, which only
+    carry the elements that were added or changed, identified by their
+    merge key, a $patch: delete entry for each removed element and a
+    $setElementOrder directive when the keys or their order changed, and
+    the lists in MERGED_PRIMITIVE_LISTS, which carry the added values and
+    a $deleteFromPrimitiveList directive. Other lists are replaced.
+
+    The API server merges lists according to the type of the object, so
+    the type must be known: it is taken from the models or from klass.
+
+    :param original: model or dict.
+    :param modified: model or dict, of the same class as original.
+    :param klass: model class, or its name, when both are dicts.
+    :return: dict, empty if there is nothing to change.
+    """
+    for obj in (original, modified):
+        if hasattr(type(obj), 'openapi_types'):
+            klass = type(obj)
+    if klass is None:
+        raise ValueError("klass is required to diff dicts")
+    if not isinstance(klass, six.string_types):
+        klass = klass.__name__
+    return _strategic_patch(_as_json(original, modified),
+                            _as_json(modified, original), klass)
+
+
+_types = {}
+
+
+def _field_type(openapi_type, key):
+    """Return the openapi type of the value at key of openapi_type."""
+    if openapi_type is None:
+        return None
+    if openapi_type.startswith('dict('):
+        return openapi_type[5:-1].split(', ', 1)[1]
+    types = _types.get(openapi_type)
+    if types is None:
+        klass = getattr(kubernetes.client.models, openapi_type, None)
+        types = {}
+        if klass is not None:
+            for attr, type_ in six.iteritems(klass.openapi_types):
+                types[klass.attribute_map[attr]] = type_
+        _types[openapi_type] = types
+    return types.get(key)
+
+
+def _item_type(openapi_type):
+    if openapi_type is not None and openapi_type.startswith('list['):
+        return openapi_type[5:-1]
+    return None
+
+
+def _strategic_patch(original, modified, openapi_type):
+    patch = {}
+    for key in original:
+        if key not in modified:
+            patch[key] = None
+    for key, value in six.iteritems(modified):
+        old = original.get(key, _MISSING)
+        if type(old) is dict and type(value) is dict:
+            nested = _strategic_patch(old, value,
+                                      _field_type(openapi_type, key))
+            if nested:
+                patch[key] = nested
+        elif type(old) is list and type(value) is list and \
+                not _same(old, value):
+            field = (openapi_type, key)
+            if field in MERGE_KEYS:
+                _merge_list(patch, key, old, value, MERGE_KEYS[field],
+                            _item_type(_field_type(openapi_type, key)))
+            elif field in MERGED_PRIMITIVE_LISTS:
+                _merge_primitive_list(patch, key, old, value)
+            else:
+                patch[key] = value
+        elif not _same(old, value):
+            patch[key] = value
+    return patch
+
+
+def _keys(items, merge_key):
+    keys = []
+    for item in items:
+        if type(item) is not dict or merge_key not in item:
+            return None
+        keys.append(item[merge_key])
+    if len(set(keys)) != len(keys):
+        return None
+    return keys
+
+
+def _merge_list(patch, key, original, modified, merge_key, item_type):
+    original_keys = _keys(original, merge_key)
+    modified_keys = _keys(modified, merge_key)
+    if original_keys is None or modified_keys is None:
+        # not a list the server can merge, replace it
+        patch[key] = modified
+        return
+    original_items = dict(zip(original_keys, original))
+    items = []
+    for name, item in zip(modified_keys, modified):
+        old = original_items.get(name)
+        if old is None:
+            items.append(item)
+            continue
+        nested = _strategic_patch(old, item, item_type)
+        if nested:
+            nested[merge_key] = name
+            items.append(nested)
+    kept = set(modified_keys)
+    for name in original_keys:
+        if name not in kept:
+            items.append({merge_key: name, '$patch': 'delete'})
+    if items:
+        patch[key] = items
+    if original_keys != modified_keys:
+        patch['$setElementOrder/' + key] = [{merge_key: name}
+                                            for name in modified_keys]
+
+
+def _merge_primitive_list(patch, key, original, modified):
+    added = [value for value in modified if value not in original]
+    removed = [value for value in original if value not in modified]
+    if added:
+        patch[key] = added
+    if removed:
+        patch['$deleteFromPrimitiveList/' + key] = removed
+    if original != modified:
+        patch['$setElementOrder/' + key] = list(modified)
@@ -0,0 +1,393 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import logging
+import re
+import threading
+import time
+
+import kubernetes.client.models
+from kubernetes.client import serialization
+from kubernetes.client.exceptions import ApiException
+from kubernetes.client.operation import operation_of
+
+from .watch_decoder import stream_lazy_events
+
+logger = logging.getLogger(__name__)
+
+# parameters of read_* and list_* calls that a cache answer honours
+_READ_PARAMS = frozenset(['name', 'namespace', 'pretty',
+                          '_return_http_data_only', '_request_timeout'])
+_LIST_PARAMS = _READ_PARAMS.union(['label_selector', 'field_selector',
+                                   'allow_watch_bookmarks'])
+_LABEL_REQUIREMENT = re.compile(
+    r'^\s*(!?)\s*([\w./-]+)\s*'
+    r'(?:(==|=|!=|\s+in\s+|\s+notin\s+)\s*(.*?))?\s*$')
+
+
+def _split_selector(selector):
+    """Split a selector on the commas that are not within parentheses."""
+    parts, depth, start = [], 0, 0
+    for i, c in enumerate(selector):
+        if c == '(':
+            depth += 1
+        elif c == ')':
+            depth -= 1
+        elif c == ',' and depth == 0:
+            parts.append(selector[start:i])
+            start = i + 1
+    parts.append(selector[start:])
+    return [part for part in parts if part.strip()]
+
+
+def parse_label_selector(selector):
+    """
+    Return a function telling whether a dict of labels matches a label
+    selector, such as "app=web,tier in (front, back),!canary".
+
+    Raises ValueError for a selector that cannot be parsed.
+    """
+    requirements = []
+    for part in _split_selector(selector or ''):
+        match = _LABEL_REQUIREMENT.match(part)
+        if match is None:
+            raise ValueError("invalid label selector %r" % selector)
+        negated, key, op, value = match.groups()
+        op = op.strip() if op else None
+        if negated and op:
+            raise ValueError("invalid label selector %r" % selector)
+        if op in ('in', 'notin'):
+            if not (value.startswith('(') and value.endswith(')')):
+                raise ValueError("invalid label selector %r" % selector)
+            value = frozenset(v.strip() for v in value[1:-1].split(','))
+        requirements.append((key, '!' if negated else op, value))
+
+    def matches(labels):
+        labels = labels or {}
+        for key, op, value in requirements:
+            if op is None:
+                if key not in labels:
+                    return False
+            elif op == '!':
+                if key in labels:
+                    return False
+            elif op in ('=', '=='):
+                if labels.get(key) != value:
+                    return False
+            elif op == '!=':
+                if labels.get(key) == value:
+                    return False
+            elif op == 'in':
+                if labels.get(key) not in value:
+                    return False
+            elif key in labels and labels[key] in value:
+                return False
+        return True
+    return matches
+
+
+def parse_field_selector(selector):
+    """
+    Return a function telling whether an object, as a dict, matches a field
+    selector, such as "metadata.name=web,status.phase!=Running".
+
+    Fields are looked up by their path in the object, a missing field has
+    the value "" as it does on the API server.
+    """
+    requirements = []
+    for part in _split_selector(selector or ''):
+        for op in ('!=', '==', '='):
+            if op in part:
+                path, value = part.split(op, 1)
+                break
+        else:
+            raise ValueError("invalid field selector %r" % selector)
+        requirements.append((path.strip().split('.'), op == '!=',
+                             value.strip()))
+
+    def matches(obj):
+        for path, negated, value in requirements:
+            current = obj
+            for key in path:
+                current = current.get(key) if isinstance(current, dict) \
+                    else None
+            if current is None:
+                current = ''
+            elif isinstance(current, bool):
+                current = 'true' if current else 'false'
+            if (str(current) == value) == negated:
+                return False
+        return True
+    return matches
+
+
+def _sort_key(obj):
+    metadata = obj.get('metadata') or {}
+    return metadata.get('namespace') or '', metadata.get('name') or ''
+
+
+class Informer(object):
+    """
+    Keeps the objects of a resource type in memory, listing them once and
+    then following a watch.
+
+    Objects are kept as dicts, keyed by namespace and name. The watch is
+    resumed from the last resource version it saw, and the objects are
+    listed again when that version is too old (410 Gone).
+
+    Input:
+    list_func: the generated method listing the resource in all namespaces,
+        e.g. CoreV1Api().list_pod_for_all_namespaces, or list_node for a
+        cluster scoped resource.
+    page_size: int. Objects per page when listing.
+    watch_timeout: int. Seconds a watch request lasts before it is renewed.
+    """
+
+    def __init__(self, list_func, page_size=500, watch_timeout=300):
+        self.list_func = list_func
+        self.operation = operation_of(list_func)
+        self.page_size = page_size
+        self.watch_timeout = watch_timeout
+        self.resource_version = None
+        self._objects = {}
+        self._synced = threading.Event()
+        self._stopped = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def synced(self):
+        return self._synced.is_set()
+
+    def wait_for_sync(self, timeout=None):
+        return self._synced.wait(timeout)
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._run, name="informer-" + self.operation.name)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop following the watch, once the current request returns."""
+        self._stopped.set()
+
+    def get(self, namespace, name):
+        with self._lock:
+            return self._objects.get(namespace, {}).get(name)
+
+    def items(self, namespace=None):
+        """Return the objects, of one namespace if given."""
+        with self._lock:
+            if namespace is not None:
+                return list(self._objects.get(namespace, {}).values())
+            return [obj for objects in self._objects.values()
+                    for obj in objects.values()]
+
+    def replace(self, items, resource_version):
+        """Replace all the objects, as after a list."""
+        objects = {}
+        for obj in items:
+            metadata = obj.get('metadata') or {}
+            objects.setdefault(metadata.get('namespace'), {})[
+                metadata.get('name')] = obj
+        with self._lock:
+            self._objects = objects
+            self.resource_version = resource_version
+        self._synced.set()
+
+    def apply(self, event_type, obj):
+        """Apply a watch event to the objects."""
+        metadata = obj.get('metadata') or {}
+        namespace, name = metadata.get('namespace'), metadata.get('name')
+        with self._lock:
+            if event_type in ('ADDED', 'MODIFIED'):
+                self._objects.setdefault(namespace, {})[name] = obj
+            elif event_type == 'DELETED':
+                objects = self._objects.get(namespace, {})
+                objects.pop(name, None)
+                if not objects:
+                    self._objects.pop(namespace, None)
+            self.resource_version = metadata.get('resourceVersion',
+                                                 self.resource_version)
+
+    def _list(self):
+        items, token = [], None
+        while True:
+            kwargs = {'limit': self.page_size, '_preload_content': False}
+            if token:
+                kwargs['_continue'] = token
+            resp = self.list_func(**kwargs)
+            page = json.loads(resp.data)
+            items.extend(page.get('items') or ())
+            metadata = page.get('metadata') or {}
+            token = metadata.get('continue')
+            if not token:
+                self.replace(items, metadata.get('resourceVersion'))
+                return
+
+    def _watch(self):
+        events = stream_lazy_events(
+            self.list_func, resource_version=self.resource_version,
+            allow_watch_bookmarks=True, timeout_seconds=self.watch_timeout)
+        for event in events:
+            self.apply(event.type, event.raw_object)
+            if self._stopped.is_set():
+                events.close()
+                return
+
+    def _run(self):
+        listed = False
+        failures = 0
+        while not self._stopped.is_set():
+            try:
+                if not listed:
+                    self._list()
+                    listed = True
+                self._watch()
+                failures = 0
+            except ApiException as e:
+                if e.status == 410:
+                    listed = False
+                    continue
+                logger.warning("watching %s failed: %s",
+                               self.operation.name, e)
+                failures += 1
+            except Exception:
+                logger.exception("watching %s failed", self.operation.name)
+                failures += 1
+            if failures:
+                self._stopped.wait(min(2 ** failures * 0.1, 30))
+
+
+class ReadCache(object):
+    """
+    Answers read_* and list_* calls from informers instead of the server.
+
+    Set as ApiClient.read_cache, it answers the read and list operations of
+    the resources registered with it, in one or all namespaces, once their
+    informer has listed them. Label and field selectors are evaluated
+    locally. Calls with parameters a cache cannot honour (resource_version,
+    limit, watch, ...), async_req or _preload_content=False calls, reads of
+    objects the cache does not have and all other operations go to the
+    server. The answers are built anew from the cached dicts, so they can
+    be modified, and are as fresh as the watch.
+
+    Example:
+        api_client = kubernetes.client.ApiClient()
+        core_v1 = kubernetes.client.CoreV1Api(api_client)
+        cache = ReadCache()
+        cache.register(core_v1.list_pod_for_all_namespaces)
+        cache.start()
+        api_client.read_cache = cache
+        cache.wait_for_sync(timeout=60)
+        pods = core_v1.list_namespaced_pod('default', label_selector='app=a')
+    """
+
+    def __init__(self, page_size=500, watch_timeout=300):
+        self.page_size = page_size
+        self.watch_timeout = watch_timeout
+        self.hits = 0
+        self.informers = []
+        # path template -> (informer, item type, whether it reads one object)
+        self._paths = {}
+
+    def register(self, list_func):
+        """
+        Cache the resource that a generated list method lists.
+
+        Input:
+        list_func: the list_*_for_all_namespaces method of a namespaced
+            resource, or the list_* method of a cluster scoped one, bound
+            to an API object.
+
+        Returns:
+            The Informer of the resource.
+        """
+        informer = Informer(list_func, self.page_size, self.watch_timeout)
+        operation = informer.operation
+        item_type = operation.response_type[:-len('List')]
+        prefix, plural = operation.path.rsplit('/', 1)
+        self._paths[operation.path] = (informer, item_type, False)
+        if operation.name.endswith('_for_all_namespaces'):
+            collection = '%s/namespaces/{namespace}/%s' % (prefix, plural)
+            self._paths[collection] = (informer, item_type, False)
+            self._paths[collection + '/{name}'] = (informer, item_type, True)
+        else:
+            self._paths[operation.path + '/{name}'] = (informer, item_type,
+                                                       True)
+        self.informers.append(informer)
+        return informer
+
+    def start(self):
+        for informer in self.informers:
+            informer.start()
+
+    def stop(self):
+        for informer in self.informers:
+            informer.stop()
+
+    def wait_for_sync(self, timeout=None):
+        """Wait until every informer has listed its objects."""
+        end = None if timeout is None else time.time() + timeout
+        for informer in self.informers:
+            wait = None if end is None else max(end - time.time(), 0)
+            if not informer.wait_for_sync(wait):
+                return False
+        return True
+
+    def answer(self, operation, params, configuration=None):
+        """
+        Return the result of a GET operation built from the cache, or None
+        if the call must go to the server.
+        """
+        entry = self._paths.get(operation.path)
+        if entry is None or operation.method != 'GET':
+            return None
+        informer, item_type, single = entry
+        if not informer.synced or params.get('async_req') or \
+                not params.get('_preload_content', True):
+            return None
+        allowed = _READ_PARAMS if single else _LIST_PARAMS
+        for key, value in params.items():
+            if value is not None and key not in allowed and \
+                    key != '_preload_content':
+                return None
+        namespace = params.get('namespace')
+        if single:
+            obj = informer.get(namespace, params['name'])
+            if obj is None:
+                return None
+            self.hits += 1
+            return serialization.from_dict(
+                getattr(kubernetes.client.models, item_type), obj,
+                configuration)
+
+        try:
+            labels = parse_label_selector(params.get('label_selector'))
+            fields = parse_field_selector(params.get('field_selector'))
+        except ValueError:
+            # let the server report it
+            return None
+        items = [obj for obj in informer.items(namespace)
+                 if labels((obj.get('metadata') or {}).get('labels')) and
+                 fields(obj)]
+        items.sort(key=_sort_key)
+        self.hits += 1
+        return serialization.from_dict(
+            getattr(kubernetes.client.models, operation.response_type),
+            {'metadata': {'resourceVersion': informer.resource_version},
+             'items': items},
+            configuration)
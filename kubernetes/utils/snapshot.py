@@ -0,0 +1,173 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import threading
+
+from six.moves import queue
+
+import kubernetes.client.models
+from kubernetes.client import serialization
+from kubernetes.client.operation import operation_of
+
+from .watch_decoder import stream_lazy_events
+
+_PAGE = 0
+_DONE = 1
+_ERROR = 2
+
+
+class Snapshot(object):
+    """
+    Lists several resource types concurrently, at one resource version.
+
+    Each type is listed page by page in its own thread, and the objects
+    are handed out as the pages arrive, so a large cluster is never held
+    in memory by the snapshot itself. With consistent=True the resource
+    version of the cluster is read first and every list is served by the
+    API server at exactly that version, so the objects of all types are
+    from the same point in time. The lists then fail with a 410 Gone
+    ApiException if that version is compacted before they complete, and a
+    new snapshot must be taken. Resources stored apart from the others,
+    such as events kept in a separate etcd, cannot be listed consistently
+    with them.
+
+    Once the iteration is over, `resource_versions` holds the version of
+    each list, from which `watch` follows the changes made since.
+
+    Input:
+    lists: dict of name to the generated method listing a resource type,
+        e.g. {'pods': core_v1.list_pod_for_all_namespaces,
+              'nodes': core_v1.list_node}.
+    page_size: int. Objects per page.
+    consistent: bool. List every type at the same resource version.
+    decode: bool. Hand out models instead of dicts.
+    buffer: int. Pages held while the consumer is busy, per snapshot.
+
+    Example:
+        snapshot = Snapshot({'pods': core_v1.list_pod_for_all_namespaces,
+                             'nodes': core_v1.list_node})
+        for name, obj in snapshot:
+            record(name, obj)
+        for event in snapshot.watch('pods'):
+            update(event.type, event.object)
+    """
+
+    def __init__(self, lists, page_size=500, consistent=True, decode=True,
+                 buffer=16):
+        self.lists = dict(lists)
+        self.page_size = page_size
+        self.consistent = consistent
+        self.decode = decode
+        self.resource_version = None
+        self.resource_versions = {}
+        self._queue = queue.Queue(buffer)
+        self._stopped = threading.Event()
+        self._started = False
+
+    def __iter__(self):
+        """Yield (name, object) pairs as the lists return them."""
+        if self._started:
+            raise RuntimeError("a snapshot can only be iterated once")
+        self._started = True
+        if self.consistent and self.lists:
+            self.resource_version = self._current_resource_version()
+        threads = [threading.Thread(target=self._list, args=(name, func),
+                                    name="snapshot-" + name)
+                   for name, func in sorted(self.lists.items())]
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+        try:
+            pending = len(threads)
+            while pending:
+                kind, name, value = self._queue.get()
+                if kind == _PAGE:
+                    for obj in value:
+                        yield name, obj
+                elif kind == _DONE:
+                    self.resource_versions[name] = value
+                    pending -= 1
+                else:
+                    raise value
+        finally:
+            self._stopped.set()
+
+    def collect(self):
+        """Return a dict of name to the list of its objects."""
+        result = dict((name, []) for name in self.lists)
+        for name, obj in self:
+            result[name].append(obj)
+        return result
+
+    def watch(self, name, **kwargs):
+        """
+        Watch a listed resource type from the version it was listed at.
+
+        Keyword arguments are passed to the list method, see
+        stream_lazy_events, which returns the events.
+        """
+        if name not in self.resource_versions:
+            raise ValueError("%s has not been listed" % name)
+        kwargs.setdefault('allow_watch_bookmarks', True)
+        kwargs['resource_version'] = self.resource_versions[name]
+        return stream_lazy_events(self.lists[name], **kwargs)
+
+    def _current_resource_version(self):
+        func = self.lists[sorted(self.lists)[0]]
+        resp = func(limit=1, _preload_content=False)
+        return json.loads(resp.data)['metadata']['resourceVersion']
+
+    def _put(self, item):
+        while not self._stopped.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _list(self, name, func):
+        try:
+            klass = None
+            if self.decode:
+                operation = operation_of(func)
+                klass = getattr(kubernetes.client.models,
+                                operation.response_type[:-len('List')])
+                configuration = func.__self__.api_client.configuration
+            kwargs = {'limit': self.page_size, '_preload_content': False}
+            if self.resource_version is not None:
+                kwargs['resource_version'] = self.resource_version
+            resource_version = None
+            while not self._stopped.is_set():
+                page = json.loads(func(**kwargs).data)
+                metadata = page.get('metadata') or {}
+                if resource_version is None:
+                    resource_version = metadata.get('resourceVersion')
+                items = page.get('items') or []
+                if klass is not None:
+                    items = [serialization.from_dict(klass, item,
+                                                     configuration)
+                             for item in items]
+                if items and not self._put((_PAGE, name, items)):
+                    return
+                token = metadata.get('continue')
+                if not token:
+                    self._put((_DONE, name, resource_version))
+                    return
+                # the version is given by the token on the next pages
+                kwargs.pop('resource_version', None)
+                kwargs['_continue'] = token
+        except Exception as e:
+            self._put((_ERROR, name, e))
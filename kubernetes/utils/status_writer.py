@@ -0,0 +1,273 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import itertools
+import logging
+import threading
+import time
+
+import six
+
+from kubernetes.client import serialization
+from kubernetes.client.exceptions import ApiException
+from kubernetes.client.operation import operation_of
+
+from .patch import MERGE_KEYS, _field_type, _item_type, _keys
+
+logger = logging.getLogger(__name__)
+
+
+def merge_status(pending, change, klass=None):
+    """
+    Merge a status change into the pending one, as the API server merges
+    a strategic merge patch: dicts are merged key by key, the lists that
+    MERGE_KEYS names for klass are merged element by element by their
+    merge key, anything else is replaced, and None marks a key to remove.
+
+    :param pending: dict, changed in place.
+    :param change: dict.
+    :param klass: name of the status model, e.g. 'V1PodStatus', None to
+        replace all the lists as a JSON merge patch would.
+    :return: pending.
+    """
+    for key, value in change.items():
+        current = pending.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            merge_status(current, value, _field_type(klass, key))
+        elif isinstance(value, list) and isinstance(current, list) and \
+                (klass, key) in MERGE_KEYS:
+            pending[key] = _merge_items(
+                current, value, MERGE_KEYS[(klass, key)],
+                _item_type(_field_type(klass, key)))
+        else:
+            pending[key] = value
+    return pending
+
+
+def _merge_items(current, items, merge_key, item_type):
+    current_keys = _keys(current, merge_key)
+    keys = _keys(items, merge_key)
+    if current_keys is None or keys is None:
+        return items
+    merged = dict(zip(current_keys, current))
+    for name, item in zip(keys, items):
+        if name in merged:
+            merge_status(merged[name], item, item_type)
+        else:
+            current.append(item)
+    return current
+
+
+def _status_type(patch_func):
+    """Return the name of the status model a patch method writes."""
+    try:
+        operation = operation_of(patch_func)
+    except (AttributeError, KeyError):
+        return None
+    return _field_type(operation.response_type, 'status')
+
+
+def _retriable(exc):
+    if isinstance(exc, ApiException):
+        return exc.status == 429 or exc.status is None or exc.status >= 500
+    return True
+
+
+class StatusWriter(object):
+    """
+    Coalesces status updates into at most one write in flight per object.
+
+    Changes submitted for an object are merged into its pending change and
+    written together, `interval` seconds after the first of them, as a
+    patch of the status subresource. While a write for an object is in
+    flight, changes for it keep accumulating and are written once it
+    completes. Significant transitions can be submitted with flush=True to
+    be written as soon as the object has no write in flight.
+
+    Changes are merged as the API server merges them, see merge_status,
+    the type of the status being taken from the patch method. Lists of
+    custom objects, which are patched with JSON merge patches, are
+    replaced: a change to such a list must carry all of it.
+
+    Writes that fail with a 429, a 5xx or a connection error are retried
+    after `interval`, merged under the changes submitted since. Other
+    errors drop the change, a 404 silently as the object is gone.
+
+    Input:
+    patch: callable(*key, body). A patch_namespaced_*_status method, or
+        patch_namespaced_custom_object_status.
+    klass: name of the status model, e.g. 'V1PodStatus', when patch is
+        not a generated method.
+    interval: float. Seconds a change waits for more to merge with.
+    workers: int. Number of threads writing, the maximum number of writes
+        in flight across objects.
+
+    Example:
+        writer = StatusWriter(
+            custom_api.patch_namespaced_custom_object_status, interval=2)
+        key = ('example.com', 'v1', 'default', 'jobs', 'job-1')
+        writer.submit(key, {'progress': 40})
+        writer.submit(key, {'progress': 45})  # written together with 40
+        writer.submit(key, {'phase': 'Succeeded'}, flush=True)
+        writer.close()
+    """
+
+    def __init__(self, patch, interval=1.0, workers=4, klass=None):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.patch = patch
+        if klass is not None and not isinstance(klass, six.string_types):
+            klass = klass.__name__
+        self.klass = klass or _status_type(patch)
+        self.interval = interval
+        self.coalesced = 0
+        self.writes = 0
+        self._pending = {}
+        self._deadlines = {}
+        self._in_flight = set()
+        self._due = []
+        self._seq = itertools.count()
+        self._closed = False
+        self._cond = threading.Condition()
+        self._threads = [
+            threading.Thread(target=self._work,
+                             name="status-writer-{}".format(i))
+            for i in range(workers)]
+        for thread in self._threads:
+            thread.daemon = True
+            thread.start()
+
+    def __len__(self):
+        with self._cond:
+            return len(self._pending)
+
+    def submit(self, key, status, flush=False):
+        """
+        Merge a status change into the pending change of an object.
+
+        Input:
+        key: tuple. The arguments of `patch` before the body, e.g.
+            (name, namespace) for patch_namespaced_pod_status.
+        status: dict or model. The fields of the status to change.
+        flush: bool. Write without waiting for the interval to pass.
+        """
+        change = serialization.sanitize(status)
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("StatusWriter is closed")
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = change
+            else:
+                merge_status(pending, change, self.klass)
+                self.coalesced += 1
+            now = time.time()
+            deadline = now if flush else now + self.interval
+            self._schedule(key, deadline)
+
+    def _schedule(self, key, deadline):
+        current = self._deadlines.get(key)
+        if current is not None and current <= deadline:
+            return
+        self._deadlines[key] = deadline
+        if key not in self._in_flight:
+            heapq.heappush(self._due, (deadline, next(self._seq), key))
+            self._cond.notify()
+
+    def _take(self):
+        """Wait for an object whose change is due, None once closed."""
+        with self._cond:
+            while True:
+                now = time.time()
+                while self._due and self._due[0][0] <= now:
+                    deadline, _, key = heapq.heappop(self._due)
+                    if self._deadlines.get(key) != deadline or \
+                            key in self._in_flight:
+                        continue
+                    del self._deadlines[key]
+                    self._in_flight.add(key)
+                    return key, self._pending.pop(key)
+                if self._closed and not self._pending:
+                    return None
+                wait = self._due[0][0] - now if self._due else None
+                self._cond.wait(wait)
+
+    def _work(self):
+        while True:
+            item = self._take()
+            if item is None:
+                return
+            key, change = item
+            retry = False
+            try:
+                self.patch(*key, body={'status': change})
+            except Exception as e:
+                if isinstance(e, ApiException) and e.status == 404:
+                    logger.debug("dropping status of %r, not found", key)
+                elif _retriable(e) and not self._closed:
+                    logger.warning("writing status of %r failed, retrying: "
+                                   "%s", key, e)
+                    retry = True
+                else:
+                    logger.exception("writing status of %r failed", key)
+            with self._cond:
+                self.writes += 1
+                self._in_flight.discard(key)
+                if retry:
+                    newer = self._pending.get(key)
+                    if newer is not None:
+                        merge_status(change, newer, self.klass)
+                    self._pending[key] = change
+                    # a change submitted during the write has a deadline
+                    # but no entry in _due, the key needs one either way
+                    deadline = time.time() + self.interval
+                    self._deadlines[key] = min(
+                        self._deadlines.get(key, deadline), deadline)
+                if key in self._deadlines:
+                    heapq.heappush(self._due, (self._deadlines[key],
+                                               next(self._seq), key))
+                self._cond.notify_all()
+
+    def flush(self, timeout=None):
+        """
+        Write all pending changes now and wait for the writes to finish.
+
+        Returns False if the timeout expired first.
+        """
+        end = None if timeout is None else time.time() + timeout
+        with self._cond:
+            now = time.time()
+            for key in list(self._pending):
+                self._schedule(key, now)
+            self._cond.notify_all()
+            while self._pending or self._in_flight:
+                wait = None
+                if end is not None:
+                    wait = end - time.time()
+                    if wait <= 0:
+                        return False
+                self._cond.wait(wait)
+        return True
+
+    def close(self, timeout=None):
+        """Write the pending changes and stop the writer threads."""
+        with self._cond:
+            self._closed = True
+        flushed = self.flush(timeout)
+        with self._cond:
+            self._cond.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        return flushed
@@ -0,0 +1,232 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import threading
+import time
+
+POLICY_BLOCK = 'block'
+POLICY_DROP_NEWEST = 'drop_newest'
+POLICY_DROP_OLDEST = 'drop_oldest'
+POLICIES = (POLICY_BLOCK, POLICY_DROP_NEWEST, POLICY_DROP_OLDEST)
+
+
+def event_key(event):
+    """
+    Return the (namespace, name) key of a watch event.
+
+    Works for the dict events of `watch.Watch.stream` as well as for
+    `LazyWatchEvent`.
+    """
+    metadata = event['raw_object'].get('metadata') or {}
+    return metadata.get('namespace'), metadata.get('name')
+
+
+def _as_added(event):
+    """Return event reported as ADDED, without decoding its object."""
+    if isinstance(event, dict):
+        return dict(event, type='ADDED')
+    event.type = 'ADDED'
+    return event
+
+
+class _Pending(object):
+
+    __slots__ = ('event', 'deleted', 'deadline')
+
+    def __init__(self, event, deadline):
+        self.event = event
+        # a DELETED event to hand out before event, the object having been
+        # recreated since
+        self.deleted = None
+        self.deadline = deadline
+
+
+class EventCoalescer(object):
+    """
+    A bounded, per object queue between a watch stream and its handler.
+
+    Events are keyed by namespace/name. While an event for a key is waiting
+    to be handed out, a newer event for the same key replaces it, so a slow
+    handler only ever sees the latest state of each object. An object that
+    was ADDED and then MODIFIED before delivery is still reported as ADDED
+    (with the latest state), and a DELETED event replaces the events before
+    it. A DELETED event is never replaced: when the object is recreated
+    before delivery, the DELETED event is handed out first and the latest
+    state of the new object after it, so the handler sees the recreation.
+    Events are merged on their type and raw object only, the objects of
+    LazyWatchEvents are not decoded.
+
+    Input:
+    maxsize: int. Maximum number of distinct keys held at once.
+    window: float. Seconds an event is held back after its key entered the
+        queue, giving later updates the chance to collapse into it.
+    policy: What to do with an event for a new key when the queue is full:
+        'block' waits for the handler to make room (backpressure on the
+        watch), 'drop_newest' discards the incoming event and
+        'drop_oldest' evicts the oldest pending key.
+
+    Example:
+        coalescer = EventCoalescer(maxsize=1000, window=0.5)
+        coalescer.feed(w.stream(v1.list_pod_for_all_namespaces))
+        for event in coalescer:
+            handle(event)
+    """
+
+    def __init__(self, maxsize=1000, window=0.0, policy=POLICY_BLOCK):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        if policy not in POLICIES:
+            raise ValueError(
+                "policy must be one of {}".format(", ".join(POLICIES)))
+        self.maxsize = maxsize
+        self.window = window
+        self.policy = policy
+        self.coalesced = 0
+        self.dropped = 0
+        self._pending = collections.OrderedDict()
+        self._closed = False
+        self._error = None
+        self._cond = threading.Condition()
+
+    def __len__(self):
+        with self._cond:
+            return len(self._pending)
+
+    def put(self, event, timeout=None):
+        """
+        Queue an event, merging it with a pending event for the same object.
+
+        Returns False if the event was dropped, True otherwise.
+        """
+        key = event_key(event)
+        with self._cond:
+            if self._closed:
+                raise ValueError("put on a closed EventCoalescer")
+            pending = self._pending.get(key)
+            if pending is None and len(self._pending) >= self.maxsize:
+                if self.policy == POLICY_DROP_NEWEST:
+                    self.dropped += 1
+                    return False
+                if self.policy == POLICY_DROP_OLDEST:
+                    self._pending.popitem(last=False)
+                    self.dropped += 1
+                elif not self._cond.wait_for(
+                        lambda: (len(self._pending) < self.maxsize or
+                                 key in self._pending or self._closed),
+                        timeout):
+                    self.dropped += 1
+                    return False
+                pending = self._pending.get(key)
+            if pending is not None:
+                self._merge(pending, event)
+                self.coalesced += 1
+                return True
+            if self._closed:
+                raise ValueError("put on a closed EventCoalescer")
+            self._pending[key] = _Pending(event, time.time() + self.window)
+            self._cond.notify_all()
+            return True
+
+    def _merge(self, pending, event):
+        current = pending.event['type']
+        if event['type'] == 'DELETED':
+            if pending.deleted is not None:
+                # the recreated object never reached the handler
+                event, pending.deleted = pending.deleted, None
+            pending.event = event
+        elif current == 'DELETED':
+            pending.deleted = pending.event
+            pending.event = event
+        elif event['type'] == 'MODIFIED' and current == 'ADDED':
+            pending.event = _as_added(event)
+        else:
+            pending.event = event
+
+    def get(self, timeout=None):
+        """
+        Remove and return the oldest event whose window has elapsed.
+
+        Blocks until such an event is available. Once the coalescer is
+        closed and drained, raises the exception the fed stream failed
+        with, if any, and StopIteration otherwise. Returns None on timeout.
+        """
+        end = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while True:
+                now = time.time()
+                wait = None
+                if self._pending:
+                    key, pending = next(iter(self._pending.items()))
+                    if pending.deadline <= now or self._closed:
+                        if pending.deleted is not None:
+                            event, pending.deleted = pending.deleted, None
+                            return event
+                        del self._pending[key]
+                        self._cond.notify_all()
+                        return pending.event
+                    wait = pending.deadline - now
+                elif self._closed:
+                    if self._error is not None:
+                        raise self._error
+                    raise StopIteration
+                if end is not None:
+                    if now >= end:
+                        return None
+                    wait = end - now if wait is None else min(wait, end - now)
+                self._cond.wait(wait)
+
+    def close(self, error=None):
+        """
+        Stop accepting events; pending events are flushed immediately.
+
+        error, when given, is raised to the consumer once they are handed
+        out, telling it that the stream failed, e.g. that a watch must be
+        relisted after a 410 Gone ApiException.
+        """
+        with self._cond:
+            # a stream fed into a closed coalescer fails on put
+            if not self._closed:
+                self._error = error
+            self._closed = True
+            self._cond.notify_all()
+
+    def feed(self, stream):
+        """
+        Consume a watch stream on a daemon thread, closing the coalescer when
+        the stream ends. An exception raised by the stream is raised to the
+        consumer after the pending events.
+
+        :return: the started thread.
+        """
+        def run():
+            error = None
+            try:
+                for event in stream:
+                    self.put(event)
+            except Exception as e:
+                error = e
+            finally:
+                self.close(error)
+        thread = threading.Thread(target=run, name="watch-coalescer")
+        thread.daemon = True
+        thread.start()
+        return thread
+
+    def __iter__(self):
+        while True:
+            try:
+                yield self.get()
+            except StopIteration:
+                return
@@ -0,0 +1,263 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import pydoc
+
+from kubernetes import client, watch
+from kubernetes.client import serialization
+
+# The API server always serializes the event type first, so the type of
+# most events can be read straight off the line prefix without parsing the
+# (potentially large) object that follows it.
+EVENT_TYPE_PREFIX = b'{"type":"'
+
+
+class _RawResponse(object):
+    """Minimal response shim accepted by ApiClient.deserialize."""
+
+    def __init__(self, data):
+        self.data = data
+
+
+class WatchLineSplitter(object):
+    """
+    Split a chunked watch response body into newline delimited lines.
+
+    Chunks are appended to a single reusable bytearray and complete lines
+    are cut out of it through a memoryview. A byte is copied into the
+    buffer and into the line returned, plus once more when it belongs to
+    a partial line that is moved to the front of the buffer after the
+    complete lines before it are removed.
+    """
+
+    def __init__(self):
+        self._buf = bytearray()
+
+    def feed(self, chunk):
+        """
+        Append a chunk and return the list of complete lines it finished.
+
+        Input:
+        chunk: bytes or str. A segment of the response body.
+
+        Returns:
+        list of bytes, without the trailing newline. Empty lines are dropped.
+        """
+        if not chunk:
+            return []
+        if not isinstance(chunk, (bytes, bytearray)):
+            chunk = chunk.encode('utf8')
+        buf = self._buf
+        buf += chunk
+        lines = []
+        start = 0
+        end = buf.find(b'\n')
+        if end < 0:
+            return lines
+        view = memoryview(buf)
+        try:
+            while end >= 0:
+                if end > start:
+                    lines.append(view[start:end].tobytes())
+                start = end + 1
+                end = buf.find(b'\n', start)
+        finally:
+            view.release()
+        del buf[:start]
+        return lines
+
+    def flush(self):
+        """Return the trailing partial line, if any, and reset the buffer."""
+        line = bytes(self._buf)
+        del self._buf[:]
+        return [line] if line.strip() else []
+
+
+def peek_event_type(line):
+    """
+    Return the event type of a raw watch line, or None if it can not be
+    determined without a full parse.
+    """
+    if line.startswith(EVENT_TYPE_PREFIX):
+        end = line.find(b'"', len(EVENT_TYPE_PREFIX))
+        if end > 0:
+            return line[len(EVENT_TYPE_PREFIX):end].decode('ascii')
+    return None
+
+
+class LazyWatchEvent(object):
+    """
+    A watch event whose payload is decoded on demand.
+
+    Only the event type is extracted eagerly. `raw_object` parses the JSON
+    line the first time it is read and `object` additionally deserializes
+    it into the model named by `return_type`. The event also supports the
+    dict style access (`event['type']`, `event['object']`,
+    `event['raw_object']`) used by the events of `watch.Watch.stream`.
+    """
+
+    __slots__ = ('type', '_line', '_return_type', '_api_client', '_raw',
+                 '_object')
+
+    def __init__(self, line, return_type=None, api_client=None):
+        self._line = line
+        self._return_type = return_type
+        self._api_client = api_client
+        self._raw = None
+        self._object = None
+        self.type = peek_event_type(line)
+        if self.type is None:
+            self.type = self._decode()['type']
+
+    def _decode(self):
+        if self._raw is None:
+            self._raw = json.loads(self._line)
+            self._line = None
+        return self._raw
+
+    @property
+    def raw_object(self):
+        """The watched object as a dict."""
+        return self._decode()['object']
+
+    @property
+    def object(self):
+        """The watched object deserialized into `return_type`."""
+        if self._object is None:
+            raw = self.raw_object
+            if (not self._return_type or self.type == 'ERROR' or
+                    self.type == 'BOOKMARK'):
+                self._object = raw
+            else:
+                klass = getattr(client.models, self._return_type, None)
+                if klass is not None:
+                    # straight from the dict, without encoding it again
+                    configuration = None
+                    if self._api_client is not None:
+                        configuration = self._api_client.configuration
+                    self._object = serialization.from_dict(klass, raw,
+                                                           configuration)
+                else:
+                    if self._api_client is None:
+                        self._api_client = client.ApiClient()
+                    self._object = self._api_client.deserialize(
+                        _RawResponse(json.dumps(raw)), self._return_type)
+        return self._object
+
+    @property
+    def name(self):
+        """The metadata.name of the watched object."""
+        return self.raw_object.get('metadata', {}).get('name')
+
+    @property
+    def namespace(self):
+        """The metadata.namespace of the watched object."""
+        return self.raw_object.get('metadata', {}).get('namespace')
+
+    @property
+    def resource_version(self):
+        """The metadata.resourceVersion of the watched object."""
+        return self.raw_object.get('metadata', {}).get('resourceVersion')
+
+    def __getitem__(self, key):
+        if key == 'type':
+            return self.type
+        if key == 'object':
+            return self.object
+        if key == 'raw_object':
+            return self.raw_object
+        raise KeyError(key)
+
+    def __repr__(self):
+        return "LazyWatchEvent(type={!r})".format(self.type)
+
+
+def iter_lazy_events(resp, return_type=None, api_client=None):
+    """
+    Decode a watch response opened with `_preload_content=False` into a
+    stream of LazyWatchEvent objects.
+
+    Input:
+    resp: urllib3.HTTPResponse. The raw watch response.
+    return_type: string. Name of the model the event objects deserialize
+        into, e.g. "V1Pod". If None, `object` is the same as `raw_object`.
+    api_client: ApiClient used for deserialization. A default one is
+        created on first use if not given.
+
+    Returns:
+        A generator of LazyWatchEvent.
+    """
+    splitter = WatchLineSplitter()
+    for chunk in resp.stream(amt=None, decode_content=False):
+        for line in splitter.feed(chunk):
+            yield LazyWatchEvent(line, return_type, api_client)
+    for line in splitter.flush():
+        yield LazyWatchEvent(line, return_type, api_client)
+
+
+def stream_lazy_events(func, *args, **kwargs):
+    """
+    Watch an API resource and yield LazyWatchEvent objects.
+
+    This is a single pass counterpart of `watch.Watch.stream` for handlers
+    that discard most events by type or name: payloads of skipped events
+    are never parsed into models. ERROR events are raised as ApiException.
+    Resuming after the watch expires is left to the caller, who can restart
+    from the `resource_version` of the last event seen.
+
+    Input:
+    func: The API function pointer, e.g. CoreV1Api.list_namespaced_pod.
+    return_type: string. Optional model name of the event objects. It is
+        derived from the docstring of func when omitted.
+    api_client: Optional ApiClient used for deserialization.
+
+    Any other parameter is passed to func.
+
+    Returns:
+        A generator of LazyWatchEvent.
+
+    Example:
+        v1 = kubernetes.client.CoreV1Api()
+        for e in stream_lazy_events(v1.list_pod_for_all_namespaces):
+            if e.type != 'DELETED':
+                continue
+            handle(e.object)
+    """
+    return_type = kwargs.pop('return_type', None)
+    api_client = kwargs.pop('api_client', None)
+    if not return_type:
+        # same as watch.Watch.get_return_type, which needs a Watch and so
+        # an ApiClient of its own
+        return_type = watch.watch._find_return_type(func)
+        if return_type.endswith(watch.watch.TYPE_LIST_SUFFIX):
+            return_type = return_type[:-len(watch.watch.TYPE_LIST_SUFFIX)]
+    if watch.watch.PYDOC_FOLLOW_PARAM in pydoc.getdoc(func):
+        kwargs['follow'] = True
+    else:
+        kwargs['watch'] = True
+    kwargs['_preload_content'] = False
+
+    resp = func(*args, **kwargs)
+    try:
+        for event in iter_lazy_events(resp, return_type, api_client):
+            if event.type == 'ERROR':
+                obj = event.raw_object
+                reason = "%s: %s" % (obj.get('reason'), obj.get('message'))
+                raise client.rest.ApiException(
+                    status=obj.get('code'), reason=reason)
+            yield event
+    finally:
+        resp.close()
+        resp.release_conn()
@@ -0,0 +1,221 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import heapq
+import itertools
+import logging
+import random
+import threading
+import time
+
+from kubernetes.client.rate_limit import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+
+class ItemExponentialBackoff(object):
+    """Per key exponential backoff: base_delay * 2^failures, capped."""
+
+    def __init__(self, base_delay=0.005, max_delay=1000.0):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._failures = collections.Counter()
+        self._lock = threading.Lock()
+
+    def when(self, key):
+        with self._lock:
+            exp = self._failures[key]
+            self._failures[key] += 1
+        return min(self.base_delay * 2 ** exp, self.max_delay)
+
+    def num_requeues(self, key):
+        with self._lock:
+            return self._failures[key]
+
+    def forget(self, key):
+        with self._lock:
+            self._failures.pop(key, None)
+
+
+class WorkQueue(object):
+    """
+    A deduplicating, rate limited work queue for controllers.
+
+    A key added several times before a worker picks it up is processed
+    once. A key is never handed to two workers at the same time: adding a
+    key that is being processed marks it dirty, and it is queued again once
+    the worker calls `done`. Failed keys are re-added with
+    `add_rate_limited`, which delays them by the larger of a per key
+    exponential backoff and the wait for a token from a global bucket.
+
+    Input:
+    qps, burst: int. Global token bucket for rate limited adds.
+    base_delay, max_delay: float. Per key backoff bounds in seconds.
+    """
+
+    def __init__(self, qps=10, burst=100, base_delay=0.005, max_delay=1000.0):
+        self._queue = collections.deque()
+        self._dirty = set()
+        self._processing = set()
+        self._waiting = []
+        self._seq = itertools.count()
+        self._shutting_down = False
+        self._cond = threading.Condition()
+        self._bucket = TokenBucket(qps, burst)
+        self._backoff = ItemExponentialBackoff(base_delay, max_delay)
+
+    def __len__(self):
+        with self._cond:
+            return len(self._queue)
+
+    def add(self, key):
+        """Queue a key unless it is already queued."""
+        with self._cond:
+            self._add(key)
+
+    def _add(self, key):
+        if self._shutting_down or key in self._dirty:
+            return
+        self._dirty.add(key)
+        if key in self._processing:
+            return
+        self._queue.append(key)
+        self._cond.notify()
+
+    def add_after(self, key, delay):
+        """Queue a key once `delay` seconds have passed."""
+        if delay <= 0:
+            return self.add(key)
+        with self._cond:
+            if self._shutting_down:
+                return
+            heapq.heappush(self._waiting,
+                           (time.time() + delay, next(self._seq), key))
+            self._cond.notify_all()
+
+    def add_rate_limited(self, key):
+        """Queue a key after its backoff and a global token allow it."""
+        self.add_after(key, max(self._backoff.when(key),
+                                self._bucket.reserve()))
+
+    def forget(self, key):
+        """Reset the backoff of a key, typically after it succeeded."""
+        self._backoff.forget(key)
+
+    def num_requeues(self, key):
+        return self._backoff.num_requeues(key)
+
+    def get(self, timeout=None):
+        """
+        Block until a key is ready and mark it as being processed.
+
+        Returns None if the queue is shut down or the timeout expires.
+        Every key returned must be passed to `done` afterwards.
+        """
+        end = None if timeout is None else time.time() + timeout
+        with self._cond:
+            while True:
+                now = time.time()
+                while self._waiting and self._waiting[0][0] <= now:
+                    self._add(heapq.heappop(self._waiting)[2])
+                if self._queue:
+                    key = self._queue.popleft()
+                    self._processing.add(key)
+                    self._dirty.discard(key)
+                    return key
+                if self._shutting_down:
+                    return None
+                wait = self._waiting[0][0] - now if self._waiting else None
+                if end is not None:
+                    if now >= end:
+                        return None
+                    wait = end - now if wait is None else min(wait, end - now)
+                self._cond.wait(wait)
+
+    def done(self, key):
+        """Mark a key as processed, re-queueing it if it was added since."""
+        with self._cond:
+            self._processing.discard(key)
+            if key in self._dirty:
+                self._queue.append(key)
+                self._cond.notify()
+
+    def shutdown(self):
+        """Release all workers; keys still queued are not processed."""
+        with self._cond:
+            self._shutting_down = True
+            self._cond.notify_all()
+
+    @property
+    def shutting_down(self):
+        return self._shutting_down
+
+
+def _worker(queue, reconcile):
+    while True:
+        key = queue.get()
+        if key is None:
+            return
+        try:
+            reconcile(key)
+        except Exception:
+            logger.exception("reconcile of %r failed, requeueing", key)
+            queue.add_rate_limited(key)
+        else:
+            queue.forget(key)
+        finally:
+            queue.done(key)
+
+
+def _resync(queue, list_keys, period, jitter):
+    while not queue.shutting_down:
+        time.sleep(period * (1 + random.random() * jitter))
+        if queue.shutting_down:
+            return
+        try:
+            for key in list_keys():
+                queue.add(key)
+        except Exception:
+            logger.exception("resync failed")
+
+
+def start_workers(queue, reconcile, workers=1, list_keys=None,
+                  resync_period=None, jitter=0.1):
+    """
+    Start daemon threads that drain a WorkQueue.
+
+    Input:
+    queue: WorkQueue. The queue to process.
+    reconcile: callable(key). Exceptions re-add the key rate limited.
+    workers: int. Number of worker threads.
+    list_keys: callable returning all keys, used for periodic resyncs.
+    resync_period: float. Seconds between resyncs, None to disable.
+    jitter: float. Each resync period is stretched by up to this fraction
+        so that controllers started together do not resync in lockstep.
+
+    Returns:
+        The list of started threads. Call `queue.shutdown()` to stop them.
+    """
+    threads = [threading.Thread(target=_worker, args=(queue, reconcile),
+                                name="workqueue-worker-{}".format(i))
+               for i in range(workers)]
+    if list_keys is not None and resync_period:
+        threads.append(threading.Thread(
+            target=_resync, args=(queue, list_keys, resync_period, jitter),
+            name="workqueue-resync"))
+    for thread in threads:
+        thread.daemon = True
+        thread.start()
+    return threads
@@ -0,0 +1,83 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Adds a from_dict() classmethod to the generated models.
+
+Usage:
+
+    python scripts/add_model_from_dict.py kubernetes/client/models/*.py
+
+Models that already have the method are left untouched.
+"""
+
+import re
+import sys
+
+CONFIGURATION_IMPORT = \
+    'from kubernetes.client.configuration import Configuration\n'
+SERIALIZATION_IMPORT = 'from kubernetes.client import serialization\n'
+TO_DICT = '    def to_dict(self):\n'
+
+FROM_DICT = '''    @classmethod
+    def from_dict(cls, data, local_vars_configuration=None):
+        """Builds a {name} from its JSON representation.
+
+        Attributes are assigned without going through the setters, so the
+        data is not validated. See serialization.from_dict.
+
+        :param data: dict keyed by the json keys of {name}.
+        :param local_vars_configuration: Configuration shared by the
+                                         created models.
+        :return: {name}
+        """
+        return serialization.from_dict(cls, data, local_vars_configuration)
+
+'''
+
+
+def add_from_dict(source):
+    if 'def from_dict(' in source:
+        return source
+    match = re.search(r'^class (\w+)\(object\):$', source, re.MULTILINE)
+    if (match is None or source.count(TO_DICT) != 1 or
+            CONFIGURATION_IMPORT not in source):
+        raise ValueError('not a generated model')
+    source = source.replace(CONFIGURATION_IMPORT,
+                            SERIALIZATION_IMPORT + CONFIGURATION_IMPORT, 1)
+    return source.replace(TO_DICT,
+                          FROM_DICT.format(name=match.group(1)) + TO_DICT)
+
+
+def main(paths):
+    failed = False
+    for path in paths:
+        if path.endswith('__init__.py'):
+            continue
+        with open(path) as f:
+            source = f.read()
+        try:
+            result = add_from_dict(source)
+        except ValueError as e:
+            sys.stderr.write('%s: %s\n' % (path, e))
+            failed = True
+            continue
+        if result != source:
+            with open(path, 'w') as f:
+                f.write(result)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,95 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the client side cost of an API call.
+
+The urllib3 pool manager is replaced by a no-op transport that returns a
+canned response without touching the network, so what is left is the
+time spent in the API method, ApiClient and RESTClientObject. The
+request column leaves the response undecoded (_preload_content=False),
+the deserialized column includes turning a small response into a model.
+Usage:
+
+    python scripts/call_overhead_benchmark.py [-n CALLS]
+"""
+
+import argparse
+import time
+
+import urllib3
+
+import kubernetes.client
+
+
+class NoopTransport(object):
+    """Stands in for urllib3.PoolManager and answers every request."""
+
+    def __init__(self, body):
+        self.response = urllib3.HTTPResponse(
+            body=body, status=200, preload_content=True,
+            headers={'Content-Type': 'application/json'})
+
+    def request(self, method, url, **kwargs):
+        return self.response
+
+
+def client():
+    configuration = kubernetes.client.Configuration()
+    configuration.host = 'https://localhost:6443'
+    configuration.api_key['authorization'] = 'token'
+    configuration.api_key_prefix['authorization'] = 'Bearer'
+    api_client = kubernetes.client.ApiClient(configuration)
+    transport = NoopTransport(b'{"metadata": {"name": "foo"}, "items": []}')
+    api_client.rest_client.pool_manager = transport
+    api_client.rest_client._stream_pool_manager = transport
+    return api_client
+
+
+CALLS = {
+    'read_namespaced_config_map': lambda api, **kwargs:
+        api.read_namespaced_config_map('foo', 'default', **kwargs),
+    'list_namespaced_pod': lambda api, **kwargs:
+        api.list_namespaced_pod('default', label_selector='app=foo',
+                                limit=500, **kwargs),
+    'create_namespaced_config_map': lambda api, **kwargs:
+        api.create_namespaced_config_map(
+            'default', {'metadata': {'name': 'foo'}, 'data': {'a': 'b'}},
+            **kwargs),
+}
+
+
+def measure(call, api, calls, **kwargs):
+    call(api, **kwargs)
+    start = time.perf_counter()
+    for _ in range(calls):
+        call(api, **kwargs)
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--calls', type=int, default=20000)
+    args = parser.parse_args()
+
+    api = kubernetes.client.CoreV1Api(client())
+    print("%-30s %12s %14s" % ('', 'request', 'deserialized'))
+    for name, call in sorted(CALLS.items()):
+        print("%-30s %9.1f us %11.1f us" % (
+            name, measure(call, api, args.calls, _preload_content=False),
+            measure(call, api, args.calls)))
+
+
+if __name__ == '__main__':
+    main()
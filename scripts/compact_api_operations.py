@@ -0,0 +1,288 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Rewrites the generated API modules to use operation descriptors.
+
+The generator emits a *_with_http_info method per operation that builds
+its request with a few dozen lines of code. This script reads those
+methods, records what they do in a kubernetes.client.operation.Operation
+table at the end of the module and replaces their bodies with a call to
+ApiClient.call_operation(). Signatures and docstrings are kept.
+
+Usage:
+
+    python scripts/compact_api_operations.py kubernetes/client/api/*.py
+
+Code that does not match what the generator emits is reported and the
+module is left untouched.
+"""
+
+import ast
+import sys
+
+SUFFIX = '_with_http_info'
+INDENT = ' ' * 4
+
+GENERATED_IMPORTS = """import re  # noqa: F401
+
+# python 2 and python 3 compatibility library
+import six
+
+from kubernetes.client.api_client import ApiClient
+"""
+
+COMPACT_IMPORTS = """import re  # noqa: F401
+
+from kubernetes.client.api_client import ApiClient
+"""
+
+GENERATED_EXCEPTIONS = """    ApiValueError
+)
+"""
+
+COMPACT_EXCEPTIONS = GENERATED_EXCEPTIONS + """\
+from kubernetes.client.operation import Operation
+"""
+
+
+class UnexpectedCode(Exception):
+    pass
+
+
+def _str(node):
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    raise UnexpectedCode(ast.dump(node))
+
+
+def _str_list(node):
+    if not isinstance(node, ast.List):
+        raise UnexpectedCode(ast.dump(node))
+    return [_str(e) for e in node.elts]
+
+
+def _param_name(node):
+    """Returns x for local_var_params['x']."""
+    if (isinstance(node, ast.Subscript) and
+            isinstance(node.value, ast.Name) and
+            node.value.id == 'local_var_params'):
+        index = node.slice
+        if isinstance(index, ast.Index):
+            index = index.value
+        return _str(index)
+    raise UnexpectedCode(ast.dump(node))
+
+
+def _subscript_target(node, name):
+    if (isinstance(node, ast.Subscript) and
+            isinstance(node.value, ast.Name) and node.value.id == name):
+        index = node.slice
+        if isinstance(index, ast.Index):
+            index = index.value
+        return _str(index)
+    return None
+
+
+class _Collector(ast.NodeVisitor):
+
+    def __init__(self):
+        self.op = {'path_params': [], 'query_params': [], 'required': [],
+                   'accepts': [], 'content_types': []}
+        self.all_params = None
+
+    def visit_Assign(self, node):
+        target = node.targets[0]
+        if isinstance(target, ast.Name):
+            if target.id == 'all_params':
+                self.all_params = _str_list(node.value)
+            elif target.id == 'body_params':
+                if not (isinstance(node.value, ast.Constant) and
+                        node.value.value is None):
+                    self.op['body'] = _param_name(node.value)
+            elif target.id == 'auth_settings':
+                self.op['auth_settings'] = _str_list(node.value)
+            elif target.id in ('collection_formats', 'path_params',
+                               'header_params', 'local_var_files'):
+                if not (isinstance(node.value, ast.Dict) and
+                        not node.value.keys):
+                    raise UnexpectedCode(ast.dump(node))
+            elif target.id in ('query_params', 'form_params'):
+                if not (isinstance(node.value, ast.List) and
+                        not node.value.elts):
+                    raise UnexpectedCode(ast.dump(node))
+            elif target.id != 'local_var_params':
+                raise UnexpectedCode(ast.dump(node))
+            return
+        if (isinstance(target, ast.Subscript) and
+                isinstance(target.value, ast.Name) and
+                target.value.id == 'local_var_params'):
+            # copying kwargs into local_var_params
+            return
+        wire = _subscript_target(target, 'path_params')
+        if wire is not None:
+            self.op['path_params'].append((_param_name(node.value), wire))
+            return
+        header = _subscript_target(target, 'header_params')
+        if header in ('Accept', 'Content-Type'):
+            call = node.value
+            func = call.func.attr
+            media_types = _str_list(call.args[0])
+            if header == 'Accept' and func == 'select_header_accept':
+                self.op['accepts'] = media_types
+                return
+            if (header == 'Content-Type' and
+                    func == 'select_header_content_type'):
+                self.op['content_types'] = media_types
+                return
+        raise UnexpectedCode(ast.dump(node))
+
+    def visit_Call(self, node):
+        func = node.func
+        if isinstance(func, ast.Attribute):
+            owner = func.value
+            if (func.attr == 'append' and isinstance(owner, ast.Name) and
+                    owner.id == 'query_params'):
+                wire, value = node.args[0].elts
+                self.op['query_params'].append((_param_name(value),
+                                                _str(wire)))
+                return
+            if func.attr == 'call_api':
+                self.op['path'] = _str(node.args[0])
+                self.op['method'] = _str(node.args[1])
+                for keyword in node.keywords:
+                    if keyword.arg == 'response_type':
+                        value = keyword.value
+                        if not (isinstance(value, ast.Constant) and
+                                value.value is None):
+                            self.op['response_type'] = _str(value)
+                return
+            if func.attr == 'append' and isinstance(owner, ast.Name):
+                raise UnexpectedCode(ast.dump(node))
+        self.generic_visit(node)
+
+    def visit_Raise(self, node):
+        call = node.exc
+        if call.func.id == 'ApiValueError':
+            message = _str(call.args[0])
+            prefix = 'Missing the required parameter `'
+            if not message.startswith(prefix):
+                raise UnexpectedCode(message)
+            self.op['required'].append(message[len(prefix):].split('`')[0])
+
+
+def collect(func):
+    collector = _Collector()
+    for statement in func.body[1:]:
+        collector.visit(statement)
+    op = collector.op
+    covered = [p for p, _ in op['path_params'] + op['query_params']]
+    if 'body' in op:
+        covered.append(op['body'])
+    if collector.all_params is None or \
+            sorted(covered) != sorted(collector.all_params):
+        raise UnexpectedCode('parameters of %s are not all handled'
+                             % func.name)
+    return op
+
+
+def _format_value(value):
+    if isinstance(value, list):
+        return '[%s]' % ', '.join(_format_value(v) for v in value)
+    if isinstance(value, tuple):
+        return '(%s)' % ', '.join(_format_value(v) for v in value)
+    return repr(value)
+
+
+def _line(text):
+    if len(text) > 79:
+        return text + '  # noqa: E501'
+    return text
+
+
+def format_operation(name, op):
+    indent = INDENT * 2
+    lines = [INDENT + 'Operation(',
+             _line(indent + '%r, %r, %r,' % (name, op['method'], op['path']))]
+    for key in ('path_params', 'query_params', 'body', 'required',
+                'response_type', 'accepts', 'content_types'):
+        value = op.get(key)
+        if value:
+            lines.append(_line('%s%s=%s,' % (indent, key,
+                                             _format_value(value))))
+    if op.get('auth_settings') != ['BearerToken']:
+        lines.append(_line('%sauth_settings=%s,' % (
+            indent, _format_value(op.get('auth_settings', [])))))
+    lines.append(INDENT + '),')
+    return lines
+
+
+def compact(source):
+    tree = ast.parse(source)
+    lines = source.split('\n')
+    replacements = []
+    operations = []
+    for node in ast.walk(tree):
+        if not (isinstance(node, ast.FunctionDef) and
+                node.name.endswith(SUFFIX)):
+            continue
+        name = node.name[:-len(SUFFIX)]
+        op = collect(node)
+        operations.append((node.lineno, name, op))
+        docstring = node.body[0]
+        params = [a.arg for a in node.args.args[1:]]
+        body = [INDENT * 2 + "kwargs[%r] = %s" % (p, p) for p in params]
+        body.append(INDENT * 2 + 'return self.api_client.call_operation(')
+        body.append(_line(INDENT * 3 + "_OPERATIONS[%r], kwargs)" % name))
+        replacements.append((docstring.end_lineno, node.end_lineno, body))
+
+    if not operations:
+        return source
+    for start, end, body in sorted(replacements, reverse=True):
+        lines[start:end] = body
+
+    source = '\n'.join(lines).rstrip('\n') + '\n'
+    if (GENERATED_IMPORTS not in source or
+            GENERATED_EXCEPTIONS not in source):
+        raise UnexpectedCode('module imports differ from the generated ones')
+    source = source.replace(GENERATED_IMPORTS, COMPACT_IMPORTS)
+    source = source.replace(GENERATED_EXCEPTIONS, COMPACT_EXCEPTIONS, 1)
+
+    table = ['', '', '_OPERATIONS = dict((op.name, op) for op in [']
+    for _, name, op in sorted(operations, key=lambda o: o[0]):
+        table.extend(format_operation(name, op))
+    table.append('])')
+    return source + '\n'.join(table) + '\n'
+
+
+def main(paths):
+    failed = False
+    for path in paths:
+        with open(path) as f:
+            source = f.read()
+        try:
+            result = compact(source)
+        except UnexpectedCode as e:
+            sys.stderr.write('%s: not rewritten, unexpected code: %s\n'
+                             % (path, e))
+            failed = True
+            continue
+        if result != source:
+            with open(path, 'w') as f:
+                f.write(result)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,65 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Measures the cold start time of the client.
+
+Every sample runs in a fresh interpreter, so nothing is cached in
+sys.modules. Usage:
+
+    python scripts/import_benchmark.py [-n RUNS] [statement]
+
+The default statement imports kubernetes.client and builds a CoreV1Api
+and a V1Pod, which is what a short lived CLI or serverless function does.
+"""
+
+import argparse
+import subprocess
+import sys
+
+DEFAULT_STATEMENT = (
+    "import kubernetes.client; "
+    "kubernetes.client.CoreV1Api(); "
+    "kubernetes.client.V1Pod()"
+)
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def sample(statement):
+    output = subprocess.check_output(
+        [sys.executable, '-c', TIMER.format(statement=statement)])
+    return float(output.decode().strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('-n', '--runs', type=int, default=10)
+    parser.add_argument('statement', nargs='?', default=DEFAULT_STATEMENT)
+    args = parser.parse_args()
+
+    samples = sorted(sample(args.statement) for _ in range(args.runs))
+    print("runs:   %d" % len(samples))
+    print("min:    %.1f ms" % (samples[0] * 1000))
+    print("median: %.1f ms" % (samples[len(samples) // 2] * 1000))
+    print("max:    %.1f ms" % (samples[-1] * 1000))
+
+
+if __name__ == '__main__':
+    main()
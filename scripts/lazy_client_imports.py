@@ -0,0 +1,207 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Rewrites the generated __init__ files of the client to import lazily.
+
+The generator imports every API and model class in kubernetes.client,
+kubernetes.client.api and kubernetes.client.models. This script replaces
+those imports with a table of class name -> module and a module level
+__getattr__ importing a module on first access.
+
+Usage:
+
+    python scripts/lazy_client_imports.py kubernetes/client
+
+Files that are already lazy are left untouched, files that do not match
+what the generator emits are reported.
+"""
+
+import os
+import re
+import sys
+
+IMPORT = re.compile(
+    r'^from kubernetes\.client\.(api|models)\.(\w+) import (\w+)$')
+
+API_COMMENT = '# import apis into api package\n'
+MODEL_COMMENT = '# import models into model package\n'
+SDK_API_COMMENT = '# import apis into sdk package\n'
+SDK_MODEL_COMMENT = '# import models into sdk package\n'
+CLIENT_IMPORTS = '# import ApiClient\n'
+FUTURE = 'from __future__ import absolute_import\n'
+
+PACKAGE_BODY = '''__all__ = sorted({table})
+
+
+def __getattr__(name):
+    module = {table}.get(name)
+    if module is None:
+        raise AttributeError(
+            "module {{!r}} has no attribute {{!r}}".format(__name__, name))
+    value = getattr(importlib.import_module(__name__ + '.' + module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set({table}))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) is not available, import eagerly
+    for _name in __all__:
+        __getattr__(_name)
+'''
+
+API_PREAMBLE = '''import importlib
+import sys
+
+# APIs are imported on first access, some of the API modules are very
+# large and only a few of them are used by a given program.
+# API class name -> module of this package defining it
+'''
+
+MODEL_PREAMBLE = '''import importlib
+import sys
+
+# Models are imported on first access, importing all of them up front
+# dominates the import time of the package.
+# model class name -> module of this package defining it
+'''
+
+SDK_BODY = '''# APIs and models are imported on first access, see
+# kubernetes.client.api and kubernetes.client.models
+from kubernetes.client.api import _APIS
+from kubernetes.client.models import _MODELS
+
+__all__ = [
+{names}
+] + sorted(_APIS) + sorted(_MODELS)
+
+
+def __getattr__(name):
+    if name in _APIS:
+        from kubernetes.client import api as package
+    elif name in _MODELS:
+        from kubernetes.client import models as package
+    else:
+        raise AttributeError(
+            "module {{!r}} has no attribute {{!r}}".format(__name__, name))
+    value = getattr(package, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_APIS) | set(_MODELS))
+
+
+if sys.version_info < (3, 7):
+    # module __getattr__ (PEP 562) is not available, import eagerly
+    for _name in __all__:
+        __getattr__(_name)
+'''
+
+
+class UnexpectedCode(Exception):
+    pass
+
+
+def _imports(lines):
+    """Return the (module, class name) pairs of generated import lines."""
+    result = []
+    for line in lines:
+        if not line.strip():
+            continue
+        match = IMPORT.match(line.rstrip('\n'))
+        if match is None:
+            raise UnexpectedCode(line.strip())
+        result.append((match.group(2), match.group(3)))
+    return result
+
+
+def _table(name, imports):
+    lines = ['%s = {' % name]
+    for module, klass in sorted(imports, key=lambda i: i[1]):
+        line = "    '%s': '%s'," % (klass, module)
+        if len(line) > 79:
+            line += '  # noqa: E501'
+        lines.append(line)
+    lines.append('}')
+    return '\n'.join(lines) + '\n\n'
+
+
+def lazy_package(source, comment, table, preamble):
+    """Rewrite the __init__ of kubernetes.client.api or .models."""
+    if table + ' = {' in source:
+        return source
+    head, sep, imports = source.partition(comment)
+    if not sep:
+        raise UnexpectedCode('no %r' % comment.strip())
+    return (head + preamble + _table(table, _imports(imports.splitlines())) +
+            PACKAGE_BODY.format(table=table))
+
+
+def lazy_sdk(source):
+    """Rewrite the __init__ of kubernetes.client."""
+    if '_APIS' in source:
+        return source
+    head, sep, rest = source.partition(SDK_API_COMMENT)
+    apis, sep2, rest = rest.partition(CLIENT_IMPORTS)
+    client, sep3, models = rest.partition(SDK_MODEL_COMMENT)
+    if not (sep and sep2 and sep3):
+        raise UnexpectedCode('unknown layout of kubernetes.client')
+    _imports(apis.splitlines())
+    _imports(models.splitlines())
+    names = []
+    for line in client.splitlines():
+        match = re.match(r'^from kubernetes\.client\.\w+ import (\w+)$',
+                         line)
+        if match is None:
+            raise UnexpectedCode(line)
+        names.append("    '%s'," % match.group(1))
+    head = head.replace(FUTURE, FUTURE + '\nimport sys\n', 1)
+    return (head + CLIENT_IMPORTS + client +
+            SDK_BODY.format(names='\n'.join(names)))
+
+
+def main(client_root):
+    rewrites = [
+        (os.path.join(client_root, '__init__.py'), lazy_sdk),
+        (os.path.join(client_root, 'api', '__init__.py'),
+         lambda s: lazy_package(s, API_COMMENT, '_APIS', API_PREAMBLE)),
+        (os.path.join(client_root, 'models', '__init__.py'),
+         lambda s: lazy_package(s, MODEL_COMMENT, '_MODELS',
+                                MODEL_PREAMBLE)),
+    ]
+    failed = False
+    for path, rewrite in rewrites:
+        with open(path) as f:
+            source = f.read()
+        try:
+            result = rewrite(source)
+        except UnexpectedCode as e:
+            sys.stderr.write('%s: not rewritten, unexpected code: %s\n'
+                             % (path, e))
+            failed = True
+            continue
+        if result != source:
+            with open(path, 'w') as f:
+                f.write(result)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1]))
@@ -70,6 +70,22 @@ sed -i'' "s,^DEVELOPMENT_STATUS = .*,DEVELOPMENT_STATUS = \\\"${DEVELOPMENT_STAT
 # This is a terrible hack:
 # first, this must be in gen repo not here
 # second, this should be ported to swagger-codegen
+# The patches carry every change made by hand to the generated rest.py,
+# api_client.py and configuration.py, they must be updated along with
+# these files.
 echo ">>> patching client..."
 git apply "${SCRIPT_ROOT}/rest_client_patch.diff"
+git apply "${SCRIPT_ROOT}/api_client_patch.diff"
+
+echo ">>> importing APIs and models lazily..."
+python "${SCRIPT_ROOT}/lazy_client_imports.py" "${CLIENT_ROOT}/client"
+
+echo ">>> replacing generated request code with operation descriptors..."
+python "${SCRIPT_ROOT}/compact_api_operations.py" "${CLIENT_ROOT}"/client/api/*_api.py
+
+echo ">>> adding from_dict to models..."
+python "${SCRIPT_ROOT}/add_model_from_dict.py" "${CLIENT_ROOT}"/client/models/*.py
+
+echo ">>> comparing models by attribute..."
+python "${SCRIPT_ROOT}/update_model_equality.py" "${CLIENT_ROOT}"/client/models/*.py
 echo ">>> Done."
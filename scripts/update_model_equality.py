@@ -0,0 +1,77 @@
+# Copyright 2021 The Kubernetes Authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Makes the generated models compare attribute by attribute and hashable.
+
+The generated __eq__ and __ne__ compare the to_dict() of both sides. They
+are changed to use serialization.equal, and a __hash__ based on
+serialization.content_hash is added. Must run after add_model_from_dict.py.
+
+Usage:
+
+    python scripts/update_model_equality.py kubernetes/client/models/*.py
+
+Models that were already changed are left untouched.
+"""
+
+import sys
+
+SERIALIZATION_IMPORT = 'from kubernetes.client import serialization\n'
+
+GENERATED_EQ = '        return self.to_dict() == other.to_dict()\n'
+GENERATED_NE = '        return self.to_dict() != other.to_dict()\n'
+
+FAST_EQ = '        return serialization.equal(self, other)\n'
+FAST_NE = '        return not serialization.equal(self, other)\n'
+
+HASH = '''
+    def __hash__(self):
+        """Returns the hash of the content, see serialization.content_hash"""
+        return int(serialization.content_hash(self)[:16], 16)
+'''
+
+
+def update_equality(source):
+    if FAST_EQ in source:
+        return source
+    if (source.count(GENERATED_EQ) != 1 or
+            not source.endswith(GENERATED_NE) or
+            SERIALIZATION_IMPORT not in source):
+        raise ValueError('not a generated model with from_dict')
+    source = source.replace(GENERATED_EQ, FAST_EQ)
+    return source[:-len(GENERATED_NE)] + FAST_NE + HASH
+
+
+def main(paths):
+    failed = False
+    for path in paths:
+        if path.endswith('__init__.py'):
+            continue
+        with open(path) as f:
+            source = f.read()
+        try:
+            result = update_equality(source)
+        except ValueError as e:
+            sys.stderr.write('%s: %s\n' % (path, e))
+            failed = True
+            continue
+        if result != source:
+            with open(path, 'w') as f:
+                f.write(result)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))